@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark parallel_get_values against a single WeftReader.get_values call.
+
+A synthetic file is built with the layout WeftWriter produces: decade blocks,
+yearly blocks, one monthly block per month, and a dense 48-hour section per
+year. The script evaluates the same random Julian dates with one process and
+with pools of increasing size, and reports the speedup over one process.
+
+Usage:
+    python scripts/benchmark_parallel_values.py
+    python scripts/benchmark_parallel_values.py --points 100000000 --processes 1 2 4 8
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from datetime import date
+from typing import List
+
+import numpy as np
+
+from starloom.weft.blocks import (
+    FortyEightHourBlock,
+    FortyEightHourSectionHeader,
+    MonthlyBlock,
+    MultiYearBlock,
+)
+from starloom.weft.blocks.utils import julian_from_date
+from starloom.weft.parallel import parallel_get_values
+from starloom.weft.weft_file import BlockType, WeftFile
+from starloom.weft.weft_reader import WeftReader
+
+START_YEAR = 1900
+SPAN_YEARS = 200
+
+
+def build_file(path: str) -> None:
+    """Write a synthetic .weft file covering SPAN_YEARS years."""
+    rng = np.random.default_rng(0)
+    blocks: List[BlockType] = []
+    for decade in range(START_YEAR, START_YEAR + SPAN_YEARS, 10):
+        blocks.append(
+            MultiYearBlock(
+                start_year=decade, duration=10, coeffs=list(rng.normal(size=12))
+            )
+        )
+    for year in range(START_YEAR, START_YEAR + SPAN_YEARS):
+        for month in range(1, 13):
+            blocks.append(
+                MonthlyBlock(
+                    year=year,
+                    month=month,
+                    day_count=28,
+                    coeffs=list(rng.normal(size=12)),
+                )
+            )
+
+        first = date(year, 3, 1).toordinal()
+        header = FortyEightHourSectionHeader(
+            start_day=date.fromordinal(first),
+            end_day=date.fromordinal(first + 29),
+            block_size=198,
+            block_count=30,
+        )
+        blocks.append(header)
+        for day in range(30):
+            blocks.append(
+                FortyEightHourBlock(
+                    header=header,
+                    coeffs=list(rng.normal(size=header.coefficient_count)),
+                    center_date=date.fromordinal(first + day),
+                )
+            )
+
+    preamble = (
+        f"#weft! v0.02 moon jpl:horizons {START_YEAR}-{START_YEAR + SPAN_YEARS} "
+        "32bit ECLIPTIC_LONGITUDE wrapping[0,360] chebychevs generated@benchmark\n\n"
+    )
+    with open(path, "wb") as f:
+        f.write(WeftFile(preamble, blocks).to_bytes())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--points", type=int, default=20_000_000, help="Number of points to evaluate"
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        nargs="+",
+        default=None,
+        help="Pool sizes to benchmark (defaults to powers of two up to the core count)",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=1_000_000, help="Number of points per task"
+    )
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    processes = args.processes or [
+        2**i for i in range(cores.bit_length()) if 2**i <= cores
+    ]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "moon_longitude.weft")
+        build_file(path)
+
+        rng = np.random.default_rng(1)
+        start_jd = julian_from_date(date(START_YEAR, 1, 1))
+        times = start_jd + rng.uniform(0, (SPAN_YEARS - 1) * 365.0, args.points)
+
+        reader = WeftReader(path, use_mmap=True)
+        start = time.perf_counter()
+        expected = reader.get_values(times)
+        baseline = time.perf_counter() - start
+        reader.close()
+
+        print(f"{args.points} points on {cores} cores")
+        print(f"{'processes':>9} {'seconds':>9} {'speedup':>8}")
+        print(f"{'reader':>9} {baseline:>9.2f} {1.0:>8.2f}")
+        for count in processes:
+            start = time.perf_counter()
+            values = parallel_get_values(
+                path, times, processes=count, chunk_size=args.chunk_size
+            )
+            elapsed = time.perf_counter() - start
+            assert np.array_equal(values, expected)
+            print(f"{count:>9} {elapsed:>9.2f} {baseline / elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark block lookup time in LazyWeftFile against the span of the file.
+
+Synthetic files are built with the same layout WeftWriter produces: decade
+blocks, yearly blocks, one monthly block per month, and a 48-hour section per
+year. For each span, the script times LazyWeftFile.get_blocks_for_julian at
+random dates and compares it with a linear scan over every block.
+
+Usage:
+    python scripts/benchmark_weft_lookup.py
+    python scripts/benchmark_weft_lookup.py --spans 10 100 400 --lookups 5000
+"""
+
+import argparse
+import random
+import time
+from datetime import date
+from typing import List
+
+from starloom.weft.blocks import (
+    FortyEightHourBlock,
+    FortyEightHourSectionHeader,
+    MonthlyBlock,
+    MultiYearBlock,
+)
+from starloom.weft.blocks.utils import julian_from_date
+from starloom.weft.weft_file import BlockType, LazyWeftFile, WeftFile
+
+START_YEAR = 1900
+SECTION_DAYS = 30
+
+
+def build_file(span_years: int) -> LazyWeftFile:
+    """Build a synthetic LazyWeftFile covering span_years years."""
+    blocks: List[BlockType] = []
+    for decade in range(START_YEAR, START_YEAR + span_years, 10):
+        blocks.append(MultiYearBlock(start_year=decade, duration=10, coeffs=[1.0]))
+    for year in range(START_YEAR, START_YEAR + span_years):
+        blocks.append(MultiYearBlock(start_year=year, duration=1, coeffs=[1.0]))
+        for month in range(1, 13):
+            blocks.append(
+                MonthlyBlock(year=year, month=month, day_count=28, coeffs=[1.0])
+            )
+
+    coeffs = [1.0] * FortyEightHourSectionHeader.coefficient_count
+    for year in range(START_YEAR, START_YEAR + span_years):
+        first = date(year, 3, 1).toordinal()
+        header = FortyEightHourSectionHeader(
+            start_day=date.fromordinal(first),
+            end_day=date.fromordinal(first + SECTION_DAYS - 1),
+            block_size=198,
+            block_count=SECTION_DAYS,
+        )
+        blocks.append(header)
+        for day in range(SECTION_DAYS):
+            blocks.append(
+                FortyEightHourBlock(
+                    header=header,
+                    coeffs=coeffs,
+                    center_date=date.fromordinal(first + day),
+                )
+            )
+
+    preamble = (
+        f"#weft! v0.02 mars jpl:horizons {START_YEAR}-{START_YEAR + span_years} "
+        "32bit ECLIPTIC_LONGITUDE unbounded chebychevs generated@benchmark\n\n"
+    )
+    return LazyWeftFile.from_bytes(WeftFile(preamble, blocks).to_bytes())
+
+
+def linear_scan(weft_file: LazyWeftFile, jd: float) -> List[BlockType]:
+    """Look up blocks by scanning every block, as LazyWeftFile used to."""
+    result: List[BlockType] = []
+    for block in weft_file.blocks:
+        if isinstance(block, (MultiYearBlock, MonthlyBlock)):
+            start, end = block.julian_span()
+            if start <= jd < end:
+                result.append(block)
+
+    for block in weft_file.blocks:
+        if isinstance(block, FortyEightHourSectionHeader):
+            start, end = block.julian_span()
+            if start <= jd < end:
+                result.extend(weft_file.find_blocks_for_julian_in_section(block, jd))
+                break
+
+    return result
+
+
+def time_lookups(lookup, weft_file: LazyWeftFile, julian_dates: List[float]) -> float:
+    """Return the mean time per lookup in microseconds."""
+    start = time.perf_counter()
+    for jd in julian_dates:
+        lookup(weft_file, jd)
+    return (time.perf_counter() - start) / len(julian_dates) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--spans",
+        type=int,
+        nargs="+",
+        default=[10, 50, 100, 200, 400],
+        help="File spans to benchmark, in years",
+    )
+    parser.add_argument(
+        "--lookups", type=int, default=2000, help="Number of lookups per span"
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(
+        f"{'span (years)':>12} {'blocks':>8} {'indexed (us)':>13} {'linear (us)':>12}"
+    )
+    for span in args.spans:
+        weft_file = build_file(span)
+        start_jd = julian_from_date(date(START_YEAR, 1, 1))
+        julian_dates = [
+            start_jd + rng.uniform(0, span * 365.0) for _ in range(args.lookups)
+        ]
+
+        indexed = time_lookups(
+            LazyWeftFile.get_blocks_for_julian, weft_file, julian_dates
+        )
+        linear = time_lookups(linear_scan, weft_file, julian_dates)
+        print(f"{span:>12} {len(weft_file.blocks):>8} {indexed:>13.1f} {linear:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
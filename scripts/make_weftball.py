@@ -3,9 +3,12 @@
 Script to generate a "weftball" for a planet or astronomical point.
 
 This script:
-1. Generates decade-by-decade weft files for ecliptic longitude, ecliptic latitude, and distance
+1. Generates decade-by-decade weft files for ecliptic longitude, ecliptic latitude, and distance,
+   fitting all three from one ephemeris query per decade
 2. Combines them into one big file for each quantity
-3. Creates a tar.gz archive containing the three files
+3. Creates a tar.gz archive containing the three files (or, with
+   --format weftpack, an indexed container whose members can be read
+   individually)
 
 Supported targets:
 - Planets: mercury, venus, mars, jupiter, saturn, uranus, neptune, pluto
@@ -20,6 +23,7 @@ Example:
     python -m scripts.make_weftball jupiter --debug  # Enable debug logging
     python -m scripts.make_weftball saturn -v        # Enable verbose (info) logging
     python -m scripts.make_weftball mercury --quiet  # Suppress all but error logs
+    python -m scripts.make_weftball venus --format weftpack  # Indexed container
 """
 
 import os
@@ -29,6 +33,7 @@ import subprocess
 import tarfile
 
 from src.starloom.weft.logging import get_logger
+from src.starloom.weft_ephemeris.weftpack import WEFTPACK_EXTENSION, write_weftpack
 from src.starloom.cli.common import setup_arg_parser, configure_logging
 
 # Define the quantities we want to generate
@@ -119,6 +124,9 @@ def create_temp_dir(planet):
 def generate_weft_files(planet, temp_dir):
     """Generate weft files for all quantities for the planet.
 
+    Each decade's quantities are generated by a single command, which
+    queries the ephemeris once and fits every quantity from the result.
+
     Args:
         planet: Planet name
         temp_dir: Temporary directory for output
@@ -126,8 +134,6 @@ def generate_weft_files(planet, temp_dir):
     Returns:
         Dict mapping quantity to generated file paths
     """
-    generated_files = {}
-
     logger.debug(f"Generating weftball for {planet}")
 
     quantities = get_quantities_for_target(planet)
@@ -136,90 +142,89 @@ def generate_weft_files(planet, temp_dir):
         f"Generating quantities for {planet}: {quantities} with step size {step_size}"
     )
 
-    for quantity in quantities:
-        logger.info(f"Generating {quantity} data for {planet}")
-
-        current_decade_files = []
-        for decade_start, decade_end in DECADES:
-            decade_range = get_decade_range(decade_start)
-            file_name = f"{planet}_{quantity}_{decade_range}.weft"
-            decade_file = os.path.join(temp_dir, file_name)
-
-            # Special handling for lunar_north_node: use Python API directly
-            # because CLI hardcodes "longitude" to ECLIPTIC_LONGITUDE
-            if planet.lower() == "lunar_north_node":
-                try:
-                    from datetime import datetime, timezone
-                    from src.starloom.planet import Planet
-                    from src.starloom.horizons.quantities import Quantity
-                    from src.starloom.weft.ephemeris_weft_generator import (
-                        generate_weft_file,
-                    )
-
-                    logger.info(
-                        f"Generating {quantity} for {decade_start} using Python API"
-                    )
-
-                    # Parse dates (use UTC timezone)
-                    start_dt = datetime.strptime(decade_start, "%Y-%m-%d").replace(
-                        tzinfo=timezone.utc
-                    )
-                    end_dt = datetime.strptime(decade_end, "%Y-%m-%d").replace(
-                        tzinfo=timezone.utc
-                    )
-
-                    # Use Python API directly
-                    generate_weft_file(
-                        planet=Planet.LUNAR_NORTH_NODE,
-                        quantity=Quantity.ASCENDING_NODE_LONGITUDE,
-                        start_date=start_dt,
-                        end_date=end_dt,
-                        output_path=decade_file,
-                        step_hours=step_size,
-                        custom_timespan=f"{start_dt.year}-{end_dt.year}",
-                    )
-                    current_decade_files.append(decade_file)
-                    logger.info(f"Successfully generated {decade_file}")
-                except Exception as e:
-                    logger.error(f"Error generating {quantity} for {decade_start}: {e}")
-                    import traceback
-
-                    traceback.print_exc()
-                    continue
-            else:
-                # Build command using starloom CLI for other planets
-                cmd = [
-                    "starloom",
-                    "weft",
-                    "generate",
-                    planet,
-                    quantity,
-                    "--start",
-                    f"{decade_start}",
-                    "--stop",
-                    f"{decade_end}",
-                    "--step",
-                    step_size,
-                    "--output",
-                    decade_file,
-                ]
-
-                # Print the command
-                print(f"Running command: {' '.join(cmd)}")
-
-                # Log the command at debug level
-                logger.debug(f"Running: {' '.join(cmd)}")
-
-                # Run the command
-                try:
-                    subprocess.run(cmd, check=True)
-                    current_decade_files.append(decade_file)
-                except subprocess.CalledProcessError as e:
-                    logger.error(f"Error generating {quantity} for {decade_start}: {e}")
-                    continue
+    generated_files = {quantity: [] for quantity in quantities}
+    for decade_start, decade_end in DECADES:
+        decade_range = get_decade_range(decade_start)
+        output_template = os.path.join(
+            temp_dir, f"{planet}_{{quantity}}_{decade_range}.weft"
+        )
+        decade_files = {
+            quantity: output_template.replace("{quantity}", quantity)
+            for quantity in quantities
+        }
 
-        # Store the list of files for this quantity
-        generated_files[quantity] = current_decade_files
+        # Special handling for lunar_north_node: use Python API directly
+        # because CLI hardcodes "longitude" to ECLIPTIC_LONGITUDE
+        if planet.lower() == "lunar_north_node":
+            try:
+                from datetime import datetime, timezone
+                from src.starloom.planet import Planet
+                from src.starloom.horizons.quantities import Quantity
+                from src.starloom.weft.ephemeris_weft_generator import (
+                    generate_weft_file,
+                )
+
+                logger.info(f"Generating longitude for {decade_start} using Python API")
+
+                # Parse dates (use UTC timezone)
+                start_dt = datetime.strptime(decade_start, "%Y-%m-%d").replace(
+                    tzinfo=timezone.utc
+                )
+                end_dt = datetime.strptime(decade_end, "%Y-%m-%d").replace(
+                    tzinfo=timezone.utc
+                )
+
+                # Use Python API directly
+                generate_weft_file(
+                    planet=Planet.LUNAR_NORTH_NODE,
+                    quantity=Quantity.ASCENDING_NODE_LONGITUDE,
+                    start_date=start_dt,
+                    end_date=end_dt,
+                    output_path=decade_files["longitude"],
+                    step_hours=step_size,
+                    custom_timespan=f"{start_dt.year}-{end_dt.year}",
+                )
+                logger.info(f"Successfully generated {decade_files['longitude']}")
+            except Exception as e:
+                logger.error(f"Error generating longitude for {decade_start}: {e}")
+                import traceback
+
+                traceback.print_exc()
+                continue
+        else:
+            # Build command using starloom CLI for other planets, generating
+            # every quantity from one ephemeris query
+            cmd = [
+                "starloom",
+                "weft",
+                "generate",
+                planet,
+                *quantities,
+                "--start",
+                f"{decade_start}",
+                "--stop",
+                f"{decade_end}",
+                "--step",
+                step_size,
+                "--output",
+                output_template,
+            ]
+
+            # Print the command
+            print(f"Running command: {' '.join(cmd)}")
+
+            # Log the command at debug level
+            logger.debug(f"Running: {' '.join(cmd)}")
+
+            # Run the command
+            try:
+                subprocess.run(cmd, check=True)
+            except subprocess.CalledProcessError as e:
+                logger.error(f"Error generating {decade_range} for {planet}: {e}")
+                continue
+
+        for quantity in quantities:
+            generated_files[quantity].append(decade_files[quantity])
 
     return generated_files
 
@@ -343,6 +348,36 @@ def create_tarball(planet, combined_files):
     return tarball_name
 
 
+def create_weftpack(planet, combined_files, compress=False):
+    """Create an indexed weftpack of the combined files.
+
+    Args:
+        planet: Planet name
+        combined_files: Dict of quantity -> file paths
+        compress: Whether to compress each member
+
+    Returns:
+        Path to the created weftpack
+    """
+    files_to_include = list(combined_files.values())
+    if not files_to_include:
+        logger.error("No files to include in weftpack")
+        return None
+
+    weftpack_name = f"{planet}_weftball{WEFTPACK_EXTENSION}"
+
+    logger.info(f"Creating weftpack: {weftpack_name}")
+    logger.debug(f"Including files: {', '.join(files_to_include)}")
+
+    members = []
+    for file_path in files_to_include:
+        with open(file_path, "rb") as f:
+            members.append((os.path.basename(file_path), f.read()))
+    write_weftpack(weftpack_name, members, compress=compress)
+
+    return weftpack_name
+
+
 def cleanup(temp_dir):
     """Clean up the temporary directory.
 
@@ -365,6 +400,18 @@ def main():
         action="store_true",
         help="Don't remove temporary files after completion",
     )
+    parser.add_argument(
+        "--format",
+        choices=["tar.gz", "weftpack"],
+        default="tar.gz",
+        help="Archive format: a tar.gz weftball, or an indexed .weftpack "
+        "whose members can be memory-mapped individually (default: tar.gz)",
+    )
+    parser.add_argument(
+        "--compress-members",
+        action="store_true",
+        help="With --format weftpack, compress each member individually",
+    )
 
     # Parse arguments
     args = parser.parse_args()
@@ -400,14 +447,19 @@ def main():
         # Combine the files
         combined_files = combine_weft_files(planet, temp_dir, generated_files)
 
-        # Create a tarball
-        tarball = create_tarball(planet, combined_files)
+        # Create the archive
+        if args.format == "weftpack":
+            archive = create_weftpack(
+                planet, combined_files, compress=args.compress_members
+            )
+        else:
+            archive = create_tarball(planet, combined_files)
 
-        if tarball:
-            logger.info(f"Successfully created {tarball}")
+        if archive:
+            logger.info(f"Successfully created {archive}")
             success = True
         else:
-            logger.error("Failed to create tarball")
+            logger.error("Failed to create archive")
             return 1
     finally:
         # Clean up only if successful and --no-cleanup was not specified
@@ -7,7 +7,7 @@ import os
 import sys
 import signal
 import traceback
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 import logging
 import time
 
@@ -15,7 +15,7 @@ from starloom.weft.blocks.forty_eight_hour_section_header import (
     FortyEightHourSectionHeader,
 )
 
-from ..weft import generate_weft_file
+from ..weft import generate_weft_file, generate_weft_files
 from .horizons import parse_date_input
 from ..weft import WeftReader
 from ..weft.weft_file import (
@@ -87,10 +87,11 @@ def weft(verbose: int, debug: bool, quiet: bool) -> None:
 @weft.command()
 @click.argument("planet", required=True)
 @click.argument(
-    "quantity",
+    "quantities",
+    metavar="QUANTITY...",
+    nargs=-1,
     required=True,
     type=click.Choice(["latitude", "longitude", "distance"]),
-    default="longitude",
 )
 @click.option(
     "--start", "-s", help="Start date (YYYY-MM-DD or Julian date)", required=True
@@ -98,7 +99,13 @@ def weft(verbose: int, debug: bool, quiet: bool) -> None:
 @click.option(
     "--stop", "-e", help="End date (YYYY-MM-DD or Julian date)", required=True
 )
-@click.option("--output", "-o", help="Output file path", required=True)
+@click.option(
+    "--output",
+    "-o",
+    help="Output file path; with several quantities, it must contain "
+    "'{quantity}', which is replaced by each quantity's name",
+    required=True,
+)
 @click.option("--data-dir", help="Data directory for cached horizons", default="./data")
 @click.option(
     "--step",
@@ -112,17 +119,35 @@ def weft(verbose: int, debug: bool, quiet: bool) -> None:
     help="Custom timespan descriptor for the preamble (e.g. '2000s' or '2020-2030')",
     type=str,
 )
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="Fetch, fit and write the file a few months at a time to bound memory use",
+)
+@click.option(
+    "--workers",
+    "-w",
+    help="Number of processes to fit blocks with",
+    default=1,
+    type=click.IntRange(min=1),
+)
 def generate(
     planet: str,
-    quantity: str,
+    quantities: Tuple[str, ...],
     start: str,
     stop: str,
     output: str,
     data_dir: str,
     step: str,
     timespan: Optional[str],
+    stream: bool,
+    workers: int,
 ) -> None:
-    """Generate a .weft binary ephemeris file."""
+    """Generate a .weft binary ephemeris file.
+
+    Several quantities can be given, e.g. "longitude latitude distance", to
+    generate a file for each from a single ephemeris query.
+    """
     # Direct debug output to see if it appears
     root_logger = logging.getLogger()
     root_logger.debug("ROOT LOGGER: Starting weft file generation")
@@ -142,12 +167,12 @@ def generate(
     # Ensure logger is properly configured
     logger.debug("Starting weft file generation")
     logger.debug(
-        f"Parameters: planet={planet}, quantity={quantity}, start={start}, stop={stop}"
+        f"Parameters: planet={planet}, quantities={quantities}, start={start}, stop={stop}"
     )
 
     print("Starting generation with parameters:")
     print(f"  Planet: {planet}")
-    print(f"  Quantity: {quantity}")
+    print(f"  Quantities: {', '.join(quantities)}")
     print(f"  Start date: {start}")
     print(f"  End date: {stop}")
     print(f"  Output: {output}")
@@ -177,54 +202,88 @@ def generate(
         logger.debug(f"Parsed dates: {start_dt} to {end_dt}")
         print(f"Parsed dates: {start_dt} to {end_dt}")
 
-        # Get the ephemeris quantity
-        logger.debug("Looking up ephemeris quantity")
-        print("Looking up ephemeris quantity...")
-        ephemeris_quantity = None
+        if len(quantities) > 1:
+            if "{quantity}" not in output:
+                raise click.BadParameter(
+                    "must contain '{quantity}' when several quantities are given",
+                    param_hint="'--output'",
+                )
+            if stream:
+                raise click.BadParameter(
+                    "streaming generates one quantity at a time",
+                    param_hint="'--stream'",
+                )
+        if stream and workers > 1:
+            raise click.BadParameter(
+                "streaming fits blocks in a single process",
+                param_hint="'--workers'",
+            )
+
+        # Get the ephemeris quantities
+        logger.debug("Looking up ephemeris quantities")
+        print("Looking up ephemeris quantities...")
 
         from starloom.horizons.quantities import EphemerisQuantity
 
-        if quantity == "latitude":
-            ephemeris_quantity = EphemerisQuantity.ECLIPTIC_LATITUDE
-        elif quantity == "longitude":
-            ephemeris_quantity = EphemerisQuantity.ECLIPTIC_LONGITUDE
-        elif quantity == "distance":
-            ephemeris_quantity = EphemerisQuantity.DISTANCE
-        else:
-            raise click.BadParameter(f"Unknown quantity: {quantity}")
-        logger.debug(f"Found ephemeris quantity: {ephemeris_quantity}")
-        print(f"Found ephemeris quantity: {ephemeris_quantity}")
+        ephemeris_quantities = {
+            "latitude": EphemerisQuantity.ECLIPTIC_LATITUDE,
+            "longitude": EphemerisQuantity.ECLIPTIC_LONGITUDE,
+            "distance": EphemerisQuantity.DISTANCE,
+        }
+        logger.debug(
+            f"Found ephemeris quantities: {[ephemeris_quantities[q] for q in quantities]}"
+        )
 
-        # Ensure output path has extension
+        # Ensure output paths have extensions
         if not output.endswith(".weft"):
             output = f"{output}.weft"
-        logger.debug(f"Using output path: {output}")
-        print(f"Using output path: {output}")
-
-        # Ensure output directory exists
-        output_dir = os.path.dirname(os.path.abspath(output))
-        if output_dir and not os.path.exists(output_dir):
-            logger.debug(f"Creating output directory: {output_dir}")
-            print(f"Creating output directory: {output_dir}")
-            os.makedirs(output_dir, exist_ok=True)
-
-        # Generate the file
+        outputs = [output.replace("{quantity}", q) for q in quantities]
+        logger.debug(f"Using output paths: {outputs}")
+        print(f"Using output paths: {', '.join(outputs)}")
+
+        # Ensure output directories exist
+        for path in outputs:
+            output_dir = os.path.dirname(os.path.abspath(path))
+            if output_dir and not os.path.exists(output_dir):
+                logger.debug(f"Creating output directory: {output_dir}")
+                print(f"Creating output directory: {output_dir}")
+                os.makedirs(output_dir, exist_ok=True)
+
+        # Generate the files
         logger.debug("Starting file generation")
-        print("Generating .weft file...")
+        print("Generating .weft files...")
         try:
-            file_path = generate_weft_file(
-                planet=planet,
-                quantity=ephemeris_quantity,
-                start_date=start_dt,
-                end_date=end_dt,
-                output_path=output,
-                data_dir=data_dir,
-                step_hours=step,
-                custom_timespan=timespan,
-            )
+            if len(quantities) == 1:
+                file_paths = [
+                    generate_weft_file(
+                        planet=planet,
+                        quantity=ephemeris_quantities[quantities[0]],
+                        start_date=start_dt,
+                        end_date=end_dt,
+                        output_path=outputs[0],
+                        data_dir=data_dir,
+                        step_hours=step,
+                        custom_timespan=timespan,
+                        stream=stream,
+                        workers=workers,
+                    )
+                ]
+            else:
+                file_paths = generate_weft_files(
+                    planet=planet,
+                    quantities=[ephemeris_quantities[q] for q in quantities],
+                    start_date=start_dt,
+                    end_date=end_dt,
+                    output_paths=outputs,
+                    data_dir=data_dir,
+                    step_hours=step,
+                    custom_timespan=timespan,
+                    workers=workers,
+                )
 
-            logger.debug(f"Successfully generated .weft file: {file_path}")
-            click.echo(f"Successfully generated .weft file: {file_path}")
+            for file_path in file_paths:
+                logger.debug(f"Successfully generated .weft file: {file_path}")
+                click.echo(f"Successfully generated .weft file: {file_path}")
         except Exception as e:
             logger.error(f"Error during generation: {e}", exc_info=True)
             print("Error during generation:")
@@ -514,7 +573,7 @@ def combine(file1: str, file2: str, output_file: str, timespan: str) -> None:
         combined = WeftFile.combine(weftA, weftB, timespan)
 
         # Write the combined file
-        combined.write_to_file(output_file)
+        combined.write_to_file(output_file, include_index=True)
         logger.debug(f"Wrote combined file to {output_file}")
         click.echo(f"Combined file written to {output_file}")
 
@@ -523,6 +582,41 @@ def combine(file1: str, file2: str, output_file: str, timespan: str) -> None:
         raise click.ClickException(f"Error combining files: {e}")
 
 
+@weft.command()
+@click.argument("file_path", type=click.Path(exists=True))
+@click.option(
+    "--output",
+    "-o",
+    help="Output file path (defaults to rewriting the file in place)",
+    type=click.Path(),
+)
+def index(file_path: str, output: Optional[str] = None) -> None:
+    """Add a table-of-contents index to an existing .weft file (format v0.03)."""
+    logger.debug(f"Adding index to file: {file_path}")
+    from ..weft.weft_file import add_index
+
+    try:
+        with open(file_path, "rb") as f:
+            data = f.read()
+        indexed = add_index(data)
+
+        # Write beside the destination first so a failure never truncates it
+        output_path = output or file_path
+        temp_path = f"{output_path}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(indexed)
+        os.replace(temp_path, output_path)
+
+        logger.debug(f"Wrote indexed file to {output_path}")
+        click.echo(
+            f"Indexed file written to {output_path} "
+            f"({len(indexed) - len(data):+d} bytes)"
+        )
+    except Exception as e:
+        logger.error(f"Error indexing file: {e}", exc_info=True)
+        raise click.ClickException(f"Error indexing file: {e}")
+
+
 @weft.command()
 @click.argument("file_path", type=click.Path(exists=True))
 @click.option(
@@ -671,3 +765,126 @@ def load_compare(file_path: str, lookup_date: Optional[str] = None) -> None:
     except Exception as e:
         logger.error(f"Error comparing loading methods: {e}", exc_info=True)
         raise click.ClickException(f"Error comparing loading methods: {e}")
+
+
+_cache_dir_option = click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    help="Cache directory (defaults to ~/.cache/starloom/weft)",
+)
+
+
+def _format_size(size_bytes: int) -> str:
+    """Format a size in bytes for display."""
+    if size_bytes < 1024 * 1024:
+        return f"{size_bytes / 1024:.1f} KB"
+    return f"{size_bytes / (1024 * 1024):.1f} MB"
+
+
+@weft.group()
+def cache() -> None:
+    """Manage the cache of decompressed weftballs."""
+
+
+@cache.command()
+@click.argument("weftballs", nargs=-1, required=True, type=click.Path(exists=True))
+@_cache_dir_option
+def warm(weftballs: tuple[str, ...], cache_dir: Optional[str] = None) -> None:
+    """Decompress weftballs into the cache (directories are searched for weftballs)."""
+    from ..weft_ephemeris.cache import WeftballCache
+
+    weftball_cache = WeftballCache(cache_dir)
+    paths = []
+    for path in weftballs:
+        if os.path.isdir(path):
+            paths.extend(
+                sorted(
+                    os.path.join(path, name)
+                    for name in os.listdir(path)
+                    if name.endswith(("_weftball.tar.gz", "_weftball.tar"))
+                )
+            )
+        else:
+            paths.append(path)
+
+    for path in paths:
+        try:
+            start_time = time.time()
+            entry = weftball_cache.warm(path)
+            click.echo(
+                f"{path}: {len(entry.members)} files, {_format_size(entry.nbytes)} "
+                f"({time.time() - start_time:.3f}s)"
+            )
+        except Exception as e:
+            logger.error(f"Error caching {path}: {e}", exc_info=True)
+            raise click.ClickException(f"Error caching {path}: {e}")
+
+
+@cache.command(name="list")
+@_cache_dir_option
+def list_entries(cache_dir: Optional[str] = None) -> None:
+    """List cached weftballs."""
+    from ..weft_ephemeris.cache import WeftballCache
+
+    weftball_cache = WeftballCache(cache_dir)
+    entries = weftball_cache.entries()
+    click.echo(f"Cache directory: {weftball_cache.root}")
+    if not entries:
+        click.echo("No cached weftballs")
+        return
+
+    for entry in entries:
+        status = "stale" if entry.is_stale() else "ok"
+        click.echo(
+            f"{entry.source} [{status}] sha256:{entry.sha256[:12]} "
+            f"{len(entry.members)} files, {_format_size(entry.nbytes)}"
+        )
+    total = sum(entry.nbytes for entry in entries)
+    click.echo(f"Total: {len(entries)} weftballs, {_format_size(total)}")
+
+
+@cache.command()
+@click.option("--all", "everything", is_flag=True, help="Remove every entry")
+@_cache_dir_option
+def prune(everything: bool, cache_dir: Optional[str] = None) -> None:
+    """Remove cached weftballs whose archives have changed or disappeared."""
+    from ..weft_ephemeris.cache import WeftballCache
+
+    removed = WeftballCache(cache_dir).prune(everything=everything)
+    click.echo(f"Removed {len(removed)} cache entries")
+
+
+@weft.command()
+@click.argument("tarballs", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option(
+    "--output",
+    "-o",
+    help="Output file path (only with a single weftball; defaults to the "
+    "weftball's path with a .weftpack extension)",
+    type=click.Path(),
+)
+@click.option(
+    "--compress",
+    is_flag=True,
+    help="Compress each member (smaller, but members cannot be memory-mapped)",
+)
+def pack(tarballs: tuple[str, ...], output: Optional[str], compress: bool) -> None:
+    """Convert .tar.gz weftballs into indexed .weftpack containers."""
+    from ..weft_ephemeris.weftpack import Weftpack, convert_tarball
+
+    if output is not None and len(tarballs) > 1:
+        raise click.UsageError("--output can only be used with a single weftball")
+
+    for tarball in tarballs:
+        try:
+            start_time = time.time()
+            output_path = convert_tarball(tarball, output, compress=compress)
+            members = Weftpack(output_path).names()
+            click.echo(
+                f"{tarball} -> {output_path}: {len(members)} files, "
+                f"{_format_size(os.path.getsize(output_path))} "
+                f"({time.time() - start_time:.3f}s)"
+            )
+        except Exception as e:
+            logger.error(f"Error converting {tarball}: {e}", exc_info=True)
+            raise click.ClickException(f"Error converting {tarball}: {e}")
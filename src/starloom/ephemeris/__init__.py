@@ -1,13 +1,22 @@
-from .quantities import Quantity, ANGLE_QUANTITIES, normalize_column_name
+from .quantities import (
+    Quantity,
+    ANGLE_QUANTITIES,
+    NON_NUMERIC_QUANTITIES,
+    normalize_column_name,
+)
 from .ephemeris import Ephemeris
+from .position_table import PositionTable, PositionsView
 from .util import get_zodiac_sign, format_latitude, format_distance
 from .time_spec import TimeSpec, TimeSpecType
 
 __all__ = [
     "Quantity",
     "ANGLE_QUANTITIES",
+    "NON_NUMERIC_QUANTITIES",
     "normalize_column_name",
     "Ephemeris",
+    "PositionTable",
+    "PositionsView",
     "get_zodiac_sign",
     "format_latitude",
     "format_distance",
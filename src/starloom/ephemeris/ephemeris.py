@@ -1,10 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, List, Sequence, Union
 from datetime import datetime
 
-from .quantities import Quantity
+from .quantities import Quantity, ANGLE_QUANTITIES
+from .position_table import PositionTable
+from ..space_time.julian import datetime_to_julian
 from .time_spec import TimeSpec
 
+# Step either side of each time for finite difference rates (15 seconds)
+RATE_STEP_DAYS = 15.0 / (24.0 * 60.0 * 60.0)
+
 
 class Ephemeris(ABC):
     """
@@ -57,3 +62,102 @@ class Ephemeris(ABC):
             - Quantity.DELTA (distance from Earth)
         """
         pass
+
+    def get_planet_positions_table(
+        self, planet: str, time_spec: TimeSpec
+    ) -> PositionTable:
+        """
+        Get a planet's positions for multiple times as a columnar table.
+
+        This default implementation converts the result of
+        get_planet_positions. Ephemerides whose data is already columnar
+        override it to build the table without per-time dictionaries.
+
+        Args:
+            planet: The name or identifier of the planet.
+            time_spec: Time specification defining the times to retrieve positions for.
+
+        Returns:
+            A PositionTable with one row per Julian date, in date order, and
+            a column for each quantity get_planet_positions would return.
+        """
+        return PositionTable.from_positions(
+            self.get_planet_positions(planet, time_spec)
+        )
+
+    def get_bodies_positions(
+        self, planets: Sequence[str], time_spec: TimeSpec
+    ) -> Dict[str, Dict[float, Dict[Quantity, Any]]]:
+        """
+        Get the positions of several planets for the same times.
+
+        This default implementation calls get_planet_positions once per
+        planet. Ephemerides that can share work between bodies, such as the
+        time points or a database query, override it.
+
+        Args:
+            planets: The names or identifiers of the planets.
+            time_spec: Time specification defining the times to retrieve positions for.
+
+        Returns:
+            A dictionary mapping each planet, as given, to the result of
+            get_planet_positions for it.
+        """
+        return {
+            planet: self.get_planet_positions(planet, time_spec) for planet in planets
+        }
+
+    def get_planet_rates(
+        self, planet: str, time_spec: TimeSpec
+    ) -> Dict[float, Dict[Quantity, float]]:
+        """
+        Get the rates of change of a planet's position for multiple times.
+
+        This default implementation estimates each rate with a central
+        difference of positions RATE_STEP_DAYS either side of each time, fetched
+        in a single get_planet_positions call. Ephemerides that can
+        differentiate their data analytically override it.
+
+        Args:
+            planet: The name or identifier of the planet.
+            time_spec: Time specification defining the times to retrieve rates for.
+
+        Returns:
+            A dictionary mapping Julian dates to dictionaries of rates of change
+            per day, keyed by Quantity, for each numeric quantity in the
+            positions. Angle differences are taken the short way around the
+            circle. Times whose positions are unavailable are omitted.
+        """
+        if time_spec.dates is not None:
+            times: List[Union[datetime, float]] = list(time_spec.dates)
+        else:
+            times = list(time_spec.to_julian_days())
+        julian_dates = [
+            datetime_to_julian(t) if isinstance(t, datetime) else float(t)
+            for t in times
+        ]
+
+        sample_dates: List[Union[datetime, float]] = []
+        for jd in julian_dates:
+            sample_dates.extend([jd - RATE_STEP_DAYS, jd + RATE_STEP_DAYS])
+        positions = self.get_planet_positions(planet, TimeSpec.from_dates(sample_dates))
+
+        result: Dict[float, Dict[Quantity, float]] = {}
+        for jd in julian_dates:
+            before = positions.get(jd - RATE_STEP_DAYS)
+            after = positions.get(jd + RATE_STEP_DAYS)
+            if before is None or after is None:
+                continue
+
+            rates: Dict[Quantity, float] = {}
+            for quantity, value in after.items():
+                try:
+                    difference = float(value) - float(before[quantity])
+                except (KeyError, TypeError, ValueError):
+                    continue
+                if quantity in ANGLE_QUANTITIES:
+                    difference = (difference + 180.0) % 360.0 - 180.0
+                rates[quantity] = difference / (2 * RATE_STEP_DAYS)
+            result[jd] = rates
+
+        return result
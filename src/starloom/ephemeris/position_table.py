@@ -0,0 +1,285 @@
+"""
+Columnar container for a series of positions.
+
+Ephemeris.get_planet_positions returns a dictionary per time point, which is
+convenient for single lookups but costly for long series. A PositionTable
+holds the same data as a sorted array of Julian dates plus one array per
+Quantity, and offers a read-only mapping view for code that expects the
+dictionary form.
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Sequence, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from .quantities import NON_NUMERIC_QUANTITIES, Quantity
+
+
+def _column(quantity: Quantity, values: Sequence[Any]) -> npt.NDArray[Any]:
+    """
+    Build a column of a quantity from a sequence of values.
+
+    Quantities in NON_NUMERIC_QUANTITIES always make an object column, so a
+    body ID such as "499" stays a string. For other quantities, values that
+    all convert to floats, including numeric strings and None (which becomes
+    NaN), make a float64 column; anything else is kept as given in an object
+    column.
+
+    Args:
+        quantity: The quantity the column holds
+        values: The column's values, one per row
+
+    Returns:
+        The column array
+    """
+    if quantity not in NON_NUMERIC_QUANTITIES:
+        try:
+            return np.array(values, dtype=np.float64)
+        except (TypeError, ValueError):
+            pass
+    column = np.empty(len(values), dtype=object)
+    column[:] = list(values)
+    return column
+
+
+class PositionTable:
+    """
+    A planet's positions as columns.
+
+    Rows are sorted by Julian date. Numeric quantities are float64 columns
+    with NaN for missing values; other quantities, such as Quantity.BODY or
+    Quantity.DATE_TIME, are object columns with None for missing values. The
+    arrays are read-only.
+
+    Example:
+        table = ephemeris.get_planet_positions_table("mars", time_spec)
+        longitudes = table[Quantity.ECLIPTIC_LONGITUDE]  # float64 array
+        position = table.positions[table.julian_dates[0]]  # dictionary form
+    """
+
+    def __init__(
+        self,
+        julian_dates: npt.ArrayLike,
+        columns: Mapping[Quantity, Union[Sequence[Any], npt.NDArray[Any]]],
+    ):
+        """
+        Create a table, sorting the rows by Julian date if needed.
+
+        Args:
+            julian_dates: The Julian date of each row
+            columns: One column of values per quantity, each with a value per row
+
+        Raises:
+            ValueError: If the Julian dates are not one-dimensional, or a
+                column's length differs from theirs
+        """
+        jd_array = np.array(julian_dates, dtype=np.float64)
+        if jd_array.ndim != 1:
+            raise ValueError("Julian dates must be one-dimensional")
+
+        order = None
+        if jd_array.size > 1 and np.any(jd_array[1:] < jd_array[:-1]):
+            order = np.argsort(jd_array, kind="stable")
+            jd_array = jd_array[order]
+        jd_array.setflags(write=False)
+
+        table_columns: Dict[Quantity, npt.NDArray[Any]] = {}
+        for quantity, values in columns.items():
+            if not isinstance(values, np.ndarray):
+                column = _column(quantity, list(values))
+            elif quantity in NON_NUMERIC_QUANTITIES:
+                column = values.astype(object)
+            else:
+                column = np.array(values)
+            if column.shape != jd_array.shape:
+                raise ValueError(
+                    f"Column {quantity.name} has {column.size} values "
+                    f"for {jd_array.size} Julian dates"
+                )
+            if order is not None:
+                column = column[order]
+            column.setflags(write=False)
+            table_columns[quantity] = column
+
+        self.julian_dates: npt.NDArray[np.float64] = jd_array
+        self.columns: Mapping[Quantity, npt.NDArray[Any]] = MappingProxyType(
+            table_columns
+        )
+
+    @classmethod
+    def from_positions(
+        cls, positions: Mapping[float, Mapping[Quantity, Any]]
+    ) -> "PositionTable":
+        """
+        Build a table from the dictionary form returned by get_planet_positions.
+
+        Args:
+            positions: A dictionary mapping Julian dates to position data dictionaries
+
+        Returns:
+            The table, with a column for every quantity found in any position
+        """
+        julian_dates = list(positions)
+        quantities: Dict[Quantity, None] = {}
+        for position in positions.values():
+            quantities.update(dict.fromkeys(position))
+        columns = {
+            quantity: _column(
+                quantity, [positions[jd].get(quantity) for jd in julian_dates]
+            )
+            for quantity in quantities
+        }
+        return cls(julian_dates, columns)
+
+    @classmethod
+    def from_rows(
+        cls,
+        julian_dates: Sequence[float],
+        rows: Sequence[Mapping[Quantity, Any]],
+    ) -> "PositionTable":
+        """
+        Build a table from parallel lists of Julian dates and position rows.
+
+        Unlike from_positions, repeated Julian dates are kept.
+
+        Args:
+            julian_dates: The Julian date of each row
+            rows: A dictionary of quantities for each row
+
+        Returns:
+            The table, with a column for every quantity found in any row
+        """
+        quantities: Dict[Quantity, None] = {}
+        for row in rows:
+            quantities.update(dict.fromkeys(row))
+        columns = {
+            quantity: _column(quantity, [row.get(quantity) for row in rows])
+            for quantity in quantities
+        }
+        return cls(julian_dates, columns)
+
+    @property
+    def quantities(self) -> List[Quantity]:
+        """The quantities with a column in the table."""
+        return list(self.columns)
+
+    @property
+    def positions(self) -> "PositionsView":
+        """A read-only view of the table in the get_planet_positions form."""
+        return PositionsView(self)
+
+    def __len__(self) -> int:
+        """Get the number of rows."""
+        return int(self.julian_dates.size)
+
+    def __getitem__(self, quantity: Quantity) -> npt.NDArray[Any]:
+        """
+        Get a quantity's column.
+
+        Args:
+            quantity: The quantity
+
+        Returns:
+            The column, aligned with julian_dates
+
+        Raises:
+            KeyError: If the table has no column for the quantity
+        """
+        return self.columns[quantity]
+
+    def __contains__(self, quantity: object) -> bool:
+        """Check whether the table has a column for a quantity."""
+        return quantity in self.columns
+
+    def row(self, index: int) -> Dict[Quantity, Any]:
+        """
+        Get one row as a position data dictionary.
+
+        Args:
+            index: The row's index
+
+        Returns:
+            A dictionary mapping each quantity to its value in the row
+        """
+        row: Dict[Quantity, Any] = {}
+        for quantity, column in self.columns.items():
+            value = column[index]
+            # Return plain Python floats rather than NumPy scalars
+            row[quantity] = value.item() if isinstance(value, np.generic) else value
+        return row
+
+    def to_dict(self) -> Dict[float, Dict[Quantity, Any]]:
+        """
+        Convert the table to the dictionary form returned by get_planet_positions.
+
+        Returns:
+            A dictionary mapping Julian dates to position data dictionaries,
+            holding the first row at each date as in the positions view
+        """
+        result: Dict[float, Dict[Quantity, Any]] = {}
+        for index, jd in enumerate(self.julian_dates.tolist()):
+            if jd not in result:
+                result[jd] = self.row(index)
+        return result
+
+    def __repr__(self) -> str:
+        """Get a short description of the table."""
+        names = ", ".join(quantity.name for quantity in self.columns)
+        return f"PositionTable({len(self)} rows: {names})"
+
+
+class PositionsView(Mapping[float, Dict[Quantity, Any]]):
+    """
+    Read-only mapping view of a PositionTable.
+
+    Behaves like the dictionary returned by get_planet_positions, in Julian
+    date order. Rows are built on access, so the view costs nothing until used.
+    """
+
+    def __init__(self, table: PositionTable):
+        """
+        Create a view of a table.
+
+        Args:
+            table: The table to view
+        """
+        self._table = table
+
+    def __getitem__(self, jd: float) -> Dict[Quantity, Any]:
+        """
+        Get the position at a Julian date.
+
+        Args:
+            jd: The Julian date, which must match a row exactly
+
+        Returns:
+            The position data dictionary for the first row at that date
+
+        Raises:
+            KeyError: If no row has that Julian date
+        """
+        julian_dates = self._table.julian_dates
+        try:
+            index = int(np.searchsorted(julian_dates, jd))
+        except TypeError:
+            raise KeyError(jd) from None
+        if index >= julian_dates.size or julian_dates[index] != jd:
+            raise KeyError(jd)
+        return self._table.row(index)
+
+    def __iter__(self) -> Iterator[float]:
+        """Iterate over the distinct Julian dates in order."""
+        previous = None
+        for jd in self._table.julian_dates.tolist():
+            if jd != previous:
+                yield jd
+            previous = jd
+
+    def __len__(self) -> int:
+        """Get the number of distinct Julian dates."""
+        julian_dates = self._table.julian_dates
+        if julian_dates.size == 0:
+            return 0
+        return int(np.count_nonzero(julian_dates[1:] != julian_dates[:-1])) + 1
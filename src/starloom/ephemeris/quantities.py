@@ -81,6 +81,15 @@ def normalize_column_name(key: str) -> str:
     return re.sub(r"_+", "_", key.strip())
 
 
+# Set of quantities whose values are labels or codes rather than numbers,
+# even when they look numeric (such as the body ID "499")
+NON_NUMERIC_QUANTITIES = {
+    Quantity.BODY,
+    Quantity.DATE_TIME,
+    Quantity.SOLAR_PRESENCE_CONDITION_CODE,
+    Quantity.TARGET_EVENT_MARKER,
+}
+
 # Set of quantities that represent angles (in degrees)
 ANGLE_QUANTITIES = {
     Quantity.RIGHT_ASCENSION,
@@ -1,8 +1,11 @@
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Optional, Union
+from typing import Iterator, List, Optional, Sequence, Tuple, Union, cast
 from enum import Enum
 
+import numpy as np
+import numpy.typing as npt
+
 
 class TimeSpecType(Enum):
     RANGE = "RANGE"  # start/stop/step
@@ -146,19 +149,12 @@ class TimeSpec:
         """
         return cls(start_time=start, stop_time=stop, step_size=step)
 
-    def to_julian_days(self) -> List[float]:
-        """
-        Convert the TimeSpec to a list of Julian dates.
+    def _step_delta(self) -> timedelta:
+        """Parse the step size into a timedelta.
 
-        Returns:
-            A list of Julian dates.
+        Raises:
+            ValueError: If the step size format is invalid
         """
-        if self.start_time is None or self.stop_time is None or self.step_size is None:
-            raise ValueError("TimeSpec is not fully specified")
-
-        from ..space_time.julian import julian_from_datetime, julian_to_datetime
-
-        # Parse step size
         if not self.step_size or len(self.step_size) < 2:
             raise ValueError("Invalid step size format. Must be like '1d', '1h', '30m'")
 
@@ -173,6 +169,30 @@ class TimeSpec:
 
         unit = self.step_size[-1].lower()
 
+        # Calculate step size in timedelta
+        if unit == "d":
+            return timedelta(days=value)
+        elif unit == "h":
+            return timedelta(hours=value)
+        elif unit == "m":
+            return timedelta(minutes=value)
+        raise ValueError(
+            "Step size must end with 'd' (days), 'h' (hours), or 'm' (minutes)"
+        )
+
+    def _range_datetimes(self) -> Tuple[datetime, datetime, timedelta]:
+        """Get the start, stop and step of a range as datetimes.
+
+        Raises:
+            ValueError: If the range is incomplete or the step size is invalid
+        """
+        if self.start_time is None or self.stop_time is None or self.step_size is None:
+            raise ValueError("TimeSpec is not fully specified")
+
+        from ..space_time.julian import julian_to_datetime
+
+        delta = self._step_delta()
+
         # Convert both time points to datetime objects for consistent handling
         start_dt = (
             self.start_time
@@ -185,18 +205,18 @@ class TimeSpec:
             if isinstance(self.stop_time, datetime)
             else julian_to_datetime(float(self.stop_time))
         )
+        return start_dt, stop_dt, delta
 
-        # Calculate step size in timedelta
-        if unit == "d":
-            delta = timedelta(days=value)
-        elif unit == "h":
-            delta = timedelta(hours=value)
-        elif unit == "m":
-            delta = timedelta(minutes=value)
-        else:
-            raise ValueError(
-                "Step size must end with 'd' (days), 'h' (hours), or 'm' (minutes)"
-            )
+    def to_julian_days(self) -> List[float]:
+        """
+        Convert the TimeSpec to a list of Julian dates.
+
+        Returns:
+            A list of Julian dates.
+        """
+        from ..space_time.julian import julian_from_datetime
+
+        start_dt, stop_dt, delta = self._range_datetimes()
 
         # Generate Julian dates
         julian_days: List[float] = []
@@ -206,3 +226,139 @@ class TimeSpec:
             current += delta
 
         return julian_days
+
+    def to_julian_array(self) -> npt.NDArray[np.float64]:
+        """
+        Convert the TimeSpec to an array of Julian dates.
+
+        Ranges are generated with datetime64 arithmetic instead of stepping a
+        datetime, and give exactly the same values as to_julian_days. Date
+        lists are converted element by element.
+
+        Returns:
+            Array of Julian dates, in order
+
+        Raises:
+            ValueError: If the TimeSpec is incomplete or the step size is invalid
+        """
+        if self.dates is not None:
+            return self._dates_julian_array(self.dates)
+
+        start, step, count = self._range_datetime64()
+        return self._range_julian_array(start, step, 0, count)
+
+    def iter_julian_arrays(self, chunk_size: int) -> Iterator[npt.NDArray[np.float64]]:
+        """
+        Iterate over the TimeSpec's Julian dates in arrays of at most chunk_size.
+
+        The concatenated chunks equal to_julian_array, but only one chunk is
+        in memory at a time, so arbitrarily long ranges can be streamed.
+
+        Args:
+            chunk_size: Maximum number of dates per array
+
+        Yields:
+            Arrays of Julian dates, in order
+
+        Raises:
+            ValueError: If chunk_size is not positive, or the TimeSpec is
+                incomplete or the step size is invalid
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+
+        if self.dates is not None:
+            for first in range(0, len(self.dates), chunk_size):
+                yield self._dates_julian_array(self.dates[first : first + chunk_size])
+            return
+
+        start, step, count = self._range_datetime64()
+        for first in range(0, count, chunk_size):
+            yield self._range_julian_array(
+                start, step, first, min(first + chunk_size, count)
+            )
+
+    def split(self, boundaries: Sequence[datetime]) -> List["TimeSpec"]:
+        """
+        Split a range into consecutive ranges at the given datetimes.
+
+        Each part holds the range's points from one boundary up to, but not
+        including, the next, so concatenating the parts' to_julian_array
+        gives exactly this range's. Parts without points are dropped.
+
+        Args:
+            boundaries: Datetimes to split at, in increasing order
+
+        Returns:
+            The non-empty parts, in order
+
+        Raises:
+            ValueError: If the TimeSpec is not a complete range or the step
+                size is invalid
+        """
+        from ..space_time.pythonic_datetimes import ensure_utc
+
+        start_dt, stop_dt, delta = self._range_datetimes()
+        start_dt, stop_dt = ensure_utc(start_dt), ensure_utc(stop_dt)
+        if stop_dt < start_dt:
+            return []
+        count = (stop_dt - start_dt) // delta + 1
+
+        # Index of the first point at or after each boundary
+        splits = [
+            min(max(-((start_dt - ensure_utc(boundary)) // delta), 0), count)
+            for boundary in boundaries
+        ]
+        edges = [0] + splits + [count]
+
+        parts: List[TimeSpec] = []
+        for first, stop in zip(edges, edges[1:]):
+            if stop > first:
+                parts.append(
+                    TimeSpec.from_range(
+                        start_dt + first * delta,
+                        start_dt + (stop - 1) * delta,
+                        cast(str, self.step_size),
+                    )
+                )
+        return parts
+
+    @staticmethod
+    def _dates_julian_array(
+        dates: List[Union[datetime, float]],
+    ) -> npt.NDArray[np.float64]:
+        """Convert a list of datetimes and Julian dates to an array."""
+        from ..space_time.julian import julian_from_datetime
+
+        return np.array(
+            [
+                julian_from_datetime(date) if isinstance(date, datetime) else date
+                for date in dates
+            ],
+            dtype=np.float64,
+        )
+
+    def _range_datetime64(self) -> Tuple[np.datetime64, np.timedelta64, int]:
+        """Get the start, step and number of points of a range as datetime64.
+
+        Raises:
+            ValueError: If the range is incomplete or the step size is invalid
+        """
+        from ..space_time.pythonic_datetimes import ensure_utc
+
+        start_dt, stop_dt, delta = self._range_datetimes()
+        start = np.datetime64(ensure_utc(start_dt).replace(tzinfo=None), "us")
+        stop = np.datetime64(ensure_utc(stop_dt).replace(tzinfo=None), "us")
+        step = np.timedelta64(delta // timedelta(microseconds=1), "us")
+        if stop < start:
+            return start, step, 0
+        return start, step, int((stop - start) // step) + 1
+
+    @staticmethod
+    def _range_julian_array(
+        start: np.datetime64, step: np.timedelta64, first: int, last: int
+    ) -> npt.NDArray[np.float64]:
+        """Get the Julian dates of points first to last (exclusive) of a range."""
+        from ..space_time.julian_calc import datetime64_to_julian
+
+        return datetime64_to_julian(start + np.arange(first, last) * step)
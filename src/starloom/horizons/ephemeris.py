@@ -1,7 +1,8 @@
-from typing import Dict, Optional, Any, Union, List, overload
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Any, Union, List, Sequence, overload
 from datetime import datetime, timezone
 
-from starloom.ephemeris import Ephemeris, Quantity
+from starloom.ephemeris import Ephemeris, PositionTable, Quantity
 from .request import HorizonsRequest
 from ..planet import Planet
 from .location import Location
@@ -24,6 +25,9 @@ class HorizonsEphemeris(Ephemeris):
     planetary positions.
     """
 
+    # Upper bound on simultaneous requests made by get_bodies_positions
+    MAX_CONCURRENT_REQUESTS = 4
+
     def __init__(self) -> None:
         """Initialize a HorizonsEphemeris instance."""
         # Define the standard quantities we'll request from Horizons
@@ -130,6 +134,75 @@ class HorizonsEphemeris(Ephemeris):
             - Quantity.ECLIPTIC_LATITUDE
             - Quantity.DELTA (distance from Earth)
         """
+        parser = self._request_positions(planet, time_spec, location)
+        data_points = parser.parse()
+
+        if not data_points:
+            raise ValueError(f"No data returned from Horizons for planet {planet}")
+
+        # Convert each data point to the required format
+        result: Dict[float, Dict[Quantity, Any]] = {}
+        for jd, values in data_points:
+            position_data: Dict[Quantity, Any] = {}
+            for ephemeris_quantity, value in values.items():
+                try:
+                    # Convert the quantity enum and add to the result
+                    standard_quantity = EphemerisQuantityToQuantity[ephemeris_quantity]
+                    position_data[standard_quantity] = self._convert_value(
+                        value, standard_quantity
+                    )
+                except KeyError:
+                    # Skip quantities that don't have a mapping
+                    continue
+            result[jd] = position_data
+
+        return result
+
+    def get_planet_positions_table(
+        self,
+        planet: str,
+        time_spec: TimeSpec,
+        location: Optional[Union[Location, str]] = None,
+    ) -> PositionTable:
+        """
+        Get a planet's positions for multiple times as a columnar table.
+
+        The response is parsed straight into columns (see
+        ObserverParser.parse_table), so numeric quantities are float64 arrays.
+
+        Args:
+            planet: The name or identifier of the planet.
+                   Can be a Planet enum value, enum name, or the Horizons ID string.
+            time_spec: TimeSpec object defining the times to get positions for.
+            location: Optional observer location. If None, geocentric coordinates are used.
+
+        Returns:
+            A PositionTable with the quantities returned by Horizons.
+
+        Raises:
+            ValueError: If Horizons returns no data for the planet.
+        """
+        table = self._request_positions(planet, time_spec, location).parse_table()
+        if len(table) == 0:
+            raise ValueError(f"No data returned from Horizons for planet {planet}")
+        return table
+
+    def _request_positions(
+        self,
+        planet: str,
+        time_spec: TimeSpec,
+        location: Optional[Union[Location, str]],
+    ) -> ObserverParser:
+        """Request a planet's positions from Horizons.
+
+        Args:
+            planet: The name or identifier of the planet.
+            time_spec: TimeSpec object defining the times to get positions for.
+            location: Optional observer location. If None, geocentric coordinates are used.
+
+        Returns:
+            A parser for the response
+        """
         # Determine the planet ID for the request
         planet_id = self._get_planet_id(planet)
 
@@ -150,29 +223,45 @@ class HorizonsEphemeris(Ephemeris):
         response = request.make_request()
 
         # Parse the response
-        parser = ObserverParser(response)
-        data_points = parser.parse()
+        return ObserverParser(response)
 
-        if not data_points:
-            raise ValueError(f"No data returned from Horizons for planet {planet}")
+    def get_bodies_positions(
+        self,
+        planets: Sequence[str],
+        time_spec: TimeSpec,
+        location: Optional[Union[Location, str]] = None,
+    ) -> Dict[str, Dict[float, Dict[Quantity, Any]]]:
+        """
+        Get several planets' positions for multiple times defined by a TimeSpec.
 
-        # Convert each data point to the required format
-        result: Dict[float, Dict[Quantity, Any]] = {}
-        for jd, values in data_points:
-            position_data: Dict[Quantity, Any] = {}
-            for ephemeris_quantity, value in values.items():
-                try:
-                    # Convert the quantity enum and add to the result
-                    standard_quantity = EphemerisQuantityToQuantity[ephemeris_quantity]
-                    position_data[standard_quantity] = self._convert_value(
-                        value, standard_quantity
-                    )
-                except KeyError:
-                    # Skip quantities that don't have a mapping
-                    continue
-            result[jd] = position_data
+        Horizons takes one target per request, so the requests are made
+        concurrently, at most MAX_CONCURRENT_REQUESTS at a time.
 
-        return result
+        Args:
+            planets: The names or identifiers of the planets.
+            time_spec: TimeSpec object defining the times to get positions for.
+            location: Optional observer location. If None, geocentric coordinates are used.
+
+        Returns:
+            A dictionary mapping each planet, as given, to the result of
+            get_planet_positions for it.
+
+        Raises:
+            ValueError: If Horizons returns no data for a planet.
+        """
+        unique_planets = list(dict.fromkeys(planets))
+        if not unique_planets:
+            return {}
+
+        workers = min(self.MAX_CONCURRENT_REQUESTS, len(unique_planets))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                planet: executor.submit(
+                    self.get_planet_positions, planet, time_spec, location
+                )
+                for planet in unique_planets
+            }
+            return {planet: future.result() for planet, future in futures.items()}
 
     @overload
     def _get_planet_id(self, planet: Planet) -> str: ...
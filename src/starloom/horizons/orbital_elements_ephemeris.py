@@ -8,7 +8,7 @@ calculated astronomical points like lunar nodes.
 from typing import Dict, Optional, Any, Union
 from datetime import datetime, timezone
 
-from starloom.ephemeris import Ephemeris, Quantity
+from starloom.ephemeris import Ephemeris, PositionTable, Quantity
 from .location import Location
 from .time_spec import TimeSpec
 
@@ -209,3 +209,50 @@ class OrbitalElementsEphemeris(Ephemeris):
             result[jd] = position_data
 
         return result
+
+    def get_planet_positions_table(
+        self,
+        planet: str,
+        time_spec: TimeSpec,
+        location: Optional[Union[Location, str]] = None,
+    ) -> PositionTable:
+        """Get orbital elements for multiple times as a columnar table.
+
+        Args:
+            planet: The planet identifier (Horizons ID).
+            time_spec: TimeSpec defining the times to get positions for.
+            location: Optional parameter, ignored for orbital elements
+                     (kept for interface compatibility).
+
+        Returns:
+            PositionTable with a column per orbital element.
+
+        Raises:
+            ValueError: If no data returned from Horizons.
+        """
+        from .request import HorizonsRequest
+        from .ephem_type import EphemType
+        from .parsers.orbital_elements_parser import ElementsParser
+        from .time_spec_param import HorizonsTimeSpecParam
+
+        # Create and execute request
+        request = HorizonsRequest(
+            planet=planet,
+            location=None,  # Not used for orbital elements
+            quantities=None,  # Not used for ELEMENTS type
+            time_spec=time_spec,
+            time_spec_param=HorizonsTimeSpecParam(time_spec),
+            ephem_type=EphemType.ELEMENTS,
+            center=self.center,
+            use_julian=True,
+        )
+
+        response = request.make_request()
+
+        # Parse the response straight into columns
+        table = ElementsParser(response).parse_table()
+
+        if len(table) == 0:
+            raise ValueError(f"No data returned from Horizons for planet {planet}")
+
+        return table
@@ -5,7 +5,9 @@ The parser can handle different column formats and dynamically maps column names
 """
 
 import csv
-from typing import List, Tuple, Dict, Optional
+from typing import Any, List, Tuple, Dict, Optional
+
+from starloom.ephemeris import PositionTable, Quantity
 from starloom.horizons.quantities import (
     EphemerisQuantity,
     QuantityForColumnName,
@@ -224,6 +226,31 @@ class ObserverParser:
 
         return data
 
+    def parse_table(self) -> PositionTable:
+        """Parse response into a PositionTable keyed by standard Quantity values.
+
+        Columns are built directly from the parsed rows. Columns whose values
+        are all numeric become float64 arrays; others keep their strings.
+        Quantities without a standard Quantity mapping are left out.
+
+        Returns:
+            PositionTable with a row per data point
+        """
+        data = self.parse()
+        quantities: Dict[EphemerisQuantity, Quantity] = {}
+        for _, values in data:
+            for ephemeris_quantity in values:
+                if ephemeris_quantity in EphemerisQuantityToQuantity:
+                    quantities[ephemeris_quantity] = EphemerisQuantityToQuantity[
+                        ephemeris_quantity
+                    ]
+
+        columns: Dict[Quantity, List[Any]] = {
+            quantity: [values.get(ephemeris_quantity) for _, values in data]
+            for ephemeris_quantity, quantity in quantities.items()
+        }
+        return PositionTable([jd for jd, _ in data], columns)
+
     def get_value(self, quantity: EphemerisQuantity) -> str:
         """Get value for a specific quantity from the first data point.
 
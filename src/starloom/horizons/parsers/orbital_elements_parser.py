@@ -5,9 +5,11 @@ The parser handles the standard column format for orbital elements.
 """
 
 import csv
-from typing import List, Tuple, Dict, Optional, TypeVar
+from typing import Any, List, Tuple, Dict, Optional, TypeVar
 from enum import Enum
 
+from starloom.ephemeris import PositionTable, Quantity
+
 T = TypeVar("T")
 
 
@@ -179,6 +181,34 @@ class ElementsParser:
 
         return data
 
+    def parse_table(self) -> PositionTable:
+        """Parse response into a PositionTable keyed by standard Quantity values.
+
+        Columns are built directly from the parsed rows. Columns whose values
+        are all numeric become float64 arrays; others keep their strings.
+        Elements without a standard Quantity mapping are left out.
+
+        Returns:
+            PositionTable with a row per data point
+        """
+        # Imported here because the mapping module imports this one
+        from ..quantities import OrbitalElementsQuantityToQuantity
+
+        data = self.parse()
+        quantities: Dict[OrbitalElementsQuantity, Quantity] = {}
+        for _, values in data:
+            for orbital_quantity in values:
+                if orbital_quantity in OrbitalElementsQuantityToQuantity:
+                    quantities[orbital_quantity] = OrbitalElementsQuantityToQuantity[
+                        orbital_quantity
+                    ]
+
+        columns: Dict[Quantity, List[Any]] = {
+            quantity: [values.get(orbital_quantity) for _, values in data]
+            for orbital_quantity, quantity in quantities.items()
+        }
+        return PositionTable([jd for jd, _ in data], columns)
+
     def get_value(self, quantity: OrbitalElementsQuantity) -> str:
         """Get value for a specific quantity from the first data point.
 
@@ -5,10 +5,11 @@ This module provides a local implementation of the Ephemeris interface
 that reads from locally stored SQLite files.
 """
 
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, Sequence, Union
 from datetime import datetime
 
 from ..ephemeris.ephemeris import Ephemeris
+from ..ephemeris.position_table import PositionTable
 from ..ephemeris.quantities import Quantity
 from ..ephemeris.time_spec import TimeSpec
 from .storage import LocalHorizonsStorage
@@ -79,3 +80,42 @@ class LocalHorizonsEphemeris(Ephemeris):
         """
         # Delegate to the storage class to retrieve data
         return self.storage.get_ephemeris_data_bulk(planet, time_spec)
+
+    def get_planet_positions_table(
+        self, planet: str, time_spec: TimeSpec
+    ) -> PositionTable:
+        """
+        Get a planet's positions for multiple times as a columnar table.
+
+        Args:
+            planet: The name or identifier of the planet.
+            time_spec: Time specification defining the times to retrieve positions for.
+
+        Returns:
+            A PositionTable with the same quantities as get_planet_positions.
+
+            Note: Times not found in the database will be omitted from the table.
+        """
+        # Delegate to the storage class to retrieve data
+        return self.storage.get_ephemeris_data_table(planet, time_spec)
+
+    def get_bodies_positions(
+        self, planets: Sequence[str], time_spec: TimeSpec
+    ) -> Dict[str, Dict[float, Dict[Quantity, Any]]]:
+        """
+        Get several planets' positions for the times specified by a TimeSpec.
+
+        All planets are read from the local database with a single query.
+
+        Args:
+            planets: The names or identifiers of the planets.
+            time_spec: Time specification defining the times to retrieve positions for.
+
+        Returns:
+            A dictionary mapping each planet to a dictionary of Julian dates to
+            position data dictionaries, as returned by get_planet_positions.
+
+            Note: Times not found in the database will be omitted from the result dictionary.
+        """
+        # Delegate to the storage class to retrieve data
+        return self.storage.get_ephemeris_data_bulk_bodies(planets, time_spec)
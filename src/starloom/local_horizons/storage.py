@@ -6,12 +6,13 @@ This module provides functions for storing and retrieving ephemeris data locally
 
 import os
 from pathlib import Path
-from typing import Dict, Any, List, Union, Optional
+from typing import Dict, Any, List, Sequence, Union, Optional
 from datetime import datetime
 
-from sqlalchemy import create_engine, select, and_, tuple_, inspect, text
+from sqlalchemy import Select, create_engine, select, and_, tuple_, inspect, text
 from sqlalchemy.orm import Session
 
+from ..ephemeris.position_table import PositionTable
 from ..ephemeris.quantities import Quantity
 from ..ephemeris.time_spec import TimeSpec
 from ..space_time.julian import (
@@ -22,6 +23,32 @@ from ..space_time.julian import (
 from .models.horizons_ephemeris_row import HorizonsGlobalEphemerisRow, Base
 
 
+# Quantities read from a database row, with the row attribute holding each
+_ROW_COLUMNS = (
+    (Quantity.DATE_TIME, "date_time"),
+    (Quantity.RIGHT_ASCENSION, "right_ascension"),
+    (Quantity.DECLINATION, "declination"),
+    (Quantity.ECLIPTIC_LONGITUDE, "ecliptic_longitude"),
+    (Quantity.ECLIPTIC_LATITUDE, "ecliptic_latitude"),
+    (Quantity.APPARENT_MAGNITUDE, "apparent_magnitude"),
+    (Quantity.SURFACE_BRIGHTNESS, "surface_brightness"),
+    (Quantity.ILLUMINATION, "illumination"),
+    (Quantity.OBSERVER_SUB_LON, "observer_sub_lon"),
+    (Quantity.OBSERVER_SUB_LAT, "observer_sub_lat"),
+    (Quantity.SUN_SUB_LON, "sun_sub_lon"),
+    (Quantity.SUN_SUB_LAT, "sun_sub_lat"),
+    (Quantity.SOLAR_NORTH_ANGLE, "solar_north_angle"),
+    (Quantity.SOLAR_NORTH_DISTANCE, "solar_north_distance"),
+    (Quantity.NORTH_POLE_ANGLE, "north_pole_angle"),
+    (Quantity.NORTH_POLE_DISTANCE, "north_pole_distance"),
+    (Quantity.DELTA, "delta"),
+    (Quantity.DELTA_DOT, "delta_dot"),
+    (Quantity.PHASE_ANGLE, "phase_angle"),
+    (Quantity.PHASE_ANGLE_BISECTOR_LON, "phase_angle_bisector_lon"),
+    (Quantity.PHASE_ANGLE_BISECTOR_LAT, "phase_angle_bisector_lat"),
+)
+
+
 class LocalHorizonsStorage:
     """
     Storage manager for local horizons ephemeris data.
@@ -111,6 +138,91 @@ class LocalHorizonsStorage:
             A dictionary mapping Julian dates (as floats) to dictionaries of quantities.
             Times not found in the database are omitted from the result.
         """
+        return self.get_ephemeris_data_bulk_bodies([body], time_spec)[body]
+
+    def get_ephemeris_data_bulk_bodies(
+        self, bodies: Sequence[str], time_spec: TimeSpec
+    ) -> Dict[str, Dict[float, Dict[Quantity, Any]]]:
+        """
+        Get ephemeris data for several celestial bodies at multiple time points.
+
+        All bodies are read with a single query, using body IN (...) together
+        with the tuple-based time lookup of get_ephemeris_data_bulk.
+
+        Args:
+            bodies: The names or identifiers of the celestial bodies.
+            time_spec: Time specification defining the times to retrieve data for.
+
+        Returns:
+            A dictionary mapping each body to a dictionary mapping Julian dates
+            (as floats) to dictionaries of quantities. Times not found in the
+            database are omitted, and bodies with no data map to an empty dictionary.
+        """
+        with Session(self.engine) as session:
+            # Execute query and process results
+            query = self._bulk_query(bodies, time_spec)
+            results = session.execute(query).scalars().all()
+
+            # Convert results to the required format
+            output: Dict[str, Dict[float, Dict[Quantity, Any]]] = {
+                body: {} for body in bodies
+            }
+            for result in results:
+                # Round to 9 decimal places for consistent precision
+                jd = round(result.julian_date + result.julian_date_fraction, 9)
+                output[str(result.body)][jd] = self._row_quantities(result, jd)
+
+            return output
+
+    def get_ephemeris_data_table(self, body: str, time_spec: TimeSpec) -> PositionTable:
+        """
+        Get ephemeris data for a celestial body at multiple time points as a table.
+
+        This runs the same query as get_ephemeris_data_bulk, but fills the
+        table's columns straight from the rows instead of building a
+        dictionary per time point.
+
+        Args:
+            body: The name or identifier of the celestial body.
+            time_spec: Time specification defining the times to retrieve data for.
+
+        Returns:
+            A PositionTable with a row per time point found in the database,
+            and the same quantities as get_ephemeris_data_bulk. Times not
+            found in the database are omitted.
+        """
+        with Session(self.engine) as session:
+            query = self._bulk_query([body], time_spec)
+            rows = session.execute(query).scalars().all()
+
+            # Round to 9 decimal places for consistent precision
+            julian_dates = [
+                round(row.julian_date + row.julian_date_fraction, 9) for row in rows
+            ]
+            columns: Dict[Quantity, List[Any]] = {
+                Quantity.BODY: [row.body for row in rows],
+                Quantity.JULIAN_DATE: julian_dates,
+            }
+            for quantity, attribute in _ROW_COLUMNS:
+                columns[quantity] = [getattr(row, attribute) for row in rows]
+
+            return PositionTable(julian_dates, columns)
+
+    @staticmethod
+    def _bulk_query(bodies: Sequence[str], time_spec: TimeSpec) -> Select[Any]:
+        """
+        Build the query for several bodies at the time points of a TimeSpec.
+
+        The query uses body IN (...) and a tuple-based IN on the Julian date
+        components, which is served by the idx_julian_lookup index.
+
+        Args:
+            bodies: The names or identifiers of the celestial bodies.
+            time_spec: Time specification defining the times to retrieve data for.
+
+        Returns:
+            The query, selecting HorizonsGlobalEphemerisRow objects
+        """
         # Get all time points from the TimeSpec
         time_points = time_spec.get_time_points()
 
@@ -124,53 +236,38 @@ class LocalHorizonsStorage:
             (jd, round(jd_fraction, 9)) for jd, jd_fraction in julian_components
         ]
 
-        with Session(self.engine) as session:
-            # Build the query using IN operator with tuples
-            query = select(HorizonsGlobalEphemerisRow).where(
-                and_(
-                    HorizonsGlobalEphemerisRow.body == body,
-                    tuple_(
-                        HorizonsGlobalEphemerisRow.julian_date,
-                        HorizonsGlobalEphemerisRow.julian_date_fraction,
-                    ).in_(date_tuples),
-                )
+        # Build the query using IN operators for the bodies and time tuples
+        return select(HorizonsGlobalEphemerisRow).where(
+            and_(
+                HorizonsGlobalEphemerisRow.__table__.c.body.in_(list(bodies)),
+                tuple_(
+                    HorizonsGlobalEphemerisRow.julian_date,
+                    HorizonsGlobalEphemerisRow.julian_date_fraction,
+                ).in_(date_tuples),
             )
+        )
 
-            # Execute query and process results
-            results = session.execute(query).scalars().all()
+    @staticmethod
+    def _row_quantities(
+        result: HorizonsGlobalEphemerisRow, jd: float
+    ) -> Dict[Quantity, Any]:
+        """
+        Convert a database row to a dictionary of quantities.
 
-            # Convert results to the required format
-            output: Dict[float, Dict[Quantity, Any]] = {}
-            for result in results:
-                # Round to 9 decimal places for consistent precision
-                jd = round(result.julian_date + result.julian_date_fraction, 9)
-                output[jd] = {
-                    Quantity.BODY: result.body,
-                    Quantity.JULIAN_DATE: jd,
-                    Quantity.DATE_TIME: result.date_time,
-                    Quantity.RIGHT_ASCENSION: result.right_ascension,
-                    Quantity.DECLINATION: result.declination,
-                    Quantity.ECLIPTIC_LONGITUDE: result.ecliptic_longitude,
-                    Quantity.ECLIPTIC_LATITUDE: result.ecliptic_latitude,
-                    Quantity.APPARENT_MAGNITUDE: result.apparent_magnitude,
-                    Quantity.SURFACE_BRIGHTNESS: result.surface_brightness,
-                    Quantity.ILLUMINATION: result.illumination,
-                    Quantity.OBSERVER_SUB_LON: result.observer_sub_lon,
-                    Quantity.OBSERVER_SUB_LAT: result.observer_sub_lat,
-                    Quantity.SUN_SUB_LON: result.sun_sub_lon,
-                    Quantity.SUN_SUB_LAT: result.sun_sub_lat,
-                    Quantity.SOLAR_NORTH_ANGLE: result.solar_north_angle,
-                    Quantity.SOLAR_NORTH_DISTANCE: result.solar_north_distance,
-                    Quantity.NORTH_POLE_ANGLE: result.north_pole_angle,
-                    Quantity.NORTH_POLE_DISTANCE: result.north_pole_distance,
-                    Quantity.DELTA: result.delta,
-                    Quantity.DELTA_DOT: result.delta_dot,
-                    Quantity.PHASE_ANGLE: result.phase_angle,
-                    Quantity.PHASE_ANGLE_BISECTOR_LON: result.phase_angle_bisector_lon,
-                    Quantity.PHASE_ANGLE_BISECTOR_LAT: result.phase_angle_bisector_lat,
-                }
+        Args:
+            result: The row
+            jd: The row's Julian date
 
-            return output
+        Returns:
+            A dictionary mapping Quantity enum values to the row's values
+        """
+        quantities: Dict[Quantity, Any] = {
+            Quantity.BODY: result.body,
+            Quantity.JULIAN_DATE: jd,
+        }
+        for quantity, attribute in _ROW_COLUMNS:
+            quantities[quantity] = getattr(result, attribute)
+        return quantities
 
     def get_ephemeris_data(
         self, body: str, time: Optional[Union[float, datetime]] = None
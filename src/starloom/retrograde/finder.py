@@ -233,35 +233,6 @@ class RetrogradeFinder:
             left_jd = max(initial_guess - window_size, left_jd)
             right_jd = min(initial_guess + window_size, right_jd)
 
-            # Function to compute velocity at a given time
-            def compute_velocity(jd):
-                # Use 15-second interval for velocity calculation
-                time_delta = 15.0 / (24.0 * 60.0 * 60.0)
-
-                try:
-                    # Get three points for central difference
-                    time_spec = TimeSpec.from_dates(
-                        [jd - time_delta, jd, jd + time_delta]
-                    )
-                    pos_data = self.planet_ephemeris.get_planet_positions(
-                        self.planet.name, time_spec
-                    )
-
-                    # Extract longitudes
-                    lon_before = pos_data[jd - time_delta][Quantity.ECLIPTIC_LONGITUDE]
-                    lon_at = pos_data[jd][Quantity.ECLIPTIC_LONGITUDE]
-                    lon_after = pos_data[jd + time_delta][Quantity.ECLIPTIC_LONGITUDE]
-
-                    # Calculate velocity using central difference
-                    vel_before = angle_diff(lon_at, lon_before) / time_delta
-                    vel_after = angle_diff(lon_after, lon_at) / time_delta
-                    velocity = (vel_before + vel_after) / 2
-
-                    return velocity, lon_at
-                except Exception:
-                    # Fallback to linear interpolation between known points
-                    return 0.0, None
-
             # Use binary search with adaptive refinement
             iterations = 0
             max_iterations = 15  # Prevent infinite loop
@@ -272,13 +243,12 @@ class RetrogradeFinder:
                 iterations += 1
 
                 mid_jd = (left_jd + right_jd) / 2
-                mid_vel, mid_lon = compute_velocity(mid_jd)
+                mid_vel = self._calculate_exact_angular_rate(mid_jd, self.planet.name)
 
                 # Track best point found so far
                 if abs(mid_vel) < abs(best_vel):
                     best_jd = mid_jd
                     best_vel = mid_vel
-                    best_lon = mid_lon
 
                 # Narrow search window based on velocity sign
                 if (find_pos_to_neg and mid_vel > 0) or (
@@ -294,11 +264,7 @@ class RetrogradeFinder:
 
             # Final result - use best point found
             cross_jd = best_jd
-            cross_lon = (
-                best_lon
-                if best_lon is not None
-                else self._get_position_at_time(best_jd)
-            )
+            cross_lon = self._get_position_at_time(best_jd)
 
             # If we still don't have longitude, interpolate
             if cross_lon is None:
@@ -402,7 +368,8 @@ class RetrogradeFinder:
     ) -> float:
         """Calculate the exact angular rate (degrees/day) of a planet at specific time.
 
-        Uses high-precision differential to get accurate velocity at a specific instant.
+        Uses the ephemeris' get_planet_rates, which is analytic for weft data and
+        a central difference for other ephemerides.
 
         Args:
             jd: Julian date to calculate velocity at
@@ -412,32 +379,13 @@ class RetrogradeFinder:
         Returns:
             Angular rate in degrees per day
         """
-        # Use a small time step for accurate differentiation (15 seconds)
-        time_delta = 15.0 / (24.0 * 60.0 * 60.0)  # 15 seconds in days
-
-        # Get positions just before and after the time point
-        jd_before = jd - time_delta
-        jd_after = jd + time_delta
-
         try:
             # Choose the appropriate ephemeris
             ephemeris = self.sun_ephemeris if is_sun else self.planet_ephemeris
 
-            # Get positions at three points
-            time_spec = TimeSpec.from_dates([jd_before, jd, jd_after])
-            positions = ephemeris.get_planet_positions(planet_name, time_spec)
-
-            # Extract longitudes
-            lon_before = positions[jd_before][Quantity.ECLIPTIC_LONGITUDE]
-            lon_at = positions[jd][Quantity.ECLIPTIC_LONGITUDE]
-            lon_after = positions[jd_after][Quantity.ECLIPTIC_LONGITUDE]
-
-            # Calculate rates of change
-            rate_before = angle_diff(lon_at, lon_before) / time_delta
-            rate_after = angle_diff(lon_after, lon_at) / time_delta
-
-            # Average for better accuracy (central difference)
-            return (rate_before + rate_after) / 2
+            time_spec = TimeSpec.from_dates([jd])
+            rates = ephemeris.get_planet_rates(planet_name, time_spec)
+            return float(rates[jd][Quantity.ECLIPTIC_LONGITUDE])
         except Exception as e:
             logging.debug(f"Error calculating angular rate: {e}")
             return 0.0
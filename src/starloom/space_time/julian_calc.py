@@ -8,6 +8,9 @@ Only supports dates after 1583 (Gregorian calendar adoption).
 from datetime import datetime, timezone
 from typing import Union
 
+import numpy as np
+import numpy.typing as npt
+
 # Precision for Julian dates (microsecond precision = 12 decimal places)
 JD_PRECISION = 12
 
@@ -122,6 +125,35 @@ def datetime_to_julian(dt: datetime) -> float:
     return round(jd, JD_PRECISION)
 
 
+def datetime64_to_julian(values: npt.ArrayLike) -> npt.NDArray[np.float64]:
+    """Convert an array of numpy datetime64 values to Julian Dates.
+
+    This is the vectorized counterpart of datetime_to_julian. Naive datetime64
+    values are interpreted as UTC and truncated to microsecond resolution, and
+    the arithmetic mirrors datetime_to_julian so that both functions return
+    identical floats for the same instant.
+
+    Args:
+        values: Array-like of datetime64 values
+
+    Returns:
+        Array of Julian Dates with the same shape as the input
+    """
+    micros = np.asarray(values, dtype="datetime64[us]").astype(np.int64)
+
+    # Split into whole days since the Unix epoch and microseconds into the day
+    days, micro_of_day = np.divmod(micros, 86_400_000_000)
+    seconds_of_day, microsecond = np.divmod(micro_of_day, 1_000_000)
+
+    # 1970-01-01 is Julian Day Number 2440588
+    jdn = days + 2440588
+
+    # Same operation order as _day_fraction and jdn_to_julian_date
+    total_seconds = seconds_of_day + microsecond / 1_000_000
+    day_fraction = total_seconds / 86400
+    return (jdn - 0.5) + day_fraction
+
+
 def julian_to_datetime(jd: Union[float, datetime]) -> datetime:
     """Convert a Julian Date to a datetime object using Meeus algorithm.
 
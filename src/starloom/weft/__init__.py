@@ -16,8 +16,9 @@ from .weft_file import (
 )
 
 from .weft_reader import WeftReader
+from .parallel import parallel_get_values
 from .weft_writer import WeftWriter
-from .ephemeris_weft_generator import generate_weft_file
+from .ephemeris_weft_generator import generate_weft_file, generate_weft_files
 
 __all__ = [
     "WeftFile",
@@ -28,6 +29,8 @@ __all__ = [
     "evaluate_chebyshev",
     "unwrap_angles",
     "WeftReader",
+    "parallel_get_values",
     "WeftWriter",
     "generate_weft_file",
+    "generate_weft_files",
 ]
@@ -0,0 +1,130 @@
+"""
+Bounded LRU cache for decoded Weft blocks.
+
+LazyWeftFile decodes FortyEightHourBlocks from bytes on demand. Clustered
+queries, such as refining a retrograde station or bisecting a transit, hit the
+same few blocks over and over, so decoded blocks are kept in a cache bounded by
+an entry count and, optionally, a byte budget.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# Default number of entries kept by a LazyWeftFile's block cache
+DEFAULT_CACHE_ENTRIES = 1024
+
+
+class BlockCache:
+    """
+    A thread-safe least-recently-used cache with hit and miss counters.
+
+    Each entry carries a size in bytes, and entries are evicted from the least
+    recently used end whenever the entry count or the total size goes over
+    its limit.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CACHE_ENTRIES,
+        max_bytes: Optional[int] = None,
+    ):
+        """
+        Initialize a BlockCache.
+
+        Args:
+            max_entries: Maximum number of entries to keep (0 disables caching)
+            max_bytes: Optional maximum total size of the cached entries in bytes
+
+        Raises:
+            ValueError: If a limit is negative
+        """
+        if max_entries < 0:
+            raise ValueError("max_entries must be non-negative")
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError("max_bytes must be non-negative")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.current_bytes = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Look up an entry, marking it as most recently used.
+
+        Args:
+            key: The entry's key
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, nbytes: int) -> None:
+        """
+        Add an entry, evicting least recently used entries to stay within limits.
+
+        Entries larger than the byte budget on their own are not cached.
+
+        Args:
+            key: The entry's key
+            value: The value to cache
+            nbytes: The size of the value in bytes
+        """
+        if self.max_entries == 0 or (
+            self.max_bytes is not None and nbytes > self.max_bytes
+        ):
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous[1]
+
+            self._entries[key] = (value, nbytes)
+            self.current_bytes += nbytes
+
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self.current_bytes > self.max_bytes
+            ):
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_bytes
+
+    def clear(self) -> None:
+        """Remove all entries and reset the hit and miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, Optional[int]]:
+        """
+        Get the cache's counters and limits.
+
+        Returns:
+            Dictionary with hits, misses, entries, bytes, max_entries and max_bytes
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+            }
@@ -9,7 +9,12 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import List, Tuple, Any, Dict
 
+import numpy as np
+import numpy.typing as npt
+
 from ..ephemeris.time_spec import TimeSpec
+from ..space_time.julian import julian_from_datetime
+from .ephemeris_data_source import SAMPLE_TIME_TOLERANCE
 from .logging import get_logger
 
 # Create a logger for this module
@@ -121,6 +126,81 @@ def analyze_data_coverage(
     return coverage, points_per_day
 
 
+def analyze_julian_coverage(
+    start: datetime, end: datetime, julian_dates: npt.NDArray[np.float64]
+) -> Tuple[float, float]:
+    """
+    Analyze the coverage of data points for a time period.
+
+    This is analyze_data_coverage for a sorted array of Julian dates: the
+    points in range are found by binary search, so the cost does not grow
+    with the number of points.
+
+    Args:
+        start: Start of time period
+        end: End of time period
+        julian_dates: Sorted array of available Julian dates
+
+    Returns:
+        Tuple of (coverage fraction, points per day)
+    """
+    first = int(
+        np.searchsorted(
+            julian_dates, julian_from_datetime(start) - SAMPLE_TIME_TOLERANCE
+        )
+    )
+    stop = int(
+        np.searchsorted(
+            julian_dates,
+            julian_from_datetime(end) + SAMPLE_TIME_TOLERANCE,
+            side="right",
+        )
+    )
+    count = stop - first
+    if count <= 0:
+        return 0.0, 0.0
+
+    # Calculate number of days in period
+    total_days = (end - start).total_seconds() / (24 * 3600)
+    points_per_day = count / total_days
+
+    # Calculate coverage based on the span of available data
+    if total_days < 0.0001:  # Avoid division by zero for very short periods
+        coverage = 1.0
+    else:
+        # Round the span to whole milliseconds, the precision of sample times
+        span_ms = round(
+            float(julian_dates[stop - 1] - julian_dates[first]) * 86_400_000
+        )
+        covered_days = span_ms / 86_400_000
+        coverage = min(1.0, covered_days / total_days)
+
+    return coverage, points_per_day
+
+
+def _data_coverage(
+    data_source: Any, start: datetime, end: datetime
+) -> Tuple[float, float]:
+    """
+    Analyze a data source's coverage of a time period.
+
+    Data sources with a julian_dates array (such as EphemerisDataSource) are
+    analyzed with analyze_julian_coverage, others with analyze_data_coverage.
+
+    Args:
+        data_source: The data source to analyze
+        start: Start of time period
+        end: End of time period
+
+    Returns:
+        Tuple of (coverage fraction, points per day)
+    """
+    julian_dates = getattr(data_source, "julian_dates", None)
+    if julian_dates is not None:
+        return analyze_julian_coverage(start, end, julian_dates)
+    return analyze_data_coverage(start, end, data_source.timestamps)
+
+
 def should_include_multi_year_block(
     data_source: Any, start_year: int, duration: int
 ) -> bool:
@@ -140,7 +220,7 @@ def should_include_multi_year_block(
     end = datetime(start_year + duration, 1, 1, tzinfo=timezone.utc)
 
     # Get data coverage
-    coverage, _ = analyze_data_coverage(start, end, data_source.timestamps)
+    coverage, _ = _data_coverage(data_source, start, end)
 
     # Multi-year blocks need at least 66.6% coverage
     return coverage >= 0.666
@@ -166,7 +246,7 @@ def should_include_monthly_block(data_source: Any, year: int, month: int) -> boo
         end = datetime(year, month + 1, 1, tzinfo=timezone.utc)
 
     # Get data coverage
-    coverage, points_per_day = analyze_data_coverage(start, end, data_source.timestamps)
+    coverage, points_per_day = _data_coverage(data_source, start, end)
 
     # Monthly blocks need at least 4 points per day
     # and 66.6% coverage
@@ -191,7 +271,7 @@ def should_include_fourty_eight_hour_block(data_source: Any, date: datetime) ->
     end = center + timedelta(hours=24)
 
     # Get data coverage
-    coverage, points_per_day = analyze_data_coverage(start, end, data_source.timestamps)
+    coverage, points_per_day = _data_coverage(data_source, start, end)
     # Daily blocks need at least 4 points per day
     # and 66.6% coverage (the same threshold used for monthly blocks)
     return coverage >= 0.666 and points_per_day >= 4.0
@@ -204,16 +284,34 @@ def get_recommended_blocks(data_source: Any) -> Dict[str, Dict[str, Any]]:
     Args:
         data_source: The data source to analyze
 
+    Returns:
+        Dictionary of block type to configuration
+    """
+    return get_recommended_blocks_for_range(
+        data_source.time_spec, data_source.start_date, data_source.end_date
+    )
+
+
+def get_recommended_blocks_for_range(
+    time_spec: TimeSpec, start_date: datetime, end_date: datetime
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Get recommended block configuration for a range before fetching its data.
+
+    Args:
+        time_spec: The TimeSpec the data will be sampled with
+        start_date: Start of the range
+        end_date: End of the range
+
     Returns:
         Dictionary of block type to configuration
     """
     # Calculate overall sampling rate
-    time_spec = data_source.time_spec
     points_per_day = calculate_sampling_rate(time_spec)
     logger.debug(f"Data sampling rate: {points_per_day:.1f} points per day")
 
     # Calculate time span
-    total_days = (data_source.end_date - data_source.start_date).days
+    total_days = (end_date - start_date).days
     logger.debug(f"Time span: {total_days} days")
 
     # Configure blocks based on data availability
@@ -4,10 +4,14 @@ FortyEightHourBlock class for handling 48-hour periods with Chebyshev polynomial
 
 import struct
 from datetime import datetime, timezone, date, time
-from typing import List, BinaryIO
+from typing import List, BinaryIO, Optional, Tuple
 
 from .forty_eight_hour_section_header import FortyEightHourSectionHeader
-from .utils import evaluate_chebyshev
+from .utils import (
+    evaluate_chebyshev,
+    evaluate_chebyshev_derivative,
+    julian_from_date,
+)
 
 
 class FortyEightHourBlock:
@@ -34,6 +38,7 @@ class FortyEightHourBlock:
         """
         self.header = header
         self.center_date = center_date
+        self._center_julian: Optional[float] = None
 
         # Check for NaN values
         if any(
@@ -78,6 +83,70 @@ class FortyEightHourBlock:
         """
         return self.midnight_utc_from_date(self.center_date)
 
+    def center_julian(self) -> float:
+        """
+        Get the Julian date at midnight UTC of this block's center date.
+
+        Returns:
+            The Julian date of the block's center
+        """
+        if self._center_julian is None:
+            self._center_julian = julian_from_date(self.center_date)
+        return self._center_julian
+
+    def x_transform(self) -> Tuple[float, float]:
+        """
+        Get the offset and scale mapping a Julian date onto this block's x.
+
+        x = (jd - offset) * scale, so x is -1 and 1 at midnight UTC 24 hours
+        either side of the center date.
+
+        Returns:
+            Tuple of (offset, scale)
+        """
+        return self.center_julian(), 1.0
+
+    def evaluate_jd(self, jd: float) -> float:
+        """
+        Evaluate the block's polynomial at a Julian date.
+
+        Args:
+            jd: The Julian date to evaluate at
+
+        Returns:
+            The interpolated value
+
+        Raises:
+            ValueError: If the Julian date is more than 24 hours from the center
+        """
+        x = jd - self.center_julian()
+        if not -1.0 <= x <= 1.0:
+            raise ValueError(f"Julian date {jd} is outside the block's range")
+
+        return evaluate_chebyshev(self.coefficients, x)
+
+    def evaluate_rate_jd(self, jd: float) -> float:
+        """
+        Evaluate the block's rate of change at a Julian date.
+
+        x advances by one unit per day, so the derivative with respect to x is
+        already a rate per day.
+
+        Args:
+            jd: The Julian date to evaluate at
+
+        Returns:
+            The derivative of the value with respect to time, per day
+
+        Raises:
+            ValueError: If the Julian date is more than 24 hours from the center
+        """
+        x = jd - self.center_julian()
+        if not -1.0 <= x <= 1.0:
+            raise ValueError(f"Julian date {jd} is outside the block's range")
+
+        return evaluate_chebyshev_derivative(self.coefficients, x)
+
     def contains(self, dt: datetime) -> bool:
         """
         Check if a datetime is within this block's range (±24 hours from center).
@@ -150,10 +219,7 @@ class FortyEightHourBlock:
         if len(coeffs_bytes) != 4 * header.coefficient_count:
             raise ValueError("Incomplete coefficient data")
 
-        coeffs = []
-        for i in range(0, len(coeffs_bytes), 4):
-            coeff = struct.unpack(">f", coeffs_bytes[i : i + 4])[0]
-            coeffs.append(coeff)
+        coeffs = list(struct.unpack(">" + "f" * header.coefficient_count, coeffs_bytes))
 
         return cls(header=header, coeffs=coeffs, center_date=center_date)
 
@@ -4,7 +4,9 @@ FortyEightHourSectionHeader class for handling metadata for forty-eight hour blo
 
 import struct
 from datetime import datetime, timezone, date, time
-from typing import BinaryIO
+from typing import BinaryIO, Tuple
+
+from .utils import julian_from_date
 
 
 class FortyEightHourSectionHeader:
@@ -95,6 +97,14 @@ class FortyEightHourSectionHeader:
         except (struct.error, ValueError) as e:
             raise ValueError(f"Invalid date data: {str(e)}")
 
+    def julian_span(self) -> Tuple[float, float]:
+        """Get the Julian dates bounding this section.
+
+        Returns:
+            Tuple of (start, end) Julian dates, end exclusive
+        """
+        return julian_from_date(self.start_day), julian_from_date(self.end_day)
+
     def contains_datetime(self, dt: datetime) -> bool:
         """Check if datetime falls within section's range.
 
@@ -6,10 +6,14 @@ It provides medium precision and is efficient for most use cases.
 """
 
 import struct
-from datetime import datetime
-from typing import List, BinaryIO
-
-from .utils import evaluate_chebyshev
+from datetime import date, datetime
+from typing import List, BinaryIO, Optional, Tuple
+
+from .utils import (
+    evaluate_chebyshev,
+    evaluate_chebyshev_derivative,
+    julian_from_date,
+)
 from starloom.space_time.pythonic_datetimes import ensure_utc
 
 
@@ -49,6 +53,7 @@ class MonthlyBlock:
         self.month = month
         self.day_count = day_count
         self.coeffs = coeffs
+        self._julian_params: Optional[Tuple[float, float, float, float]] = None
 
     def to_bytes(self) -> bytes:
         """
@@ -104,6 +109,80 @@ class MonthlyBlock:
 
         return cls(year=year, month=month, day_count=day_count, coeffs=coeffs)
 
+    def julian_span(self) -> Tuple[float, float]:
+        """
+        Get the Julian dates bounding this block.
+
+        Returns:
+            Tuple of (start, end) Julian dates, end exclusive
+        """
+        if self.month == 12:
+            next_month = date(self.year + 1, 1, 1)
+        else:
+            next_month = date(self.year, self.month + 1, 1)
+        return julian_from_date(date(self.year, self.month, 1)), julian_from_date(
+            next_month
+        )
+
+    def x_transform(self) -> Tuple[float, float]:
+        """
+        Get the offset and scale mapping a Julian date onto this block's x.
+
+        x = (jd - offset) * scale, so x is -1 at the start of the month and 1 at
+        the start of the next. Computed once per block.
+
+        Returns:
+            Tuple of (offset, scale)
+        """
+        return self._get_julian_params()[2:]
+
+    def _get_julian_params(self) -> Tuple[float, float, float, float]:
+        """Get the block's span and x transform as (start, end, offset, scale)."""
+        if self._julian_params is None:
+            start, end = self.julian_span()
+            self._julian_params = (start, end, (start + end) / 2, 2 / (end - start))
+        return self._julian_params
+
+    def evaluate_jd(self, jd: float) -> float:
+        """
+        Evaluate the block at a Julian date.
+
+        Args:
+            jd: The Julian date to evaluate at
+
+        Returns:
+            The interpolated value
+
+        Raises:
+            ValueError: If the Julian date is outside the block's range
+        """
+        start, end, offset, scale = self._get_julian_params()
+        if not start <= jd < end:
+            raise ValueError(f"Julian date {jd} is outside the block's range")
+
+        x = max(-1.0, min(1.0, (jd - offset) * scale))
+        return evaluate_chebyshev(self.coeffs, x)
+
+    def evaluate_rate_jd(self, jd: float) -> float:
+        """
+        Evaluate the block's rate of change at a Julian date.
+
+        Args:
+            jd: The Julian date to evaluate at
+
+        Returns:
+            The derivative of the value with respect to time, per day
+
+        Raises:
+            ValueError: If the Julian date is outside the block's range
+        """
+        start, end, offset, scale = self._get_julian_params()
+        if not start <= jd < end:
+            raise ValueError(f"Julian date {jd} is outside the block's range")
+
+        x = max(-1.0, min(1.0, (jd - offset) * scale))
+        return evaluate_chebyshev_derivative(self.coeffs, x) * scale
+
     def contains(self, dt: datetime) -> bool:
         """
         Check if a datetime is within this block's range.
@@ -6,11 +6,18 @@ It is the most space-efficient block type but with lower precision.
 Typically used for slow-moving objects like outer planets.
 """
 
+import calendar
+import math
 import struct
-from datetime import datetime
-from typing import List, BinaryIO
-
-from .utils import evaluate_chebyshev
+from datetime import date, datetime
+from typing import List, BinaryIO, Optional, Tuple
+
+from .utils import (
+    evaluate_chebyshev,
+    evaluate_chebyshev_derivative,
+    julian_from_date,
+    julian_year_fraction,
+)
 from starloom.space_time.pythonic_datetimes import ensure_utc
 
 
@@ -36,6 +43,7 @@ class MultiYearBlock:
         self.start_year = start_year
         self.duration = duration
         self.coeffs = coeffs
+        self._julian_params: Optional[Tuple[float, float, float, float]] = None
 
     def to_bytes(self) -> bytes:
         """
@@ -78,6 +86,88 @@ class MultiYearBlock:
 
         return cls(start_year=start_year, duration=duration, coeffs=coeffs)
 
+    def julian_span(self) -> Tuple[float, float]:
+        """
+        Get the Julian dates bounding this block.
+
+        Returns:
+            Tuple of (start, end) Julian dates, end exclusive
+        """
+        return julian_from_date(date(self.start_year, 1, 1)), julian_from_date(
+            date(self.start_year + self.duration, 1, 1)
+        )
+
+    def x_transform(self) -> Tuple[float, float]:
+        """
+        Get the offset and scale mapping a fractional year onto this block's x.
+
+        x = (year - offset) * scale, where year is the fractional year from
+        julian_year_fraction, so x is -1 at the start of the first year and 1 at
+        the end of the last.
+
+        Returns:
+            Tuple of (offset, scale)
+        """
+        return self._get_julian_params()[2:]
+
+    def _get_julian_params(self) -> Tuple[float, float, float, float]:
+        """Get the block's span and x transform as (start, end, offset, scale)."""
+        if self._julian_params is None:
+            start, end = self.julian_span()
+            self._julian_params = (
+                start,
+                end,
+                self.start_year + self.duration / 2,
+                2 / self.duration,
+            )
+        return self._julian_params
+
+    def evaluate_jd(self, jd: float) -> float:
+        """
+        Evaluate the block's polynomial at a Julian date.
+
+        Args:
+            jd: The Julian date to evaluate at
+
+        Returns:
+            The interpolated value
+
+        Raises:
+            ValueError: If the Julian date is outside the block's range
+        """
+        start, end, offset, scale = self._get_julian_params()
+        if not start <= jd < end:
+            raise ValueError(f"Julian date {jd} is outside the block's range")
+
+        x = max(-1.0, min(1.0, (julian_year_fraction(jd) - offset) * scale))
+        return evaluate_chebyshev(self.coeffs, x)
+
+    def evaluate_rate_jd(self, jd: float) -> float:
+        """
+        Evaluate the block's rate of change at a Julian date.
+
+        The fractional year advances by one day's worth per day, so the rate is
+        the derivative with respect to the fractional year divided by the
+        length of the year containing the date.
+
+        Args:
+            jd: The Julian date to evaluate at
+
+        Returns:
+            The derivative of the value with respect to time, per day
+
+        Raises:
+            ValueError: If the Julian date is outside the block's range
+        """
+        start, end, offset, scale = self._get_julian_params()
+        if not start <= jd < end:
+            raise ValueError(f"Julian date {jd} is outside the block's range")
+
+        year_fraction = julian_year_fraction(jd)
+        x = max(-1.0, min(1.0, (year_fraction - offset) * scale))
+        days_in_year = 366 if calendar.isleap(math.floor(year_fraction)) else 365
+        return evaluate_chebyshev_derivative(self.coeffs, x) * scale / days_in_year
+
     def contains(self, dt: datetime) -> bool:
         """
         Check if a datetime is within this block's range.
@@ -2,8 +2,78 @@
 Utility functions for Weft blocks.
 """
 
-from typing import List
+import math
+from datetime import date
+from typing import List, cast
+
 import numpy as np
+import numpy.typing as npt
+
+# Julian date of 0001-01-01T00:00 UTC minus its proleptic Gregorian ordinal (1)
+_ORDINAL_JULIAN_OFFSET = 1721424.5
+
+
+def julian_from_date(d: date) -> float:
+    """Get the Julian date of midnight UTC at the start of a calendar date.
+
+    Args:
+        d: The calendar date
+
+    Returns:
+        The Julian date at 00:00 UTC on that date
+    """
+    return d.toordinal() + _ORDINAL_JULIAN_OFFSET
+
+
+def date_from_julian(jd: float) -> date:
+    """Get the UTC calendar date containing a Julian date.
+
+    Args:
+        jd: The Julian date
+
+    Returns:
+        The calendar date whose [00:00, 24:00) UTC span contains jd
+
+    Raises:
+        ValueError: If the date is outside the range supported by datetime.date
+    """
+    if math.isnan(jd):
+        raise ValueError("Julian date is NaN")
+    ordinal = math.floor(jd - _ORDINAL_JULIAN_OFFSET)
+    if not date.min.toordinal() <= ordinal <= date.max.toordinal():
+        raise ValueError(f"Julian date {jd} is outside the supported date range")
+    return date.fromordinal(ordinal)
+
+
+def julian_year_fraction(jd: float) -> float:
+    """Get the fractional year of the UTC day containing a Julian date.
+
+    The fraction counts whole days: midnight on January 1st of year Y and any
+    time that day give Y + 0.0, and the last day of the year gives
+    Y + (days_in_year - 1) / days_in_year. Only integer arithmetic is used to
+    find the calendar date.
+
+    Args:
+        jd: The Julian date
+
+    Returns:
+        The year plus the fraction of the year elapsed before that day
+    """
+    # Days since 0001-01-01, split into 400-, 100-, 4- and 1-year cycles
+    days = math.floor(jd - _ORDINAL_JULIAN_OFFSET) - 1
+    n400, days = divmod(days, 146097)
+    n100, days = divmod(days, 36524)
+    n4, days = divmod(days, 1461)
+    n1, day_of_year = divmod(days, 365)
+    year = n400 * 400 + n100 * 100 + n4 * 4 + n1 + 1
+    if n1 == 4 or n100 == 4:
+        # December 31st of a leap year
+        year -= 1
+        day_of_year = 365
+
+    is_leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    days_in_year = 366 if is_leap else 365
+    return year + day_of_year / days_in_year
 
 
 def evaluate_chebyshev(coeffs: List[float], x: float) -> float:
@@ -28,6 +98,29 @@ def evaluate_chebyshev(coeffs: List[float], x: float) -> float:
     return float(np.polynomial.chebyshev.chebval(x, coeffs))
 
 
+def evaluate_chebyshev_derivative(coeffs: List[float], x: float) -> float:
+    """Evaluate the derivative with respect to x of a Chebyshev polynomial.
+
+    Args:
+        coeffs: Chebyshev coefficients as a list of floats
+        x: Point to evaluate at, must be in [-1, 1]
+
+    Returns:
+        The derivative's value at x
+
+    Raises:
+        ValueError: If x is outside [-1, 1]
+    """
+    if not -1 <= x <= 1:
+        raise ValueError("x must be in [-1, 1]")
+
+    if len(coeffs) < 2:
+        return 0.0
+
+    derivative = np.polynomial.chebyshev.chebder(coeffs)
+    return float(np.polynomial.chebyshev.chebval(x, derivative))
+
+
 def unwrap_angles(values: List[float], min_val: float, max_val: float) -> List[float]:
     """
     Unwrap a sequence of values to avoid jumps greater than half the range size.
@@ -47,23 +140,25 @@ def unwrap_angles(values: List[float], min_val: float, max_val: float) -> List[f
     """
     if not values:
         return []
+    return cast(List[float], unwrap_angle_array(values, min_val, max_val).tolist())
 
-    range_size = max_val - min_val
-    half_range = range_size / 2
 
-    # Pure unwrapping algorithm - no special cases
-    result = [values[0]]
-    for i in range(1, len(values)):
-        # Calculate the difference from the previous unwrapped value
-        diff = values[i] - values[i - 1]
+def unwrap_angle_array(
+    values: npt.ArrayLike, min_val: float, max_val: float
+) -> npt.NDArray[np.float64]:
+    """
+    Unwrap an array of values to avoid jumps greater than half the range size.
 
-        # Normalize the difference to minimize the jump
-        while diff > half_range:
-            diff -= range_size
-        while diff < -half_range:
-            diff += range_size
+    This is the vectorized form of unwrap_angles: each step between
+    consecutive values is shifted by a whole number of ranges to lie within
+    half a range of zero, and the first value is kept.
 
-        # Add the normalized difference to the previous result
-        result.append(result[-1] + diff)
+    Args:
+        values: Values to unwrap
+        min_val: The minimum value of the range
+        max_val: The maximum value of the range
 
-    return result
+    Returns:
+        Array of unwrapped values
+    """
+    return np.unwrap(np.asarray(values, dtype=np.float64), period=max_val - min_val)
@@ -0,0 +1,387 @@
+"""
+Columnar NumPy representations of Weft blocks.
+
+Blocks are decoded into native float64 coefficient matrices so that many
+points can be evaluated with array operations instead of per-block Python
+objects:
+
+- SectionArrays holds a run of FortyEightHourBlocks from one section, decoded
+  with a single np.frombuffer over the section bytes.
+- TierArrays holds all MonthlyBlocks or all MultiYearBlocks of a file, with
+  their coefficients zero-padded to a common width.
+
+chebval_rows evaluates a different coefficient row at each point. It performs
+the same floating point operations as numpy.polynomial.chebyshev.chebval, and
+zero padding does not change the result, so values agree exactly with
+evaluating the individual blocks.
+
+The arrays are read-only once built, so decoded blocks can be cached and
+evaluated from several threads at once without copying.
+"""
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import List, Optional, Sequence, TypeVar, Union, cast
+
+import numpy as np
+import numpy.typing as npt
+from numpy.polynomial import chebyshev
+
+from .blocks import (
+    FortyEightHourBlock,
+    FortyEightHourSectionHeader,
+    MonthlyBlock,
+    MultiYearBlock,
+)
+
+# Julian date of 1970-01-01T00:00 UTC
+_UNIX_EPOCH_JULIAN = 2440587.5
+
+# Size of a FortyEightHourBlock's marker and center date
+_FORTY_EIGHT_HOUR_PREFIX_SIZE = 6
+
+TierBlock = Union[MonthlyBlock, MultiYearBlock]
+
+T = TypeVar("T", bound=np.generic)
+
+
+def chebval_rows(
+    x: npt.NDArray[np.float64],
+    coefficients: npt.NDArray[np.float64],
+    rows: Optional[npt.NDArray[np.intp]] = None,
+) -> npt.NDArray[np.float64]:
+    """
+    Evaluate a Chebyshev series with its own coefficient row at each point.
+
+    Uses the Clenshaw recurrence in the same order as chebyshev.chebval.
+    Coefficient columns are gathered one at a time, so memory stays
+    proportional to the number of points, and the recurrence updates its
+    arrays in place rather than allocating temporaries for every term.
+
+    Args:
+        x: Points to evaluate at, shape (n,)
+        coefficients: Coefficient matrix, shape (block_count, coefficient_count)
+        rows: Row of the coefficient matrix to use for each point (defaults to
+            row i for point i)
+
+    Returns:
+        The series values, shape (n,)
+    """
+    if rows is None:
+        rows = np.arange(x.shape[0])
+
+    if len(rows) > coefficients.shape[0]:
+        # Gathering from contiguous columns is faster than from a 2-D matrix
+        by_column = np.ascontiguousarray(coefficients.T)
+
+        def column(i: int) -> npt.NDArray[np.float64]:
+            return cast(npt.NDArray[np.float64], by_column[i].take(rows))
+
+    else:
+
+        def column(i: int) -> npt.NDArray[np.float64]:
+            return cast(npt.NDArray[np.float64], coefficients[rows, i])
+
+    width = coefficients.shape[1]
+    if width == 0:
+        return np.zeros(x.shape)
+    if width == 1:
+        return column(0) + 0 * x
+    if width == 2:
+        return column(0) + column(1) * x
+
+    # Each gathered column is a fresh array, so it can be updated in place;
+    # addition is commutative, so c1 * x2 + tmp equals chebval's tmp + c1 * x2
+    x2 = 2 * x
+    c0 = column(width - 2)
+    c1 = column(width - 1)
+    for i in range(3, width + 1):
+        tmp = c0
+        c0 = column(width - i)
+        c0 -= c1
+        c1 *= x2
+        c1 += tmp
+    c1 *= x
+    c1 += c0
+    return c1
+
+
+def derivative_coefficients(
+    coefficients: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """
+    Differentiate every row of a coefficient matrix with chebyshev.chebder.
+
+    Args:
+        coefficients: Coefficient matrix, shape (block_count, coefficient_count)
+
+    Returns:
+        Read-only derivative coefficient matrix, shape
+        (block_count, coefficient_count - 1)
+    """
+    if coefficients.shape[1] < 2:
+        return _read_only(np.zeros((coefficients.shape[0], 0)))
+    derivative = np.asarray(chebyshev.chebder(coefficients, axis=1), dtype=np.float64)
+    return _read_only(derivative)
+
+
+def _read_only(array: npt.NDArray[T]) -> npt.NDArray[T]:
+    """
+    Mark an array read-only, so it can be shared between threads safely.
+
+    Args:
+        array: The array, which must own its data or be a view of one that does
+
+    Returns:
+        The same array
+    """
+    array.setflags(write=False)
+    return array
+
+
+@dataclass(frozen=True)
+class SectionArrays:
+    """
+    A run of FortyEightHourBlocks from one section in columnar form.
+
+    Attributes:
+        header: The section header
+        dates: Center date of each block, as datetime64[D]
+        centers: Julian date at the center of each block
+        coefficients: Coefficient matrix of shape (block_count, coefficient_count)
+    """
+
+    header: FortyEightHourSectionHeader
+    dates: npt.NDArray[np.datetime64]
+    centers: npt.NDArray[np.float64]
+    coefficients: npt.NDArray[np.float64]
+
+    def __len__(self) -> int:
+        return len(self.centers)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the arrays in bytes."""
+        return self.dates.nbytes + self.centers.nbytes + self.coefficients.nbytes
+
+    @cached_property
+    def derivative_coefficients(self) -> npt.NDArray[np.float64]:
+        """Coefficients of each block's derivative with respect to x."""
+        return derivative_coefficients(self.coefficients)
+
+    @classmethod
+    def from_buffer(
+        cls,
+        header: FortyEightHourSectionHeader,
+        buffer: memoryview,
+        count: int,
+        first_index: int = 0,
+    ) -> "SectionArrays":
+        """
+        Decode consecutive FortyEightHourBlocks with a single np.frombuffer.
+
+        Each block is read through a structured dtype of header.block_size
+        bytes: a >u2 marker, the center date as >u2 year, u1 month and u1 day,
+        then the >f4 coefficients.
+
+        Args:
+            header: The section header
+            buffer: Buffer starting at the marker of the first block
+            count: Number of blocks to decode
+            first_index: Index of the first block within its section, for errors
+
+        Returns:
+            The decoded SectionArrays
+
+        Raises:
+            ValueError: If the data is truncated, a marker is wrong, a date is
+                invalid, or a coefficient is NaN
+        """
+        coefficient_count = header.coefficient_count
+        if header.block_size < _FORTY_EIGHT_HOUR_PREFIX_SIZE + 4 * coefficient_count:
+            raise ValueError(
+                f"Block size {header.block_size} is too small for "
+                f"{coefficient_count} coefficients"
+            )
+        if len(buffer) < count * header.block_size:
+            raise ValueError("Incomplete coefficient data")
+
+        dtype = np.dtype(
+            {
+                "names": ["marker", "year", "month", "day", "coefficients"],
+                "formats": [">u2", ">u2", "u1", "u1", (">f4", (coefficient_count,))],
+                "offsets": [0, 2, 4, 5, _FORTY_EIGHT_HOUR_PREFIX_SIZE],
+                "itemsize": header.block_size,
+            }
+        )
+        records = np.frombuffer(buffer, dtype=dtype, count=count)
+
+        marker = int.from_bytes(FortyEightHourBlock.marker, "big")
+        if np.any(records["marker"] != marker):
+            bad = int(np.argmax(records["marker"] != marker))
+            raise ValueError(
+                f"Expected FortyEightHourBlock marker at index {first_index + bad}, "
+                f"got {records['marker'][bad]:#06x}"
+            )
+
+        dates = _dates_from_fields(records["year"], records["month"], records["day"])
+        centers = dates.astype(np.int64).astype(np.float64) + _UNIX_EPOCH_JULIAN
+        coefficients = records["coefficients"].astype(np.float64)
+        if np.isnan(coefficients).any():
+            raise ValueError("Coefficients cannot be NaN")
+
+        return cls(
+            header=header,
+            dates=_read_only(dates),
+            centers=_read_only(centers),
+            coefficients=_read_only(coefficients),
+        )
+
+    def block(self, index: int) -> FortyEightHourBlock:
+        """
+        Build the FortyEightHourBlock object for one row.
+
+        Args:
+            index: The row to build
+
+        Returns:
+            The FortyEightHourBlock at that row
+        """
+        return FortyEightHourBlock(
+            header=self.header,
+            coeffs=self.coefficients[index].tolist(),
+            center_date=self.dates[index].item(),
+        )
+
+
+def _dates_from_fields(
+    years: npt.NDArray[np.integer],
+    months: npt.NDArray[np.integer],
+    days: npt.NDArray[np.integer],
+) -> npt.NDArray[np.datetime64]:
+    """
+    Combine year, month and day arrays into datetime64[D] dates.
+
+    Raises:
+        ValueError: If any combination is not a valid calendar date
+    """
+    years = years.astype(np.int64)
+    months = months.astype(np.int64)
+    days = days.astype(np.int64)
+
+    valid = (years >= 1) & (months >= 1) & (months <= 12) & (days >= 1)
+    month_starts = (years - 1970) * 12 + np.clip(months, 1, 12) - 1
+    dates: npt.NDArray[np.datetime64] = month_starts.astype("datetime64[M]").astype(
+        "datetime64[D]"
+    ) + (days - 1).astype("timedelta64[D]")
+
+    # Days past the end of their month roll over into the next month
+    valid &= dates.astype("datetime64[M]").astype(np.int64) == month_starts
+    if not valid.all():
+        bad = int(np.argmax(~valid))
+        raise ValueError(
+            f"Invalid date data: {years[bad]:04d}-{months[bad]:02d}-{days[bad]:02d}"
+        )
+
+    return dates
+
+
+@dataclass(frozen=True)
+class TierArrays:
+    """
+    All MonthlyBlocks or all MultiYearBlocks of a file in columnar form.
+
+    Rows are in file order. Coefficients are zero-padded to the widest block,
+    which does not change the value of the Chebyshev series.
+
+    Attributes:
+        blocks: The blocks, in file order
+        starts: Julian date at the start of each block's span
+        ends: Julian date at the (exclusive) end of each block's span
+        offsets: Offset of each block's x transform (see x_transform)
+        scales: Scale of each block's x transform
+        coefficients: Coefficient matrix of shape (block_count, max_coefficient_count)
+        disjoint: Whether no two block spans overlap
+    """
+
+    blocks: List[TierBlock]
+    starts: npt.NDArray[np.float64]
+    ends: npt.NDArray[np.float64]
+    offsets: npt.NDArray[np.float64]
+    scales: npt.NDArray[np.float64]
+    coefficients: npt.NDArray[np.float64]
+    disjoint: bool
+
+    def __len__(self) -> int:
+        return len(self.blocks)
+
+    @cached_property
+    def derivative_coefficients(self) -> npt.NDArray[np.float64]:
+        """Coefficients of each block's derivative with respect to x."""
+        return derivative_coefficients(self.coefficients)
+
+    @classmethod
+    def from_blocks(cls, blocks: Sequence[TierBlock]) -> "TierArrays":
+        """
+        Build the columnar form of a tier's blocks.
+
+        Args:
+            blocks: The blocks, in file order
+
+        Returns:
+            The TierArrays for the blocks
+        """
+        spans = np.array([block.julian_span() for block in blocks], dtype=np.float64)
+        spans = spans.reshape(len(blocks), 2)
+        transforms = np.array(
+            [block.x_transform() for block in blocks], dtype=np.float64
+        ).reshape(len(blocks), 2)
+        width = max((len(block.coeffs) for block in blocks), default=0)
+        coefficients = np.zeros((len(blocks), width))
+        for row, block in enumerate(blocks):
+            coefficients[row, : len(block.coeffs)] = block.coeffs
+
+        order = np.argsort(spans[:, 0], kind="stable")
+        disjoint = bool(np.all(spans[order[1:], 0] >= spans[order[:-1], 1]))
+
+        return cls(
+            blocks=list(blocks),
+            starts=_read_only(spans[:, 0].copy()),
+            ends=_read_only(spans[:, 1].copy()),
+            offsets=_read_only(transforms[:, 0].copy()),
+            scales=_read_only(transforms[:, 1].copy()),
+            coefficients=_read_only(coefficients),
+            disjoint=disjoint,
+        )
+
+    def find_rows(self, jd: npt.NDArray[np.float64]) -> npt.NDArray[np.intp]:
+        """
+        Find the first block in file order whose span contains each Julian date.
+
+        Args:
+            jd: Julian dates, shape (n,)
+
+        Returns:
+            Row index of the covering block for each date, or -1 if none covers it
+        """
+        rows = np.full(jd.shape, -1, dtype=np.intp)
+        if not len(self.blocks):
+            return rows
+
+        if self.disjoint:
+            # At most one span contains each date: the last one starting before it
+            order = np.argsort(self.starts, kind="stable")
+            position = np.searchsorted(self.starts[order], jd, side="right") - 1
+            candidate = order[np.maximum(position, 0)]
+            covered = (position >= 0) & (jd < self.ends[candidate])
+            rows[covered] = candidate[covered]
+            return rows
+
+        # Assign in reverse file order so the first covering block wins
+        jd_order = np.argsort(jd, kind="stable")
+        sorted_jd = jd[jd_order]
+        lows = np.searchsorted(sorted_jd, self.starts, side="left")
+        highs = np.searchsorted(sorted_jd, self.ends, side="left")
+        for row in range(len(self.blocks) - 1, -1, -1):
+            rows[jd_order[lows[row] : highs[row]]] = row
+        return rows
@@ -0,0 +1,399 @@
+"""
+Root finding on .weft data.
+
+Between consecutive block edges, the value a WeftReader evaluates comes from
+a fixed set of blocks: one monthly or multi-year polynomial, one 48-hour
+block, or a blend of neighbouring 48-hour blocks whose weights are linear in
+time. Each such piece is re-expanded as a Chebyshev series over the piece, so
+the times where the value equals a target are the roots of a single
+polynomial. Blends are solved through the numerator of their weighted mean,
+sum(w_i * (v_i - target)), which is also a polynomial.
+
+Roots come from chebyshev.chebroots, which solves a small eigenvalue problem
+per piece; pieces whose series cannot reach the target are skipped without
+solving. Wrapping values are solved for every multiple of the range the piece
+can reach, and jumps across the target where one piece hands over to the next
+are reported at the seam.
+"""
+
+import calendar
+import math
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple, Union, cast
+
+import numpy as np
+import numpy.typing as npt
+from numpy.polynomial import Chebyshev, chebyshev
+
+from .blocks import (
+    FortyEightHourBlock,
+    FortyEightHourSectionHeader,
+    MonthlyBlock,
+    MultiYearBlock,
+)
+from .blocks.utils import julian_from_date, julian_year_fraction
+from .weft_file import BlockType, LazyWeftFile
+
+# Largest imaginary part of a root, relative to the piece's half-width, that
+# is still treated as real
+_IMAGINARY_TOLERANCE = 1e-7
+
+# Roots closer together than this many days are reported once
+_DUPLICATE_TOLERANCE = 1e-9
+
+EvaluatedBlock = Union[FortyEightHourBlock, MonthlyBlock, MultiYearBlock]
+
+
+def active_blocks(relevant_blocks: Sequence[BlockType]) -> List[EvaluatedBlock]:
+    """
+    Select the blocks a WeftReader evaluates from those containing a date.
+
+    Args:
+        relevant_blocks: The blocks containing the date, in file order
+
+    Returns:
+        The 48-hour blocks of a section to blend, a single block to evaluate,
+        or an empty list if no block covers the date
+    """
+    forty_eight_hour_blocks = [
+        b for b in relevant_blocks if isinstance(b, FortyEightHourBlock)
+    ]
+    if forty_eight_hour_blocks:
+        by_header: Dict[Tuple[date, date], List[FortyEightHourBlock]] = {}
+        for block in forty_eight_hour_blocks:
+            key = (block.header.start_day, block.header.end_day)
+            by_header.setdefault(key, []).append(block)
+        for blocks in by_header.values():
+            if len(blocks) > 1:
+                return list(blocks)
+        return [forty_eight_hour_blocks[0]]
+
+    monthly_blocks = [b for b in relevant_blocks if isinstance(b, MonthlyBlock)]
+    if monthly_blocks:
+        return [monthly_blocks[0]]
+
+    multi_year_blocks = [b for b in relevant_blocks if isinstance(b, MultiYearBlock)]
+    if multi_year_blocks:
+        return [multi_year_blocks[0]]
+    return []
+
+
+@dataclass
+class _Piece:
+    """
+    The value between two breakpoints as weighted Chebyshev series.
+
+    The series are in u on [-1, 1], where the Julian date is middle + half * u.
+    The value is sum(weights[i] * values[i]) / sum(weights).
+
+    Attributes:
+        middle: Julian date at u = 0
+        half: Half the width of the piece in days
+        weights: Blend weight series, one per block
+        values: Block value series, one per block
+        day_origin: For multi-year blocks, the Julian date of January 1st of the
+            piece's year; the value then only changes at midnight
+    """
+
+    middle: float
+    half: float
+    weights: List[Chebyshev]
+    values: List[Chebyshev]
+    day_origin: Optional[float] = None
+
+    def to_u(self, jd: float) -> float:
+        """Map a Julian date onto the piece's u."""
+        return (jd - self.middle) / self.half
+
+    def value(self, jd: float) -> float:
+        """The smooth value of the piece at a Julian date."""
+        u = self.to_u(jd)
+        weights = [float(w(u)) for w in self.weights]
+        total = sum(w * float(v(u)) for w, v in zip(weights, self.values))
+        return total / sum(weights)
+
+    def value_after(self, jd: float) -> float:
+        """The value the reader evaluates at a Julian date inside the piece."""
+        if self.day_origin is not None:
+            jd = self.day_origin + math.floor(jd - self.day_origin)
+        return self.value(jd)
+
+    def value_before(self, jd: float) -> float:
+        """The value the reader evaluates just before a Julian date."""
+        if self.day_origin is not None:
+            jd = self.day_origin + math.ceil(jd - self.day_origin) - 1
+        return self.value(jd)
+
+    def bounds(self) -> Tuple[float, float]:
+        """Bounds on the value over the piece, from the series coefficients."""
+        lows, highs = [], []
+        for series in self.values:
+            spread = float(np.abs(series.coef[1:]).sum())
+            lows.append(series.coef[0] - spread)
+            highs.append(series.coef[0] + spread)
+        return min(lows), max(highs)
+
+    def roots(self, target: float) -> List[float]:
+        """
+        Find the times in the piece where the smooth value equals a target.
+
+        Args:
+            target: The value to solve for
+
+        Returns:
+            Julian dates of the roots, unsorted
+        """
+        numerator = sum(
+            (w * (v - target) for w, v in zip(self.weights, self.values)),
+            Chebyshev([0.0]),
+        )
+        coefficients = numerator.coef
+        spread = np.abs(coefficients[1:]).sum()
+        if spread == 0 or abs(coefficients[0]) > spread:
+            # The series cannot reach zero on [-1, 1]
+            return []
+
+        roots = chebyshev.chebroots(coefficients)
+        real = roots[np.abs(np.imag(roots)) <= _IMAGINARY_TOLERANCE].real
+        real = np.clip(real[np.abs(real) <= 1 + _IMAGINARY_TOLERANCE], -1.0, 1.0)
+        return [self.middle + self.half * float(u) for u in real]
+
+
+def _series(block: EvaluatedBlock, middle: float, half: float) -> Chebyshev:
+    """
+    Re-expand a monthly or 48-hour block's series over a piece.
+
+    Args:
+        block: The block
+        middle: Julian date at the middle of the piece
+        half: Half the width of the piece in days
+
+    Returns:
+        The block's value as a Chebyshev series in the piece's u
+    """
+    offset, scale = block.x_transform()
+    x = Chebyshev([(middle - offset) * scale, half * scale])
+    coefficients = (
+        block.coefficients if isinstance(block, FortyEightHourBlock) else block.coeffs
+    )
+    return Chebyshev(coefficients)(x)
+
+
+def _multi_year_piece(block: MultiYearBlock, start: float, end: float) -> _Piece:
+    """
+    Build the piece for a multi-year block within one calendar year.
+
+    Multi-year blocks are evaluated at the fractional year of each UTC day,
+    which advances linearly from January 1st, so the series is expanded over
+    that line. The piece is widened back to the midnight before start so
+    roots earlier in start's day are found as well.
+    """
+    year_fraction = julian_year_fraction(start)
+    year = math.floor(year_fraction)
+    days_in_year = 366 if calendar.isleap(year) else 365
+    day_origin = (
+        math.floor(start - 0.5) + 0.5 - round((year_fraction - year) * days_in_year)
+    )
+
+    start = day_origin + math.floor(start - day_origin)
+    middle, half = (start + end) / 2, (end - start) / 2
+    offset, scale = block.x_transform()
+    x = Chebyshev(
+        [
+            ((year - offset) + (middle - day_origin) / days_in_year) * scale,
+            half / days_in_year * scale,
+        ]
+    )
+    return _Piece(
+        middle=middle,
+        half=half,
+        weights=[Chebyshev([1.0])],
+        values=[Chebyshev(block.coeffs)(x)],
+        day_origin=day_origin,
+    )
+
+
+def _piece(
+    blocks: List[EvaluatedBlock],
+    start: float,
+    end: float,
+    range_size: Optional[float],
+) -> _Piece:
+    """
+    Build the piece for the blocks evaluated between two breakpoints.
+
+    Args:
+        blocks: The blocks, as returned by active_blocks
+        start: Julian date of the first breakpoint
+        end: Julian date of the second breakpoint
+        range_size: The range of wrapping values, or None
+
+    Returns:
+        The piece
+    """
+    if isinstance(blocks[0], MultiYearBlock):
+        return _multi_year_piece(blocks[0], start, end)
+
+    middle, half = (start + end) / 2, (end - start) / 2
+    values = [_series(block, middle, half) for block in blocks]
+    if len(blocks) == 1:
+        return _Piece(middle, half, [Chebyshev([1.0])], values)
+
+    weights = []
+    for block in blocks:
+        # Within a piece each block's weight 1 - |jd - center| is linear
+        offset = middle - cast(FortyEightHourBlock, block).center_julian()
+        sign = 1.0 if offset >= 0 else -1.0
+        weights.append(Chebyshev([1.0 - sign * offset, -sign * half]))
+
+    if range_size is not None:
+        # Unwrap relative to the first block, as when interpolating values
+        reference = float(values[0](0.0))
+        values = [
+            v + range_size * round((reference - float(v(0.0))) / range_size)
+            for v in values
+        ]
+    return _Piece(middle, half, weights, values)
+
+
+def _breakpoints(
+    weft_file: LazyWeftFile, start: float, end: float
+) -> npt.NDArray[np.float64]:
+    """
+    Find every date in a range where the blocks a reader evaluates can change.
+
+    Args:
+        weft_file: The file
+        start: Julian date at the start of the range
+        end: Julian date at the end of the range
+
+    Returns:
+        The sorted, distinct breakpoints, including start and end
+    """
+    points = [np.array([start, end])]
+    for block in weft_file.blocks:
+        if not isinstance(block, FortyEightHourSectionHeader):
+            continue
+        section_start, section_end = block.julian_span()
+        if section_end < start or section_start > end:
+            continue
+        centers = weft_file.get_section_centers(block)
+        low = np.searchsorted(centers, start - 1.0, side="left")
+        high = np.searchsorted(centers, end + 1.0, side="right")
+        centers = centers[low:high]
+        points.extend(
+            [
+                np.array([section_start, section_end]),
+                centers - 1.0,
+                centers,
+                centers + 1.0,
+            ]
+        )
+
+    for tier in (weft_file.monthly_arrays, weft_file.multi_year_arrays):
+        points.extend([tier.starts, tier.ends])
+
+    if len(weft_file.multi_year_arrays):
+        # Multi-year blocks are expanded one calendar year at a time
+        first_year = math.floor(julian_year_fraction(start)) + 1
+        last_year = math.floor(julian_year_fraction(end))
+        points.append(
+            np.array(
+                [
+                    julian_from_date(date(year, 1, 1))
+                    for year in range(first_year, last_year + 1)
+                ]
+            )
+        )
+
+    combined = np.concatenate(points)
+    combined = combined[(combined >= start) & (combined <= end)]
+    return np.unique(combined)
+
+
+def find_crossings(
+    weft_file: LazyWeftFile, target: float, start: float, end: float
+) -> List[float]:
+    """
+    Find every time in a range where a file's value equals a target.
+
+    Args:
+        weft_file: The file
+        target: The value to solve for
+        start: Julian date at the start of the range
+        end: Julian date at the end of the range
+
+    Returns:
+        Sorted Julian dates of the crossings
+
+    Raises:
+        ValueError: If end is before start or no block covers part of the range
+    """
+    if end < start:
+        raise ValueError(f"End {end} is before start {start}")
+
+    behavior = weft_file.value_behavior
+    range_size: Optional[float] = None
+    if behavior["type"] == "wrapping":
+        min_val, max_val = behavior["range"]
+        range_size = max_val - min_val
+        target = min_val + (target - min_val) % range_size
+    elif behavior["type"] == "bounded":
+        min_val, max_val = behavior["range"]
+        if not min_val <= target <= max_val:
+            # Bounded values are clipped to their range
+            return []
+
+    def difference(value: float) -> float:
+        if range_size is None:
+            return value - target
+        return (value - target + range_size / 2) % range_size - range_size / 2
+
+    crossings: List[float] = []
+    previous: Optional[Tuple[float, float]] = None
+    breakpoints = _breakpoints(weft_file, start, end)
+    for piece_start, piece_end in zip(breakpoints[:-1], breakpoints[1:]):
+        piece_start, piece_end = float(piece_start), float(piece_end)
+        middle = (piece_start + piece_end) / 2
+        blocks = active_blocks(weft_file.get_blocks_for_julian(middle))
+        if not blocks:
+            raise ValueError(f"No block found for Julian date: {middle}")
+        piece = _piece(blocks, piece_start, piece_end, range_size)
+
+        targets = [target]
+        if range_size is not None:
+            low, high = piece.bounds()
+            targets = [
+                target + k * range_size
+                for k in range(
+                    math.ceil((low - target) / range_size),
+                    math.floor((high - target) / range_size) + 1,
+                )
+            ]
+        for value in targets:
+            for root in piece.roots(value):
+                if piece.day_origin is not None:
+                    # The value only changes at midnight
+                    root = piece.day_origin + math.ceil(
+                        root - piece.day_origin - _DUPLICATE_TOLERANCE
+                    )
+                if piece_start <= root <= piece_end:
+                    crossings.append(root)
+
+        # A jump across the target where the previous piece hands over
+        after = difference(piece.value_after(piece_start))
+        if previous is not None and previous[0] == piece_start:
+            before = previous[1]
+            if (before < 0) != (after < 0) and (
+                range_size is None or abs(after - before) < range_size / 2
+            ):
+                crossings.append(piece_start)
+        previous = (piece_end, difference(piece.value_before(piece_end)))
+
+    crossings.sort()
+    result: List[float] = []
+    for crossing in crossings:
+        if not result or crossing - result[-1] > _DUPLICATE_TOLERANCE:
+            result.append(crossing)
+    return result
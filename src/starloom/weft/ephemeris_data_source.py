@@ -6,38 +6,71 @@ data fetching and filtering for different Weft block types.
 """
 
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, List, Tuple, Optional, Union, Dict, Any, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    List,
+    Mapping,
+    Protocol,
+    Tuple,
+    Optional,
+    Union,
+    Dict,
+    cast,
+)
+
+import numpy as np
+import numpy.typing as npt
 
 from ..ephemeris.ephemeris import Ephemeris
-from ..ephemeris import Quantity
+from ..ephemeris import PositionTable, Quantity
 
 if TYPE_CHECKING:
     from ..horizons.quantities import EphemerisQuantity
     from ..horizons.parsers import OrbitalElementsQuantity
 from ..ephemeris.time_spec import TimeSpec
-from ..space_time.julian import datetime_from_julian
+from ..space_time.julian import datetime_from_julian, julian_from_datetime
 from .logging import get_logger
 
 # Create a logger for this module
 logger = get_logger(__name__)
 
+# Sample times this close to a bound count as on it: half a millisecond, in
+# days, matching the millisecond precision of datetime_from_julian
+SAMPLE_TIME_TOLERANCE = 0.0005 / 86400
+
+
+class PositionSource(Protocol):
+    """
+    Any object with get_planet_positions, such as an Ephemeris.
+
+    Positions may be keyed by Julian date or by datetime.
+    """
+
+    def get_planet_positions(
+        self, planet: str, time_spec: TimeSpec
+    ) -> Mapping[Any, Mapping[Quantity, Any]]: ...
+
 
 class EphemerisDataSource:
     """
     A data source that manages ephemeris data for Weft file generation.
 
     This class handles fetching and filtering data for different block types,
-    ensuring efficient data access patterns.
+    ensuring efficient data access patterns. Samples are stored as a sorted
+    float64 array of Julian dates and a float64 array of values for each
+    quantity, so a time range is a searchsorted lookup and a zero-copy slice.
     """
 
     def __init__(
         self,
-        ephemeris: Ephemeris,
+        ephemeris: PositionSource,
         planet_id: str,
         quantity: Union["EphemerisQuantity", "OrbitalElementsQuantity"],
         start_date: datetime,
         end_date: datetime,
         step_hours: Union[int, str] = "24h",
+        table: Optional[PositionTable] = None,
     ):
         """
         Initialize the data source.
@@ -49,6 +82,8 @@ class EphemerisDataSource:
             start_date: Start date for data
             end_date: End date for data
             step_hours: Step size for sampling data. Can be a string like '1h', '30m' or an integer for hours.
+            table: Positions already fetched for this range; if given, the
+                ephemeris is not queried
         """
         self.ephemeris = ephemeris
         self.planet_id = planet_id
@@ -95,56 +130,158 @@ class EphemerisDataSource:
             step=self.step_hours_str,
         )
 
-        logger.info(f"Fetching ephemeris data from {start_date} to {end_date}...")
+        if table is None:
+            logger.info(f"Fetching ephemeris data from {start_date} to {end_date}...")
+            table = self._fetch_table(ephemeris, planet_id, self.time_spec)
+        logger.debug(
+            f"Fetched {len(table)} rows with quantities {table.quantities}, "
+            f"looking for {self.standard_quantity}"
+        )
 
-        # Get the raw data with float timestamps
-        raw_data = ephemeris.get_planet_positions(planet_id, self.time_spec)
+        # Keep the table so other quantities can be read without refetching
+        self.table = table
 
-        # Debug: print first data point to see structure
-        if raw_data:
-            first_timestamp = next(iter(raw_data))
-            logger.debug("First data point structure:")
-            logger.debug(f"Timestamp: {first_timestamp}")
-            logger.debug(f"Data: {raw_data[first_timestamp]}")
-            logger.debug(f"Available keys: {list(raw_data[first_timestamp].keys())}")
-            logger.debug(
-                f"Looking for quantity: {self.quantity} (value: {self.quantity.value if hasattr(self.quantity, 'value') else self.quantity})"
+        # Keep each numeric quantity as a float64 column aligned with the dates
+        self.julian_dates: npt.NDArray[np.float64] = table.julian_dates
+        self.columns: Dict[Quantity, npt.NDArray[np.float64]] = {
+            quantity: np.asarray(column, dtype=np.float64)
+            for quantity, column in table.columns.items()
+            if column.dtype.kind in "iuf"
+        }
+        if len(table) and self.standard_quantity not in self.columns:
+            raise ValueError(
+                f"Ephemeris returned no numeric {self.standard_quantity} values; "
+                f"available quantities: {table.quantities}"
             )
+        self.values: npt.NDArray[np.float64] = self.columns.get(
+            self.standard_quantity, np.empty(0, dtype=np.float64)
+        )
 
-        # Convert float timestamps to datetime objects and store in self.data
-        self.data: Dict[datetime, Dict[Quantity, Any]] = {}
-        for timestamp, values in raw_data.items():
-            dt = (
-                datetime_from_julian(timestamp)
-                if isinstance(timestamp, float)
-                else timestamp
-            )
-            self.data[dt] = values
+    def with_quantity(
+        self, quantity: Union["EphemerisQuantity", "OrbitalElementsQuantity"]
+    ) -> "EphemerisDataSource":
+        """
+        Get a data source for another quantity of the same positions.
+
+        The positions already fetched are shared, not copied or refetched,
+        so several quantities can be fitted from a single query.
+
+        Args:
+            quantity: The quantity to get data for
+
+        Returns:
+            A data source for the quantity over the same times
+
+        Raises:
+            ValueError: If the positions have no numeric values of the quantity
+        """
+        return EphemerisDataSource(
+            ephemeris=self.ephemeris,
+            planet_id=self.planet_id,
+            quantity=quantity,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            step_hours=self.step_hours_str,
+            table=self.table,
+        )
+
+    @staticmethod
+    def _fetch_table(
+        ephemeris: PositionSource, planet_id: str, time_spec: TimeSpec
+    ) -> PositionTable:
+        """
+        Fetch positions from an ephemeris as a table.
+
+        Args:
+            ephemeris: The ephemeris source to use
+            planet_id: The planet ID to get data for
+            time_spec: The times to get data for
+
+        Returns:
+            The positions, in date order
+        """
+        if isinstance(ephemeris, Ephemeris):
+            return ephemeris.get_planet_positions_table(planet_id, time_spec)
+
+        # Duck-typed sources may key their positions by datetime
+        raw_data = ephemeris.get_planet_positions(planet_id, time_spec)
+        return PositionTable.from_positions(
+            {
+                julian_from_datetime(timestamp)
+                if isinstance(timestamp, datetime)
+                else timestamp: values
+                for timestamp, values in raw_data.items()
+            }
+        )
+
+    @property
+    def timestamps(self) -> List[datetime]:
+        """
+        The sample times as datetimes, in order.
+
+        The list is built on each access; use julian_dates for bulk work.
+        """
+        return [datetime_from_julian(jd) for jd in self.julian_dates.tolist()]
 
-        # Create sorted list of timestamps for binary search
-        self.timestamps = sorted(self.data.keys())
+    def index_range(self, start: datetime, end: datetime) -> Tuple[int, int]:
+        """
+        Find the samples between two datetimes, inclusive.
+
+        Sample times within SAMPLE_TIME_TOLERANCE of a bound count as on it.
+
+        Args:
+            start: Start datetime
+            end: End datetime
+
+        Returns:
+            (first, stop) indices such that julian_dates[first:stop] holds
+            the samples from start to end
+        """
+        first = np.searchsorted(
+            self.julian_dates,
+            julian_from_datetime(start) - SAMPLE_TIME_TOLERANCE,
+            "left",
+        )
+        stop = np.searchsorted(
+            self.julian_dates,
+            julian_from_datetime(end) + SAMPLE_TIME_TOLERANCE,
+            "right",
+        )
+        return int(first), max(int(first), int(stop))
+
+    def get_samples(
+        self, start: datetime, end: datetime
+    ) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """
+        Get the samples between two datetimes, inclusive.
+
+        Args:
+            start: Start datetime
+            end: End datetime
+
+        Returns:
+            (Julian dates, values) arrays; both are views of the stored data
+        """
+        first, stop = self.index_range(start, end)
+        return self.julian_dates[first:stop], self.values[first:stop]
 
     def get_value_at(self, dt: datetime) -> float:
         """
-        Get the value at a specific datetime by interpolating between data points.
+        Get the value at a sample time.
 
         Args:
             dt: The datetime to get a value for
 
         Returns:
             The value
+
+        Raises:
+            KeyError: If there is no sample at dt
         """
-        if dt in self.data:
-            data_keys = list(self.data[dt].keys())
-            logger.debug(
-                f"Looking up {self.standard_quantity} (type: {type(self.standard_quantity)}) in data with keys: {data_keys}"
-            )
-            if self.standard_quantity not in self.data[dt]:
-                logger.error(
-                    f"Key {self.standard_quantity} not in data! Available keys: {data_keys}"
-                )
-                logger.error(f"Key types: {[type(k) for k in data_keys]}")
-        return float(self.data[dt][self.standard_quantity])
+        first, stop = self.index_range(dt, dt)
+        if first == stop:
+            raise KeyError(dt)
+        return float(self.values[first])
 
     def get_values_in_range(
         self, start: datetime, end: datetime, step_hours: Optional[float] = None
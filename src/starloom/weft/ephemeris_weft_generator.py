@@ -6,7 +6,7 @@ uses an ephemeris source to generate .weft files.
 """
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Dict, Any, Optional, Union
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Sequence, Tuple, Union
 import os
 
 
@@ -19,8 +19,9 @@ if TYPE_CHECKING:
 
 from .weft_writer import WeftWriter
 from ..ephemeris.ephemeris import Ephemeris
+from ..ephemeris.time_spec import TimeSpec
 from .ephemeris_data_source import EphemerisDataSource
-from .block_selection import get_recommended_blocks
+from .block_selection import get_recommended_blocks, get_recommended_blocks_for_range
 from .logging import get_logger
 from ..horizons.orbital_elements_ephemeris import OrbitalElementsEphemeris
 from ..horizons.ephemeris import HorizonsEphemeris
@@ -28,6 +29,21 @@ from ..horizons.ephemeris import HorizonsEphemeris
 # Create a logger for this module
 logger = get_logger(__name__)
 
+# Quantities that are queried as orbital elements rather than observer positions
+ORBITAL_ELEMENT_QUANTITIES = {
+    Quantity.ASCENDING_NODE_LONGITUDE,
+    Quantity.ECCENTRICITY,
+    Quantity.PERIAPSIS_DISTANCE,
+    Quantity.APOAPSIS_DISTANCE,
+    Quantity.INCLINATION,
+    Quantity.ARGUMENT_OF_PERIFOCUS,
+    Quantity.MEAN_MOTION,
+    Quantity.MEAN_ANOMALY,
+    Quantity.TRUE_ANOMALY,
+    Quantity.SEMI_MAJOR_AXIS,
+    Quantity.ORBITAL_PERIOD,
+}
+
 
 def generate_weft_file(
     planet: Union[str, Planet],
@@ -40,6 +56,8 @@ def generate_weft_file(
     config: Optional[Dict[str, Any]] = None,
     step_hours: Union[int, str] = "24h",
     custom_timespan: Optional[str] = None,
+    stream: bool = False,
+    workers: int = 1,
 ) -> str:
     """
     Generate a .weft file for a planet and quantity using an ephemeris source.
@@ -55,13 +73,23 @@ def generate_weft_file(
         config: Configuration for the WEFT generator (if None, will be auto-configured)
         step_hours: Step size for sampling ephemeris data. Can be a string like '1h', '30m' or an integer for hours.
         custom_timespan: Optional custom timespan for the file preamble (e.g., "2000s" or "1950-2050")
+        stream: Whether to fetch, fit and write the file a chunk at a time, so
+            memory use does not grow with the length of the range (see
+            WeftWriter.stream_multi_precision_file)
+        workers: Number of processes to fit blocks with; the file is the same
+            for any number. Streamed files are fitted in this process, so
+            stream needs workers=1.
 
     Returns:
         The path to the generated .weft file
 
     Raises:
-        ValueError: If the planet or quantity is invalid
+        ValueError: If the planet or quantity is invalid, or if stream is
+            combined with more than one worker
     """
+    if stream and workers > 1:
+        raise ValueError("Streamed weft files are fitted in a single process")
+
     logger.debug("Starting weft file generation")
     logger.debug(
         f"Parameters: planet={planet}, quantity={quantity}, start_date={start_date}, end_date={end_date}, output_path={output_path}"
@@ -71,89 +99,38 @@ def generate_weft_file(
     if isinstance(step_hours, int):
         step_hours = f"{step_hours}h"
 
-    # Convert string planet to Planet enum if needed
-    if isinstance(planet, str):
-        try:
-            if planet.isdigit() or (planet.startswith("-") and planet[1:].isdigit()):
-                # It's a Horizons ID like "499" for Mars
-                planet_id = planet
-                planet_name = planet  # Use ID as name
-            else:
-                # Try as enum name
-                planet_enum = Planet[planet.upper()]
-                planet_id = planet_enum.value
-                planet_name = planet_enum.name.lower()
-        except KeyError:
-            raise ValueError(f"Unknown planet: {planet}")
-    else:
-        # It's already a Planet enum
-        planet_id = planet.value
-        planet_name = planet.name.lower()
-
-    from ..horizons.quantities import EphemerisQuantity
-    from ..horizons.parsers import OrbitalElementsQuantity
-
-    # Convert Quantity to EphemerisQuantity if needed
-    ephemeris_quantity = None
-    for eq in EphemerisQuantity:
-        if isinstance(quantity, Quantity) and eq.name == quantity.name:
-            ephemeris_quantity = eq
-            break
-        elif isinstance(quantity, EphemerisQuantity) and eq == quantity:
-            ephemeris_quantity = eq
-            break
-        elif isinstance(quantity, OrbitalElementsQuantity) and eq.name == quantity.name:
-            ephemeris_quantity = eq
-            break
-
-    if ephemeris_quantity is None:
-        raise ValueError(f"Unsupported quantity: {quantity}")
+    planet_id, planet_name = _resolve_planet(planet)
+    ephemeris_quantity = _to_ephemeris_quantity(quantity)
 
     # Create or use provided ephemeris client
     if ephemeris is None:
-        # Detect if we need OrbitalElementsEphemeris (for lunar nodes or orbital element quantities)
-        needs_orbital_elements = False
-
-        # Check if planet is LUNAR_NORTH_NODE
-        if isinstance(planet, Planet) and planet == Planet.LUNAR_NORTH_NODE:
-            needs_orbital_elements = True
-            # Convert lunar_north_node to Moon's Horizons ID for orbital elements query
-            planet_id = "301"
-        elif isinstance(planet, str) and planet.lower() == "lunar_north_node":
-            needs_orbital_elements = True
-            # Convert lunar_north_node to Moon's Horizons ID for orbital elements query
-            planet_id = "301"
-        elif planet_id == "lunar_north_node":
-            needs_orbital_elements = True
-            # Convert lunar_north_node to Moon's Horizons ID for orbital elements query
-            planet_id = "301"
-
-        # Check if quantity is an orbital element
-        if isinstance(quantity, Quantity):
-            orbital_element_quantities = {
-                Quantity.ASCENDING_NODE_LONGITUDE,
-                Quantity.ECCENTRICITY,
-                Quantity.PERIAPSIS_DISTANCE,
-                Quantity.APOAPSIS_DISTANCE,
-                Quantity.INCLINATION,
-                Quantity.ARGUMENT_OF_PERIFOCUS,
-                Quantity.MEAN_MOTION,
-                Quantity.MEAN_ANOMALY,
-                Quantity.TRUE_ANOMALY,
-                Quantity.SEMI_MAJOR_AXIS,
-                Quantity.ORBITAL_PERIOD,
-            }
-            if quantity in orbital_element_quantities:
-                needs_orbital_elements = True
-
-        if needs_orbital_elements:
-            ephemeris = OrbitalElementsEphemeris()
-        else:
-            ephemeris = HorizonsEphemeris()
+        ephemeris, planet_id = _default_ephemeris(planet, planet_id, quantity)
 
     # Create the writer
     writer = WeftWriter(quantity=ephemeris_quantity)
 
+    if stream:
+        print(f"Streaming .weft file for {planet_name} {ephemeris_quantity.name}...")
+        if config is None:
+            config = get_recommended_blocks_for_range(
+                TimeSpec.from_range(start_date, end_date, step_hours),
+                start_date,
+                end_date,
+            )
+            print(f"Auto-configured config: {config}")
+
+        writer.stream_multi_precision_file(
+            ephemeris=ephemeris,
+            planet_id=planet_id,
+            start_date=start_date,
+            end_date=end_date,
+            config=config,
+            output_path=output_path,
+            step_hours=step_hours,
+            custom_timespan=custom_timespan,
+        )
+        return output_path
+
     # Create data source
     data_source = EphemerisDataSource(
         ephemeris=ephemeris,
@@ -173,13 +150,143 @@ def generate_weft_file(
         config = get_recommended_blocks(data_source)
         print(f"Auto-configured config: {config}")
 
+    _write_weft_file(
+        writer,
+        data_source,
+        start_date,
+        end_date,
+        output_path,
+        config,
+        custom_timespan,
+        workers,
+    )
+
+    return output_path
+
+
+def generate_weft_files(
+    planet: Union[str, Planet],
+    quantities: Sequence[
+        Union["Quantity", "EphemerisQuantity", "OrbitalElementsQuantity"]
+    ],
+    start_date: datetime,
+    end_date: datetime,
+    output_paths: Sequence[str],
+    ephemeris: Optional[Ephemeris] = None,
+    data_dir: str = "./data",
+    config: Optional[Dict[str, Any]] = None,
+    step_hours: Union[int, str] = "24h",
+    custom_timespan: Optional[str] = None,
+    workers: int = 1,
+) -> List[str]:
+    """
+    Generate a .weft file for each of several quantities of a planet.
+
+    The positions are fetched from the ephemeris once, and every quantity is
+    fitted from them, instead of querying the ephemeris once per quantity as
+    separate generate_weft_file calls would. Each file is the same as the one
+    generate_weft_file writes for its quantity.
+
+    Args:
+        planet: The planet to generate data for (can be a Planet enum or a string name)
+        quantities: The quantities to generate data for
+        start_date: The start date for the ephemeris data
+        end_date: The end date for the ephemeris data
+        output_paths: Path where each quantity's .weft file should be saved
+        ephemeris: Optional ephemeris source to use. If None, one is chosen as in generate_weft_file
+        data_dir: Directory for data storage (only used if ephemeris is None)
+        config: Configuration for the WEFT generator (if None, will be auto-configured)
+        step_hours: Step size for sampling ephemeris data. Can be a string like '1h', '30m' or an integer for hours.
+        custom_timespan: Optional custom timespan for the file preambles (e.g., "2000s" or "1950-2050")
+        workers: Number of processes to fit blocks with; the files are the
+            same for any number
+
+    Returns:
+        The paths to the generated .weft files, in the order of quantities
+
+    Raises:
+        ValueError: If the planet or a quantity is invalid, the numbers of
+            quantities and output paths differ, or the quantities need
+            different ephemeris sources
+    """
+    if len(quantities) != len(output_paths):
+        raise ValueError(
+            f"Got {len(output_paths)} output paths for {len(quantities)} quantities"
+        )
+    if not quantities:
+        return []
+
+    # Convert step_hours to string format if it's an integer
+    if isinstance(step_hours, int):
+        step_hours = f"{step_hours}h"
+
+    planet_id, planet_name = _resolve_planet(planet)
+    ephemeris_quantities = [_to_ephemeris_quantity(q) for q in quantities]
+
+    if ephemeris is None:
+        if len({_needs_orbital_elements(planet, planet_id, q) for q in quantities}) > 1:
+            raise ValueError(
+                "Orbital element and observer quantities cannot be generated "
+                "from a single ephemeris query"
+            )
+        ephemeris, planet_id = _default_ephemeris(planet, planet_id, quantities[0])
+
+    # Fetch the positions once, through the first quantity's data source
+    first_source = EphemerisDataSource(
+        ephemeris=ephemeris,
+        planet_id=planet_id,
+        quantity=ephemeris_quantities[0],
+        start_date=start_date,
+        end_date=end_date,
+        step_hours=step_hours,
+    )
+
+    # Every quantity is sampled at the same times, so one config fits all
+    if config is None:
+        print("\nAuto-configuring block settings based on data availability...")
+        config = get_recommended_blocks(first_source)
+        print(f"Auto-configured config: {config}")
+
+    for ephemeris_quantity, output_path in zip(ephemeris_quantities, output_paths):
+        print(f"Generating .weft file for {planet_name} {ephemeris_quantity.name}...")
+        data_source = (
+            first_source
+            if ephemeris_quantity == first_source.quantity
+            else first_source.with_quantity(ephemeris_quantity)
+        )
+        _write_weft_file(
+            WeftWriter(quantity=ephemeris_quantity),
+            data_source,
+            start_date,
+            end_date,
+            output_path,
+            config,
+            custom_timespan,
+            workers,
+        )
+
+    return list(output_paths)
+
+
+def _write_weft_file(
+    writer: WeftWriter,
+    data_source: EphemerisDataSource,
+    start_date: datetime,
+    end_date: datetime,
+    output_path: str,
+    config: Dict[str, Any],
+    custom_timespan: Optional[str],
+    workers: int,
+) -> None:
+    """Fit a data source's blocks and save them to output_path."""
     weft_file = writer.create_multi_precision_file(
         data_source=data_source,
-        quantity=ephemeris_quantity,
+        quantity=data_source.quantity,
         start_date=start_date,
         end_date=end_date,
         config=config,
         custom_timespan=custom_timespan,
+        workers=workers,
     )
 
     # Ensure the output directory exists
@@ -189,4 +296,92 @@ def generate_weft_file(
     # Save the file
     writer.save_file(weft_file, output_path)
 
-    return output_path
+
+def _resolve_planet(planet: Union[str, Planet]) -> Tuple[str, str]:
+    """
+    Get a planet's Horizons ID and name.
+
+    Args:
+        planet: A Planet enum, a Planet name, or a Horizons ID
+
+    Returns:
+        (planet_id, planet_name)
+
+    Raises:
+        ValueError: If the planet is unknown
+    """
+    if isinstance(planet, Planet):
+        return planet.value, planet.name.lower()
+
+    if planet.isdigit() or (planet.startswith("-") and planet[1:].isdigit()):
+        # It's a Horizons ID like "499" for Mars, used as its own name
+        return planet, planet
+
+    try:
+        planet_enum = Planet[planet.upper()]
+    except KeyError:
+        raise ValueError(f"Unknown planet: {planet}")
+    return planet_enum.value, planet_enum.name.lower()
+
+
+def _to_ephemeris_quantity(
+    quantity: Union["Quantity", "EphemerisQuantity", "OrbitalElementsQuantity"],
+) -> "EphemerisQuantity":
+    """
+    Convert a quantity to the EphemerisQuantity of the same name.
+
+    Raises:
+        ValueError: If there is no such EphemerisQuantity
+    """
+    from ..horizons.quantities import EphemerisQuantity
+    from ..horizons.parsers import OrbitalElementsQuantity
+
+    for eq in EphemerisQuantity:
+        if isinstance(quantity, Quantity) and eq.name == quantity.name:
+            return eq
+        elif isinstance(quantity, EphemerisQuantity) and eq == quantity:
+            return eq
+        elif isinstance(quantity, OrbitalElementsQuantity) and eq.name == quantity.name:
+            return eq
+
+    raise ValueError(f"Unsupported quantity: {quantity}")
+
+
+def _needs_orbital_elements(
+    planet: Union[str, Planet],
+    planet_id: str,
+    quantity: Union["Quantity", "EphemerisQuantity", "OrbitalElementsQuantity"],
+) -> bool:
+    """Whether a planet and quantity must be queried as orbital elements."""
+    # The lunar nodes are computed from the Moon's orbital elements
+    if _is_lunar_north_node(planet, planet_id):
+        return True
+
+    return isinstance(quantity, Quantity) and quantity in ORBITAL_ELEMENT_QUANTITIES
+
+
+def _is_lunar_north_node(planet: Union[str, Planet], planet_id: str) -> bool:
+    """Whether the planet is the Moon's ascending node."""
+    if isinstance(planet, Planet):
+        return planet == Planet.LUNAR_NORTH_NODE
+    return planet.lower() == "lunar_north_node" or planet_id == "lunar_north_node"
+
+
+def _default_ephemeris(
+    planet: Union[str, Planet],
+    planet_id: str,
+    quantity: Union["Quantity", "EphemerisQuantity", "OrbitalElementsQuantity"],
+) -> Tuple[Ephemeris, str]:
+    """
+    Choose the ephemeris to query for a planet and quantity.
+
+    Returns:
+        The ephemeris, and the planet ID to query it with
+    """
+    if _is_lunar_north_node(planet, planet_id):
+        # Convert lunar_north_node to Moon's Horizons ID for orbital elements query
+        planet_id = "301"
+
+    if _needs_orbital_elements(planet, planet_id, quantity):
+        return OrbitalElementsEphemeris(), planet_id
+    return HorizonsEphemeris(), planet_id
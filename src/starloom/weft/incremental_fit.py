@@ -0,0 +1,84 @@
+"""
+Least-squares Chebyshev fitting of samples that arrive in chunks.
+
+chebfit needs every sample at once: for a multi-year block of minute samples
+that is millions of rows of a Vandermonde matrix with hundreds of columns.
+IncrementalChebyshevFit keeps only the triangular factor R of the QR
+factorization of [V | y], updating it with each chunk of rows, so its memory
+does not grow with the number of samples. The final solve scales the columns
+and truncates small singular values exactly as chebfit does, so when there
+are at least as many samples as coefficients, the coefficients match chebfit
+on all the samples, up to rounding.
+"""
+
+from typing import Optional
+
+import numpy as np
+import numpy.typing as npt
+from numpy.polynomial import chebyshev
+
+# Rows factored at a time, bounding the size of the Vandermonde matrix built
+# for a large chunk
+MAX_FACTOR_ROWS = 2048
+
+
+class IncrementalChebyshevFit:
+    """A Chebyshev least-squares fit built up from chunks of samples."""
+
+    def __init__(self, degree: int):
+        """
+        Initialize an empty fit.
+
+        Args:
+            degree: Degree of Chebyshev polynomial to fit
+        """
+        self.degree = degree
+        self.count = 0
+        self._r: Optional[npt.NDArray[np.float64]] = None
+
+    def add(self, x: npt.ArrayLike, values: npt.ArrayLike) -> None:
+        """
+        Add samples to the fit.
+
+        Args:
+            x: Sample positions in [-1, 1]
+            values: Sample values
+        """
+        x_array = np.asarray(x, dtype=np.float64)
+        value_array = np.asarray(values, dtype=np.float64)
+        for first in range(0, len(x_array), MAX_FACTOR_ROWS):
+            rows = np.column_stack(
+                [
+                    chebyshev.chebvander(
+                        x_array[first : first + MAX_FACTOR_ROWS], self.degree
+                    ),
+                    value_array[first : first + MAX_FACTOR_ROWS],
+                ]
+            )
+            if self._r is not None:
+                rows = np.vstack([self._r, rows])
+            self._r = np.asarray(np.linalg.qr(rows, mode="r"), dtype=np.float64)
+        self.count += len(x_array)
+
+    def coefficients(self) -> npt.NDArray[np.float64]:
+        """
+        Solve for the coefficients that best fit the samples added so far.
+
+        Returns:
+            degree + 1 Chebyshev coefficients
+
+        Raises:
+            ValueError: If no samples have been added
+        """
+        if self._r is None:
+            raise ValueError("No samples to fit")
+
+        lhs = self._r[:, : self.degree + 1]
+        rhs = self._r[:, self.degree + 1]
+
+        # Scale the columns to unit length and set rcond as chebfit does
+        scale = np.sqrt(np.sum(lhs * lhs, axis=0))
+        scale[scale == 0] = 1
+        rcond = self.count * np.finfo(np.float64).eps
+        coeffs = np.linalg.lstsq(lhs / scale, rhs, rcond=rcond)[0]
+        return np.asarray(coeffs / scale, dtype=np.float64)
@@ -0,0 +1,182 @@
+"""
+Evaluate a .weft file at many times across a pool of processes.
+
+WeftReader.get_values evaluates on one core. For very large batches,
+parallel_get_values splits the times into shards and evaluates them in worker
+processes. Nothing large is pickled: each worker memory-maps the .weft file
+itself, so all processes share the OS page cache, and the times and results
+live in shared memory that every worker reads and writes in place.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from ..space_time.julian_calc import datetime64_to_julian
+from .weft_reader import WeftReader
+
+# Number of points in each task handed to a worker, unless given
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+# Batches smaller than this are evaluated in the calling process, where
+# starting a pool would cost more than it saves
+MIN_PARALLEL_POINTS = 100_000
+
+# State of a worker process, set up once by _init_worker
+_worker_reader: Optional[WeftReader] = None
+_worker_memory: List[shared_memory.SharedMemory] = []
+_worker_times: Optional[npt.NDArray[np.float64]] = None
+_worker_output: Optional[npt.NDArray[np.float64]] = None
+
+
+def parallel_get_values(
+    file_path: str,
+    times: npt.ArrayLike,
+    processes: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    rates: bool = False,
+    offset: int = 0,
+    length: Optional[int] = None,
+) -> npt.NDArray[np.float64]:
+    """
+    Evaluate a .weft file at many times using a pool of processes.
+
+    Results are identical to WeftReader.get_values (or get_rates). Each
+    worker process memory-maps the file once and writes its shards' results
+    straight into a shared output array, which is copied out once at the end.
+    Batches of at most one chunk, or under MIN_PARALLEL_POINTS points, are
+    evaluated in the calling process.
+
+    Args:
+        file_path: Path to the .weft file, or to a file containing it
+        times: Array of Julian dates, or of datetime64 values (naive values are
+            treated as UTC)
+        processes: Number of worker processes (defaults to os.cpu_count())
+        chunk_size: Number of points in each task
+        rates: Whether to evaluate rates of change instead of values
+        offset: Position of the .weft data within the file
+        length: Size of the .weft data (defaults to the rest of the file)
+
+    Returns:
+        Array of values or rates with the same shape as times
+
+    Raises:
+        ValueError: If chunk_size or processes is not positive, the file is
+            invalid, or no block covers one of the times
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes < 1:
+        raise ValueError("processes must be positive")
+
+    times_array = np.asarray(times)
+    if np.issubdtype(times_array.dtype, np.datetime64):
+        jd = datetime64_to_julian(times_array).ravel()
+    else:
+        jd = times_array.astype(np.float64).ravel()
+
+    # Open the file here too, so format errors are raised in this process
+    reader = WeftReader()
+    reader.load_file(file_path, use_mmap=True, offset=offset, length=length)
+    try:
+        if processes == 1 or jd.size < MIN_PARALLEL_POINTS or jd.size <= chunk_size:
+            values = reader.get_rates(jd) if rates else reader.get_values(jd)
+            return values.reshape(times_array.shape)
+    finally:
+        reader.close()
+
+    times_memory = shared_memory.SharedMemory(create=True, size=jd.nbytes)
+    output_memory = shared_memory.SharedMemory(create=True, size=jd.nbytes)
+    shared_times: Optional[npt.NDArray[np.float64]] = None
+    output: Optional[npt.NDArray[np.float64]] = None
+    try:
+        shared_times = np.ndarray(jd.shape, dtype=np.float64, buffer=times_memory.buf)
+        shared_times[:] = jd
+        output = np.ndarray(jd.shape, dtype=np.float64, buffer=output_memory.buf)
+
+        bounds = range(0, jd.size, chunk_size)
+        with ProcessPoolExecutor(
+            max_workers=min(processes, len(bounds)),
+            initializer=_init_worker,
+            initargs=(
+                file_path,
+                offset,
+                length,
+                times_memory.name,
+                output_memory.name,
+                jd.size,
+            ),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _evaluate_shard, start, min(start + chunk_size, jd.size), rates
+                )
+                for start in bounds
+            ]
+            for future in futures:
+                future.result()
+
+        return output.reshape(times_array.shape).copy()
+    finally:
+        # Drop the views so the shared memory can be closed
+        shared_times = output = None
+        for memory in (times_memory, output_memory):
+            memory.close()
+            memory.unlink()
+
+
+def _init_worker(
+    file_path: str,
+    offset: int,
+    length: Optional[int],
+    times_name: str,
+    output_name: str,
+    size: int,
+) -> None:
+    """
+    Set up a worker process: memory-map the file and attach the shared arrays.
+
+    Args:
+        file_path: Path to the .weft file, or to a file containing it
+        offset: Position of the .weft data within the file
+        length: Size of the .weft data
+        times_name: Name of the shared memory holding the Julian dates
+        output_name: Name of the shared memory receiving the results
+        size: Number of points
+    """
+    global _worker_reader, _worker_memory, _worker_times, _worker_output
+
+    _worker_reader = WeftReader()
+    _worker_reader.load_file(file_path, use_mmap=True, offset=offset, length=length)
+
+    _worker_memory = [
+        shared_memory.SharedMemory(name=times_name),
+        shared_memory.SharedMemory(name=output_name),
+    ]
+    _worker_times = np.ndarray((size,), dtype=np.float64, buffer=_worker_memory[0].buf)
+    _worker_output = np.ndarray((size,), dtype=np.float64, buffer=_worker_memory[1].buf)
+
+
+def _evaluate_shard(start: int, stop: int, rates: bool) -> None:
+    """
+    Evaluate one shard of the shared times into the shared output.
+
+    Args:
+        start: Index of the shard's first point
+        stop: Index after the shard's last point
+        rates: Whether to evaluate rates of change instead of values
+    """
+    assert _worker_reader is not None
+    assert _worker_times is not None and _worker_output is not None
+
+    shard = _worker_times[start:stop]
+    if rates:
+        _worker_output[start:stop] = _worker_reader.get_rates(shard)
+    else:
+        _worker_output[start:stop] = _worker_reader.get_values(shard)
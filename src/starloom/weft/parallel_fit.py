@@ -0,0 +1,181 @@
+"""
+Fit the blocks of a .weft file across a pool of processes.
+
+WeftWriter fits its windows in batches (see fit_window_batch), one batch
+after another. With WeftWriter.create_multi_precision_file(workers=N), a
+FitPool hands the batches to N worker processes instead. The data source's
+sample arrays are copied once into shared memory, which every worker reads in
+place, so each task only carries the index ranges and bounds of its windows.
+The batches are the same whatever the number of workers, and the results are
+collected in submission order, so the file is byte-identical to one written
+in a single process.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from types import TracebackType
+from typing import List, Optional, Sequence, Tuple, Type
+
+import numpy as np
+import numpy.typing as npt
+
+from .ephemeris_data_source import EphemerisDataSource
+from .weft_writer import WindowSpan, fit_window_batch
+
+# Batches with fewer samples in total than this are fitted in the calling
+# process, where handing them to a worker would cost more than it saves
+MIN_PARALLEL_SAMPLES = 100_000
+
+# State of a worker process, set up once by _init_worker
+_worker_memory: List[shared_memory.SharedMemory] = []
+_worker_julian_dates: Optional[npt.NDArray[np.float64]] = None
+_worker_values: Optional[npt.NDArray[np.float64]] = None
+
+
+class FitPool:
+    """A pool of processes fitting windows of one data source's samples."""
+
+    def __init__(self, data_source: EphemerisDataSource, workers: int):
+        """
+        Copy the data source's samples to shared memory and start the workers.
+
+        Args:
+            data_source: The data source whose windows will be fitted
+            workers: Number of worker processes
+
+        Raises:
+            ValueError: If workers is not positive
+        """
+        if workers < 1:
+            raise ValueError("workers must be positive")
+        self.data_source = data_source
+        self.workers = workers
+
+        size = len(data_source.julian_dates)
+        # SharedMemory cannot be empty
+        nbytes = max(size * np.dtype(np.float64).itemsize, 1)
+        self._memory: List[shared_memory.SharedMemory] = []
+        try:
+            for array in (data_source.julian_dates, data_source.values):
+                memory = shared_memory.SharedMemory(create=True, size=nbytes)
+                self._memory.append(memory)
+                np.ndarray((size,), dtype=np.float64, buffer=memory.buf)[:] = array
+
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self._memory[0].name, self._memory[1].name, size),
+            )
+        except BaseException:
+            # Nothing else holds the segments, so they would outlive the process
+            self._release_memory()
+            raise
+
+    def map(
+        self,
+        tasks: Sequence[Sequence[WindowSpan]],
+        degree: int,
+        wrap_range: Optional[Tuple[float, float]] = None,
+    ) -> List[npt.NDArray[np.float64]]:
+        """
+        Fit batches of windows, as fit_window_batch does.
+
+        Args:
+            tasks: The windows of each batch
+            degree: Degree of Chebyshev polynomial to fit
+            wrap_range: (min, max) of a wrapping quantity
+
+        Returns:
+            The coefficients of each batch, in order
+        """
+        samples = sum(stop - first for task in tasks for first, stop, _, _ in task)
+        if len(tasks) < 2 or samples < MIN_PARALLEL_SAMPLES:
+            return [
+                fit_window_batch(
+                    self.data_source.julian_dates,
+                    self.data_source.values,
+                    task,
+                    degree,
+                    wrap_range,
+                )
+                for task in tasks
+            ]
+
+        futures = [
+            self._executor.submit(_fit_batch, task, degree, wrap_range)
+            for task in tasks
+        ]
+        return [future.result() for future in futures]
+
+    def close(self) -> None:
+        """Stop the workers and release the shared memory."""
+        self._executor.shutdown()
+        self._release_memory()
+
+    def _release_memory(self) -> None:
+        """Close and unlink the shared memory segments created so far."""
+        for memory in self._memory:
+            memory.close()
+            memory.unlink()
+        self._memory = []
+
+    def __enter__(self) -> "FitPool":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def _init_worker(julian_dates_name: str, values_name: str, size: int) -> None:
+    """
+    Set up a worker process: attach the shared sample arrays.
+
+    The worker keeps its handles open for as long as it runs, since the
+    arrays are views of them and a handle cannot be closed while views
+    exist. ProcessPoolExecutor has no hook that runs when a worker exits,
+    and the mappings are released with the process. The segments
+    themselves are unlinked by FitPool.close in the parent, after the
+    workers have stopped.
+
+    Args:
+        julian_dates_name: Name of the shared memory holding the sample times
+        values_name: Name of the shared memory holding the sample values
+        size: Number of samples
+    """
+    global _worker_memory, _worker_julian_dates, _worker_values
+
+    _worker_memory = [
+        shared_memory.SharedMemory(name=julian_dates_name),
+        shared_memory.SharedMemory(name=values_name),
+    ]
+    _worker_julian_dates = np.ndarray(
+        (size,), dtype=np.float64, buffer=_worker_memory[0].buf
+    )
+    _worker_values = np.ndarray((size,), dtype=np.float64, buffer=_worker_memory[1].buf)
+
+
+def _fit_batch(
+    windows: Sequence[WindowSpan],
+    degree: int,
+    wrap_range: Optional[Tuple[float, float]],
+) -> npt.NDArray[np.float64]:
+    """
+    Fit one batch of windows of the shared samples.
+
+    Args:
+        windows: The windows to fit
+        degree: Degree of Chebyshev polynomial to fit
+        wrap_range: (min, max) of a wrapping quantity
+
+    Returns:
+        The batch's coefficients
+    """
+    assert _worker_julian_dates is not None and _worker_values is not None
+    return fit_window_batch(
+        _worker_julian_dates, _worker_values, windows, degree, wrap_range
+    )
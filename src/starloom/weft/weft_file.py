@@ -8,9 +8,29 @@ to store astronomical values efficiently. It supports multiple levels of precisi
 - Daily blocks for short-term, high-precision data
 """
 
-from datetime import datetime, timezone
-from typing import Union, Tuple, Literal, TypedDict, Sequence, List, Dict, Optional
-from io import BytesIO
+import math
+import mmap
+import os
+import struct
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timezone
+from itertools import accumulate
+from typing import (
+    Union,
+    Tuple,
+    Literal,
+    TypedDict,
+    Sequence,
+    List,
+    Dict,
+    Optional,
+    BinaryIO,
+    cast,
+)
+from io import BytesIO, SEEK_SET, SEEK_CUR, SEEK_END
+
+import numpy as np
+import numpy.typing as npt
 
 from .blocks import (
     MultiYearBlock,
@@ -18,7 +38,12 @@ from .blocks import (
     FortyEightHourBlock,
     FortyEightHourSectionHeader,
 )
+from .blocks.utils import date_from_julian, julian_from_date
+from .block_cache import BlockCache, DEFAULT_CACHE_ENTRIES
+from .columnar import SectionArrays, TierArrays
+from .weft_index import INDEX_VERSION, IndexedBlock, WeftIndex, WeftIndexEntry
 from .logging import get_logger
+from ..space_time.julian_calc import datetime_to_julian
 
 __all__ = [
     "WeftFile",
@@ -30,8 +55,16 @@ __all__ = [
     "MonthlyBlock",
     "FortyEightHourBlock",
     "FortyEightHourSectionHeader",
+    "WeftIndex",
+    "add_index",
 ]
 
+# Maximum size of a preamble in bytes
+_MAX_PREAMBLE_SIZE = 1001
+
+# Versions sharing the v0.02 block layout, which add_index can upgrade
+_INDEXABLE_VERSIONS = {"v0.02", INDEX_VERSION}
+
 # Define block types
 BlockType = Union[
     MultiYearBlock,
@@ -53,6 +86,84 @@ class UnboundedBehavior(TypedDict):
 
 ValueBehavior = Union[RangedBehavior, UnboundedBehavior]
 
+# Binary buffers a LazyWeftFile can decode from without copying
+WeftBuffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+
+class _BufferReader:
+    """
+    A minimal read-only stream over a memoryview.
+
+    Unlike BytesIO, wrapping a memoryview (e.g. of a memory-mapped file) does
+    not copy the underlying buffer; each read only copies the requested bytes.
+    """
+
+    def __init__(self, view: memoryview, end: Optional[int] = None):
+        self._view = view
+        self._end = len(view) if end is None else end
+        self._position = 0
+
+    def read(self, size: int = -1) -> bytes:
+        end = self._end if size < 0 else min(self._position + size, self._end)
+        data = self._view[self._position : end].tobytes()
+        self._position += len(data)
+        return data
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        if whence == SEEK_CUR:
+            offset += self._position
+        elif whence == SEEK_END:
+            offset += self._end
+        self._position = max(0, offset)
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+
+class _IntervalIndex:
+    """
+    A sorted index of half-open [start, end) Julian date intervals.
+
+    Intervals are sorted by start date alongside a running maximum of their end
+    dates. A lookup bisects to the last interval starting at or before the query
+    and walks back only while an earlier interval could still reach it, so
+    disjoint intervals are found in O(log n).
+    """
+
+    def __init__(self, intervals: Sequence[Tuple[float, float, int]]):
+        """
+        Initialize the index.
+
+        Args:
+            intervals: (start, end, position) triples, where position identifies
+                the interval's block in file order
+        """
+        ordered = sorted(intervals, key=lambda interval: interval[0])
+        self._starts = [start for start, _, _ in ordered]
+        self._ends = [end for _, end, _ in ordered]
+        self._positions = [position for _, _, position in ordered]
+        self._max_ends = list(accumulate(self._ends, max))
+
+    def find(self, jd: float) -> List[int]:
+        """
+        Find the intervals containing a Julian date.
+
+        Args:
+            jd: The Julian date to look up
+
+        Returns:
+            Positions of the intervals containing jd, in ascending order
+        """
+        matches = []
+        i = bisect_right(self._starts, jd) - 1
+        while i >= 0 and self._max_ends[i] > jd:
+            if self._ends[i] > jd:
+                matches.append(self._positions[i])
+            i -= 1
+        matches.sort()
+        return matches
+
 
 class WeftFile:
     """
@@ -191,15 +302,29 @@ class WeftFile:
             "block_count": len(self.blocks),
         }
 
-    def to_bytes(self) -> bytes:
+    def to_bytes(self, include_index: bool = False) -> bytes:
         """Convert file to binary format.
 
+        Args:
+            include_index: Whether to append a table-of-contents index (see
+                WeftIndex). The preamble's version is raised to v0.03 if needed.
+
         Returns:
             Binary representation of file
         """
-        result = bytearray(self.preamble.encode("utf-8"))
+        preamble = self.preamble
+        if include_index:
+            preamble = _with_version(preamble, INDEX_VERSION)
+
+        result = bytearray(preamble.encode("utf-8"))
+        entries: List[WeftIndexEntry] = []
         for block in self.blocks:
+            if include_index and not isinstance(block, FortyEightHourBlock):
+                entries.append(WeftIndexEntry.for_block(block, len(result)))
             result.extend(block.to_bytes())
+
+        if include_index:
+            result.extend(WeftIndex(entries).to_bytes())
         return bytes(result)
 
     @classmethod
@@ -218,14 +343,8 @@ class WeftFile:
         """
         # Read preamble
         stream = BytesIO(data)
-        preamble = ""
-        while True:
-            char = stream.read(1).decode("utf-8")
-            preamble += char
-            if preamble.endswith("\n\n"):
-                break
-            if len(preamble) > 1000:  # Reasonable maximum preamble size
-                raise ValueError("Invalid preamble format")
+        preamble = _read_preamble(memoryview(data))
+        stream.seek(len(preamble.encode("utf-8")))
 
         blocks: list[BlockType] = []
         current_header: Optional[FortyEightHourSectionHeader] = None
@@ -234,7 +353,7 @@ class WeftFile:
         while True:
             # Try to read marker
             marker = stream.read(2)
-            if not marker:  # End of file
+            if not marker or marker == WeftIndex.marker:  # End of blocks
                 break
 
             # Determine block type and read
@@ -296,15 +415,16 @@ class WeftFile:
 
         return cls(preamble=preamble, blocks=blocks)
 
-    def write_to_file(self, filepath: str) -> None:
+    def write_to_file(self, filepath: str, include_index: bool = False) -> None:
         """
         Write the .weft file to disk.
 
         Args:
             filepath: Path to write the file to
+            include_index: Whether to append a table-of-contents index
         """
         with open(filepath, "wb") as f:
-            f.write(self.to_bytes())
+            f.write(self.to_bytes(include_index=include_index))
 
     @classmethod
     def combine(
@@ -351,7 +471,11 @@ class WeftFile:
         def err(msg: str) -> None:
             raise ValueError(msg)
 
-        if parts1[0] != parts2[0] or parts1[1] != parts2[1]:
+        # v0.03 only adds an optional index, so its blocks combine with v0.02
+        versions = {parts1[1], parts2[1]}
+        if parts1[0] != parts2[0] or (
+            len(versions) > 1 and not versions <= _INDEXABLE_VERSIONS
+        ):
             err("Weft format/version mismatch")
         if parts1[2] != parts2[2]:
             err(f"Files are for different planets: {parts1[2]} vs {parts2[2]}")
@@ -548,9 +672,20 @@ class LazyWeftFile(WeftFile):
     1. Reading and parsing MultiYearBlocks and MonthlyBlocks immediately
     2. Reading FortyEightHourSectionHeaders immediately
     3. Deferring reading of FortyEightHourBlocks until they are needed
+    4. Indexing blocks by date at load time, so lookups do not scan the file
+    5. Keeping recently decoded FortyEightHourBlocks and sections in an LRU cache
+    6. Decoding sections into NumPy coefficient matrices (see SectionArrays) and
+       keeping the monthly and multi-year tiers as matrices too (see TierArrays)
 
     When a FortyEightHourBlock is requested, it will be loaded from the original file data
     based on its section header information.
+
+    Once loaded, a LazyWeftFile can be read from several threads at once. The
+    file data is never written, the indexes are built before the file is
+    returned, decoded arrays are read-only, and the per-section memos hold
+    immutable values that are published whole, so a race at worst decodes
+    the same thing twice. The block cache serializes its own bookkeeping.
+    close() must not be called while other threads are reading.
     """
 
     def __init__(
@@ -558,8 +693,10 @@ class LazyWeftFile(WeftFile):
         preamble: str,
         blocks: Sequence[BlockType],
         value_behavior: ValueBehavior = UnboundedBehavior(type="unbounded"),
-        file_data: Optional[bytes] = None,
+        file_data: Optional[WeftBuffer] = None,
         section_positions: Optional[Dict[FortyEightHourSectionHeader, int]] = None,
+        cache_entries: int = DEFAULT_CACHE_ENTRIES,
+        cache_bytes: Optional[int] = None,
     ):
         """
         Initialize a LazyWeftFile.
@@ -568,20 +705,93 @@ class LazyWeftFile(WeftFile):
             preamble: The file preamble
             blocks: List of data blocks (excluding FortyEightHourBlocks)
             value_behavior: The value behavior
-            file_data: Original binary file data
+            file_data: Original binary file data (bytes, memoryview, or mmap)
             section_positions: Dict mapping section headers to file positions
+            cache_entries: Maximum number of decoded blocks and sections to cache
+                (0 disables the cache)
+            cache_bytes: Optional byte budget for the cache, based on the size of
+                the decoded coefficients
         """
         super().__init__(preamble, blocks, value_behavior)
         self.file_data = file_data
         self.section_positions = section_positions or {}
+        self._view: Optional[memoryview] = (
+            memoryview(file_data) if file_data is not None else None
+        )
+        self._mmap: Optional[mmap.mmap] = None
+        self._mmap_view: Optional[memoryview] = None
+        self._dense_sections: Dict[FortyEightHourSectionHeader, bool] = {}
+        self._section_centers: Dict[FortyEightHourSectionHeader, Tuple[float, ...]] = {}
+        self.block_cache = BlockCache(cache_entries, cache_bytes)
+        self._build_index()
+
+    def _build_index(self) -> None:
+        """
+        Build the date indexes used to look up blocks.
+
+        Multi-year blocks and section headers go into sorted interval indexes,
+        and monthly blocks are keyed by (year, month). Every index stores
+        positions in self.blocks, so lookups can return blocks in file order.
+        The monthly and multi-year tiers are also kept in columnar form for
+        batch evaluation.
+        """
+        multi_year: List[Tuple[float, float, int]] = []
+        sections: List[Tuple[float, float, int]] = []
+        self._monthly_index: Dict[Tuple[int, int], List[int]] = {}
+
+        for position, block in enumerate(self.blocks):
+            if isinstance(block, MultiYearBlock):
+                multi_year.append((*block.julian_span(), position))
+            elif isinstance(block, MonthlyBlock):
+                key = (block.year, block.month)
+                self._monthly_index.setdefault(key, []).append(position)
+            elif isinstance(block, FortyEightHourSectionHeader):
+                sections.append((*block.julian_span(), position))
+
+        self._multi_year_index = _IntervalIndex(multi_year)
+        self._section_index = _IntervalIndex(sections)
+
+        self.monthly_arrays = TierArrays.from_blocks(
+            [block for block in self.blocks if isinstance(block, MonthlyBlock)]
+        )
+        self.multi_year_arrays = TierArrays.from_blocks(
+            [block for block in self.blocks if isinstance(block, MultiYearBlock)]
+        )
+
+    def _find_monthly_positions(self, jd: float) -> List[int]:
+        """
+        Find the positions of the monthly blocks covering a Julian date.
+
+        Args:
+            jd: The Julian date to look up
+
+        Returns:
+            Positions in self.blocks of the monthly blocks for jd's month
+        """
+        try:
+            day = date_from_julian(jd)
+        except ValueError:
+            return []
+        return self._monthly_index.get((day.year, day.month), [])
 
     @classmethod
-    def from_bytes(cls, data: bytes) -> "LazyWeftFile":
+    def from_bytes(
+        cls,
+        data: WeftBuffer,
+        cache_entries: int = DEFAULT_CACHE_ENTRIES,
+        cache_bytes: Optional[int] = None,
+    ) -> "LazyWeftFile":
         """
         Create a LazyWeftFile from binary data.
 
+        The data is never copied as a whole: the preamble, multi-year blocks,
+        monthly blocks and section headers are read through a memoryview, and
+        FortyEightHourBlocks are decoded later from slices of it.
+
         Args:
-            data: Binary data to read from
+            data: Binary data to read from (bytes, memoryview, or mmap)
+            cache_entries: Maximum number of decoded blocks and sections to cache
+            cache_bytes: Optional byte budget for the decoded block cache
 
         Returns:
             A LazyWeftFile instance with lazily loaded FortyEightHourBlocks
@@ -589,58 +799,24 @@ class LazyWeftFile(WeftFile):
         Raises:
             ValueError: If the data format is invalid
         """
-        # Read preamble
-        stream = BytesIO(data)
-        preamble = ""
-        while True:
-            char = stream.read(1).decode("utf-8")
-            preamble += char
-            if preamble.endswith("\n\n"):
-                break
-            if len(preamble) > 1000:  # Reasonable maximum preamble size
-                raise ValueError("Invalid preamble format")
+        with memoryview(data) as view:
+            preamble = _read_preamble(view)
 
-        # Parse value behavior from preamble
-        value_behavior = WeftFile._parse_value_behavior(preamble)
+            # Parse value behavior from preamble
+            value_behavior = WeftFile._parse_value_behavior(preamble)
 
-        blocks: list[BlockType] = []
-        current_header: Optional[FortyEightHourSectionHeader] = None
-        section_positions: Dict[FortyEightHourSectionHeader, int] = {}
+            # Files with an index list their blocks at the end; others are scanned
+            located = _read_index(view, preamble)
+            if located is None:
+                located = _scan_blocks(view, len(preamble.encode("utf-8")))
+            blocks: list[BlockType] = [block for _, block in located]
 
-        while True:
-            # Try to read marker
-            marker = stream.read(2)
-            if not marker:  # End of file
-                break
-
-            # Determine block type and read
-            if marker == MultiYearBlock.marker:
-                blocks.append(MultiYearBlock.from_stream(stream))
-            elif marker == MonthlyBlock.marker:
-                blocks.append(MonthlyBlock.from_stream(stream))
-            elif marker == FortyEightHourSectionHeader.marker:
-                # Read the new header
-                header = FortyEightHourSectionHeader.from_stream(stream)
-                blocks.append(header)
-
-                # Store the position right after the header
-                section_positions[header] = stream.tell()
-                current_header = header
-
-                # Skip all the blocks in this section instead of reading them
-                section_size = header.block_size * header.block_count
-                stream.seek(section_size, 1)  # Seek relative to current position
-            elif marker == FortyEightHourBlock.marker:
-                # We shouldn't reach here with lazy loading, but if we do:
-                if current_header is None:
-                    raise ValueError("FortyEightHourBlock without a preceding header")
-
-                # Skip the block
-                stream.seek(
-                    current_header.block_size - 2, 1
-                )  # -2 for the marker already read
-            else:
-                raise ValueError(f"Unknown block type marker: {marker!r}")
+            # Store the position of each section's blocks, right after its header
+            section_positions: Dict[FortyEightHourSectionHeader, int] = {
+                block: offset + len(block.to_bytes())
+                for offset, block in located
+                if isinstance(block, FortyEightHourSectionHeader)
+            }
 
         # Return the LazyWeftFile with information needed for lazy loading
         return cls(
@@ -649,14 +825,150 @@ class LazyWeftFile(WeftFile):
             value_behavior=value_behavior,  # Pass the parsed value behavior
             file_data=data,
             section_positions=section_positions,
+            cache_entries=cache_entries,
+            cache_bytes=cache_bytes,
+        )
+
+    @classmethod
+    def from_mmap(
+        cls,
+        file_path: str,
+        cache_entries: int = DEFAULT_CACHE_ENTRIES,
+        cache_bytes: Optional[int] = None,
+        offset: int = 0,
+        length: Optional[int] = None,
+    ) -> "LazyWeftFile":
+        """
+        Create a LazyWeftFile backed by a read-only memory map of a .weft file.
+
+        Opening is cheap regardless of file size: only the pages holding the
+        preamble, multi-year blocks, monthly blocks and section headers are
+        touched, and FortyEightHourBlocks are decoded straight from the mapping.
+        The mapping lives in the OS page cache, so several processes opening the
+        same file share its memory. Call close() to release the mapping.
+
+        A .weft file stored inside a larger file, such as a member of an indexed
+        weftball, is mapped by passing its offset and length.
+
+        Args:
+            file_path: Path to the .weft file, or to the file containing it
+            cache_entries: Maximum number of decoded blocks and sections to cache
+            cache_bytes: Optional byte budget for the decoded block cache
+            offset: Position of the .weft data within the file
+            length: Size of the .weft data (defaults to the rest of the file)
+
+        Returns:
+            A LazyWeftFile instance reading from the memory-mapped file
+
+        Raises:
+            ValueError: If the file is empty or the data format is invalid
+        """
+        # Mappings must start at a multiple of the allocation granularity
+        skip = offset % mmap.ALLOCATIONGRANULARITY
+        with open(file_path, "rb") as f:
+            if length is None:
+                length = os.fstat(f.fileno()).st_size - offset
+            mapped = mmap.mmap(
+                f.fileno(),
+                length + skip,
+                access=mmap.ACCESS_READ,
+                offset=offset - skip,
+            )
+
+        data: WeftBuffer = mapped
+        if skip:
+            data = memoryview(mapped)[skip:]
+        try:
+            weft_file = cls.from_bytes(data, cache_entries, cache_bytes)
+        except Exception:
+            if isinstance(data, memoryview):
+                data.release()
+            mapped.close()
+            raise
+
+        weft_file._mmap = mapped
+        if isinstance(data, memoryview):
+            weft_file._mmap_view = data
+        return weft_file
+
+    def close(self) -> None:
+        """
+        Release the file data, closing the memory map if there is one.
+
+        The file can no longer load FortyEightHourBlocks after it is closed.
+        """
+        self.block_cache.clear()
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        self.file_data = None
+        if self._mmap_view is not None:
+            self._mmap_view.release()
+            self._mmap_view = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _decode_rows(
+        self, header: FortyEightHourSectionHeader, index: int, count: int
+    ) -> SectionArrays:
+        """
+        Decode a run of FortyEightHourBlocks in a section into arrays.
+
+        The blocks are read with a single np.frombuffer over a slice of the
+        file data, without copying the rest of the file.
+
+        Args:
+            header: The section header
+            index: The 0-based index of the first block
+            count: The number of blocks to decode
+
+        Returns:
+            SectionArrays for the requested blocks
+
+        Raises:
+            ValueError: If the section cannot be loaded or its data is invalid
+        """
+        if self._view is None or header not in self.section_positions:
+            raise ValueError("Section not found or file data not available")
+
+        start = self.section_positions[header] + index * header.block_size
+        return SectionArrays.from_buffer(
+            header, self._view[start : start + count * header.block_size], count, index
         )
 
+    def get_section_arrays(self, header: FortyEightHourSectionHeader) -> SectionArrays:
+        """
+        Get every FortyEightHourBlock of a section as a coefficient matrix.
+
+        Decoded sections are kept in the block cache.
+
+        Args:
+            header: The section header
+
+        Returns:
+            SectionArrays with one row per block in the section
+
+        Raises:
+            ValueError: If the section cannot be loaded or its data is invalid
+        """
+        key = ("arrays", header)
+        cached = self.block_cache.get(key)
+        if cached is not None:
+            return cast(SectionArrays, cached)
+
+        arrays = self._decode_rows(header, 0, header.block_count)
+        self.block_cache.put(key, arrays, arrays.nbytes)
+        return arrays
+
     def get_blocks_in_section(
         self, header: FortyEightHourSectionHeader
     ) -> List[FortyEightHourBlock]:
         """
         Load FortyEightHourBlocks for a specific section header.
 
+        Decoded sections are kept in the block cache.
+
         Args:
             header: The section header to load blocks for
 
@@ -666,26 +978,16 @@ class LazyWeftFile(WeftFile):
         Raises:
             ValueError: If the section cannot be loaded
         """
-        if self.file_data is None or header not in self.section_positions:
-            raise ValueError("Section not found or file data not available")
-
-        # Create stream from file data
-        stream = BytesIO(self.file_data)
-
-        # Seek to the position right after the header
-        stream.seek(self.section_positions[header])
+        key = ("section", header)
+        cached = self.block_cache.get(key)
+        if cached is not None:
+            return list(cached)
 
-        # Read all blocks in this section
-        blocks = []
-        for _ in range(header.block_count):
-            marker = stream.read(2)
-            if marker != FortyEightHourBlock.marker:
-                raise ValueError(f"Expected FortyEightHourBlock marker, got {marker!r}")
-
-            block = FortyEightHourBlock.from_stream(stream, header)
-            blocks.append(block)
+        arrays = self.get_section_arrays(header)
+        blocks = [arrays.block(i) for i in range(len(arrays))]
 
-        return blocks
+        self.block_cache.put(key, blocks, _decoded_size(blocks))
+        return list(blocks)
 
     def get_forty_eight_hour_block_at_index(
         self, header: FortyEightHourSectionHeader, index: int
@@ -693,6 +995,8 @@ class LazyWeftFile(WeftFile):
         """
         Load a specific FortyEightHourBlock by its index in the section.
 
+        Decoded blocks are kept in the block cache.
+
         Args:
             header: The section header
             index: The 0-based index of the block within the section
@@ -703,7 +1007,7 @@ class LazyWeftFile(WeftFile):
         Raises:
             ValueError: If the index is out of range or section cannot be loaded
         """
-        if self.file_data is None or header not in self.section_positions:
+        if self._view is None or header not in self.section_positions:
             raise ValueError("Section not found or file data not available")
 
         if index < 0 or index >= header.block_count:
@@ -711,25 +1015,13 @@ class LazyWeftFile(WeftFile):
                 f"Block index {index} out of range (0-{header.block_count - 1})"
             )
 
-        # Create stream from file data
-        stream = BytesIO(self.file_data)
-
-        # Calculate position of the specific block
-        section_start = self.section_positions[header]
-        block_position = section_start + (index * header.block_size)
-
-        # Seek to the position of the block
-        stream.seek(block_position)
-
-        # Read the marker
-        marker = stream.read(2)
-        if marker != FortyEightHourBlock.marker:
-            raise ValueError(
-                f"Expected FortyEightHourBlock marker at index {index}, got {marker!r}"
-            )
+        key = ("block", header, index)
+        cached = self.block_cache.get(key)
+        if cached is not None:
+            return cast(FortyEightHourBlock, cached)
 
-        # Read the block
-        block = FortyEightHourBlock.from_stream(stream, header)
+        block = self._decode_rows(header, index, 1).block(0)
+        self.block_cache.put(key, block, _decoded_size([block]))
         return block
 
     def find_blocks_for_datetime_in_section(
@@ -748,57 +1040,147 @@ class LazyWeftFile(WeftFile):
         Raises:
             ValueError: If the section cannot be loaded
         """
-        if self.file_data is None or header not in self.section_positions:
+        return self.find_blocks_for_julian_in_section(header, _datetime_to_julian(dt))
+
+    def find_blocks_for_julian_in_section(
+        self, header: FortyEightHourSectionHeader, jd: float
+    ) -> List[FortyEightHourBlock]:
+        """
+        Find FortyEightHourBlocks in a section whose ±24 hour window contains a Julian date.
+
+        In dense sections (one block per consecutive day, as WeftWriter emits)
+        the neighbouring block indices are computed directly from the date.
+        Sparse sections bisect an array of center dates read once per section.
+        Either way only the blocks that contain jd are decoded, at most three.
+
+        Args:
+            header: The section header
+            jd: The Julian date to find blocks for
+
+        Returns:
+            List of FortyEightHourBlocks containing the Julian date, ordered by center date
+
+        Raises:
+            ValueError: If the section cannot be loaded
+        """
+        if self._view is None or header not in self.section_positions:
             raise ValueError("Section not found or file data not available")
 
         if header.block_count == 0:
             return []
 
-        # If there are only a few blocks, just load and check them all
-        if header.block_count <= 5:
-            blocks = []
-            for i in range(header.block_count):
-                block = self.get_forty_eight_hour_block_at_index(header, i)
-                if block.contains(dt):
-                    blocks.append(block)
-            return blocks
-
-        # Binary search to find potential blocks
-        # Since 48-hour blocks have overlapping coverage (±24 hours),
-        # we may need to check multiple blocks around our target
-        low = 0
-        high = header.block_count - 1
-        target_date = dt.date()
-
-        # First binary search to find a block closest to our target date
-        while low <= high:
-            mid = (low + high) // 2
-            block = self.get_forty_eight_hour_block_at_index(header, mid)
-
-            if block.center_date < target_date:
-                low = mid + 1
-            elif block.center_date > target_date:
-                high = mid - 1
-            else:
-                # Exact match on date
-                break
+        # Blocks are centered on distinct days and cover ±24 hours, so only
+        # the neighbours of jd's position in the section can contain it
+        if self._is_dense_section(header):
+            first_center = julian_from_date(header.start_day)
+            offset = math.floor(jd - first_center)
+            start_idx = max(0, offset - 1)
+            end_idx = min(header.block_count - 1, offset + 1)
+            candidates = [(i, first_center + i) for i in range(start_idx, end_idx + 1)]
+        else:
+            centers = self._get_section_centers(header)
+            low = bisect_left(centers, jd)
+            start_idx = max(0, low - 1)
+            end_idx = min(header.block_count - 1, low + 1)
+            candidates = [(i, centers[i]) for i in range(start_idx, end_idx + 1)]
+
+        return [
+            self.get_forty_eight_hour_block_at_index(header, i)
+            for i, center in candidates
+            if abs(jd - center) <= 1.0
+        ]
+
+    def _read_center_julian(
+        self, header: FortyEightHourSectionHeader, index: int
+    ) -> float:
+        """
+        Read the center date of a FortyEightHourBlock without decoding the block.
 
-        # The loop exited, so mid is our best guess
-        # Now check this block and potentially adjacent blocks
-        potential_blocks = []
+        Args:
+            header: The section header
+            index: The 0-based index of the block within the section
 
-        # Get the range of blocks to check (at most 3 blocks)
-        # This handles the 48-hour coverage overlap
-        start_idx = max(0, mid - 1)
-        end_idx = min(header.block_count - 1, mid + 1)
+        Returns:
+            The Julian date at the block's center
 
-        # Check all potential blocks in range
-        for i in range(start_idx, end_idx + 1):
-            block = self.get_forty_eight_hour_block_at_index(header, i)
-            if block.contains(dt):
-                potential_blocks.append(block)
+        Raises:
+            ValueError: If the block's date is invalid
+        """
+        assert self._view is not None
+        position = self.section_positions[header] + index * header.block_size
+        # Skip the 2-byte marker; the center date is year (>H), month, day
+        year, month, day = struct.unpack_from(">HBB", self._view, position + 2)
+        try:
+            return julian_from_date(date(year, month, day))
+        except ValueError as e:
+            raise ValueError(f"Invalid date data: {str(e)}")
+
+    def _is_dense_section(self, header: FortyEightHourSectionHeader) -> bool:
+        """
+        Check whether a section holds one block for each consecutive day.
+
+        That is the case when the block count matches the header's day span
+        and the first and last blocks are centered on its start and end days.
+        The result is cached per section.
+
+        Args:
+            header: The section header
+
+        Returns:
+            True if block i is centered on header.start_day + i days
+        """
+        dense = self._dense_sections.get(header)
+        if dense is None:
+            span_days = (header.end_day - header.start_day).days + 1
+            dense = (
+                header.block_count == span_days
+                and self._read_center_julian(header, 0)
+                == julian_from_date(header.start_day)
+                and self._read_center_julian(header, header.block_count - 1)
+                == julian_from_date(header.end_day)
+            )
+            self._dense_sections[header] = dense
+        return dense
+
+    def _get_section_centers(
+        self, header: FortyEightHourSectionHeader
+    ) -> Tuple[float, ...]:
+        """
+        Get the center dates of every block in a section, reading them once.
+
+        Args:
+            header: The section header
+
+        Returns:
+            The Julian dates at the blocks' centers, in block order
+        """
+        centers = self._section_centers.get(header)
+        if centers is None:
+            centers = tuple(
+                self._read_center_julian(header, i) for i in range(header.block_count)
+            )
+            self._section_centers[header] = centers
+        return centers
+
+    def get_section_centers(
+        self, header: FortyEightHourSectionHeader
+    ) -> npt.NDArray[np.float64]:
+        """
+        Get the center dates of every block in a section without decoding it.
+
+        Dense sections are computed from the header; sparse sections read each
+        block's date once.
+
+        Args:
+            header: The section header
 
-        return potential_blocks
+        Returns:
+            The Julian dates at the blocks' centers, in block order
+        """
+        if header.block_count and self._is_dense_section(header):
+            first_center = julian_from_date(header.start_day)
+            return first_center + np.arange(header.block_count, dtype=np.float64)
+        return np.array(self._get_section_centers(header), dtype=np.float64)
 
     def get_forty_eight_hour_section_for_datetime(
         self, dt: datetime
@@ -812,20 +1194,27 @@ class LazyWeftFile(WeftFile):
         Returns:
             FortyEightHourSectionHeader if found, None otherwise
         """
-        # Convert to UTC if timezone-aware, or assume UTC if naive
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        else:
-            dt = dt.astimezone(timezone.utc)
+        return self.get_forty_eight_hour_section_for_julian(_datetime_to_julian(dt))
 
-        # Find section header containing the datetime
-        for block in self.blocks:
-            if isinstance(
-                block, FortyEightHourSectionHeader
-            ) and block.contains_datetime(dt):
-                return block
+    def get_forty_eight_hour_section_for_julian(
+        self, jd: float
+    ) -> Optional[FortyEightHourSectionHeader]:
+        """
+        Find the FortyEightHourSectionHeader containing the given Julian date.
 
-        return None
+        Args:
+            jd: The Julian date to find a section for
+
+        Returns:
+            FortyEightHourSectionHeader if found, None otherwise
+        """
+        positions = self._section_index.find(jd)
+        if not positions:
+            return None
+
+        header = self.blocks[positions[0]]
+        assert isinstance(header, FortyEightHourSectionHeader)
+        return header
 
     def get_blocks_for_datetime(self, dt: datetime) -> List[BlockType]:
         """
@@ -833,25 +1222,227 @@ class LazyWeftFile(WeftFile):
         Lazily loads FortyEightHourBlocks as needed, using binary search for efficiency.
 
         Args:
-            dt: The datetime to get blocks for
+            dt: The datetime to get blocks for (naive datetimes are treated as UTC)
 
         Returns:
             List of blocks containing the datetime
         """
-        result = []
+        return self.get_blocks_for_julian(_datetime_to_julian(dt))
 
-        # Check all loaded blocks first
-        for block in self.blocks:
-            if isinstance(block, (MultiYearBlock, MonthlyBlock)) and block.contains(dt):
-                result.append(block)
+    def get_blocks_for_julian(self, jd: float) -> List[BlockType]:
+        """
+        Get all blocks that contain the given Julian date.
+        Lazily loads FortyEightHourBlocks as needed, using binary search for efficiency.
+
+        Args:
+            jd: The Julian date to get blocks for
+
+        Returns:
+            List of blocks containing the Julian date, in file order
+        """
+        # Look up the multi-year and monthly blocks in the date indexes
+        positions = self._multi_year_index.find(jd) + self._find_monthly_positions(jd)
+        result: List[BlockType] = [self.blocks[i] for i in sorted(positions)]
 
         # Check for and load forty-eight hour blocks
-        section_header = self.get_forty_eight_hour_section_for_datetime(dt)
+        section_header = self.get_forty_eight_hour_section_for_julian(jd)
         if section_header is not None:
             # Use binary search to find relevant blocks efficiently
-            section_blocks = self.find_blocks_for_datetime_in_section(
-                section_header, dt
-            )
+            section_blocks = self.find_blocks_for_julian_in_section(section_header, jd)
             result.extend(section_blocks)
 
         return result
+
+
+def _decoded_size(blocks: Sequence[FortyEightHourBlock]) -> int:
+    """Estimate the size of decoded blocks as 8 bytes per coefficient."""
+    return 8 * sum(len(block.coefficients) for block in blocks)
+
+
+def _datetime_to_julian(dt: datetime) -> float:
+    """Convert a datetime to a Julian date, treating naive datetimes as UTC."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return datetime_to_julian(dt)
+
+
+def _read_preamble(view: memoryview) -> str:
+    """
+    Read the preamble at the start of a .weft file's data.
+
+    Args:
+        view: The file data
+
+    Returns:
+        The preamble, including its terminating blank line
+
+    Raises:
+        ValueError: If no preamble of a reasonable size is found
+    """
+    # Reasonable maximum preamble size
+    head = bytes(view[:_MAX_PREAMBLE_SIZE])
+    end = head.find(b"\n\n")
+    if end == -1:
+        raise ValueError("Invalid preamble format")
+    return head[: end + 2].decode("utf-8")
+
+
+def _with_version(preamble: str, version: str) -> str:
+    """
+    Replace the format version in a preamble.
+
+    Args:
+        preamble: The preamble, starting with "#weft! <version>"
+        version: The new version, such as "v0.03"
+
+    Returns:
+        The preamble with its version replaced
+    """
+    magic, _, rest = preamble.partition(" ")
+    _, _, rest = rest.partition(" ")
+    return f"{magic} {version} {rest}" if rest else f"{magic} {version}\n\n"
+
+
+def _scan_blocks(
+    view: memoryview, start: int, end: Optional[int] = None
+) -> List[Tuple[int, IndexedBlock]]:
+    """
+    Find the blocks and section headers of a .weft file by walking its markers.
+
+    FortyEightHourBlocks are skipped over without being decoded.
+
+    Args:
+        view: The file data
+        start: Offset of the first block, just after the preamble
+        end: Offset to stop at (defaults to the end of the data)
+
+    Returns:
+        List of (offset of the block's marker, block) pairs, in file order
+
+    Raises:
+        ValueError: If an unknown marker is found
+    """
+    stream = cast(BinaryIO, _BufferReader(view, end))
+    stream.seek(start)
+    located: List[Tuple[int, IndexedBlock]] = []
+    current_header: Optional[FortyEightHourSectionHeader] = None
+
+    while True:
+        # Try to read marker
+        offset = stream.tell()
+        marker = stream.read(2)
+        if not marker or marker == WeftIndex.marker:  # End of blocks
+            break
+
+        # Determine block type and read
+        if marker == MultiYearBlock.marker:
+            located.append((offset, MultiYearBlock.from_stream(stream)))
+        elif marker == MonthlyBlock.marker:
+            located.append((offset, MonthlyBlock.from_stream(stream)))
+        elif marker == FortyEightHourSectionHeader.marker:
+            header = FortyEightHourSectionHeader.from_stream(stream)
+            located.append((offset, header))
+            current_header = header
+
+            # Skip all the blocks in this section instead of reading them
+            stream.seek(header.block_size * header.block_count, SEEK_CUR)
+        elif marker == FortyEightHourBlock.marker:
+            # We shouldn't reach here with lazy loading, but if we do:
+            if current_header is None:
+                raise ValueError("FortyEightHourBlock without a preceding header")
+
+            # Skip the block (-2 for the marker already read)
+            stream.seek(current_header.block_size - 2, SEEK_CUR)
+        else:
+            raise ValueError(f"Unknown block type marker: {marker!r}")
+
+    return located
+
+
+def _read_index(
+    view: memoryview, preamble: str
+) -> Optional[List[Tuple[int, IndexedBlock]]]:
+    """
+    Decode the blocks and section headers listed in a .weft file's index.
+
+    Args:
+        view: The file data
+        preamble: The file's preamble
+
+    Returns:
+        List of (offset of the block's marker, block) pairs in file order, or
+        None if the file has no index
+
+    Raises:
+        ValueError: If the index is malformed
+    """
+    parts = preamble.split()
+    if len(parts) < 2 or parts[1] != INDEX_VERSION:
+        return None
+    found = WeftIndex.from_buffer(view)
+    if found is None:
+        return None
+    index, index_offset = found
+
+    stream = cast(BinaryIO, _BufferReader(view, index_offset))
+    located: List[Tuple[int, IndexedBlock]] = []
+    for entry in index.entries:
+        stream.seek(entry.offset + 2)
+        block: IndexedBlock
+        if entry.marker == MultiYearBlock.marker:
+            block = MultiYearBlock.from_stream(stream)
+        elif entry.marker == MonthlyBlock.marker:
+            block = MonthlyBlock.from_stream(stream)
+        elif entry.marker == FortyEightHourSectionHeader.marker:
+            block = FortyEightHourSectionHeader.from_stream(stream)
+            if stream.tell() + block.block_size * block.block_count > index_offset:
+                raise ValueError(
+                    f"Invalid weft index: section at offset {entry.offset} "
+                    "overlaps the index"
+                )
+        else:
+            raise ValueError(f"Unknown block type marker in index: {entry.marker!r}")
+        located.append((entry.offset, block))
+
+    return located
+
+
+def add_index(data: WeftBuffer) -> bytes:
+    """
+    Add a table-of-contents index to the data of an existing .weft file.
+
+    The blocks are copied unchanged; the preamble's version is raised to v0.03
+    and any existing index is replaced.
+
+    Args:
+        data: The .weft file data (v0.02 or v0.03)
+
+    Returns:
+        The file data with an index appended
+
+    Raises:
+        ValueError: If the data format or version is invalid
+    """
+    with memoryview(data) as view:
+        preamble = _read_preamble(view)
+        preamble_size = len(preamble.encode("utf-8"))
+        version = preamble.split()[1] if len(preamble.split()) > 1 else ""
+        if version not in _INDEXABLE_VERSIONS:
+            raise ValueError(f"Cannot add an index to weft version {version!r}")
+
+        end = len(view)
+        if version == INDEX_VERSION:
+            found = WeftIndex.from_buffer(view)
+            if found is not None:
+                end = found[1]
+        located = _scan_blocks(view, preamble_size, end)
+
+        new_preamble = _with_version(preamble, INDEX_VERSION).encode("utf-8")
+        shift = len(new_preamble) - preamble_size
+        index = WeftIndex(
+            [
+                WeftIndexEntry.for_block(block, offset + shift)
+                for offset, block in located
+            ]
+        )
+        return new_preamble + bytes(view[preamble_size:end]) + index.to_bytes()
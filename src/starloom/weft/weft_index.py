@@ -0,0 +1,159 @@
+"""
+Table-of-contents index for .weft files.
+
+From format v0.03, a .weft file may end with an index listing the offset, time
+span and tier of every multi-year block, monthly block and 48-hour section.
+A reader can then seek to the end of the file, load the index and decode just
+the blocks it lists, instead of walking every marker from the start.
+
+The index is laid out as:
+
+- the index marker (\\x00\\x04)
+- the entry count (>I)
+- one entry per block or section: its marker (2 bytes), the byte offset of
+  that marker in the file (>Q), and the start and end of its span as Julian
+  dates (>d, >d)
+- the total size of the index in bytes, from its marker to the end of the
+  file (>Q)
+- the magic number b"weft-toc"
+
+Files without an index, including all v0.02 files, are read by scanning.
+"""
+
+import struct
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple, Union
+
+from .blocks import (
+    FortyEightHourSectionHeader,
+    MonthlyBlock,
+    MultiYearBlock,
+)
+
+# First format version that may carry an index
+INDEX_VERSION = "v0.03"
+
+IndexedBlock = Union[MultiYearBlock, MonthlyBlock, FortyEightHourSectionHeader]
+
+_ENTRY = struct.Struct(">2sQdd")
+_COUNT = struct.Struct(">I")
+_TRAILER = struct.Struct(">Q8s")
+
+
+@dataclass(frozen=True)
+class WeftIndexEntry:
+    """
+    The location of one block or section in a .weft file.
+
+    Attributes:
+        marker: The marker of the block type (its tier)
+        offset: Byte offset of the block's marker in the file
+        start: Julian date at the start of the block's span
+        end: Julian date at the end of the block's span
+    """
+
+    marker: bytes
+    offset: int
+    start: float
+    end: float
+
+    @classmethod
+    def for_block(cls, block: IndexedBlock, offset: int) -> "WeftIndexEntry":
+        """
+        Create the entry for a block written at an offset.
+
+        Args:
+            block: A multi-year block, monthly block or section header
+            offset: Byte offset of the block's marker in the file
+
+        Returns:
+            The index entry for the block
+        """
+        start, end = block.julian_span()
+        return cls(marker=block.marker, offset=offset, start=start, end=end)
+
+
+class WeftIndex:
+    """A .weft file's table of contents, stored as a footer."""
+
+    marker = b"\x00\x04"  # Block type marker
+    magic = b"weft-toc"
+
+    def __init__(self, entries: Sequence[WeftIndexEntry]):
+        """
+        Initialize a WeftIndex.
+
+        Args:
+            entries: The index entries, in file order
+        """
+        self.entries = list(entries)
+
+    @property
+    def size(self) -> int:
+        """Size of the serialized index in bytes."""
+        return (
+            len(self.marker)
+            + _COUNT.size
+            + _ENTRY.size * len(self.entries)
+            + _TRAILER.size
+        )
+
+    def to_bytes(self) -> bytes:
+        """
+        Convert the index to binary format.
+
+        Returns:
+            Binary representation of the index, to be appended to the file
+        """
+        result = bytearray(self.marker)
+        result.extend(_COUNT.pack(len(self.entries)))
+        for entry in self.entries:
+            result.extend(
+                _ENTRY.pack(entry.marker, entry.offset, entry.start, entry.end)
+            )
+        result.extend(_TRAILER.pack(self.size, self.magic))
+        return bytes(result)
+
+    @classmethod
+    def from_buffer(cls, data: memoryview) -> Optional[Tuple["WeftIndex", int]]:
+        """
+        Read the index from the end of a file's data, if it has one.
+
+        Args:
+            data: The complete file data
+
+        Returns:
+            Tuple of (index, offset of the index marker), or None if the data
+            does not end with an index
+
+        Raises:
+            ValueError: If the data ends with the magic number but the index is
+                malformed or points outside the data
+        """
+        if len(data) < _TRAILER.size:
+            return None
+        size, magic = _TRAILER.unpack_from(data, len(data) - _TRAILER.size)
+        if magic != cls.magic:
+            return None
+
+        position = len(data) - size
+        if position < 0 or bytes(data[position : position + 2]) != cls.marker:
+            raise ValueError("Invalid weft index: marker not found")
+        (count,) = _COUNT.unpack_from(data, position + 2)
+        if size != len(cls.marker) + _COUNT.size + _ENTRY.size * count + _TRAILER.size:
+            raise ValueError("Invalid weft index: size does not match entry count")
+
+        entries: List[WeftIndexEntry] = []
+        entry_offset = position + len(cls.marker) + _COUNT.size
+        for _ in range(count):
+            marker, offset, start, end = _ENTRY.unpack_from(data, entry_offset)
+            entry_offset += _ENTRY.size
+            if offset + 2 > position or bytes(data[offset : offset + 2]) != marker:
+                raise ValueError(
+                    f"Invalid weft index: no {marker!r} block at offset {offset}"
+                )
+            entries.append(
+                WeftIndexEntry(marker=marker, offset=offset, start=start, end=end)
+            )
+
+        return cls(entries), position
@@ -1,14 +1,74 @@
 from datetime import datetime, timezone, date
-from typing import Dict, List, Tuple, Optional, Union, cast
+from typing import Dict, Iterator, List, Tuple, Optional, Union, cast
+import logging
+import math
 import time
+
+import numpy as np
+import numpy.typing as npt
+
 from .weft_file import (
     LazyWeftFile,
     MultiYearBlock,
     MonthlyBlock,
     FortyEightHourBlock,
+    FortyEightHourSectionHeader,
     RangedBehavior,
     BlockType,
+    WeftBuffer,
 )
+from .columnar import TierArrays, chebval_rows
+from .crossings import find_crossings
+from ..space_time.julian_calc import datetime_to_julian, datetime64_to_julian
+
+# Julian Day Number of 1970-01-01
+_UNIX_EPOCH_JDN = 2440588
+
+# Number of points evaluated at a time by the iter_ methods
+DEFAULT_ITER_CHUNK_SIZE = 4096
+
+
+def _tier_x(
+    value: npt.NDArray[np.float64],
+    offsets: npt.NDArray[np.float64],
+    scales: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """
+    Map values onto blocks' [-1, 1] domains with each block's offset and scale.
+
+    Uses the same floating point operations as the blocks' evaluate_jd, so
+    batch and scalar evaluation agree exactly.
+
+    Args:
+        value: Julian dates, or fractional years for multi-year blocks
+        offsets: Offset of the block covering each value
+        scales: Scale of the block covering each value
+
+    Returns:
+        The x values, clipped to [-1, 1]
+    """
+    return np.clip((value - offsets) * scales, -1.0, 1.0)
+
+
+def _year_fraction(jd: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """
+    Vectorized counterpart of julian_year_fraction.
+
+    Args:
+        jd: Julian dates
+
+    Returns:
+        The year plus the fraction of the year elapsed before each date's UTC day
+    """
+    days = (np.floor(jd + 0.5) - _UNIX_EPOCH_JDN).astype(np.int64)
+    day_numbers = days.astype("datetime64[D]")
+    years = day_numbers.astype("datetime64[Y]")
+    day_of_year = (day_numbers - years.astype("datetime64[D]")).astype(np.int64)
+    year = years.astype(np.int64) + 1970
+    is_leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    days_in_year = np.where(is_leap, 366, 365)
+    year_float: npt.NDArray[np.float64] = year + day_of_year / days_in_year
+    return year_float
 
 
 class WeftReader:
@@ -25,35 +85,61 @@ class WeftReader:
     1. 48-hour blocks (with interpolation only between blocks in same section)
     2. Monthly blocks
     3. Multi-year blocks
+
+    Evaluation methods keep no state on the reader, so once a file is loaded
+    the reader can be shared between threads (see LazyWeftFile). The batch
+    methods spend their time in NumPy array operations, which release the
+    GIL, so large batches evaluate in parallel. Loading or closing a file
+    while other threads are reading is not supported.
     """
 
-    def __init__(self, file_path: Optional[str] = None):
+    def __init__(self, file_path: Optional[str] = None, use_mmap: bool = False):
         """
         Initialize a WeftReader.
 
         Args:
             file_path: Optional path to a .weft file to load
+            use_mmap: Whether to memory-map the file instead of reading it into memory
         """
         self.file: Optional[LazyWeftFile] = None
         if file_path is not None:
-            self.load_file(file_path)
-
-    def load_file(self, file_path: str) -> LazyWeftFile:
+            self.load_file(file_path, use_mmap=use_mmap)
+
+    def load_file(
+        self,
+        file_path: str,
+        use_mmap: bool = False,
+        offset: int = 0,
+        length: Optional[int] = None,
+    ) -> LazyWeftFile:
         """
         Load a .weft file.
 
+        With use_mmap, the file is memory-mapped read-only rather than read into
+        memory, so opening is cheap regardless of file size and processes reading
+        the same file share the OS page cache. Call close() to release the mapping.
+
         Args:
-            file_path: Path to the .weft file
+            file_path: Path to the .weft file, or to a file containing it
+            use_mmap: Whether to memory-map the file instead of reading it into memory
+            offset: Position of the .weft data within the file
+            length: Size of the .weft data (defaults to the rest of the file)
 
         Returns:
             The loaded LazyWeftFile instance
         """
-        start_time = time.time()
-        with open(file_path, "rb") as f:
-            data = f.read()
-        read_time = time.time()
+        self.close()
 
-        self.file = LazyWeftFile.from_bytes(data)
+        start_time = time.time()
+        if use_mmap:
+            read_time = start_time
+            self.file = LazyWeftFile.from_mmap(file_path, offset=offset, length=length)
+        else:
+            with open(file_path, "rb") as f:
+                f.seek(offset)
+                data = f.read() if length is None else f.read(length)
+            read_time = time.time()
+            self.file = LazyWeftFile.from_bytes(data)
         parse_time = time.time()
 
         if self.file is not None:
@@ -65,6 +151,42 @@ class WeftReader:
 
         return self.file
 
+    def load_bytes(self, data: WeftBuffer) -> LazyWeftFile:
+        """
+        Load a .weft file from data already in memory.
+
+        The data is used in place, without a round trip through the filesystem,
+        so it can come straight from an archive member (for example
+        tarfile.extractfile(...).read()). Each reader owns its own LazyWeftFile,
+        so readers loaded concurrently from different threads or processes do
+        not share any state.
+
+        Args:
+            data: The contents of a .weft file (bytes, memoryview, or mmap)
+
+        Returns:
+            The loaded LazyWeftFile instance
+
+        Raises:
+            ValueError: If the data format is invalid
+        """
+        self.close()
+
+        start_time = time.time()
+        self.file = LazyWeftFile.from_bytes(data)
+        self.file.logger.info(
+            f"File load timing: {time.time() - start_time:.3f}s to parse"
+        )
+        return self.file
+
+    def close(self) -> None:
+        """
+        Close the loaded file, releasing its data or memory map.
+        """
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
     def get_info(self) -> dict[str, Union[str, list[BlockType], int]]:
         """
         Get information about the loaded .weft file.
@@ -150,9 +272,130 @@ class WeftReader:
             dt = dt.replace(tzinfo=timezone.utc)
         else:
             dt = dt.astimezone(timezone.utc)
+        jd = datetime_to_julian(dt)
 
         # Get blocks containing this datetime (lazy-loads 48-hour blocks as needed)
         relevant_blocks = self.file.get_blocks_for_datetime(dt)
+        value = self._value_from_blocks(relevant_blocks, jd)
+        if value is None:
+            raise ValueError(f"No block found for datetime: {dt}")
+        return value
+
+    def get_value_jd(self, jd: float) -> float:
+        """
+        Get a value from the loaded .weft file for a specific Julian date.
+
+        Equivalent to get_value for the corresponding UTC datetime, but stays in
+        floating point throughout: no datetime objects are created per call.
+
+        Args:
+            jd: The Julian date to get the value for
+
+        Returns:
+            The value at the given Julian date
+
+        Raises:
+            ValueError: If no file is loaded or no block covers the given date
+        """
+        if self.file is None:
+            raise ValueError("No file loaded")
+
+        value = self._value_from_blocks(self.file.get_blocks_for_julian(jd), jd)
+        if value is None:
+            raise ValueError(f"No block found for Julian date: {jd}")
+        return value
+
+    def get_rate(self, jd: float) -> float:
+        """
+        Get the rate of change of the value at a specific Julian date.
+
+        The rate is the analytic derivative of the same polynomials and 48-hour
+        interpolation that get_value_jd evaluates, so no extra evaluations are
+        needed for finite differences. Value behavior does not apply: wrapping
+        values are differentiated without their jumps.
+
+        Args:
+            jd: The Julian date to get the rate for
+
+        Returns:
+            The rate of change, in the file's units per day
+
+        Raises:
+            ValueError: If no file is loaded or no block covers the given date
+        """
+        if self.file is None:
+            raise ValueError("No file loaded")
+
+        relevant_blocks = self.file.get_blocks_for_julian(jd)
+
+        forty_eight_hour_blocks = [
+            b for b in relevant_blocks if isinstance(b, FortyEightHourBlock)
+        ]
+        if forty_eight_hour_blocks:
+            # Interpolated sections blend the rates of their blocks
+            blocks_by_header: Dict[Tuple[date, date], List[FortyEightHourBlock]] = {}
+            for block in forty_eight_hour_blocks:
+                header_key = (block.header.start_day, block.header.end_day)
+                blocks_by_header.setdefault(header_key, []).append(block)
+            for blocks in blocks_by_header.values():
+                if len(blocks) > 1:
+                    return self._interpolate_block_rates(blocks, jd)
+            return forty_eight_hour_blocks[0].evaluate_rate_jd(jd)
+
+        monthly_blocks = [b for b in relevant_blocks if isinstance(b, MonthlyBlock)]
+        if monthly_blocks:
+            return monthly_blocks[0].evaluate_rate_jd(jd)
+
+        multi_year_blocks = [
+            b for b in relevant_blocks if isinstance(b, MultiYearBlock)
+        ]
+        if multi_year_blocks:
+            return multi_year_blocks[0].evaluate_rate_jd(jd)
+
+        raise ValueError(f"No block found for Julian date: {jd}")
+
+    def find_crossings(self, target: float, start: float, end: float) -> List[float]:
+        """
+        Find every time in a range where the value equals a target.
+
+        Rather than bisecting with repeated point queries, each stretch between
+        block edges is solved as one Chebyshev polynomial, including the blends
+        between 48-hour blocks. Wrapping values cross the target once per
+        revolution, and a jump across the target where one block hands over to
+        the next is reported at the seam. Multi-year blocks only change value
+        at midnight, so their crossings are reported at the first midnight past
+        the target.
+
+        Args:
+            target: The value to find
+            start: Julian date at the start of the range
+            end: Julian date at the end of the range
+
+        Returns:
+            Sorted Julian dates where the value equals or jumps across the target
+
+        Raises:
+            ValueError: If no file is loaded, end is before start, or no block
+                covers part of the range
+        """
+        if self.file is None:
+            raise ValueError("No file loaded")
+        return find_crossings(self.file, target, start, end)
+
+    def _value_from_blocks(
+        self, relevant_blocks: List[BlockType], jd: float
+    ) -> Optional[float]:
+        """
+        Evaluate the highest priority blocks containing a Julian date.
+
+        Args:
+            relevant_blocks: The blocks containing the Julian date, in file order
+            jd: The Julian date to evaluate at
+
+        Returns:
+            The value at the Julian date, or None if no block covers it
+        """
+        assert self.file is not None
 
         # Find all forty-eight hour blocks
         forty_eight_hour_blocks = [
@@ -173,24 +416,24 @@ class WeftReader:
             for blocks in blocks_by_header.values():
                 if len(blocks) > 1:
                     self.file.logger.debug(
-                        f"Interpolating between {len(blocks)} blocks in same section for {dt.isoformat()}"
+                        "Interpolating between %d blocks in same section for JD %s",
+                        len(blocks),
+                        jd,
                     )
-                    return self._interpolate_blocks(blocks, dt)
+                    return self._interpolate_blocks(blocks, jd)
 
             # Otherwise, just use the single block's value
-            value = forty_eight_hour_blocks[0].evaluate(dt)
+            value = forty_eight_hour_blocks[0].evaluate_jd(jd)
             self.file.logger.debug(
-                f"Value {value} from FortyEightHourBlock for {dt.isoformat()}"
+                "Value %s from FortyEightHourBlock for JD %s", value, jd
             )
             return self.apply_value_behavior(value)
 
         # Try monthly blocks next
         monthly_blocks = [b for b in relevant_blocks if isinstance(b, MonthlyBlock)]
         if monthly_blocks:
-            value = monthly_blocks[0].evaluate(dt)
-            self.file.logger.debug(
-                f"Value {value} from MonthlyBlock for {dt.isoformat()}"
-            )
+            value = monthly_blocks[0].evaluate_jd(jd)
+            self.file.logger.debug("Value %s from MonthlyBlock for JD %s", value, jd)
             return self.apply_value_behavior(value)
 
         # Finally, try multi-year blocks
@@ -198,13 +441,481 @@ class WeftReader:
             b for b in relevant_blocks if isinstance(b, MultiYearBlock)
         ]
         if multi_year_blocks:
-            value = multi_year_blocks[0].evaluate(dt)
-            self.file.logger.debug(
-                f"Value {value} from MultiYearBlock for {dt.isoformat()}"
-            )
+            value = multi_year_blocks[0].evaluate_jd(jd)
+            self.file.logger.debug("Value %s from MultiYearBlock for JD %s", value, jd)
             return self.apply_value_behavior(value)
 
-        raise ValueError(f"No block found for datetime: {dt}")
+        return None
+
+    def get_values(self, times: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """
+        Get values from the loaded .weft file for many times at once.
+
+        Points are grouped by the block that covers them and each group is
+        evaluated with a single Chebyshev pass. Block priority, 48-hour
+        interpolation and value behavior follow get_value, and the results are
+        identical to calling get_value for each time individually.
+
+        Args:
+            times: Array of Julian dates, or of datetime64 values (naive values are
+                treated as UTC)
+
+        Returns:
+            Array of values with the same shape as times
+
+        Raises:
+            ValueError: If no file is loaded or no block covers one of the times
+        """
+        return self._evaluate_times(times, rates=False)
+
+    def get_rates(self, times: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """
+        Get rates of change from the loaded .weft file for many times at once.
+
+        The batch counterpart of get_rate, evaluated like get_values.
+
+        Args:
+            times: Array of Julian dates, or of datetime64 values (naive values are
+                treated as UTC)
+
+        Returns:
+            Array of rates, in the file's units per day, with the same shape as
+            times
+
+        Raises:
+            ValueError: If no file is loaded or no block covers one of the times
+        """
+        return self._evaluate_times(times, rates=True)
+
+    def iter_values(
+        self,
+        start: float,
+        stop: float,
+        step: float,
+        chunk_size: int = DEFAULT_ITER_CHUNK_SIZE,
+    ) -> Iterator[Tuple[float, float]]:
+        """
+        Iterate over values at evenly spaced times, in order.
+
+        Values are evaluated chunk_size points at a time (see iter_chunks), so
+        memory use does not grow with the length of the range and each point
+        costs a share of one vectorized evaluation rather than a block lookup.
+
+        Args:
+            start: Julian date of the first point
+            stop: Julian date of the last point (included if it falls on a step)
+            step: Days between points
+            chunk_size: Number of points to evaluate at a time
+
+        Yields:
+            (Julian date, value) pairs, identical to get_value_jd at each date
+
+        Raises:
+            ValueError: If no file is loaded, step or chunk_size is not
+                positive, or no block covers one of the times
+        """
+        for julian_dates, values in self.iter_chunks(start, stop, step, chunk_size):
+            yield from zip(julian_dates.tolist(), values.tolist())
+
+    def iter_chunks(
+        self,
+        start: float,
+        stop: float,
+        step: float,
+        chunk_size: int = DEFAULT_ITER_CHUNK_SIZE,
+        rates: bool = False,
+    ) -> Iterator[Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]]:
+        """
+        Iterate over values at evenly spaced times, a chunk of arrays at a time.
+
+        Point i is at start + i * step, computed directly rather than by
+        accumulating steps, so long ranges do not drift.
+
+        Args:
+            start: Julian date of the first point
+            stop: Julian date of the last point (included if it falls on a step)
+            step: Days between points
+            chunk_size: Maximum number of points per chunk
+            rates: Whether to evaluate rates of change instead of values
+
+        Yields:
+            (Julian dates, values) array pairs, as returned by get_values (or
+            get_rates) for the chunk's dates
+
+        Raises:
+            ValueError: If no file is loaded, step or chunk_size is not
+                positive, or no block covers one of the times
+        """
+        if self.file is None:
+            raise ValueError("No file loaded")
+        if not step > 0:
+            raise ValueError("step must be positive")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+
+        # Allow for rounding when stop falls on a step
+        count = max(0, math.floor((stop - start) / step + 1e-9) + 1)
+        for first in range(0, count, chunk_size):
+            indices = np.arange(first, min(first + chunk_size, count), dtype=np.float64)
+            julian_dates = start + indices * step
+            yield julian_dates, self._evaluate_times(julian_dates, rates)
+
+    def _evaluate_times(
+        self, times: npt.ArrayLike, rates: bool
+    ) -> npt.NDArray[np.float64]:
+        """
+        Evaluate values or rates for many times at once.
+
+        Args:
+            times: Array of Julian dates or datetime64 values
+            rates: Whether to evaluate rates of change instead of values
+
+        Returns:
+            Array of values or rates with the same shape as times
+
+        Raises:
+            ValueError: If no file is loaded or no block covers one of the times
+        """
+        if self.file is None:
+            raise ValueError("No file loaded")
+
+        times_array = np.asarray(times)
+        if np.issubdtype(times_array.dtype, np.datetime64):
+            jd = datetime64_to_julian(times_array).ravel()
+        else:
+            jd = times_array.astype(np.float64).ravel()
+
+        values = np.full(jd.shape, np.nan)
+        pending = np.ones(jd.shape, dtype=bool)
+
+        # Sort once so the points inside any block's span form a contiguous run
+        order = np.argsort(jd, kind="stable")
+        sorted_jd = jd[order]
+
+        def pending_in_span(start: float, end: float) -> npt.NDArray[np.intp]:
+            low = np.searchsorted(sorted_jd, start, side="left")
+            high = np.searchsorted(sorted_jd, end, side="left")
+            candidates = order[low:high]
+            return candidates[pending[candidates]]
+
+        # 48-hour sections take priority; the first section covering a point wins
+        for block in self.file.blocks:
+            if isinstance(block, FortyEightHourSectionHeader):
+                indices = pending_in_span(*block.julian_span())
+                if indices.size:
+                    resolved = self._evaluate_section(block, jd, indices, values, rates)
+                    pending[indices[resolved]] = False
+
+        # Then the first monthly block, then the first multi-year block, in file order
+        for tier in (self.file.monthly_arrays, self.file.multi_year_arrays):
+            indices = np.flatnonzero(pending)
+            if not indices.size:
+                break
+            rows = tier.find_rows(jd[indices])
+            covered = rows >= 0
+            indices, rows = indices[covered], rows[covered]
+            if rates:
+                values[indices] = self._evaluate_tier_rates(tier, jd[indices], rows)
+            else:
+                values[indices] = self._apply_value_behavior_array(
+                    self._evaluate_tier(tier, jd[indices], rows)
+                )
+            pending[indices] = False
+
+        if pending.any():
+            raise ValueError(
+                f"No block found for Julian date: {jd[np.argmax(pending)]}"
+            )
+
+        return values.reshape(times_array.shape)
+
+    def _evaluate_section(
+        self,
+        header: FortyEightHourSectionHeader,
+        jd: npt.NDArray[np.float64],
+        indices: npt.NDArray[np.intp],
+        out: npt.NDArray[np.float64],
+        rates: bool = False,
+    ) -> npt.NDArray[np.bool_]:
+        """
+        Evaluate points that fall inside a 48-hour section.
+
+        Args:
+            header: The section header
+            jd: All requested Julian dates
+            indices: Indices into jd of the points inside the section
+            out: Output array; values are written at the resolved indices
+            rates: Whether to write rates of change instead of values
+
+        Returns:
+            Boolean mask over indices of the points covered by a block in the section
+        """
+        assert self.file is not None
+        arrays = self.file.get_section_arrays(header)
+        if not len(arrays):
+            return np.zeros(indices.shape, dtype=bool)
+        centers = arrays.centers
+        points = jd[indices]
+
+        # Blocks are centered on consecutive days, so only the blocks either side
+        # of a point's position among the centers can contain it
+        position = np.searchsorted(centers, points, side="left")
+        candidates = position + np.array([[-1], [0], [1]])
+        valid = (candidates >= 0) & (candidates < len(arrays))
+        candidates = np.where(valid, candidates, 0)
+        offsets = points - centers[candidates]
+        distances = np.abs(offsets)
+        valid &= distances <= 1.0
+
+        # Evaluate every (point, block) pair with its block's coefficient row
+        raw = np.full(candidates.shape, np.nan)
+        flat_blocks = candidates[valid]
+        flat_x = offsets[valid]
+        raw[valid] = chebval_rows(flat_x, arrays.coefficients, flat_blocks)
+        if rates:
+            # x advances one unit per day, so d/dx is already a rate per day
+            raw_rates = np.full(candidates.shape, np.nan)
+            raw_rates[valid] = chebval_rows(
+                flat_x, arrays.derivative_coefficients, flat_blocks
+            )
+
+        counts = valid.sum(axis=0)
+        resolved: npt.NDArray[np.bool_] = counts > 0
+
+        single = np.flatnonzero(counts == 1)
+        if single.size:
+            slot = np.argmax(valid[:, single], axis=0)
+            if rates:
+                out[indices[single]] = raw_rates[slot, single]
+            else:
+                out[indices[single]] = self._apply_value_behavior_array(
+                    raw[slot, single]
+                )
+
+        multiple = counts > 1
+        if multiple.any():
+            if rates:
+                out[indices[multiple]] = self._interpolate_rate_arrays(
+                    raw[:, multiple],
+                    raw_rates[:, multiple],
+                    offsets[:, multiple],
+                    valid[:, multiple],
+                )
+            else:
+                out[indices[multiple]] = self._interpolate_arrays(
+                    raw[:, multiple], distances[:, multiple], valid[:, multiple]
+                )
+
+        return resolved
+
+    def _tier_x(
+        self,
+        tier: TierArrays,
+        jd: npt.NDArray[np.float64],
+        rows: npt.NDArray[np.intp],
+    ) -> npt.NDArray[np.float64]:
+        """
+        Map points onto the domains of the monthly or multi-year blocks covering them.
+
+        Args:
+            tier: The loaded file's monthly or multi-year TierArrays
+            jd: Julian dates to map
+            rows: Row of tier covering each Julian date
+
+        Returns:
+            The x value of each point in its block
+        """
+        assert self.file is not None
+        if tier is self.file.multi_year_arrays:
+            value = _year_fraction(jd)
+        else:
+            value = jd
+        return _tier_x(value, tier.offsets[rows], tier.scales[rows])
+
+    def _evaluate_tier(
+        self,
+        tier: TierArrays,
+        jd: npt.NDArray[np.float64],
+        rows: npt.NDArray[np.intp],
+    ) -> npt.NDArray[np.float64]:
+        """
+        Evaluate monthly or multi-year blocks at points, one block row per point.
+
+        Args:
+            tier: The loaded file's monthly or multi-year TierArrays
+            jd: Julian dates to evaluate
+            rows: Row of tier covering each Julian date
+
+        Returns:
+            The raw polynomial values, before value behavior is applied
+        """
+        return chebval_rows(self._tier_x(tier, jd, rows), tier.coefficients, rows)
+
+    def _evaluate_tier_rates(
+        self,
+        tier: TierArrays,
+        jd: npt.NDArray[np.float64],
+        rows: npt.NDArray[np.intp],
+    ) -> npt.NDArray[np.float64]:
+        """
+        Evaluate the rates of monthly or multi-year blocks at points.
+
+        Args:
+            tier: The loaded file's monthly or multi-year TierArrays
+            jd: Julian dates to evaluate
+            rows: Row of tier covering each Julian date
+
+        Returns:
+            The rates of change, per day
+        """
+        assert self.file is not None
+        x = self._tier_x(tier, jd, rows)
+        rates = chebval_rows(x, tier.derivative_coefficients, rows) * tier.scales[rows]
+        if tier is self.file.multi_year_arrays:
+            # Fractional years advance by one day's worth per day
+            year = np.floor(_year_fraction(jd))
+            is_leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+            rates = rates / np.where(is_leap, 366, 365)
+        return rates
+
+    def _interpolate_arrays(
+        self,
+        raw: npt.NDArray[np.float64],
+        distances: npt.NDArray[np.float64],
+        valid: npt.NDArray[np.bool_],
+    ) -> npt.NDArray[np.float64]:
+        """
+        Vectorized counterpart of _interpolate_blocks.
+
+        Each column holds up to three candidate blocks for one point, ordered by
+        center date. The arithmetic follows _interpolate_blocks step for step.
+
+        Args:
+            raw: Raw block values, shape (3, n)
+            distances: Distance in days from each block's center, shape (3, n)
+            valid: Which candidate blocks contain the point, shape (3, n)
+
+        Returns:
+            The interpolated values, shape (n,)
+        """
+        assert self.file is not None
+        slots = range(raw.shape[0])
+
+        weights = np.where(valid, np.maximum(0.0, 1.0 - distances), 0.0)
+        weight_sum = np.zeros(raw.shape[1])
+        for i in slots:
+            weight_sum = np.where(valid[i], weight_sum + weights[i], weight_sum)
+        has_weight = weight_sum > 0
+        weights = np.divide(
+            weights, weight_sum, out=np.zeros_like(weights), where=has_weight
+        )
+
+        def weighted_sum(
+            block_values: npt.NDArray[np.float64],
+        ) -> npt.NDArray[np.float64]:
+            total = np.zeros(raw.shape[1])
+            for i in slots:
+                total = np.where(valid[i], total + block_values[i] * weights[i], total)
+            return total
+
+        if self._is_wrapping_angle():
+            behavior = cast(RangedBehavior, self.file.value_behavior)
+            min_val, max_val = behavior["range"]
+            range_size = max_val - min_val
+
+            normalized = min_val + ((raw - min_val) % range_size)
+
+            crossing_boundary = np.zeros(raw.shape[1], dtype=bool)
+            for i in slots:
+                for j in range(i + 1, raw.shape[0]):
+                    crossing_boundary |= (
+                        valid[i]
+                        & valid[j]
+                        & (np.abs(normalized[i] - normalized[j]) > range_size / 2)
+                    )
+
+            # Unwrap relative to the first block containing each point
+            reference = normalized[np.argmax(valid, axis=0), np.arange(raw.shape[1])]
+            unwrapped = reference + (
+                ((normalized - reference + range_size / 2) % range_size)
+                - range_size / 2
+            )
+            unwrapped_value = weighted_sum(unwrapped)
+            result = np.where(
+                crossing_boundary,
+                min_val + ((unwrapped_value - min_val) % range_size),
+                weighted_sum(normalized),
+            )
+        else:
+            result = self._apply_value_behavior_array(weighted_sum(raw))
+
+        if not has_weight.all():
+            # Fall back to the closest block when every weight is zero
+            closest = np.argmin(np.where(valid, distances, np.inf), axis=0)
+            closest_raw = raw[closest, np.arange(raw.shape[1])]
+            result = np.where(
+                has_weight, result, self._apply_value_behavior_array(closest_raw)
+            )
+
+        return result
+
+    def _interpolate_rate_arrays(
+        self,
+        raw: npt.NDArray[np.float64],
+        raw_rates: npt.NDArray[np.float64],
+        offsets: npt.NDArray[np.float64],
+        valid: npt.NDArray[np.bool_],
+    ) -> npt.NDArray[np.float64]:
+        """
+        Vectorized counterpart of _interpolate_block_rates.
+
+        Args:
+            raw: Raw block values, shape (3, n)
+            raw_rates: Raw block rates, shape (3, n)
+            offsets: Signed distance in days from each block's center, shape (3, n)
+            valid: Which candidate blocks contain the point, shape (3, n)
+
+        Returns:
+            The rates of change of the interpolated values, shape (n,)
+        """
+        assert self.file is not None
+        columns = np.arange(raw.shape[1])
+
+        weights = np.where(valid, np.maximum(0.0, 1.0 - np.abs(offsets)), 0.0)
+        weight_rates = np.where(weights > 0, -np.sign(offsets), 0.0)
+        weight_sum = weights.sum(axis=0)
+        has_weight = weight_sum > 0
+        safe_sum = np.where(has_weight, weight_sum, 1.0)
+
+        values = np.where(valid, raw, 0.0)
+        if self._is_wrapping_angle():
+            behavior = cast(RangedBehavior, self.file.value_behavior)
+            min_val, max_val = behavior["range"]
+            range_size = max_val - min_val
+
+            # Unwrap relative to the first block containing each point
+            reference = raw[np.argmax(valid, axis=0), columns]
+            values = np.where(
+                valid,
+                reference
+                + ((raw - reference + range_size / 2) % range_size)
+                - range_size / 2,
+                0.0,
+            )
+
+        rates = np.where(valid, raw_rates, 0.0)
+        value = (weights * values).sum(axis=0) / safe_sum
+        result = (
+            (weight_rates * (values - value)).sum(axis=0)
+            + (weights * rates).sum(axis=0)
+        ) / safe_sum
+
+        if not has_weight.all():
+            # Fall back to the closest block when every weight is zero
+            closest = np.argmin(np.where(valid, np.abs(offsets), np.inf), axis=0)
+            result = np.where(has_weight, result, raw_rates[closest, columns])
+
+        return cast(npt.NDArray[np.float64], result)
 
     def get_all_values(self, dt: datetime) -> List[Tuple[str, float]]:
         """
@@ -228,6 +939,8 @@ class WeftReader:
         else:
             dt = dt.astimezone(timezone.utc)
 
+        jd = datetime_to_julian(dt)
+
         # Get blocks containing this datetime (lazy-loads 48-hour blocks as needed)
         relevant_blocks = self.file.get_blocks_for_datetime(dt)
         results = []
@@ -236,15 +949,15 @@ class WeftReader:
         for block in relevant_blocks:
             if isinstance(block, FortyEightHourBlock):
                 # For 48-hour blocks, we need to handle interpolation if multiple blocks are in the same section
-                value = block.evaluate(dt)
+                value = block.evaluate_jd(jd)
                 block_type = f"48h {block.center_date} (within {block.header.start_day} to {block.header.end_day})"
                 results.append((block_type, value))
             elif isinstance(block, MonthlyBlock):
-                value = block.evaluate(dt)
+                value = block.evaluate_jd(jd)
                 block_type = f"Monthly block ({block.year}-{block.month:02d})"
                 results.append((block_type, value))
             elif isinstance(block, MultiYearBlock):
-                value = block.evaluate(dt)
+                value = block.evaluate_jd(jd)
                 block_type = f"Multi-year block ({block.start_year}-{block.start_year + block.duration - 1})"
                 results.append((block_type, value))
 
@@ -255,14 +968,14 @@ class WeftReader:
         ]
 
     def _interpolate_blocks(
-        self, blocks: List[FortyEightHourBlock], dt: datetime
+        self, blocks: List[FortyEightHourBlock], jd: float
     ) -> float:
         """
         Interpolate between multiple blocks in the same section.
 
         Args:
             blocks: List of blocks to interpolate between
-            dt: The datetime to evaluate at
+            jd: The Julian date to evaluate at
 
         Returns:
             The interpolated value
@@ -270,29 +983,27 @@ class WeftReader:
         # Sort blocks by date
         blocks = sorted(blocks, key=lambda b: b.header.start_day)
 
-        # work in timestamp (floats) for easier calculation
-        target_ts = dt.timestamp()
-
         weights = []
         for i, block in enumerate(blocks):
-            # Calculate time distance from block's midpoint in hours
-            time_diff = (
-                abs(target_ts - block.midnight().timestamp()) / 3600
-            )  # Convert to hours
+            # Calculate time distance from block's midpoint in days
+            time_diff = abs(jd - block.center_julian())
             # Weight decreases linearly from 1 at midpoint to 0 at 24 hours away
-            weight = max(0.0, 1.0 - time_diff / 24.0)
+            weight = max(0.0, 1.0 - time_diff)
             weights.append(weight)
 
-        # Log interpolation details
-        if self.file is not None:
+        # Calculate values from each block
+        block_values = [block.evaluate_jd(jd) for block in blocks]
+
+        # Log interpolation details (formatting block dates allocates per call)
+        if self.file is not None and self.file.logger.isEnabledFor(logging.DEBUG):
             self.file.logger.debug(
-                f"Interpolating between {len(blocks)} blocks for {dt.isoformat()}"
+                f"Interpolating between {len(blocks)} blocks for JD {jd}"
             )
             for i, block in enumerate(blocks):
                 self.file.logger.debug(
                     f"  Block {i + 1}: {block.midnight().isoformat()}, "
                     f"weight={weights[i]:.4f}, "
-                    f"raw_value={block.evaluate(dt):.6f}"
+                    f"raw_value={block_values[i]:.6f}"
                 )
 
         # Normalize weights
@@ -301,14 +1012,11 @@ class WeftReader:
             weights = [w / weight_sum for w in weights]
         else:
             # Fallback to using the closest block
-            closest_block = min(
-                blocks,
-                key=lambda b: abs(dt.timestamp() - b.midnight().timestamp()),
+            closest = min(
+                range(len(blocks)),
+                key=lambda i: abs(jd - blocks[i].center_julian()),
             )
-            return self.apply_value_behavior(closest_block.evaluate(dt))
-
-        # Calculate values from each block
-        block_values = [block.evaluate(dt) for block in blocks]
+            return self.apply_value_behavior(block_values[closest])
 
         # Handle wrapping angles
         if self._is_wrapping_angle():
@@ -352,13 +1060,67 @@ class WeftReader:
             value = sum(v * w for v, w in zip(block_values, weights))
             result = self.apply_value_behavior(value)
 
-        if self.file is not None:
+        if self.file is not None and self.file.logger.isEnabledFor(logging.DEBUG):
             self.file.logger.debug(
                 f"Final interpolated value: {result:.6f} (weights: {', '.join(f'{w:.4f}' for w in weights)})"
             )
 
         return result
 
+    def _interpolate_block_rates(
+        self, blocks: List[FortyEightHourBlock], jd: float
+    ) -> float:
+        """
+        Differentiate the interpolation between blocks in the same section.
+
+        The interpolated value is sum(w_i * v_i) / sum(w_i), where each weight
+        w_i = 1 - |jd - center_i| changes at one unit per day. By the quotient
+        rule its rate is (sum(w_i' * (v_i - value)) + sum(w_i * v_i')) / sum(w_i).
+        For wrapping angles the block values are unwrapped first, as when
+        interpolating values.
+
+        Args:
+            blocks: List of blocks to interpolate between
+            jd: The Julian date to evaluate at
+
+        Returns:
+            The rate of change of the interpolated value, per day
+        """
+        blocks = sorted(blocks, key=lambda b: b.header.start_day)
+        offsets = [jd - block.center_julian() for block in blocks]
+        weights = [max(0.0, 1.0 - abs(offset)) for offset in offsets]
+        weight_rates = [
+            0.0 if weight == 0.0 else -math.copysign(1.0, offset)
+            for weight, offset in zip(weights, offsets)
+        ]
+        block_rates = [block.evaluate_rate_jd(jd) for block in blocks]
+
+        weight_sum = sum(weights)
+        if weight_sum <= 0:
+            # Fallback to using the closest block
+            closest = min(range(len(blocks)), key=lambda i: abs(offsets[i]))
+            return block_rates[closest]
+
+        block_values = [block.evaluate_jd(jd) for block in blocks]
+        if self._is_wrapping_angle():
+            assert self.file is not None
+            behavior = cast(RangedBehavior, self.file.value_behavior)
+            min_val, max_val = behavior["range"]
+            range_size = max_val - min_val
+            reference = block_values[0]
+            block_values = [
+                reference
+                + ((value - reference + range_size / 2) % range_size)
+                - range_size / 2
+                for value in block_values
+            ]
+
+        value = sum(w * v for w, v in zip(weights, block_values)) / weight_sum
+        return (
+            sum(dw * (v - value) for dw, v in zip(weight_rates, block_values))
+            + sum(w * r for w, r in zip(weights, block_rates))
+        ) / weight_sum
+
     def _is_wrapping_angle(self) -> bool:
         """
         Check if the file contains wrapping angle values.
@@ -397,3 +1159,40 @@ class WeftReader:
             return max(min_val, min(max_val, value))
         else:  # unbounded
             return value
+
+    def _apply_value_behavior_array(
+        self, values: npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.float64]:
+        """
+        Apply value behavior to an array of values.
+
+        This mirrors apply_value_behavior element by element.
+
+        Args:
+            values: The values to process
+
+        Returns:
+            The processed values
+        """
+        if self.file is None:
+            raise ValueError("No file loaded")
+
+        behavior_type = self.file.value_behavior["type"]
+        if behavior_type == "wrapping":
+            min_val, max_val = cast(RangedBehavior, self.file.value_behavior)["range"]
+            range_size = max_val - min_val
+            values = np.array(values, dtype=np.float64)
+            below = values < min_val
+            while below.any():
+                values[below] += range_size
+                below = values < min_val
+            above = values >= max_val
+            while above.any():
+                values[above] -= range_size
+                above = values >= max_val
+            return values
+        elif behavior_type == "bounded":
+            min_val, max_val = cast(RangedBehavior, self.file.value_behavior)["range"]
+            return np.maximum(min_val, np.minimum(max_val, values))
+        else:  # unbounded
+            return np.asarray(values, dtype=np.float64)
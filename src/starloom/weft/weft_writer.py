@@ -6,7 +6,7 @@ and daily blocks, using Chebyshev polynomials for efficient storage.
 """
 
 from datetime import datetime, timedelta, date, time, timezone
-from typing import List, Dict, Tuple, Optional, Any, Union, TypeVar, cast
+from typing import List, Dict, Tuple, Optional, Any, Sequence, Union, TypeVar, cast
 from zoneinfo import ZoneInfo
 import os
 from numpy.polynomial import chebyshev
@@ -30,22 +30,45 @@ if TYPE_CHECKING:
     from ..horizons.quantities import (
         EphemerisQuantity,
     )
+    from .parallel_fit import FitPool
 
-from .ephemeris_data_source import EphemerisDataSource
+from .ephemeris_data_source import EphemerisDataSource, SAMPLE_TIME_TOLERANCE
 from .block_selection import (
+    calculate_sampling_rate,
     should_include_multi_year_block,
     should_include_monthly_block,
     should_include_fourty_eight_hour_block,
 )
+from .incremental_fit import IncrementalChebyshevFit
 from .logging import get_logger
 from .timespan import descriptive_timespan
-from .blocks.utils import unwrap_angles
+from .blocks.utils import unwrap_angle_array
+from .weft_index import INDEX_VERSION, WeftIndex, WeftIndexEntry
+from ..ephemeris.ephemeris import Ephemeris
+from ..ephemeris.position_table import PositionTable
+from ..ephemeris.time_spec import TimeSpec
+from ..space_time.julian import julian_from_datetime
 
 # Create a logger for this module
 logger = get_logger(__name__)
 
 T = TypeVar("T", bound=BlockType)
 
+# Trailing coefficients smaller than this are dropped
+COEFFICIENT_TRIM_THRESHOLD = 1e-12
+
+# Number of samples stream_multi_precision_file fetches at a time, unless
+# given; chunks are rounded down to whole months, with at least one month each
+DEFAULT_STREAM_CHUNK_SIZE = 100_000
+
+# Most windows fitted by one chebfit call. The batches do not depend on the
+# number of worker processes, so neither do the coefficients.
+FIT_BATCH_SIZE = 256
+
+# A window to fit: the indices of its first and after its last sample in the
+# data source's arrays, and its start and end datetimes
+WindowSpan = Tuple[int, int, datetime, datetime]
+
 
 class WeftWriter:
     """
@@ -76,6 +99,10 @@ class WeftWriter:
         # Initialize value behavior based on quantity
         self.value_behavior = self._initialize_value_behavior()
 
+        # Pool fitting windows in worker processes, while
+        # create_multi_precision_file runs with workers > 1
+        self._fit_pool: Optional["FitPool"] = None
+
     def _initialize_value_behavior(self) -> Union[RangedBehavior, UnboundedBehavior]:
         """Initialize the value behavior based on the quantity type.
 
@@ -124,7 +151,7 @@ class WeftWriter:
         data_source: EphemerisDataSource,
         start_dt: datetime,
         end_dt: datetime,
-    ) -> Tuple[List[float], List[float]]:
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Generate sample points for fitting using all available data points.
 
@@ -134,82 +161,50 @@ class WeftWriter:
             end_dt: End datetime
 
         Returns:
-            Tuple of (x_values, values)
-        """
-        # Time the timestamp filtering
-        filter_start = time_module.time()
-
-        # Use binary search to find indices of start and end timestamps
-        # since the timestamps list is sorted
-        timestamps = data_source.timestamps
-
-        # Find start index (first timestamp >= start_dt)
-        start_idx = 0
-        end_idx = len(timestamps) - 1
-        while start_idx <= end_idx:
-            mid_idx = (start_idx + end_idx) // 2
-            if timestamps[mid_idx] < start_dt:
-                start_idx = mid_idx + 1
-            else:
-                end_idx = mid_idx - 1
-
-        # Find end index (last timestamp <= end_dt)
-        start_idx_for_end = start_idx
-        end_idx = len(timestamps) - 1
-        while start_idx_for_end <= end_idx:
-            mid_idx = (start_idx_for_end + end_idx) // 2
-            if timestamps[mid_idx] <= end_dt:
-                start_idx_for_end = mid_idx + 1
-            else:
-                end_idx = mid_idx - 1
+            Tuple of (x_values, values) arrays
+        """
+        julian_dates, values = data_source.get_samples(start_dt, end_dt)
+        x_values = self._window_x(julian_dates, start_dt, end_dt)
 
-        # Extract the timestamps in range using the found indices
-        filtered_timestamps = timestamps[start_idx : end_idx + 1]
+        # Handle wrapping behavior if needed
+        wrap_range = self._wrap_range()
+        if wrap_range is not None and values.size:
+            values = unwrap_angle_array(values, *wrap_range)
 
-        filter_end = time_module.time()
-        filter_time_ms = (filter_end - filter_start) * 1000
-        logger.debug(
-            f"Filtered {len(filtered_timestamps)} timestamps in {filter_time_ms:.2f}ms (binary search)"
-        )
+        return x_values, values
 
-        if not filtered_timestamps:
-            return [], []
-
-        # Calculate x values for each timestamp
-        total_seconds = (end_dt - start_dt).total_seconds()
-        x_values = []
-        values = []
-
-        # Time the value retrieval and x-value calculation
-        value_start = time_module.time()
-        for dt in filtered_timestamps:
-            # Calculate x value in [-1, 1] range
-            elapsed_seconds = (dt - start_dt).total_seconds()
-            x = -1.0 + 2.0 * elapsed_seconds / total_seconds
-            x_values.append(x)
-
-            # Get value at this time
-            value = data_source.get_value_at(dt)  # basically a dictionary lookup
-            values.append(value)
-        value_end = time_module.time()
-        value_time_ms = (value_end - value_start) * 1000
-        logger.debug(f"Retrieved {len(values)} values in {value_time_ms:.2f}ms")
+    def _wrap_range(self) -> Optional[Tuple[float, float]]:
+        """
+        Get the range of a wrapping quantity.
 
-        # Handle wrapping behavior if needed
-        if self.wrapping_behavior == "wrapping":
-            # Get the range from the value behavior
-            ranged_behavior = cast(RangedBehavior, self.value_behavior)
-            min_val, max_val = ranged_behavior["range"]
+        Returns:
+            (min, max) of the quantity's values if they wrap, otherwise None
+        """
+        if self.wrapping_behavior != "wrapping":
+            return None
+        return cast(RangedBehavior, self.value_behavior)["range"]
 
-            # Unwrap the values
-            values = unwrap_angles(values, min_val, max_val)
-            logger.debug("Applied angle unwrapping to values")
+    @staticmethod
+    def _window_x(
+        julian_dates: np.ndarray, start_dt: datetime, end_dt: datetime
+    ) -> np.ndarray:
+        """
+        Map sample times onto a window's Chebyshev domain.
 
-        # Log total time
-        total_time_ms = filter_time_ms + value_time_ms
-        logger.debug(f"Total sample generation time: {total_time_ms:.2f}ms")
+        Args:
+            julian_dates: Sample times as Julian dates
+            start_dt: Start of the window, mapped to -1
+            end_dt: End of the window, mapped to 1
 
-        return x_values, values
+        Returns:
+            Array of x values
+        """
+        # Offsets are rounded to whole milliseconds, the precision of the
+        # sample times, so windows with the same layout get identical x values
+        start_jd = julian_from_datetime(start_dt)
+        elapsed_ms = np.round((julian_dates - start_jd) * 86_400_000)
+        total_ms = (end_dt - start_dt) / timedelta(milliseconds=1)
+        return -1.0 + 2.0 * elapsed_ms / total_ms
 
     def _generate_chebyshev_coefficients(
         self,
@@ -229,76 +224,107 @@ class WeftWriter:
 
         Returns:
             List of Chebyshev coefficients
+
+        Raises:
+            ValueError: If the data source has no samples in the range
+        """
+        return self._fit_windows(data_source, [(start_dt, end_dt)], degree)[0]
+
+    def _fit_windows(
+        self,
+        data_source: EphemerisDataSource,
+        windows: Sequence[Tuple[datetime, datetime]],
+        degree: int,
+    ) -> List[List[float]]:
         """
+        Fit Chebyshev coefficients for many time ranges at once.
 
-        logger.debug(f"Generating coefficients for {start_dt} to {end_dt}")
+        Windows whose samples fall at the same positions within the window
+        (such as months of equal length, or whole 48-hour windows) share the
+        same Chebyshev Vandermonde matrix, so each group of them is fitted in
+        batches of up to FIT_BATCH_SIZE windows, with one chebfit call per
+        batch (see fit_window_batch), which factors the matrix once for all
+        the batch's windows. Results match fitting each window on its own.
 
-        # Time the sample generation
-        sample_start = time_module.time()
-        x_values, values = self._generate_samples(data_source, start_dt, end_dt)
-        sample_end = time_module.time()
-        sample_time_ms = (sample_end - sample_start) * 1000
-        logger.debug(
-            f"Generated {len(x_values)} samples for {start_dt} to {end_dt} in {sample_time_ms:.2f}ms"
-        )
+        While create_multi_precision_file runs with workers > 1, the batches
+        for its data source are fitted in worker processes.
+
+        Args:
+            data_source: The data source to get values from
+            windows: (start, end) datetimes of each range
+            degree: Degree of Chebyshev polynomial to fit
 
-        # Time the Chebyshev coefficient fitting
+        Returns:
+            Coefficients for each window, in order
+
+        Raises:
+            ValueError: If the data source has no samples in one of the windows
+        """
         fit_start = time_module.time()
-        coeffs = chebyshev.chebfit(x_values, values, deg=degree)
-        fit_end = time_module.time()
-        fit_time_ms = (fit_end - fit_start) * 1000
+
+        spans: List[WindowSpan] = []
+        groups: Dict[bytes, List[int]] = {}
+        for index, (start_dt, end_dt) in enumerate(windows):
+            first, stop = data_source.index_range(start_dt, end_dt)
+            if stop == first:
+                raise ValueError(f"No samples between {start_dt} and {end_dt}")
+            x = self._window_x(data_source.julian_dates[first:stop], start_dt, end_dt)
+            groups.setdefault(x.tobytes(), []).append(index)
+            spans.append((first, stop, start_dt, end_dt))
+
+        batches = [
+            indices[first : first + FIT_BATCH_SIZE]
+            for indices in groups.values()
+            for first in range(0, len(indices), FIT_BATCH_SIZE)
+        ]
+        tasks = [[spans[index] for index in batch] for batch in batches]
+        wrap_range = self._wrap_range()
+        if self._fit_pool is not None and self._fit_pool.data_source is data_source:
+            fitted = self._fit_pool.map(tasks, degree, wrap_range)
+        else:
+            fitted = [
+                fit_window_batch(
+                    data_source.julian_dates,
+                    data_source.values,
+                    task,
+                    degree,
+                    wrap_range,
+                )
+                for task in tasks
+            ]
+
+        results: List[List[float]] = [[] for _ in windows]
+        for batch, coeffs in zip(batches, fitted):
+            for index, row in zip(batch, coeffs):
+                results[index] = self._trim_coefficients(row)
+
+        fit_time_ms = (time_module.time() - fit_start) * 1000
         logger.debug(
-            f"Fitted Chebyshev coefficients (degree {degree}) in {fit_time_ms:.2f}ms"
+            f"Fitted {len(windows)} windows in {len(batches)} batches "
+            f"(degree {degree}) in {fit_time_ms:.2f}ms"
         )
+        return results
 
-        # Convert numpy array to list of float
-        try:
-            # This is safe because we know coeffs is a numpy array of floats
-            coeffs_list = coeffs.tolist()
-        except (AttributeError, TypeError):
-            # Handle the case where coeffs is not a numpy array
-            logger.warning(
-                f"Failed to convert coeffs to list using tolist(): {type(coeffs)}"
-            )
-            try:
-                # Try to convert to a list of floats
-                coeffs_list = [float(c) for c in coeffs]
-            except Exception as e:
-                # If all else fails, return a safe default
-                logger.error(f"Unable to process coefficients: {e}")
-                return [0.0]
-
-        # Define threshold for "very very tiny"
-        threshold = 1e-12
-
-        # Ensure coeffs_list is a list we can work with
-        if not isinstance(coeffs_list, list):
-            logger.warning(
-                f"Expected list but got {type(coeffs_list)}, trying conversion"
-            )
-            try:
-                # Convert to list and ensure it's a List[float]
-                coeffs_list = cast(List[float], list(coeffs_list))
-            except Exception:
-                logger.error("Failed to convert to list")
-                return [0.0]
-
-        # Trim from the end until we find a coefficient larger than the threshold
-        while len(coeffs_list) > 1 and abs(cast(float, coeffs_list[-1])) < threshold:
-            coeffs_list.pop()
-
-        # Count how many coefficients we dropped
-        if isinstance(coeffs, np.ndarray):
-            original_len = len(coeffs)
-            current_len = len(coeffs_list)
-            if current_len < original_len:
-                logger.debug(
-                    f"Dropped {original_len - current_len} tiny coefficients below {threshold}"
-                )
+    @staticmethod
+    def _trim_coefficients(coeffs: np.ndarray) -> List[float]:
+        """
+        Drop negligible trailing coefficients.
 
-        logger.debug(f"Coefficients: {coeffs_list}")
-        # Ensure we return a List[float] as the function signature promises
-        return cast(List[float], coeffs_list)
+        Args:
+            coeffs: Fitted coefficients
+
+        Returns:
+            The coefficients up to the last one of at least
+            COEFFICIENT_TRIM_THRESHOLD, keeping at least one
+        """
+        significant = np.flatnonzero(~(np.abs(coeffs) < COEFFICIENT_TRIM_THRESHOLD))
+        count = int(significant[-1]) + 1 if significant.size else 1
+        if count < len(coeffs):
+            logger.debug(
+                f"Dropped {len(coeffs) - count} tiny coefficients "
+                f"below {COEFFICIENT_TRIM_THRESHOLD}"
+            )
+        return cast(List[float], coeffs[:count].tolist())
 
     def create_multi_year_block(
         self,
@@ -319,25 +345,54 @@ class WeftWriter:
         Returns:
             A MultiYearBlock or None if coverage criteria not met
         """
+        blocks = self.create_multi_year_blocks(
+            data_source, [start_year], duration, degree
+        )
+        return blocks[0] if blocks else None
 
-        # Check if this block should be included based on coverage criteria
-        if not should_include_multi_year_block(data_source, start_year, duration):
-            logger.debug(
-                f"Multi-year block not included for {start_year}-{start_year + duration - 1}"
-            )
-            return None
+    def create_multi_year_blocks(
+        self,
+        data_source: EphemerisDataSource,
+        start_years: Sequence[int],
+        duration: int,
+        degree: int,
+    ) -> List[MultiYearBlock]:
+        """
+        Create multi-year blocks of the same duration, fitted together.
 
-        start_dt = datetime(start_year, 1, 1, tzinfo=ZoneInfo("UTC"))
-        end_dt = datetime(start_year + duration, 1, 1, tzinfo=ZoneInfo("UTC"))
+        Args:
+            data_source: The data source to get values from
+            start_years: Starting year of each block
+            duration: Number of years each block covers
+            degree: Degree of Chebyshev polynomial to fit
 
-        # Generate samples and fit coefficients
-        coeffs_list = self._generate_chebyshev_coefficients(
-            data_source, start_dt, end_dt, degree
-        )
+        Returns:
+            MultiYearBlocks for the start years that meet the coverage
+            criteria, in order
+        """
+        included = []
+        for start_year in start_years:
+            if should_include_multi_year_block(data_source, start_year, duration):
+                included.append(start_year)
+            else:
+                logger.debug(
+                    f"Multi-year block not included for {start_year}-{start_year + duration - 1}"
+                )
+        if not included:
+            return []
 
-        return MultiYearBlock(
-            start_year=start_year, duration=duration, coeffs=coeffs_list
-        )
+        windows = [
+            (
+                datetime(start_year, 1, 1, tzinfo=ZoneInfo("UTC")),
+                datetime(start_year + duration, 1, 1, tzinfo=ZoneInfo("UTC")),
+            )
+            for start_year in included
+        ]
+        coeffs = self._fit_windows(data_source, windows, degree)
+        return [
+            MultiYearBlock(start_year=start_year, duration=duration, coeffs=coeffs_list)
+            for start_year, coeffs_list in zip(included, coeffs)
+        ]
 
     def create_monthly_blocks(
         self,
@@ -358,7 +413,8 @@ class WeftWriter:
         Returns:
             List of MonthlyBlock objects
         """
-        blocks = []
+        months: List[Tuple[int, int, int]] = []
+        windows: List[Tuple[datetime, datetime]] = []
 
         year, month = start_date.year, start_date.month
 
@@ -377,23 +433,24 @@ class WeftWriter:
 
             # Only include if the month meets the criteria
             if should_include_monthly_block(data_source, year, month):
-                # TODO: It's error-prone that the start/end to _generate_chebyshev_coefficients
+                # TODO: It's error-prone that the start/end to _fit_windows
                 # are not the same logic as evaluate on the block class
                 # we should unify these
-                coeffs_list = self._generate_chebyshev_coefficients(
-                    data_source, month_start, next_month, degree
-                )
-                blocks.append(
-                    MonthlyBlock(
-                        year=year, month=month, day_count=day_count, coeffs=coeffs_list
-                    )
-                )
+                months.append((year, month, day_count))
+                windows.append((month_start, next_month))
 
             # Move to the next month
             year = next_month.year
             month = next_month.month
 
-        return blocks
+        # Fit all the months together
+        coeffs = self._fit_windows(data_source, windows, degree) if windows else []
+        return [
+            MonthlyBlock(
+                year=year, month=month, day_count=day_count, coeffs=coeffs_list
+            )
+            for (year, month, day_count), coeffs_list in zip(months, coeffs)
+        ]
 
     def create_forty_eight_hour_blocks(
         self,
@@ -401,7 +458,27 @@ class WeftWriter:
         start_date: datetime,
         end_date: datetime,
         degree: int,
+        first_day: Optional[date] = None,
+        last_day: Optional[date] = None,
     ) -> List[Union[FortyEightHourSectionHeader, FortyEightHourBlock]]:
+        """
+        Create a 48-hour section with a block for each day in a range.
+
+        Each block's window is the 48 hours centered on its day, clipped to
+        the range.
+
+        Args:
+            data_source: The data source to get values from
+            start_date: Start date
+            end_date: End date (inclusive)
+            degree: Degree of Chebyshev polynomial to fit
+            first_day: Only create blocks centered on or after this day
+            last_day: Only create blocks centered on or before this day
+
+        Returns:
+            The section header followed by its blocks, or an empty list if no
+            day meets the coverage criteria
+        """
         # Normalize to day boundaries
         start_date = datetime.combine(start_date.date(), time(0), tzinfo=timezone.utc)
         end_date = datetime.combine(end_date.date(), time(0), tzinfo=timezone.utc)
@@ -410,14 +487,24 @@ class WeftWriter:
         blocks: List[Union[FortyEightHourSectionHeader, FortyEightHourBlock]] = []
 
         current_date = start_date
+        last_date = end_date
+        if first_day is not None:
+            current_date = max(
+                current_date, datetime.combine(first_day, time(0), tzinfo=timezone.utc)
+            )
+        if last_day is not None:
+            last_date = min(
+                last_date, datetime.combine(last_day, time(0), tzinfo=timezone.utc)
+            )
 
-        # Create a temporary list to store blocks before creating the header
-        all_blocks = []
+        # Collect the windows to fit before creating the header
+        block_dates: List[date] = []
+        windows: List[Tuple[datetime, datetime]] = []
         min_block_date = None
         max_block_date = None
 
         # Process each day in the range
-        while current_date <= end_date:
+        while current_date <= last_date:
             # Only process dates that pass the coverage criteria
             if should_include_fourty_eight_hour_block(data_source, current_date):
                 # Create a block for this date
@@ -436,14 +523,15 @@ class WeftWriter:
                 block_start = max(start_date, current_date - timedelta(days=1))
                 block_end = min(end_date, current_date + timedelta(days=1))
 
-                coeffs_list = self._generate_chebyshev_coefficients(
-                    data_source, block_start, block_end, degree
-                )
-
-                all_blocks.append((block_date, coeffs_list))
+                block_dates.append(block_date)
+                windows.append((block_start, block_end))
 
             current_date += timedelta(days=1)
 
+        # Fit all the windows together
+        coeffs = self._fit_windows(data_source, windows, degree) if windows else []
+        all_blocks = list(zip(block_dates, coeffs))
+
         # Skip if no blocks were created
         if all_blocks:
             # Create header using actual min/max dates from included blocks
@@ -486,6 +574,7 @@ class WeftWriter:
         end_date: datetime,
         config: Dict[str, Any],
         custom_timespan: Optional[str] = None,
+        workers: int = 1,
     ) -> WeftFile:
         """
         Create a .weft file with multiple precision levels.
@@ -497,10 +586,44 @@ class WeftWriter:
             end_date: End date (inclusive)
             config: Configuration for each block type
             custom_timespan: Optional custom timespan for the file preamble
+            workers: Number of processes to fit blocks with. With more than
+                one, the samples are shared with a pool of worker processes
+                (see FitPool); the blocks are identical either way.
 
         Returns:
             A WeftFile instance
+
+        Raises:
+            ValueError: If workers is not positive
         """
+        if workers < 1:
+            raise ValueError("workers must be positive")
+        if workers == 1:
+            return self._create_multi_precision_file(
+                data_source, quantity, start_date, end_date, config, custom_timespan
+            )
+
+        from .parallel_fit import FitPool
+
+        with FitPool(data_source, workers) as pool:
+            self._fit_pool = pool
+            try:
+                return self._create_multi_precision_file(
+                    data_source, quantity, start_date, end_date, config, custom_timespan
+                )
+            finally:
+                self._fit_pool = None
+
+    def _create_multi_precision_file(
+        self,
+        data_source: EphemerisDataSource,
+        quantity: Union["EphemerisQuantity", "OrbitalElementsQuantity"],
+        start_date: datetime,
+        end_date: datetime,
+        config: Dict[str, Any],
+        custom_timespan: Optional[str] = None,
+    ) -> WeftFile:
+        """Create the blocks and preamble of create_multi_precision_file."""
         blocks: List[BlockType] = []
 
         # Add blocks in order of decreasing precision (least precise first)
@@ -512,30 +635,24 @@ class WeftWriter:
             end_year = data_source.end_date.year
 
             # Create blocks for each decade in the range
-            for decade_start in range(start_year - (start_year % 10), end_year + 1, 10):
-                decade_block = self.create_multi_year_block(
-                    data_source=data_source,
-                    start_year=decade_start,
-                    duration=10,
-                    degree=multi_year_config["polynomial_degree"],
-                )
-                if decade_block:
-                    blocks.append(decade_block)
-                    logger.debug(
-                        f"Added decade block for {decade_start}-{decade_start + 9}"
-                    )
+            decade_blocks = self.create_multi_year_blocks(
+                data_source=data_source,
+                start_years=range(start_year - (start_year % 10), end_year + 1, 10),
+                duration=10,
+                degree=multi_year_config["polynomial_degree"],
+            )
+            blocks.extend(decade_blocks)
+            logger.debug(f"Added {len(decade_blocks)} decade blocks")
 
             # Create blocks for each year in the range
-            for year in range(start_year, end_year + 1):
-                year_block = self.create_multi_year_block(
-                    data_source=data_source,
-                    start_year=year,
-                    duration=1,
-                    degree=multi_year_config["polynomial_degree"],
-                )
-                if year_block:
-                    blocks.append(year_block)
-                    logger.debug(f"Added year block for {year}")
+            year_blocks = self.create_multi_year_blocks(
+                data_source=data_source,
+                start_years=range(start_year, end_year + 1),
+                duration=1,
+                degree=multi_year_config["polynomial_degree"],
+            )
+            blocks.extend(year_blocks)
+            logger.debug(f"Added {len(year_blocks)} year blocks")
 
         if config["monthly"]["enabled"]:
             monthly_config = config["monthly"]
@@ -576,6 +693,9 @@ class WeftWriter:
         """
         Save a WeftFile to disk.
 
+        The file is written in format v0.03, with a table-of-contents index at
+        the end so readers can load it without scanning every block.
+
         Args:
             weft_file: The WeftFile to save
             output_path: Path to save the file
@@ -584,7 +704,254 @@ class WeftWriter:
         os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
 
         # Save the file
-        weft_file.write_to_file(output_path)
+        weft_file.write_to_file(output_path, include_index=True)
+
+    def stream_multi_precision_file(
+        self,
+        ephemeris: Ephemeris,
+        planet_id: str,
+        start_date: datetime,
+        end_date: datetime,
+        config: Dict[str, Any],
+        output_path: str,
+        step_hours: Union[int, str] = "24h",
+        custom_timespan: Optional[str] = None,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> None:
+        """
+        Fetch, fit and write a multi-precision .weft file a chunk at a time.
+
+        This writes the same blocks as create_multi_precision_file followed by
+        save_file, but never holds more than a few chunks of samples. The
+        range is fetched in chunks of whole months, of about chunk_size
+        samples. Once the samples for a batch of months, and two days either
+        side of it, have been fetched, the batch's monthly blocks and a 48-hour
+        section are fitted and appended to the file, and the samples no longer
+        needed are dropped. Multi-year blocks are fitted incrementally as the
+        chunks arrive, and written after the other blocks, before the index.
+
+        Readers pick the first covering block of each tier in file order, and
+        within each tier the blocks are in the same order as in
+        create_multi_precision_file, so they pick the same blocks. Consecutive
+        48-hour sections overlap by one day on each side, so points near the
+        end of a section are interpolated from the same blocks as they would
+        be in a single section.
+
+        Args:
+            ephemeris: The ephemeris source to fetch positions from
+            planet_id: The planet ID to get data for
+            start_date: Start date
+            end_date: End date (inclusive)
+            config: Configuration for each block type
+            output_path: Path to save the file
+            step_hours: Step size for sampling ephemeris data. Can be a string
+                like '1h', '30m' or an integer for hours.
+            custom_timespan: Optional custom timespan for the file preamble
+            chunk_size: Approximate number of samples to fetch at a time
+
+        Raises:
+            ValueError: If chunk_size is not positive
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        if isinstance(step_hours, int):
+            step_hours = f"{step_hours}h"
+
+        # Each entry is the start of a month and the start of the next
+        months: List[Tuple[datetime, datetime]] = []
+        year, month = start_date.year, start_date.month
+        while datetime(year, month, 1, tzinfo=start_date.tzinfo) <= end_date:
+            next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+            months.append(
+                (
+                    datetime(year, month, 1, tzinfo=start_date.tzinfo),
+                    datetime(next_year, next_month, 1, tzinfo=start_date.tzinfo),
+                )
+            )
+            year, month = next_year, next_month
+
+        time_spec = TimeSpec.from_range(start_date, end_date, step_hours)
+        samples_per_month = 31 * calculate_sampling_rate(time_spec)
+        months_per_chunk = max(1, int(chunk_size // samples_per_month))
+        chunks = time_spec.split(
+            [
+                months[i][0]
+                for i in range(months_per_chunk, len(months), months_per_chunk)
+            ]
+        )
+        logger.info(
+            f"Streaming {len(months)} months in {len(chunks)} chunks "
+            f"of {months_per_chunk} months"
+        )
+
+        multi_year_blocks: List[_StreamedMultiYearBlock] = []
+        if config["multi_year"]["enabled"]:
+            degree = config["multi_year"]["polynomial_degree"]
+            wrap_range = self._wrap_range()
+            start_year, end_year = start_date.year, end_date.year
+            for first_year, duration in [
+                (decade, 10)
+                for decade in range(start_year - (start_year % 10), end_year + 1, 10)
+            ] + [(year, 1) for year in range(start_year, end_year + 1)]:
+                multi_year_blocks.append(
+                    _StreamedMultiYearBlock(first_year, duration, degree, wrap_range)
+                )
+
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        entries: List[WeftIndexEntry] = []
+        julian_dates = np.empty(0, dtype=np.float64)
+        values = np.empty(0, dtype=np.float64)
+        pending = 0  # Index of the first month not yet written
+
+        with open(output_path, "wb") as f:
+
+            def write(block: BlockType) -> None:
+                if not isinstance(block, FortyEightHourBlock):
+                    entries.append(WeftIndexEntry.for_block(block, f.tell()))
+                f.write(block.to_bytes())
+
+            for index, chunk_spec in enumerate(chunks):
+                chunk = EphemerisDataSource(
+                    ephemeris=ephemeris,
+                    planet_id=planet_id,
+                    quantity=self.quantity,
+                    start_date=cast(datetime, chunk_spec.start_time),
+                    end_date=cast(datetime, chunk_spec.stop_time),
+                    step_hours=step_hours,
+                )
+                if index == 0:
+                    preamble = self._create_preamble(
+                        data_source=chunk,
+                        quantity=self.quantity,
+                        start_date=start_date,
+                        end_date=end_date,
+                        config=config,
+                        custom_timespan=custom_timespan,
+                        version=INDEX_VERSION,
+                    )
+                    f.write(preamble.encode("utf-8"))
+
+                for streamed in multi_year_blocks:
+                    streamed.add(chunk.julian_dates, chunk.values)
+                julian_dates = np.concatenate([julian_dates, chunk.julian_dates])
+                values = np.concatenate([values, chunk.values])
+
+                # Every sample up to this one has been fetched
+                if index + 1 < len(chunks):
+                    fetched_jd = (
+                        julian_from_datetime(
+                            cast(datetime, chunks[index + 1].start_time)
+                        )
+                        - 2 * SAMPLE_TIME_TOLERANCE
+                    )
+                else:
+                    fetched_jd = np.inf
+
+                for streamed in multi_year_blocks:
+                    if streamed.end_jd < fetched_jd:
+                        streamed.finish()
+
+                # A month is ready once the 48-hour block for the first day
+                # of the next month can be fitted
+                ready = pending
+                while (
+                    ready < len(months)
+                    and julian_from_datetime(months[ready][1] + timedelta(days=1))
+                    < fetched_jd
+                ):
+                    ready += 1
+                if ready == pending:
+                    continue
+
+                data_source = EphemerisDataSource(
+                    ephemeris=ephemeris,
+                    planet_id=planet_id,
+                    quantity=self.quantity,
+                    start_date=start_date,
+                    end_date=end_date,
+                    step_hours=step_hours,
+                    table=PositionTable(
+                        julian_dates, {chunk.standard_quantity: values}
+                    ),
+                )
+                for fitted in self._stream_months(
+                    data_source, months[pending:ready], start_date, end_date, config
+                ):
+                    write(fitted)
+                pending = ready
+
+                # Keep the samples needed by the next batch of months
+                if pending < len(months):
+                    keep_jd = julian_from_datetime(
+                        months[pending][0] - timedelta(days=2)
+                    )
+                    first = np.searchsorted(
+                        julian_dates, keep_jd - SAMPLE_TIME_TOLERANCE, "left"
+                    )
+                    julian_dates, values = julian_dates[first:], values[first:]
+
+            # Multi-year blocks are small, so they are written last, in order
+            for streamed in multi_year_blocks:
+                finished = streamed.finish()
+                if finished is not None:
+                    write(finished)
+
+            f.write(WeftIndex(entries).to_bytes())
+
+    def _stream_months(
+        self,
+        data_source: EphemerisDataSource,
+        months: Sequence[Tuple[datetime, datetime]],
+        start_date: datetime,
+        end_date: datetime,
+        config: Dict[str, Any],
+    ) -> List[BlockType]:
+        """
+        Create the monthly blocks and 48-hour section for a batch of months.
+
+        Args:
+            data_source: Samples from two days before the first month to one
+                day after the last
+            months: (start, start of next month) of each month, in order
+            start_date: Start of the file's range
+            end_date: End of the file's range (inclusive)
+            config: Configuration for each block type
+
+        Returns:
+            The blocks, in file order
+        """
+        blocks: List[BlockType] = []
+        if config["monthly"]["enabled"]:
+            blocks.extend(
+                self.create_monthly_blocks(
+                    data_source=data_source,
+                    start_date=months[0][0],
+                    end_date=months[-1][0],
+                    degree=config["monthly"]["polynomial_degree"],
+                )
+            )
+
+        if config["forty_eight_hour"]["enabled"]:
+            first_day = max(months[0][0].date(), start_date.date())
+            last_day = min(months[-1][1].date() - timedelta(days=1), end_date.date())
+
+            # Overlap the neighbouring sections by a day on each side
+            section = self.create_forty_eight_hour_blocks(
+                data_source=data_source,
+                start_date=start_date,
+                end_date=end_date,
+                degree=config["forty_eight_hour"]["polynomial_degree"],
+                first_day=first_day - timedelta(days=1),
+                last_day=last_day + timedelta(days=1),
+            )
+            if any(
+                first_day <= block.center_date <= last_day
+                for block in section
+                if isinstance(block, FortyEightHourBlock)
+            ):
+                blocks.extend(section)
+
+        return blocks
 
     def _create_preamble(
         self,
@@ -594,6 +961,7 @@ class WeftWriter:
         end_date: datetime,
         config: Dict[str, Any],
         custom_timespan: Optional[str] = None,
+        version: str = "v0.02",
     ) -> str:
         """
         Create the preamble for a .weft file.
@@ -605,6 +973,7 @@ class WeftWriter:
             end_date: End date (inclusive)
             config: Configuration for each block type
             custom_timespan: Optional custom timespan for the file preamble
+            version: The format version
 
         Returns:
             The preamble string
@@ -624,9 +993,157 @@ class WeftWriter:
             behavior_str = f"{behavior_str}[{min_val},{max_val}]"
 
         preamble = (
-            f"#weft! v0.02 {data_source.planet_id} jpl:horizons {timespan} "
+            f"#weft! {version} {data_source.planet_id} jpl:horizons {timespan} "
             f"32bit {quantity.name} {behavior_str} chebychevs "
             f"generated@{now.isoformat()}\n\n"
         )
 
         return preamble
+
+
+def fit_window_batch(
+    julian_dates: np.ndarray,
+    values: np.ndarray,
+    windows: Sequence[WindowSpan],
+    degree: int,
+    wrap_range: Optional[Tuple[float, float]] = None,
+) -> np.ndarray:
+    """
+    Fit windows whose samples fall at the same positions, with one chebfit call.
+
+    This is the unit of work WeftWriter hands to worker processes, so it only
+    takes plain arrays and window bounds.
+
+    Args:
+        julian_dates: Sample times of the data source, as Julian dates
+        values: Sample values of the data source
+        windows: The windows to fit, which must all map their samples to the
+            same x values
+        degree: Degree of Chebyshev polynomial to fit
+        wrap_range: (min, max) of a wrapping quantity, whose values are
+            unwrapped in each window
+
+    Returns:
+        Array of shape (len(windows), degree + 1) of coefficients
+    """
+    first, stop, start_dt, end_dt = windows[0]
+    x = WeftWriter._window_x(julian_dates[first:stop], start_dt, end_dt)
+
+    rows = []
+    for first, stop, _, _ in windows:
+        window_values = values[first:stop]
+        if wrap_range is not None:
+            window_values = unwrap_angle_array(window_values, *wrap_range)
+        rows.append(window_values)
+
+    # Each column of y is fitted separately, with one factorization
+    return np.asarray(chebyshev.chebfit(x, np.stack(rows, axis=1), deg=degree).T)
+
+
+class _StreamedMultiYearBlock:
+    """A multi-year block fitted from chunks of samples as they are fetched."""
+
+    def __init__(
+        self,
+        start_year: int,
+        duration: int,
+        degree: int,
+        wrap_range: Optional[Tuple[float, float]] = None,
+    ):
+        """
+        Initialize the block with no samples.
+
+        Args:
+            start_year: Starting year
+            duration: Number of years to cover
+            degree: Degree of Chebyshev polynomial to fit
+            wrap_range: (min, max) of a wrapping quantity, whose values are
+                unwrapped across chunks
+        """
+        self.start_year = start_year
+        self.duration = duration
+        self.wrap_range = wrap_range
+        self.start = datetime(start_year, 1, 1, tzinfo=timezone.utc)
+        self.end = datetime(start_year + duration, 1, 1, tzinfo=timezone.utc)
+        self.start_jd = julian_from_datetime(self.start)
+        self.end_jd = julian_from_datetime(self.end)
+
+        self._fit: Optional[IncrementalChebyshevFit] = IncrementalChebyshevFit(degree)
+        self._block: Optional[MultiYearBlock] = None
+        self._first_jd = 0.0
+        self._last_jd = 0.0
+        self._last_value = 0.0
+        self._offset = 0.0
+
+    def add(self, julian_dates: np.ndarray, values: np.ndarray) -> None:
+        """
+        Add the samples within the block's span, inclusive.
+
+        Args:
+            julian_dates: Sorted sample times, later than any added before
+            values: Sample values
+        """
+        if self._fit is None:
+            return
+        first = np.searchsorted(
+            julian_dates, self.start_jd - SAMPLE_TIME_TOLERANCE, "left"
+        )
+        stop = np.searchsorted(
+            julian_dates, self.end_jd + SAMPLE_TIME_TOLERANCE, "right"
+        )
+        if stop <= first:
+            return
+        julian_dates, values = julian_dates[first:stop], values[first:stop]
+
+        if self.wrap_range is not None:
+            # Continue unwrapping from the last value of the previous chunk
+            raw = values
+            if self._fit.count:
+                values = (
+                    unwrap_angle_array(
+                        np.concatenate([[self._last_value], raw]), *self.wrap_range
+                    )[1:]
+                    + self._offset
+                )
+            else:
+                values = unwrap_angle_array(raw, *self.wrap_range)
+            self._last_value = float(raw[-1])
+            self._offset = float(values[-1] - raw[-1])
+
+        if not self._fit.count:
+            self._first_jd = float(julian_dates[0])
+        self._last_jd = float(julian_dates[-1])
+        self._fit.add(WeftWriter._window_x(julian_dates, self.start, self.end), values)
+
+    def finish(self) -> Optional[MultiYearBlock]:
+        """
+        Fit the block from the samples added, once all have been added.
+
+        The block is included only if the samples span at least 66.6% of it,
+        as in should_include_multi_year_block.
+
+        Returns:
+            The MultiYearBlock, or None if the coverage criteria are not met
+        """
+        if self._fit is None:
+            return self._block
+
+        if self._fit.count:
+            # Round the span to whole milliseconds, as analyze_julian_coverage does
+            span_days = (
+                round((self._last_jd - self._first_jd) * 86_400_000) / 86_400_000
+            )
+            total_days = (self.end - self.start).total_seconds() / 86400
+            if min(1.0, span_days / total_days) >= 0.666:
+                self._block = MultiYearBlock(
+                    start_year=self.start_year,
+                    duration=self.duration,
+                    coeffs=WeftWriter._trim_coefficients(self._fit.coefficients()),
+                )
+        if self._block is None:
+            logger.debug(
+                f"Multi-year block not included for "
+                f"{self.start_year}-{self.start_year + self.duration - 1}"
+            )
+        self._fit = None
+        return self._block
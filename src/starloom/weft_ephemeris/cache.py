@@ -0,0 +1,295 @@
+"""
+Persistent cache of decompressed weftballs.
+
+Decompressing a weftball takes most of the start-up time of a short-lived
+process. The cache keeps each weftball's .weft members as plain files, so later
+processes can memory-map them instead of gunzipping the archive again.
+
+Each entry is a directory named after a hash of the weftball's resolved path,
+size and modification time. It holds the extracted members and a manifest.json
+recording those keys and the SHA-256 of the archive. Entries are written to a
+temporary directory and renamed into place, so concurrent processes never see a
+partial entry.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tarfile
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+# Environment variable overriding the base cache directory
+CACHE_DIR_ENV = "STARLOOM_CACHE_DIR"
+
+MANIFEST_NAME = "manifest.json"
+
+# Prefix of entries still being written
+_TEMP_PREFIX = ".tmp-"
+
+# Age in seconds after which an unfinished entry is assumed to be abandoned
+_TEMP_MAX_AGE = 3600
+
+
+def default_cache_dir() -> Path:
+    """
+    Get the default weftball cache directory.
+
+    Returns:
+        $STARLOOM_CACHE_DIR/weft if set, otherwise starloom/weft under
+        $XDG_CACHE_HOME or ~/.cache
+    """
+    base = os.environ.get(CACHE_DIR_ENV)
+    if base:
+        return Path(base).expanduser() / "weft"
+    xdg_cache = os.environ.get("XDG_CACHE_HOME") or os.path.join("~", ".cache")
+    return Path(xdg_cache).expanduser() / "starloom" / "weft"
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """
+    A decompressed weftball in the cache.
+
+    Attributes:
+        directory: The entry's directory
+        source: Resolved path of the weftball
+        size: Size of the weftball in bytes when it was cached
+        mtime_ns: Modification time of the weftball when it was cached
+        sha256: SHA-256 of the weftball's contents
+        members: Names of the cached .weft files
+        created: Unix time the entry was written
+    """
+
+    directory: Path
+    source: str
+    size: int
+    mtime_ns: int
+    sha256: str
+    members: List[str]
+    created: float
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the cached .weft files in bytes."""
+        return sum(self.member_path(name).stat().st_size for name in self.members)
+
+    def member_path(self, name: str) -> Path:
+        """
+        Get the path of a cached .weft file.
+
+        Args:
+            name: The member name, such as "mars_longitude.weft"
+
+        Returns:
+            Path to the extracted file
+        """
+        return self.directory / name
+
+    def is_stale(self) -> bool:
+        """
+        Check whether the weftball has changed or disappeared since it was cached.
+
+        Returns:
+            True if the source is missing or its size or mtime differ
+        """
+        try:
+            stat = os.stat(self.source)
+        except OSError:
+            return True
+        return stat.st_size != self.size or stat.st_mtime_ns != self.mtime_ns
+
+
+class WeftballCache:
+    """A directory of decompressed weftballs, keyed by path, size and mtime."""
+
+    def __init__(self, root: Optional[Union[str, Path]] = None):
+        """
+        Initialize a WeftballCache.
+
+        Args:
+            root: The cache directory (defaults to default_cache_dir())
+        """
+        self.root = Path(root) if root is not None else default_cache_dir()
+
+    @staticmethod
+    def _key(weftball: Union[str, Path]) -> Tuple[str, os.stat_result, str]:
+        """
+        Compute the cache key of a weftball.
+
+        Returns:
+            Tuple of (resolved path, stat result, entry directory name)
+        """
+        source = os.path.realpath(weftball)
+        stat = os.stat(source)
+        digest = hashlib.sha256(
+            f"{source}\0{stat.st_size}\0{stat.st_mtime_ns}".encode()
+        ).hexdigest()
+        return source, stat, digest[:32]
+
+    @staticmethod
+    def _read_entry(directory: Path) -> Optional[CacheEntry]:
+        """Read an entry's manifest, or return None if it is missing or invalid."""
+        try:
+            with open(directory / MANIFEST_NAME) as f:
+                manifest = json.load(f)
+            return CacheEntry(
+                directory=directory,
+                source=manifest["source"],
+                size=manifest["size"],
+                mtime_ns=manifest["mtime_ns"],
+                sha256=manifest["sha256"],
+                members=list(manifest["members"]),
+                created=manifest["created"],
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def lookup(self, weftball: Union[str, Path]) -> Optional[CacheEntry]:
+        """
+        Find the cache entry for a weftball, without decompressing anything.
+
+        Args:
+            weftball: Path to the weftball
+
+        Returns:
+            The entry, or None if the weftball is not cached or has changed
+
+        Raises:
+            FileNotFoundError: If the weftball does not exist
+        """
+        source, stat, name = self._key(weftball)
+        entry = self._read_entry(self.root / name)
+        if (
+            entry is None
+            or entry.source != source
+            or entry.size != stat.st_size
+            or entry.mtime_ns != stat.st_mtime_ns
+        ):
+            return None
+        return entry
+
+    def warm(self, weftball: Union[str, Path]) -> CacheEntry:
+        """
+        Make sure a weftball is in the cache, decompressing it if needed.
+
+        Args:
+            weftball: Path to the weftball (.tar.gz or .tar)
+
+        Returns:
+            The cache entry for the weftball
+
+        Raises:
+            FileNotFoundError: If the weftball does not exist
+            OSError: If the cache directory cannot be written
+            tarfile.TarError: If the weftball cannot be read
+        """
+        entry = self.lookup(weftball)
+        if entry is not None:
+            return entry
+
+        source, stat, name = self._key(weftball)
+        self.root.mkdir(parents=True, exist_ok=True)
+        temp_dir = Path(tempfile.mkdtemp(prefix=_TEMP_PREFIX, dir=self.root))
+        try:
+            digest = hashlib.sha256()
+            with open(source, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+
+            members = []
+            with tarfile.open(source, "r") as tar:
+                for member in tar.getmembers():
+                    # Only flat .weft files, never paths outside the entry
+                    if not member.isfile() or not member.name.endswith(".weft"):
+                        continue
+                    if os.path.basename(member.name) != member.name:
+                        continue
+                    file_obj = tar.extractfile(member)
+                    if file_obj is None:
+                        continue
+                    with file_obj, open(temp_dir / member.name, "wb") as out:
+                        shutil.copyfileobj(file_obj, out)
+                    members.append(member.name)
+
+            with open(temp_dir / MANIFEST_NAME, "w") as f:
+                json.dump(
+                    {
+                        "source": source,
+                        "size": stat.st_size,
+                        "mtime_ns": stat.st_mtime_ns,
+                        "sha256": digest.hexdigest(),
+                        "members": members,
+                        "created": time.time(),
+                    },
+                    f,
+                    indent=2,
+                )
+
+            try:
+                os.rename(temp_dir, self.root / name)
+            except OSError:
+                # Another process cached the same weftball first
+                shutil.rmtree(temp_dir, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            raise
+
+        entry = self._read_entry(self.root / name)
+        if entry is None:
+            raise OSError(f"Could not cache weftball {source} in {self.root}")
+        return entry
+
+    def entries(self) -> List[CacheEntry]:
+        """
+        List the entries in the cache.
+
+        Returns:
+            The valid entries, sorted by source path
+        """
+        if not self.root.is_dir():
+            return []
+        found = []
+        for directory in self.root.iterdir():
+            if directory.name.startswith(_TEMP_PREFIX) or not directory.is_dir():
+                continue
+            entry = self._read_entry(directory)
+            if entry is not None:
+                found.append(entry)
+        return sorted(found, key=lambda entry: entry.source)
+
+    def prune(self, everything: bool = False) -> List[Path]:
+        """
+        Remove entries whose weftballs have changed or disappeared.
+
+        Unreadable entries, and unfinished ones older than an hour, are
+        removed as well.
+
+        Args:
+            everything: Remove every entry, not just stale ones
+
+        Returns:
+            The removed directories
+        """
+        if not self.root.is_dir():
+            return []
+        removed = []
+        for directory in self.root.iterdir():
+            if not directory.is_dir():
+                continue
+            if directory.name.startswith(_TEMP_PREFIX):
+                # Another process may still be writing this entry
+                age = time.time() - directory.stat().st_mtime
+                if everything or age > _TEMP_MAX_AGE:
+                    shutil.rmtree(directory, ignore_errors=True)
+                    removed.append(directory)
+                continue
+            entry = self._read_entry(directory)
+            if everything or entry is None or entry.is_stale():
+                shutil.rmtree(directory, ignore_errors=True)
+                removed.append(directory)
+        return removed
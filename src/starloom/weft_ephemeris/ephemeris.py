@@ -2,18 +2,46 @@
 Weft-based ephemeris implementation.
 
 This module provides an implementation of the Ephemeris interface
-that reads position data from weftball archives (tar.gz or tar files).
+that reads position data from weftball archives (tar.gz or tar files, or
+indexed .weftpack containers).
 """
 
 import os
 import tarfile
+import threading
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, Union, List
-
-from starloom.ephemeris import Ephemeris, Quantity
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+import numpy.typing as npt
+
+from starloom.ephemeris import Ephemeris, PositionTable, Quantity
 from starloom.ephemeris.time_spec import TimeSpec
-from starloom.space_time.julian import datetime_to_julian, julian_to_datetime
-from starloom.weft.weft_reader import WeftReader
+from starloom.weft.weft_reader import DEFAULT_ITER_CHUNK_SIZE, WeftReader
+from starloom.weft.logging import get_logger
+
+from .cache import CacheEntry, WeftballCache
+from .weftpack import WEFTPACK_EXTENSION, Weftpack
+
+logger = get_logger(__name__)
+
+
+# Quantities stored in a weftball, with the suffix of their weft file names
+_WEFT_QUANTITIES = (
+    (Quantity.ECLIPTIC_LONGITUDE, "longitude"),
+    (Quantity.ECLIPTIC_LATITUDE, "latitude"),
+    (Quantity.DELTA, "distance"),
+)
 
 
 class WeftEphemeris(Ephemeris):
@@ -22,26 +50,48 @@ class WeftEphemeris(Ephemeris):
 
     This class reads weft files from a tar.gz or tar archive (weftball) without
     extracting them to disk, and provides ephemeris data from them.
+
+    An instance can be shared between threads. Each quantity's reader is
+    loaded exactly once, and once loaded it is read without locking.
     """
 
-    def __init__(self, data_dir: str = "./data", data: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        data_dir: str = "./data",
+        data: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> None:
         """
         Initialize a WeftEphemeris instance.
 
+        By default weftballs are decompressed once into a persistent cache
+        (see WeftballCache) and later instances memory-map the cached files.
+
         Args:
             data_dir: Path to the weftball file or directory containing weftball files
                      (maintained for backward compatibility)
             data: Path to the weftball file or directory containing weftball files
                   (newer parameter name that takes precedence when provided)
+            cache_dir: Directory of the decompressed weftball cache
+                       (defaults to ~/.cache/starloom/weft)
+            use_cache: Whether to use the cache, rather than decompressing
+                       weftballs into memory every time
         """
         # data parameter takes precedence if provided
         self.data_dir = data if data is not None else data_dir
+        self.cache = WeftballCache(cache_dir) if use_cache else None
         self.readers: Dict[str, Dict[str, WeftReader]] = {}
+        # One lock per weft file, so a file is loaded once while other files
+        # load in parallel; _locks_lock guards creating them
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
 
     def get_planet_position(
         self,
         planet: str,
         time_point: Optional[Union[float, datetime]] = None,
+        quantities: Optional[Iterable[Quantity]] = None,
     ) -> Dict[Quantity, Any]:
         """
         Get a planet's position at a specific time.
@@ -51,6 +101,8 @@ class WeftEphemeris(Ephemeris):
             time_point: The time for which to retrieve the position.
                      If None, the current time is used.
                      Can be a Julian date float or a datetime object.
+            quantities: The quantities to return (defaults to all of
+                     ECLIPTIC_LONGITUDE, ECLIPTIC_LATITUDE and DELTA)
 
         Returns:
             A dictionary mapping Quantity enum values to their corresponding values
@@ -62,7 +114,7 @@ class WeftEphemeris(Ephemeris):
         time_spec = TimeSpec.from_dates([time_point])
 
         # Use the get_planet_positions method to handle the single time point
-        positions = self.get_planet_positions(planet, time_spec)
+        positions = self.get_planet_positions(planet, time_spec, quantities)
 
         # Return the position for the single time point
         if positions:
@@ -74,67 +126,338 @@ class WeftEphemeris(Ephemeris):
         self,
         planet: str,
         time_spec: TimeSpec,
+        quantities: Optional[Iterable[Quantity]] = None,
     ) -> Dict[float, Dict[Quantity, Any]]:
         """
         Get a planet's positions for multiple times specified by a TimeSpec.
 
+        Each quantity's .weft file is loaded the first time it is asked for,
+        so a caller that only needs longitudes never decodes the others. Each
+        quantity is evaluated for all times in one vectorized pass (see
+        get_planet_position_arrays, which returns the same values as columns).
+
         Args:
             planet: The name or identifier of the planet
             time_spec: Time specification defining the times to retrieve positions for
+            quantities: The quantities to return (defaults to all of
+                     ECLIPTIC_LONGITUDE, ECLIPTIC_LATITUDE and DELTA)
 
         Returns:
             A dictionary mapping Julian dates to position data dictionaries
+
+        Raises:
+            ValueError: If a quantity is not stored in weftballs
         """
-        planet_lower = planet.lower()
-        # Ensure we have readers for this planet
-        self._ensure_planet_readers(planet_lower)
+        julian_dates, columns = self.get_planet_position_arrays(
+            planet, time_spec, quantities
+        )
+        return self._position_dicts(julian_dates, columns)
+
+    def get_planet_positions_table(
+        self,
+        planet: str,
+        time_spec: TimeSpec,
+        quantities: Optional[Iterable[Quantity]] = None,
+    ) -> PositionTable:
+        """
+        Get a planet's positions for a TimeSpec as a PositionTable.
+
+        The table wraps the arrays of get_planet_position_arrays directly, so
+        no per-date dictionaries are built.
 
-        # Generate all required Julian dates
+        Args:
+            planet: The name or identifier of the planet
+            time_spec: Time specification defining the times to retrieve positions for
+            quantities: The quantities to return (defaults to all of
+                     ECLIPTIC_LONGITUDE, ECLIPTIC_LATITUDE and DELTA)
+
+        Returns:
+            A table with a float64 column for each quantity
+
+        Raises:
+            ValueError: If a quantity is not stored in weftballs
+        """
+        julian_dates, columns = self.get_planet_position_arrays(
+            planet, time_spec, quantities
+        )
+        return PositionTable(julian_dates, columns)
+
+    def get_bodies_positions(
+        self,
+        planets: Sequence[str],
+        time_spec: TimeSpec,
+        quantities: Optional[Iterable[Quantity]] = None,
+    ) -> Dict[str, Dict[float, Dict[Quantity, Any]]]:
+        """
+        Get the positions of several planets for the same times.
+
+        The Julian dates are generated once and shared by every planet's
+        readers, each of which evaluates all the dates in one pass.
+
+        Args:
+            planets: The names or identifiers of the planets
+            time_spec: Time specification defining the times to retrieve positions for
+            quantities: The quantities to return (defaults to all of
+                     ECLIPTIC_LONGITUDE, ECLIPTIC_LATITUDE and DELTA)
+
+        Returns:
+            A dictionary mapping each planet, as given, to a dictionary mapping
+            Julian dates to position data dictionaries
+
+        Raises:
+            ValueError: If a quantity is not stored in weftballs
+        """
+        selected = self._select_quantities(quantities)
         julian_dates = self._get_julian_dates(time_spec)
+        return {
+            planet: self._position_dicts(
+                julian_dates, self._position_columns(planet, julian_dates, selected)
+            )
+            for planet in planets
+        }
+
+    def get_planet_position_arrays(
+        self,
+        planet: str,
+        time_spec: TimeSpec,
+        quantities: Optional[Iterable[Quantity]] = None,
+    ) -> Tuple[npt.NDArray[np.float64], Dict[Quantity, npt.NDArray[np.float64]]]:
+        """
+        Get a planet's positions for a TimeSpec as columns of a table.
+
+        The Julian dates are generated once as an array (see
+        TimeSpec.to_julian_array) and each quantity is evaluated with a single
+        WeftReader.get_values call, so large ranges avoid per-date Python work.
+        Values are identical to those of get_planet_positions.
+
+        Args:
+            planet: The name or identifier of the planet
+            time_spec: Time specification defining the times to retrieve positions for
+            quantities: The quantities to return (defaults to all of
+                     ECLIPTIC_LONGITUDE, ECLIPTIC_LATITUDE and DELTA)
+
+        Returns:
+            Tuple of (Julian dates, dictionary mapping each quantity to an array
+            of values aligned with the dates). Times not covered by a weft file
+            get the value 0.0.
+
+        Raises:
+            ValueError: If a quantity is not stored in weftballs
+        """
+        selected = self._select_quantities(quantities)
+        julian_dates = self._get_julian_dates(time_spec)
+        return julian_dates, self._position_columns(planet, julian_dates, selected)
+
+    def iter_position_tables(
+        self,
+        planet: str,
+        time_spec: TimeSpec,
+        quantities: Optional[Iterable[Quantity]] = None,
+        chunk_size: int = DEFAULT_ITER_CHUNK_SIZE,
+    ) -> Iterator[PositionTable]:
+        """
+        Iterate over a planet's positions for a TimeSpec, a table at a time.
+
+        The dates are generated chunk_size at a time (see
+        TimeSpec.iter_julian_arrays) and each quantity is evaluated for a
+        whole chunk at once, so scans over very long ranges run in constant
+        memory. Values are identical to those of get_planet_position_arrays.
+
+        Args:
+            planet: The name or identifier of the planet
+            time_spec: Time specification defining the times to retrieve positions for
+            quantities: The quantities to return (defaults to all of
+                     ECLIPTIC_LONGITUDE, ECLIPTIC_LATITUDE and DELTA)
+            chunk_size: Maximum number of dates per table
+
+        Yields:
+            Tables of at most chunk_size consecutive dates of the TimeSpec
+
+        Raises:
+            ValueError: If a quantity is not stored in weftballs, or
+                chunk_size is not positive
+        """
+        for julian_dates, columns in self._iter_position_columns(
+            planet, time_spec, quantities, chunk_size
+        ):
+            yield PositionTable(julian_dates, columns)
+
+    def iter_planet_positions(
+        self,
+        planet: str,
+        time_spec: TimeSpec,
+        quantities: Optional[Iterable[Quantity]] = None,
+        chunk_size: int = DEFAULT_ITER_CHUNK_SIZE,
+    ) -> Iterator[Tuple[float, Dict[Quantity, float]]]:
+        """
+        Iterate over a planet's positions for a TimeSpec, one date at a time.
+
+        Positions are evaluated in chunks, as for iter_position_tables, and
+        handed out one by one in the TimeSpec's order.
+
+        Args:
+            planet: The name or identifier of the planet
+            time_spec: Time specification defining the times to retrieve positions for
+            quantities: The quantities to return (defaults to all of
+                     ECLIPTIC_LONGITUDE, ECLIPTIC_LATITUDE and DELTA)
+            chunk_size: Number of dates to evaluate at a time
+
+        Yields:
+            (Julian date, position data dictionary) pairs, in order
+
+        Raises:
+            ValueError: If a quantity is not stored in weftballs, or
+                chunk_size is not positive
+        """
+        for julian_dates, columns in self._iter_position_columns(
+            planet, time_spec, quantities, chunk_size
+        ):
+            names = list(columns)
+            rows = zip(*(column.tolist() for column in columns.values()))
+            for jd, row in zip(julian_dates.tolist(), rows):
+                yield jd, dict(zip(names, row))
+
+    def _iter_position_columns(
+        self,
+        planet: str,
+        time_spec: TimeSpec,
+        quantities: Optional[Iterable[Quantity]],
+        chunk_size: int,
+    ) -> Iterator[
+        Tuple[npt.NDArray[np.float64], Dict[Quantity, npt.NDArray[np.float64]]]
+    ]:
+        """
+        Evaluate a planet's quantities for a TimeSpec, a chunk of dates at a time.
+
+        Args:
+            planet: The name or identifier of the planet
+            time_spec: Time specification defining the times to evaluate
+            quantities: The quantities to evaluate, or None for all of them
+            chunk_size: Maximum number of dates per chunk
+
+        Yields:
+            (Julian dates, columns) pairs, as returned by get_planet_position_arrays
 
-        result: Dict[float, Dict[Quantity, Any]] = {}
-
-        # For each date, get the position data
-        for jd in julian_dates:
-            # Convert to datetime for WeftReader
-            dt = julian_to_datetime(jd)
-
-            # Get each quantity from the corresponding reader
-            position_data: Dict[Quantity, Any] = {}
-
-            # Longitude
-            if f"{planet_lower}_longitude" in self.readers.get(planet_lower, {}):
-                reader = self.readers[planet_lower][f"{planet_lower}_longitude"]
-                try:
-                    longitude = reader.get_value(dt)
-                    position_data[Quantity.ECLIPTIC_LONGITUDE] = longitude
-                except Exception:
-                    position_data[Quantity.ECLIPTIC_LONGITUDE] = 0.0
-
-            # Latitude
-            if f"{planet_lower}_latitude" in self.readers.get(planet_lower, {}):
-                reader = self.readers[planet_lower][f"{planet_lower}_latitude"]
-                try:
-                    latitude = reader.get_value(dt)
-                    position_data[Quantity.ECLIPTIC_LATITUDE] = latitude
-                except Exception:
-                    position_data[Quantity.ECLIPTIC_LATITUDE] = 0.0
-
-            # Distance
-            if f"{planet_lower}_distance" in self.readers.get(planet_lower, {}):
-                reader = self.readers[planet_lower][f"{planet_lower}_distance"]
-                try:
-                    distance = reader.get_value(dt)
-                    position_data[Quantity.DELTA] = distance
-                except Exception:
-                    position_data[Quantity.DELTA] = 0.0
-
-            # Add the data to the result
-            result[jd] = position_data
+        Raises:
+            ValueError: If a quantity is not stored in weftballs, or
+                chunk_size is not positive
+        """
+        selected = self._select_quantities(quantities)
+        for julian_dates in time_spec.iter_julian_arrays(chunk_size):
+            yield julian_dates, self._position_columns(planet, julian_dates, selected)
+
+    def _position_columns(
+        self,
+        planet: str,
+        julian_dates: npt.NDArray[np.float64],
+        selected: List[Tuple[Quantity, str]],
+    ) -> Dict[Quantity, npt.NDArray[np.float64]]:
+        """
+        Evaluate a planet's quantities at an array of Julian dates.
+
+        Args:
+            planet: The name or identifier of the planet
+            julian_dates: The Julian dates
+            selected: The quantities, as returned by _select_quantities
+
+        Returns:
+            Dictionary mapping each quantity to an array of values aligned
+            with the dates; times not covered by a weft file get 0.0
+        """
+        planet_lower = planet.lower()
+        readers = [
+            (quantity, self._get_reader(planet_lower, suffix))
+            for quantity, suffix in selected
+        ]
+
+        columns: Dict[Quantity, npt.NDArray[np.float64]] = {}
+        for quantity, reader in readers:
+            try:
+                columns[quantity] = reader.get_values(julian_dates)
+            except ValueError:
+                # Some times are not covered: fill those with 0.0
+                values = []
+                for jd in julian_dates.tolist():
+                    try:
+                        values.append(reader.get_value_jd(jd))
+                    except Exception:
+                        values.append(0.0)
+                columns[quantity] = np.array(values, dtype=np.float64)
+
+        return columns
+
+    @staticmethod
+    def _position_dicts(
+        julian_dates: npt.NDArray[np.float64],
+        columns: Dict[Quantity, npt.NDArray[np.float64]],
+    ) -> Dict[float, Dict[Quantity, Any]]:
+        """
+        Convert evaluated columns into per-date position dictionaries.
+
+        Args:
+            julian_dates: The Julian dates
+            columns: Arrays of values aligned with the dates, by quantity
+
+        Returns:
+            A dictionary mapping Julian dates to position data dictionaries
+        """
+        dates = julian_dates.tolist()
+        if not columns:
+            return {jd: {} for jd in dates}
+        names = list(columns)
+        rows = zip(*(column.tolist() for column in columns.values()))
+        return {jd: dict(zip(names, row)) for jd, row in zip(dates, rows)}
+
+    def get_planet_rates(
+        self,
+        planet: str,
+        time_spec: TimeSpec,
+        quantities: Optional[Iterable[Quantity]] = None,
+    ) -> Dict[float, Dict[Quantity, float]]:
+        """
+        Get the rates of change of a planet's position for multiple times.
+
+        Rates are the analytic derivatives of the weft files' Chebyshev
+        polynomials (see WeftReader.get_rates), so each time needs a single
+        evaluation rather than finite differences.
+
+        Args:
+            planet: The name or identifier of the planet
+            time_spec: Time specification defining the times to retrieve rates for
+            quantities: The quantities whose rates to return (defaults to all)
+
+        Returns:
+            A dictionary mapping Julian dates to dictionaries of rates per day
+
+        Raises:
+            ValueError: If a quantity is not stored in weftballs
+        """
+        planet_lower = planet.lower()
+        selected = self._select_quantities(quantities)
+
+        julian_dates = self._get_julian_dates(time_spec).tolist()
+        result: Dict[float, Dict[Quantity, float]] = {jd: {} for jd in julian_dates}
+
+        for quantity, suffix in selected:
+            reader = self._get_reader(planet_lower, suffix)
+
+            try:
+                rates = reader.get_rates(np.array(julian_dates, dtype=float)).tolist()
+            except ValueError:
+                # Some times are not covered: fill those with 0.0, as for positions
+                rates = []
+                for jd in julian_dates:
+                    try:
+                        rates.append(reader.get_rate(jd))
+                    except Exception:
+                        rates.append(0.0)
+
+            for jd, rate in zip(julian_dates, rates):
+                result[jd][quantity] = rate
 
         return result
 
-    def _get_julian_dates(self, time_spec: TimeSpec) -> List[float]:
+    def _get_julian_dates(self, time_spec: TimeSpec) -> npt.NDArray[np.float64]:
         """
         Get Julian dates from a TimeSpec.
 
@@ -144,113 +467,166 @@ class WeftEphemeris(Ephemeris):
             time_spec: The TimeSpec to convert to Julian dates
 
         Returns:
-            List of Julian dates
+            Array of Julian dates
         """
-        # If it's a range-based TimeSpec
-        if (
-            time_spec.start_time is not None
-            and time_spec.stop_time is not None
-            and time_spec.step_size is not None
+        if time_spec.dates is None and (
+            time_spec.start_time is None
+            or time_spec.stop_time is None
+            or time_spec.step_size is None
         ):
-            return time_spec.to_julian_days()
+            # Shouldn't happen if TimeSpec is validated
+            raise ValueError(
+                "TimeSpec must contain either dates or start/stop/step values"
+            )
+        return time_spec.to_julian_array()
+
+    def _select_quantities(
+        self, quantities: Optional[Iterable[Quantity]]
+    ) -> List[Tuple[Quantity, str]]:
+        """
+        Select the weftball quantities to evaluate.
 
-        # If it's a date-based TimeSpec
-        elif time_spec.dates is not None:
-            # Convert any datetime objects to Julian dates
-            julian_dates: List[float] = []
-            for date in time_spec.dates:
-                if isinstance(date, datetime):
-                    julian_dates.append(datetime_to_julian(date))
-                else:
-                    julian_dates.append(date)
-            return julian_dates
+        Args:
+            quantities: The quantities asked for, or None for all of them
 
-        # If it's neither (shouldn't happen if TimeSpec is validated)
-        raise ValueError("TimeSpec must contain either dates or start/stop/step values")
+        Returns:
+            (quantity, file name suffix) pairs, in weftball order
 
-    def _ensure_planet_readers(self, planet: str) -> None:
+        Raises:
+            ValueError: If a quantity is not stored in weftballs
+        """
+        if quantities is None:
+            return list(_WEFT_QUANTITIES)
+        wanted = set(quantities)
+        unknown = wanted - {quantity for quantity, _ in _WEFT_QUANTITIES}
+        if unknown:
+            names = ", ".join(sorted(quantity.name for quantity in unknown))
+            raise ValueError(f"Quantities not available from weftballs: {names}")
+        return [(q, suffix) for q, suffix in _WEFT_QUANTITIES if q in wanted]
+
+    def _get_reader(self, planet: str, suffix: str) -> WeftReader:
         """
-        Ensure we have readers for all required quantities for the given planet.
+        Get the reader for one quantity of a planet, loading it on first use.
+
+        Only the requested .weft file is decoded; the planet's other
+        quantities stay unloaded until they are asked for. Threads asking for
+        a file that is being loaded wait for that load instead of repeating it.
 
         Args:
             planet: The planet name (lowercase)
+            suffix: The quantity's file name suffix, such as "longitude"
+
+        Returns:
+            The reader for the quantity
+
+        Raises:
+            FileNotFoundError: If there is no weftball for the planet
+            KeyError: If the weftball has no file for the quantity
+        """
+        key = f"{planet}_{suffix}"
+        reader = self.readers.get(planet, {}).get(key)
+        if reader is not None:
+            return reader
+
+        with self._locks_lock:
+            lock = self._load_locks.setdefault(key, threading.Lock())
+        with lock:
+            # Another thread may have loaded it while we waited
+            reader = self.readers.get(planet, {}).get(key)
+            if reader is None:
+                reader = self._load_reader(self._weftball_path(planet), f"{key}.weft")
+                # Publish only complete readers
+                self.readers.setdefault(planet, {})[key] = reader
+            return reader
+
+    def _weftball_path(self, planet: str) -> str:
         """
-        # If we already have readers for this planet, return
-        if planet in self.readers:
-            return
+        Find the weftball holding a planet's data.
+
+        Args:
+            planet: The planet name (lowercase)
 
-        # Initialize readers dictionary for this planet
-        self.readers[planet] = {}
+        Returns:
+            Path to the weftball
 
+        Raises:
+            FileNotFoundError: If no weftball exists
+        """
         # Check if data_dir is a directory or a specific file
         weftball_path = self.data_dir
-        if not (weftball_path.endswith(".tar.gz") or weftball_path.endswith(".tar")):
-            # Assume it's a directory containing a weftball for this planet
-            # First try .tar.gz
-            tar_gz_path = os.path.join(self.data_dir, f"{planet}_weftball.tar.gz")
-            tar_path = os.path.join(self.data_dir, f"{planet}_weftball.tar")
-
-            if os.path.exists(tar_gz_path):
-                weftball_path = tar_gz_path
-            elif os.path.exists(tar_path):
-                weftball_path = tar_path
+        if not weftball_path.endswith((".tar.gz", ".tar", WEFTPACK_EXTENSION)):
+            # Assume it's a directory containing a weftball for this planet,
+            # preferring the indexed container, then .tar.gz, then .tar
+            candidates = [
+                os.path.join(self.data_dir, f"{planet}_weftball{extension}")
+                for extension in (WEFTPACK_EXTENSION, ".tar.gz", ".tar")
+            ]
+            for candidate in candidates:
+                if os.path.exists(candidate):
+                    weftball_path = candidate
+                    break
             else:
                 raise FileNotFoundError(
-                    f"Weftball not found: neither {tar_gz_path} nor {tar_path} exists"
+                    f"Weftball not found: none of {', '.join(candidates)} exists"
                 )
 
         if not os.path.exists(weftball_path):
             raise FileNotFoundError(f"Weftball not found: {weftball_path}")
+        return weftball_path
+
+    def _load_reader(self, weftball_path: str, filename: str) -> WeftReader:
+        """
+        Load one .weft file from a weftball.
+
+        Args:
+            weftball_path: Path to the weftball
+            filename: Name of the .weft file within the weftball
+
+        Returns:
+            A reader for the file
 
-        # Open the tar file (auto-detect format)
+        Raises:
+            KeyError: If the weftball has no such file
+        """
+        if weftball_path.endswith(WEFTPACK_EXTENSION):
+            # Indexed weftballs are read in place: no cache is needed, and
+            # only the member asked for is touched
+            return Weftpack(weftball_path).open_reader(filename)
+
+        entry = self._cache_entry(weftball_path)
+        if entry is not None:
+            # Memory-map the decompressed file instead of reading the archive
+            if filename not in entry.members:
+                raise KeyError(f"filename {filename!r} not found")
+            return WeftReader(str(entry.member_path(filename)), use_mmap=True)
+
+        # Open the tar file (auto-detect format) and read just this member
         with tarfile.open(weftball_path, "r") as tar:
-            # Expected filenames within the archive
-            expected_files = [
-                f"{planet}_longitude.weft",
-                f"{planet}_latitude.weft",
-                f"{planet}_distance.weft",
-            ]
+            file_obj = tar.extractfile(tar.getmember(filename))
+            if file_obj is None:
+                raise KeyError(f"filename {filename!r} is not a regular file")
+
+            # Parse the member's data in place, without a temporary file
+            reader = WeftReader()
+            with file_obj as f:
+                reader.load_bytes(f.read())
+            return reader
+
+    def _cache_entry(self, weftball_path: str) -> Optional[CacheEntry]:
+        """
+        Get the cache entry for a weftball, caching it first if needed.
 
-            # For each expected file
-            for filename in expected_files:
-                try:
-                    # Extract the file member
-                    file_info = tar.getmember(filename)
-
-                    # Read the file into memory
-                    file_obj = tar.extractfile(file_info)
-                    if file_obj is None:
-                        continue
-
-                    # Read the data into a bytes object
-                    with file_obj as f:
-                        weft_data = f.read()
-
-                    # Create an in-memory file-like object
-                    # Create a reader for this weft file
-                    reader = WeftReader()
-
-                    # The WeftReader normally reads from a file,
-                    # but we need to parse the data from memory.
-                    # We'll modify the approach to use from_bytes:
-                    with open("temp_weft_file.weft", "wb") as temp_file:
-                        temp_file.write(weft_data)
-
-                    # Now load the temporary file
-                    reader.load_file("temp_weft_file.weft")
-                    os.remove("temp_weft_file.weft")
-
-                    # Store the reader
-                    quantity_name = filename[
-                        len(planet) + 1 : -5
-                    ]  # Extract "longitude", "latitude", etc.
-                    self.readers[planet][f"{planet}_{quantity_name}"] = reader
-
-                except Exception as e:
-                    # Just log the error and continue
-                    print(f"Error loading {filename}: {str(e)}")
-                    # print the full stack trace
-                    import traceback
-
-                    print(traceback.format_exc())
-                    raise e
+        Args:
+            weftball_path: Path to the weftball
+
+        Returns:
+            The cache entry, or None if caching is disabled or failed
+        """
+        if self.cache is None:
+            return None
+        try:
+            return self.cache.warm(weftball_path)
+        except (OSError, tarfile.TarError) as e:
+            # Fall back to reading the archive, e.g. if the cache is read-only
+            logger.warning(f"Not using weftball cache for {weftball_path}: {e}")
+            return None
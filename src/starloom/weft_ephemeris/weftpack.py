@@ -0,0 +1,369 @@
+"""
+Indexed weftball container (.weftpack).
+
+A .tar.gz weftball can only be decompressed from the start, so reading one
+member means inflating the members before it. A weftpack stores each .weft
+member on its own, either uncompressed or individually zlib-compressed, and
+lists them in a directory whose position is recorded in a fixed header. Any
+member can be read without touching the others, and uncompressed members are
+page-aligned so they can be memory-mapped in place.
+
+Layout (all integers big-endian):
+
+- Header, 32 bytes at offset 0: magic b"WEFTPACK", >H version, >H flags
+  (reserved, 0), >I member count, >Q directory offset, >Q directory size
+- Member data, each starting at a multiple of MEMBER_ALIGNMENT
+- Directory, one entry per member: >H name length, the UTF-8 name,
+  >B compression, >Q offset, >Q stored size, >Q size, >I CRC-32 of the
+  uncompressed data
+"""
+
+import os
+import struct
+import tarfile
+import tempfile
+import zlib
+from dataclasses import dataclass
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple
+
+from starloom.weft.weft_reader import WeftReader
+
+WEFTPACK_EXTENSION = ".weftpack"
+
+MAGIC = b"WEFTPACK"
+VERSION = 1
+
+# Members start on page boundaries so they can be memory-mapped directly
+MEMBER_ALIGNMENT = 4096
+
+# Compression methods of a member
+COMPRESSION_STORED = 0
+COMPRESSION_ZLIB = 1
+
+_HEADER = struct.Struct(">8sHHIQQ")
+_ENTRY = struct.Struct(">BQQQI")
+
+
+@dataclass(frozen=True)
+class WeftpackMember:
+    """
+    A directory entry of a weftpack.
+
+    Attributes:
+        name: The member name, such as "mars_longitude.weft"
+        compression: COMPRESSION_STORED or COMPRESSION_ZLIB
+        offset: Position of the member's data in the weftpack
+        stored_size: Size of the member's data as stored
+        size: Size of the member's uncompressed data
+        crc32: CRC-32 of the uncompressed data
+    """
+
+    name: str
+    compression: int
+    offset: int
+    stored_size: int
+    size: int
+    crc32: int
+
+
+def is_weftpack(path: str) -> bool:
+    """
+    Check whether a file is a weftpack, from its magic bytes.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        True if the file starts with the weftpack magic
+    """
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def _pad_to_alignment(f: BinaryIO) -> None:
+    """Write zero bytes until the position is a multiple of MEMBER_ALIGNMENT."""
+    f.write(b"\0" * (-f.tell() % MEMBER_ALIGNMENT))
+
+
+def write_weftpack(
+    path: str, members: Iterable[Tuple[str, bytes]], compress: bool = False
+) -> List[WeftpackMember]:
+    """
+    Write a weftpack.
+
+    The weftpack is written beside the destination and renamed into place, so
+    readers never see a partial file.
+
+    Args:
+        path: Path of the weftpack to write
+        members: (name, data) pairs, in the order to store them
+        compress: Whether to zlib-compress each member; compressed members are
+            smaller but must be decompressed into memory rather than mapped
+
+    Returns:
+        The directory entries written
+
+    Raises:
+        ValueError: If a member name is repeated or too long
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(
+        prefix=".tmp-", suffix=WEFTPACK_EXTENSION, dir=directory
+    )
+    compression = COMPRESSION_ZLIB if compress else COMPRESSION_STORED
+    try:
+        entries: List[WeftpackMember] = []
+        with os.fdopen(fd, "wb") as f:
+            # The header is rewritten once the directory's position is known
+            f.write(_HEADER.pack(MAGIC, VERSION, 0, 0, 0, 0))
+            for name, data in members:
+                if any(entry.name == name for entry in entries):
+                    raise ValueError(f"Duplicate weftpack member: {name}")
+                stored = zlib.compress(data, 9) if compress else data
+                _pad_to_alignment(f)
+                entries.append(
+                    WeftpackMember(
+                        name=name,
+                        compression=compression,
+                        offset=f.tell(),
+                        stored_size=len(stored),
+                        size=len(data),
+                        crc32=zlib.crc32(data),
+                    )
+                )
+                f.write(stored)
+
+            directory_offset = f.tell()
+            for entry in entries:
+                encoded = entry.name.encode("utf-8")
+                if len(encoded) > 0xFFFF:
+                    raise ValueError(f"Weftpack member name too long: {entry.name}")
+                f.write(struct.pack(">H", len(encoded)))
+                f.write(encoded)
+                f.write(
+                    _ENTRY.pack(
+                        entry.compression,
+                        entry.offset,
+                        entry.stored_size,
+                        entry.size,
+                        entry.crc32,
+                    )
+                )
+            directory_size = f.tell() - directory_offset
+
+            f.seek(0)
+            f.write(
+                _HEADER.pack(
+                    MAGIC,
+                    VERSION,
+                    0,
+                    len(entries),
+                    directory_offset,
+                    directory_size,
+                )
+            )
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return entries
+
+
+class Weftpack:
+    """
+    A weftpack opened for reading.
+
+    Opening reads only the header and the directory. Members are read or
+    memory-mapped individually on request.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a weftpack.
+
+        Args:
+            path: Path to the weftpack
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ValueError: If the file is not a valid weftpack
+        """
+        self.path = path
+        self.members: Dict[str, WeftpackMember] = {}
+
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size or header[: len(MAGIC)] != MAGIC:
+                raise ValueError(f"Not a weftpack: {path}")
+            _, version, _, count, directory_offset, directory_size = _HEADER.unpack(
+                header
+            )
+            if version != VERSION:
+                raise ValueError(f"Unsupported weftpack version {version}: {path}")
+            if directory_offset + directory_size > size:
+                raise ValueError(f"Truncated weftpack directory: {path}")
+
+            f.seek(directory_offset)
+            directory = f.read(directory_size)
+
+        position = 0
+        for _ in range(count):
+            if position + 2 > len(directory):
+                raise ValueError(f"Truncated weftpack directory: {path}")
+            (name_length,) = struct.unpack_from(">H", directory, position)
+            position += 2
+            name = directory[position : position + name_length].decode("utf-8")
+            position += name_length
+            if position + _ENTRY.size > len(directory):
+                raise ValueError(f"Truncated weftpack directory: {path}")
+            compression, offset, stored_size, member_size, crc32 = _ENTRY.unpack_from(
+                directory, position
+            )
+            position += _ENTRY.size
+            if compression not in (COMPRESSION_STORED, COMPRESSION_ZLIB):
+                raise ValueError(
+                    f"Unknown compression {compression} for weftpack member {name}"
+                )
+            if offset + stored_size > directory_offset:
+                raise ValueError(f"Weftpack member {name} overlaps the directory")
+            self.members[name] = WeftpackMember(
+                name=name,
+                compression=compression,
+                offset=offset,
+                stored_size=stored_size,
+                size=member_size,
+                crc32=crc32,
+            )
+
+    def names(self) -> List[str]:
+        """
+        Get the names of the members, in storage order.
+
+        Returns:
+            The member names
+        """
+        return [
+            member.name
+            for member in sorted(self.members.values(), key=lambda m: m.offset)
+        ]
+
+    def _member(self, name: str) -> WeftpackMember:
+        """Look up a member, raising KeyError like tarfile.getmember."""
+        try:
+            return self.members[name]
+        except KeyError:
+            raise KeyError(f"filename {name!r} not found") from None
+
+    def read(self, name: str) -> bytes:
+        """
+        Read a member into memory, decompressing it if needed.
+
+        Args:
+            name: The member name
+
+        Returns:
+            The member's uncompressed data
+
+        Raises:
+            KeyError: If there is no such member
+            ValueError: If the data does not match its size or checksum
+        """
+        member = self._member(name)
+        with open(self.path, "rb") as f:
+            f.seek(member.offset)
+            data = f.read(member.stored_size)
+        if member.compression == COMPRESSION_ZLIB:
+            data = zlib.decompress(data)
+        if len(data) != member.size or zlib.crc32(data) != member.crc32:
+            raise ValueError(f"Corrupt weftpack member {name} in {self.path}")
+        return data
+
+    def open_reader(self, name: str, use_mmap: bool = True) -> WeftReader:
+        """
+        Open a WeftReader on a member.
+
+        Uncompressed members are memory-mapped in place unless use_mmap is
+        False; compressed members are decompressed into memory.
+
+        Args:
+            name: The member name
+            use_mmap: Whether to memory-map uncompressed members
+
+        Returns:
+            A WeftReader for the member
+
+        Raises:
+            KeyError: If there is no such member
+            ValueError: If the member is not a valid .weft file
+        """
+        member = self._member(name)
+        reader = WeftReader()
+        if use_mmap and member.compression == COMPRESSION_STORED:
+            reader.load_file(
+                self.path, use_mmap=True, offset=member.offset, length=member.size
+            )
+        else:
+            reader.load_bytes(self.read(name))
+        return reader
+
+
+def weftpack_path_for(tarball: str) -> str:
+    """
+    Get the default weftpack path for a tarball weftball.
+
+    Args:
+        tarball: Path to a .tar.gz or .tar weftball
+
+    Returns:
+        The same path with a .weftpack extension
+    """
+    for extension in (".tar.gz", ".tar"):
+        if tarball.endswith(extension):
+            return tarball[: -len(extension)] + WEFTPACK_EXTENSION
+    return tarball + WEFTPACK_EXTENSION
+
+
+def convert_tarball(
+    tarball: str, output: Optional[str] = None, compress: bool = False
+) -> str:
+    """
+    Convert a .tar.gz or .tar weftball into a weftpack.
+
+    Only flat .weft members are copied, as when caching weftballs.
+
+    Args:
+        tarball: Path to the weftball
+        output: Path of the weftpack to write (defaults to the tarball's path
+            with a .weftpack extension)
+        compress: Whether to zlib-compress each member
+
+    Returns:
+        Path of the weftpack written
+
+    Raises:
+        tarfile.TarError: If the weftball cannot be read
+        ValueError: If the weftball has no .weft members
+    """
+    output_path = output or weftpack_path_for(tarball)
+    members: List[Tuple[str, bytes]] = []
+    with tarfile.open(tarball, "r") as tar:
+        for info in tar.getmembers():
+            if not info.isfile() or not info.name.endswith(".weft"):
+                continue
+            if os.path.basename(info.name) != info.name:
+                continue
+            file_obj = tar.extractfile(info)
+            if file_obj is None:
+                continue
+            with file_obj:
+                members.append((info.name, file_obj.read()))
+
+    if not members:
+        raise ValueError(f"No .weft files found in {tarball}")
+    write_weftpack(output_path, members, compress=compress)
+    return output_path
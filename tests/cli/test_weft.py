@@ -0,0 +1,96 @@
+"""Tests for the weft generate CLI command."""
+
+import unittest
+from unittest.mock import patch
+from click.testing import CliRunner
+
+from starloom.cli.weft import weft
+from starloom.horizons.quantities import EphemerisQuantity
+
+
+class TestWeftGenerateCommand(unittest.TestCase):
+    """Tests for generating several quantities with weft generate."""
+
+    @patch("starloom.cli.weft.generate_weft_files")
+    def test_several_quantities(self, mock_generate):
+        """Several quantities are generated by one generate_weft_files call."""
+        mock_generate.return_value = ["mars_longitude.weft", "mars_distance.weft"]
+
+        result = CliRunner().invoke(
+            weft,
+            [
+                "generate",
+                "mars",
+                "longitude",
+                "distance",
+                "--start",
+                "2025-01-01",
+                "--stop",
+                "2025-02-01",
+                "--output",
+                "mars_{quantity}",
+            ],
+        )
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        mock_generate.assert_called_once()
+        kwargs = mock_generate.call_args.kwargs
+        self.assertEqual(
+            kwargs["quantities"],
+            [EphemerisQuantity.ECLIPTIC_LONGITUDE, EphemerisQuantity.DISTANCE],
+        )
+        self.assertEqual(
+            kwargs["output_paths"], ["mars_longitude.weft", "mars_distance.weft"]
+        )
+
+    @patch("starloom.cli.weft.generate_weft_files")
+    def test_several_quantities_need_output_template(self, mock_generate):
+        """Several quantities need '{quantity}' in the output path."""
+        result = CliRunner().invoke(
+            weft,
+            [
+                "generate",
+                "mars",
+                "longitude",
+                "latitude",
+                "--start",
+                "2025-01-01",
+                "--stop",
+                "2025-02-01",
+                "--output",
+                "mars.weft",
+            ],
+        )
+
+        self.assertNotEqual(result.exit_code, 0)
+        self.assertIn("{quantity}", result.output)
+        mock_generate.assert_not_called()
+
+    @patch("starloom.cli.weft.generate_weft_file")
+    def test_stream_rejects_workers(self, mock_generate):
+        """Streaming fits in one process, so --workers must stay 1."""
+        result = CliRunner().invoke(
+            weft,
+            [
+                "generate",
+                "mars",
+                "longitude",
+                "--start",
+                "2025-01-01",
+                "--stop",
+                "2025-02-01",
+                "--output",
+                "mars_longitude.weft",
+                "--stream",
+                "--workers",
+                "4",
+            ],
+        )
+
+        self.assertNotEqual(result.exit_code, 0)
+        self.assertIn("--workers", result.output)
+        mock_generate.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+"""Tests for the PositionTable class."""
+
+import unittest
+
+import numpy as np
+
+from starloom.ephemeris.position_table import PositionTable
+from starloom.ephemeris.quantities import Quantity
+
+
+class TestPositionTable(unittest.TestCase):
+    """Test cases for the PositionTable class."""
+
+    def setUp(self):
+        """Set up a table with rows out of order."""
+        self.table = PositionTable(
+            [2460002.5, 2460000.5, 2460001.5],
+            {
+                Quantity.ECLIPTIC_LONGITUDE: [12.0, 10.0, 11.0],
+                Quantity.BODY: ["mars", "mars", "mars"],
+            },
+        )
+
+    def test_rows_sorted_by_julian_date(self):
+        """Test that rows are sorted with their columns."""
+        np.testing.assert_array_equal(
+            self.table.julian_dates, [2460000.5, 2460001.5, 2460002.5]
+        )
+        longitudes = self.table[Quantity.ECLIPTIC_LONGITUDE]
+        self.assertEqual(longitudes.dtype, np.float64)
+        self.assertEqual(longitudes.tolist(), [10.0, 11.0, 12.0])
+        self.assertEqual(self.table[Quantity.BODY].dtype, object)
+        self.assertEqual(len(self.table), 3)
+        self.assertIn(Quantity.BODY, self.table)
+        self.assertNotIn(Quantity.DELTA, self.table)
+
+    def test_arrays_are_read_only(self):
+        """Test that the table's arrays cannot be modified."""
+        with self.assertRaises(ValueError):
+            self.table.julian_dates[0] = 0.0
+        with self.assertRaises(ValueError):
+            self.table[Quantity.ECLIPTIC_LONGITUDE][0] = 0.0
+        with self.assertRaises(TypeError):
+            self.table.columns[Quantity.DELTA] = np.zeros(3)
+
+    def test_positions_view(self):
+        """Test the read-only mapping view in the get_planet_positions form."""
+        positions = self.table.positions
+        self.assertEqual(list(positions), [2460000.5, 2460001.5, 2460002.5])
+        self.assertEqual(len(positions), 3)
+        self.assertEqual(
+            positions[2460001.5],
+            {Quantity.ECLIPTIC_LONGITUDE: 11.0, Quantity.BODY: "mars"},
+        )
+        self.assertIsInstance(positions[2460001.5][Quantity.ECLIPTIC_LONGITUDE], float)
+        self.assertIsNone(positions.get(2460003.5))
+        self.assertNotIn("2460000.5", positions)
+        self.assertEqual(dict(positions), self.table.to_dict())
+
+    def test_from_positions_round_trip(self):
+        """Test building a table from position dictionaries."""
+        positions = {
+            2460001.5: {Quantity.DELTA: 1.5, Quantity.ECLIPTIC_LONGITUDE: "20.5"},
+            2460000.5: {Quantity.DELTA: 1.25},
+        }
+        table = PositionTable.from_positions(positions)
+
+        self.assertEqual(
+            table.quantities, [Quantity.DELTA, Quantity.ECLIPTIC_LONGITUDE]
+        )
+        self.assertEqual(table[Quantity.DELTA].tolist(), [1.25, 1.5])
+        # Numeric strings become floats and missing values NaN
+        longitudes = table[Quantity.ECLIPTIC_LONGITUDE]
+        self.assertTrue(np.isnan(longitudes[0]))
+        self.assertEqual(longitudes[1], 20.5)
+
+    def test_numeric_body_id_stays_a_string(self):
+        """Test that non-numeric quantities are object columns even if numeric."""
+        table = PositionTable(
+            [2460000.5, 2460001.5],
+            {Quantity.BODY: ["499", "499"], Quantity.DELTA: ["1.5", "1.25"]},
+        )
+        self.assertEqual(table[Quantity.BODY].dtype, object)
+        self.assertEqual(table[Quantity.BODY].tolist(), ["499", "499"])
+        self.assertEqual(table[Quantity.DELTA].dtype, np.float64)
+
+        array_table = PositionTable([2460000.5], {Quantity.BODY: np.array(["499"])})
+        self.assertEqual(array_table[Quantity.BODY].dtype, object)
+        self.assertEqual(array_table.positions[2460000.5], {Quantity.BODY: "499"})
+
+        positions = PositionTable.from_positions(
+            {2460000.5: {Quantity.BODY: "499", Quantity.ECLIPTIC_LONGITUDE: 10.0}}
+        )
+        self.assertEqual(positions[Quantity.BODY].tolist(), ["499"])
+
+    def test_from_rows_keeps_repeated_dates(self):
+        """Test that from_rows keeps rows with the same Julian date."""
+        table = PositionTable.from_rows(
+            [2460000.5, 2460000.5],
+            [{Quantity.DELTA: 1.0}, {Quantity.DELTA: 2.0}],
+        )
+        self.assertEqual(len(table), 2)
+        self.assertEqual(len(table.positions), 1)
+        self.assertEqual(table.positions[2460000.5], {Quantity.DELTA: 1.0})
+
+    def test_column_length_mismatch(self):
+        """Test that columns must have a value per Julian date."""
+        with self.assertRaises(ValueError):
+            PositionTable([2460000.5, 2460001.5], {Quantity.DELTA: [1.0]})
+
+    def test_empty_table(self):
+        """Test a table with no rows."""
+        table = PositionTable.from_positions({})
+        self.assertEqual(len(table), 0)
+        self.assertEqual(len(table.positions), 0)
+        self.assertEqual(table.to_dict(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,10 @@
 """Tests for the TimeSpec class."""
 
 import unittest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
 from starloom.ephemeris.time_spec import TimeSpec
 
 
@@ -171,3 +174,89 @@ class TestTimeSpec(unittest.TestCase):
         self.assertAlmostEqual(result[0], 2460754.0, delta=0.0001)  # 2025-03-19 12:00
         self.assertAlmostEqual(result[1], 2460754.5, delta=0.0001)  # 2025-03-20 00:00
         self.assertAlmostEqual(result[2], 2460755.0, delta=0.0001)  # 2025-03-20 12:00
+
+    def test_to_julian_array(self):
+        """Test that the Julian date array matches to_julian_days exactly."""
+        specs = [
+            TimeSpec.from_range(
+                datetime(2024, 1, 1, tzinfo=timezone.utc),
+                datetime(2024, 2, 1, tzinfo=timezone.utc),
+                "1m",
+            ),
+            TimeSpec.from_range(2460000.123456, 2460100.9, "1.5h"),
+            TimeSpec(
+                start_time=datetime(
+                    2025, 3, 19, 5, 0, tzinfo=timezone(timedelta(hours=-7))
+                ),
+                stop_time=2460800.0,
+                step_size="7d",
+            ),
+            TimeSpec.from_range(2460754.0, 2460754.0, "1d"),
+        ]
+        for time_spec in specs:
+            result = time_spec.to_julian_array()
+            self.assertIsInstance(result, np.ndarray)
+            np.testing.assert_array_equal(result, np.array(time_spec.to_julian_days()))
+
+        # Date lists are converted element by element
+        time_spec = TimeSpec.from_dates(
+            [datetime(2025, 3, 19, 12, 0, tzinfo=timezone.utc), 2460755.25]
+        )
+        np.testing.assert_array_equal(
+            time_spec.to_julian_array(), np.array([2460754.0, 2460755.25])
+        )
+
+        with self.assertRaises(ValueError):
+            TimeSpec().to_julian_array()
+
+    def test_iter_julian_arrays(self):
+        """Test that the chunks concatenate to to_julian_array."""
+        specs = [
+            TimeSpec.from_range(2460000.123456, 2460100.9, "1.5h"),
+            TimeSpec.from_dates(
+                [datetime(2025, 3, 19, 12, 0, tzinfo=timezone.utc), 2460755.25, 1.0]
+            ),
+        ]
+        for time_spec in specs:
+            chunks = list(time_spec.iter_julian_arrays(7))
+            self.assertTrue(all(0 < len(chunk) <= 7 for chunk in chunks))
+            np.testing.assert_array_equal(
+                np.concatenate(chunks), time_spec.to_julian_array()
+            )
+
+        with self.assertRaises(ValueError):
+            next(specs[0].iter_julian_arrays(0))
+
+    def test_split(self):
+        """Test that the parts of a split range concatenate to the range."""
+        time_spec = TimeSpec.from_range(
+            datetime(2024, 1, 30, 12, 0, tzinfo=timezone.utc),
+            datetime(2024, 4, 2, tzinfo=timezone.utc),
+            "7h",
+        )
+        boundaries = [
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+            datetime(2024, 2, 1, tzinfo=timezone.utc),
+            datetime(2024, 3, 1, tzinfo=timezone.utc),
+            datetime(2024, 3, 1, 3, 0, tzinfo=timezone.utc),
+            datetime(2024, 5, 1, tzinfo=timezone.utc),
+        ]
+        parts = time_spec.split(boundaries)
+
+        # Empty parts before the range, between close boundaries and after
+        # the range are dropped
+        self.assertEqual(len(parts), 3)
+        self.assertEqual(
+            parts[0].stop_time, datetime(2024, 1, 31, 23, 0, tzinfo=timezone.utc)
+        )
+        self.assertEqual(
+            parts[1].start_time, datetime(2024, 2, 1, 6, 0, tzinfo=timezone.utc)
+        )
+        np.testing.assert_array_equal(
+            np.concatenate([part.to_julian_array() for part in parts]),
+            time_spec.to_julian_array(),
+        )
+        self.assertEqual(len(time_spec.split([])), 1)
+
+        with self.assertRaises(ValueError):
+            TimeSpec.from_dates([2460754.0]).split(boundaries)
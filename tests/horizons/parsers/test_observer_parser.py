@@ -3,6 +3,9 @@
 import unittest
 from pathlib import Path
 
+import numpy as np
+
+from starloom.ephemeris.quantities import Quantity
 from starloom.horizons.parsers.observer_parser import ObserverParser
 from starloom.horizons.quantities import EphemerisQuantity
 
@@ -121,6 +124,20 @@ class TestObserverParser(unittest.TestCase):
         if EphemerisQuantity.DISTANCE in values:
             self.assertTrue(values[EphemerisQuantity.DISTANCE].startswith("1.025"))
 
+    def test_parse_table(self):
+        """Test parse_table method."""
+        parser = ObserverParser(self.mars_single_response)
+        table = parser.parse_table()
+        self.assertEqual(len(table), 1)
+
+        jd, values = parser.parse()[0]
+        self.assertEqual(table.julian_dates.tolist(), [jd])
+        self.assertIn(Quantity.DELTA, table)
+        self.assertEqual(table[Quantity.DELTA].dtype, np.float64)
+        self.assertEqual(
+            table[Quantity.DELTA][0], float(values[EphemerisQuantity.DISTANCE])
+        )
+
     def test_get_value(self):
         """Test get_value method."""
         parser = ObserverParser(self.mars_single_response)
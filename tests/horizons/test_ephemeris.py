@@ -519,3 +519,27 @@ class TestHorizonsEphemeris:
             ValueError, match="No data returned from Horizons for planet"
         ):
             ephemeris.get_planet_positions(Planet.MARS, time_spec)
+
+    def test_get_bodies_positions_requests_each_planet(self):
+        """Test that several planets are fetched with one request each."""
+        ephemeris = HorizonsEphemeris()
+        time_spec = TimeSpec.from_dates([2460754.5])
+        location = "@500"
+
+        def fake_positions(planet, spec, loc):
+            assert spec is time_spec
+            assert loc == location
+            return {2460754.5: {Quantity.BODY: planet}}
+
+        with patch.object(
+            ephemeris, "get_planet_positions", side_effect=fake_positions
+        ) as mock_positions:
+            result = ephemeris.get_bodies_positions(
+                ["mars", "venus", "mars"], time_spec, location
+            )
+
+        assert mock_positions.call_count == 2
+        assert result == {
+            "mars": {2460754.5: {Quantity.BODY: "mars"}},
+            "venus": {2460754.5: {Quantity.BODY: "venus"}},
+        }
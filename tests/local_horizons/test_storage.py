@@ -2,6 +2,7 @@
 Unit tests for the LocalHorizonsStorage class.
 """
 
+import math
 import unittest
 from datetime import datetime, timezone
 from pathlib import Path
@@ -9,6 +10,7 @@ import tempfile
 import sqlite3
 
 from starloom.ephemeris.quantities import Quantity
+from starloom.ephemeris.time_spec import TimeSpec
 from starloom.local_horizons.storage import LocalHorizonsStorage
 from starloom.space_time.julian import (
     julian_from_datetime,
@@ -345,6 +347,87 @@ class TestLocalHorizonsStorage(unittest.TestCase):
         self.assertIsNone(result.get(Quantity.RIGHT_ASCENSION))
         self.assertIsNone(result.get(Quantity.DECLINATION))
 
+    def test_bulk_retrieval_for_several_bodies(self):
+        """Test retrieving several bodies with a single bulk query."""
+        times = [
+            self.test_time,
+            datetime(2025, 3, 19, 21, 0, 0, tzinfo=timezone.utc),
+        ]
+        for i, time in enumerate(times):
+            self.storage.store_ephemeris_quantities(
+                self.test_planet,
+                time,
+                {Quantity.ECLIPTIC_LONGITUDE: 120.0 + i, Quantity.DELTA: 1.5},
+            )
+        self.storage.store_ephemeris_quantities(
+            "jupiter", times[1], {Quantity.ECLIPTIC_LONGITUDE: 150.5}
+        )
+
+        result = self.storage.get_ephemeris_data_bulk_bodies(
+            [self.test_planet, "jupiter", "saturn"], TimeSpec.from_dates(times)
+        )
+
+        self.assertEqual(list(result), [self.test_planet, "jupiter", "saturn"])
+        self.assertEqual(len(result[self.test_planet]), 2)
+        self.assertEqual(len(result["jupiter"]), 1)
+        self.assertEqual(result["saturn"], {})
+        (jupiter_position,) = result["jupiter"].values()
+        self.assertEqual(jupiter_position[Quantity.BODY], "jupiter")
+        self.assertEqual(jupiter_position[Quantity.ECLIPTIC_LONGITUDE], 150.5)
+
+        # Single-body bulk retrieval gives the same results
+        self.assertEqual(
+            self.storage.get_ephemeris_data_bulk(
+                self.test_planet, TimeSpec.from_dates(times)
+            ),
+            result[self.test_planet],
+        )
+
+    def test_table_retrieval(self):
+        """Test retrieving a body's data as a PositionTable."""
+        times = [
+            datetime(2025, 3, 19, 21, 0, 0, tzinfo=timezone.utc),
+            self.test_time,
+        ]
+        for i, time in enumerate(times):
+            self.storage.store_ephemeris_quantities(
+                self.test_planet,
+                time,
+                {Quantity.ECLIPTIC_LONGITUDE: 121.0 - i, Quantity.DELTA: 1.5},
+            )
+        time_spec = TimeSpec.from_dates(times)
+
+        table = self.storage.get_ephemeris_data_table(self.test_planet, time_spec)
+
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table[Quantity.ECLIPTIC_LONGITUDE].tolist(), [120.0, 121.0])
+        self.assertEqual(table[Quantity.BODY].tolist(), ["mars", "mars"])
+        # Quantities not stored are NaN
+        self.assertTrue(all(math.isnan(value) for value in table[Quantity.DECLINATION]))
+        self.assertEqual(
+            table.julian_dates.tolist(), table[Quantity.JULIAN_DATE].tolist()
+        )
+        self.assertEqual(
+            list(table.positions),
+            sorted(self.storage.get_ephemeris_data_bulk(self.test_planet, time_spec)),
+        )
+
+    def test_table_keeps_numeric_body_ids(self):
+        """Test that a numeric body ID comes back as the same string as bulk."""
+        self.storage.store_ephemeris_quantities(
+            "499", self.test_time, {Quantity.ECLIPTIC_LONGITUDE: 120.0}
+        )
+        time_spec = TimeSpec.from_dates([self.test_time])
+
+        table = self.storage.get_ephemeris_data_table("499", time_spec)
+        bulk = self.storage.get_ephemeris_data_bulk("499", time_spec)
+
+        self.assertEqual(table[Quantity.BODY].tolist(), ["499"])
+        self.assertEqual(
+            [position[Quantity.BODY] for position in table.positions.values()],
+            [position[Quantity.BODY] for position in bulk.values()],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,18 @@
 """Unit tests for Weft block utilities."""
 
 import unittest
+from datetime import date, timedelta
 
-from starloom.weft.blocks.utils import evaluate_chebyshev, unwrap_angles
+import numpy as np
+
+from starloom.weft.blocks.utils import (
+    date_from_julian,
+    evaluate_chebyshev,
+    julian_from_date,
+    julian_year_fraction,
+    unwrap_angle_array,
+    unwrap_angles,
+)
 
 
 class TestEvaluateChebyshev(unittest.TestCase):
@@ -117,3 +127,69 @@ class TestUnwrapAngles(unittest.TestCase):
         # 3. 23.0 -> 0.0 becomes 23.0 -> 24.0 (smallest jump)
         expected = [22.0, 23.0, 24.0, 25.0, 26.0, 23.0, 24.0, 25.0]
         self.assertEqual(result, expected)
+
+    def test_array_matches_list(self):
+        """Test that the array form unwraps like the list form."""
+        angles = [350.0, 10.0, 190.0, 10.0, 180.0, 0.0, 540.0, 359.0]
+        result = unwrap_angle_array(np.array(angles), min_val=0, max_val=360)
+        self.assertIsInstance(result, np.ndarray)
+        self.assertEqual(result.tolist(), unwrap_angles(angles, 0, 360))
+        self.assertEqual(
+            result.tolist(), [350.0, 370.0, 550.0, 370.0, 540.0, 360.0, 540.0, 719.0]
+        )
+
+
+class TestJulianDates(unittest.TestCase):
+    """Test conversions between calendar dates and Julian dates."""
+
+    def test_round_trip(self):
+        """Dates survive a round trip through their Julian date."""
+        for d in [
+            date(1, 1, 1),
+            date(1900, 2, 28),
+            date(2000, 1, 1),
+            date(2024, 2, 29),
+        ]:
+            self.assertEqual(date_from_julian(julian_from_date(d)), d)
+
+    def test_date_boundaries(self):
+        """A Julian date maps to the UTC day containing it."""
+        midnight = julian_from_date(date(2024, 3, 1))
+        self.assertEqual(date_from_julian(midnight), date(2024, 3, 1))
+        self.assertEqual(date_from_julian(midnight - 1e-6), date(2024, 2, 29))
+        self.assertEqual(date_from_julian(midnight + 0.999), date(2024, 3, 1))
+
+    def test_out_of_range(self):
+        """Julian dates outside the datetime.date range raise ValueError."""
+        with self.assertRaises(ValueError):
+            date_from_julian(0.0)
+        with self.assertRaises(ValueError):
+            date_from_julian(float("nan"))
+
+    def test_year_fraction(self):
+        """julian_year_fraction counts whole days elapsed in the year."""
+        for d in [
+            date(1, 1, 1),
+            date(1899, 12, 31),
+            date(1900, 3, 1),
+            date(2000, 12, 31),
+            date(2023, 12, 31),
+            date(2024, 2, 29),
+            date(2024, 12, 31),
+            date(2100, 12, 31),
+        ]:
+            days_in_year = (date(d.year + 1, 1, 1) - date(d.year, 1, 1)).days
+            expected = d.year + (d.timetuple().tm_yday - 1) / days_in_year
+            for fraction in (0.0, 0.25, 0.999):
+                self.assertEqual(
+                    julian_year_fraction(julian_from_date(d) + fraction), expected
+                )
+
+        # Consecutive days never go backwards across year boundaries
+        d = date(1999, 12, 25)
+        previous = julian_year_fraction(julian_from_date(d))
+        for _ in range(800):
+            d += timedelta(days=1)
+            current = julian_year_fraction(julian_from_date(d))
+            self.assertGreater(current, previous)
+            previous = current
@@ -0,0 +1,91 @@
+"""Tests for the decoded block cache."""
+
+import unittest
+
+from starloom.weft.block_cache import BlockCache
+
+
+class TestBlockCache(unittest.TestCase):
+    """Test BlockCache eviction and counters."""
+
+    def test_hits_and_misses(self):
+        """Lookups are counted as hits or misses."""
+        cache = BlockCache(max_entries=4)
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", 1, 8)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("a"), 1)
+
+        info = cache.info()
+        self.assertEqual(info["hits"], 2)
+        self.assertEqual(info["misses"], 1)
+        self.assertEqual(info["entries"], 1)
+        self.assertEqual(info["bytes"], 8)
+
+    def test_evicts_least_recently_used(self):
+        """The least recently used entry is evicted when the cache is full."""
+        cache = BlockCache(max_entries=2)
+        cache.put("a", 1, 8)
+        cache.put("b", 2, 8)
+        cache.get("a")
+        cache.put("c", 3, 8)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_byte_budget(self):
+        """Entries are evicted to stay within the byte budget."""
+        cache = BlockCache(max_entries=100, max_bytes=20)
+        cache.put("a", 1, 8)
+        cache.put("b", 2, 8)
+        cache.put("c", 3, 8)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.current_bytes, 16)
+        self.assertIsNone(cache.get("a"))
+
+        # Entries bigger than the whole budget are not cached
+        cache.put("big", 4, 21)
+        self.assertIsNone(cache.get("big"))
+        self.assertEqual(len(cache), 2)
+
+    def test_replacing_entry_updates_size(self):
+        """Putting an existing key replaces its value and size."""
+        cache = BlockCache(max_entries=4)
+        cache.put("a", 1, 8)
+        cache.put("a", 2, 16)
+        self.assertEqual(cache.get("a"), 2)
+        self.assertEqual(cache.current_bytes, 16)
+
+    def test_disabled(self):
+        """A cache with no entries never stores anything."""
+        cache = BlockCache(max_entries=0)
+        cache.put("a", 1, 8)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test_clear(self):
+        """Clearing removes entries and resets counters."""
+        cache = BlockCache()
+        cache.put("a", 1, 8)
+        cache.get("a")
+        cache.clear()
+        self.assertEqual(
+            cache.info(),
+            {
+                "hits": 0,
+                "misses": 0,
+                "entries": 0,
+                "bytes": 0,
+                "max_entries": cache.max_entries,
+                "max_bytes": None,
+            },
+        )
+
+    def test_invalid_limits(self):
+        """Negative limits are rejected."""
+        with self.assertRaises(ValueError):
+            BlockCache(max_entries=-1)
+        with self.assertRaises(ValueError):
+            BlockCache(max_bytes=-1)
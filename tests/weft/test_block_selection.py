@@ -4,14 +4,19 @@ import unittest
 from datetime import datetime, timedelta, timezone
 from typing import List
 
+import numpy as np
+
 from starloom.ephemeris.time_spec import TimeSpec
+from starloom.space_time.julian import julian_from_datetime
 from starloom.weft.block_selection import (
     calculate_sampling_rate,
     analyze_data_coverage,
+    analyze_julian_coverage,
     should_include_multi_year_block,
     should_include_monthly_block,
     should_include_fourty_eight_hour_block,
     get_recommended_blocks,
+    get_recommended_blocks_for_range,
     BlockCriteria,
 )
 
@@ -105,6 +110,19 @@ class TestAnalyzeDataCoverage(unittest.TestCase):
         self.assertEqual(coverage, 0.0)
         self.assertEqual(points_per_day, 0.0)
 
+    def test_julian_coverage_matches(self):
+        """Test that coverage of Julian dates matches coverage of datetimes."""
+        timestamps = [self.start + timedelta(hours=i) for i in range(-5, 19)]
+        julian_dates = np.array([julian_from_datetime(dt) for dt in timestamps])
+        for end in (self.end, self.start + timedelta(hours=10)):
+            self.assertEqual(
+                analyze_julian_coverage(self.start, end, julian_dates),
+                analyze_data_coverage(self.start, end, list(timestamps)),
+            )
+        self.assertEqual(
+            analyze_julian_coverage(self.start, self.end, np.array([])), (0.0, 0.0)
+        )
+
 
 class TestBlockInclusion(unittest.TestCase):
     """Test block inclusion decisions."""
@@ -246,6 +264,18 @@ class TestGetRecommendedBlocks(unittest.TestCase):
         # Should include multi_year blocks
         self.assertTrue(config["multi_year"]["enabled"])
 
+    def test_recommendation_for_range(self):
+        """Test that a range can be configured before its data is fetched."""
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        config = get_recommended_blocks_for_range(
+            TimeSpec.from_range(start, end, "6h"), start, end
+        )
+
+        self.assertTrue(config["multi_year"]["enabled"])
+        self.assertTrue(config["monthly"]["enabled"])
+        self.assertFalse(config["forty_eight_hour"]["enabled"])
+
 
 class TestBlockCriteria(unittest.TestCase):
     """Test BlockCriteria dataclass."""
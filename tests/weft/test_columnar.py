@@ -0,0 +1,163 @@
+"""Tests for columnar decoding and evaluation of Weft blocks."""
+
+import unittest
+from datetime import date, timedelta
+from io import BytesIO
+
+import numpy as np
+from numpy.polynomial import chebyshev
+
+from starloom.weft.blocks import (
+    FortyEightHourBlock,
+    FortyEightHourSectionHeader,
+    MonthlyBlock,
+    MultiYearBlock,
+)
+from starloom.weft.columnar import SectionArrays, TierArrays, chebval_rows
+
+
+class TestChebvalRows(unittest.TestCase):
+    """Test row-wise Chebyshev evaluation."""
+
+    def test_matches_chebval_exactly(self):
+        """Each point matches chebval with its own coefficient row."""
+        rng = np.random.default_rng(7)
+        for width in range(0, 8):
+            coefficients = rng.normal(size=(5, width))
+            rows = rng.integers(0, 5, size=200)
+            x = rng.uniform(-1, 1, size=200)
+
+            result = chebval_rows(x, coefficients, rows)
+            expected = [
+                chebyshev.chebval(xi, coefficients[row]) if width else 0.0
+                for xi, row in zip(x, rows)
+            ]
+            np.testing.assert_array_equal(result, expected)
+
+    def test_zero_padding_does_not_change_values(self):
+        """Trailing zero coefficients give the same values as the unpadded series."""
+        rng = np.random.default_rng(8)
+        x = rng.uniform(-1, 1, size=100)
+        for length in range(1, 6):
+            coeffs = rng.normal(size=length)
+            padded = np.zeros((1, 9))
+            padded[0, :length] = coeffs
+            np.testing.assert_array_equal(
+                chebval_rows(x, padded, np.zeros(100, dtype=np.intp)),
+                chebyshev.chebval(x, coeffs),
+            )
+
+
+class TestSectionArrays(unittest.TestCase):
+    """Test decoding 48-hour sections with np.frombuffer."""
+
+    def setUp(self):
+        start = date(2023, 6, 1)
+        self.header = FortyEightHourSectionHeader(
+            start_day=start,
+            end_day=start + timedelta(days=9),
+            block_size=198,
+            block_count=10,
+        )
+        rng = np.random.default_rng(9)
+        self.blocks = [
+            FortyEightHourBlock(
+                header=self.header,
+                coeffs=list(rng.normal(size=12)) + [0.0] * 3,
+                center_date=start + timedelta(days=i),
+            )
+            for i in range(10)
+        ]
+        self.data = b"".join(block.to_bytes() for block in self.blocks)
+
+    def test_matches_stream_decode(self):
+        """Decoded arrays hold the same values as FortyEightHourBlock.from_stream."""
+        arrays = SectionArrays.from_buffer(self.header, memoryview(self.data), 10)
+        stream = BytesIO(self.data)
+        for i in range(10):
+            stream.read(2)
+            block = FortyEightHourBlock.from_stream(stream, self.header)
+            self.assertEqual(arrays.centers[i], block.center_julian())
+            self.assertEqual(arrays.block(i).center_date, block.center_date)
+            self.assertEqual(arrays.block(i).coefficients, block.coefficients)
+            padded = block.coefficients + [0.0] * (
+                self.header.coefficient_count - len(block.coefficients)
+            )
+            self.assertEqual(arrays.coefficients[i].tolist(), padded)
+
+        self.assertEqual(arrays.coefficients.dtype, np.float64)
+        self.assertEqual(arrays.coefficients.shape, (10, self.header.coefficient_count))
+
+    def test_arrays_are_read_only(self):
+        """Decoded arrays cannot be modified, so they can be shared safely."""
+        arrays = SectionArrays.from_buffer(self.header, memoryview(self.data), 10)
+        for array in (
+            arrays.dates,
+            arrays.centers,
+            arrays.coefficients,
+            arrays.derivative_coefficients,
+        ):
+            self.assertFalse(array.flags.writeable)
+        with self.assertRaises(ValueError):
+            arrays.coefficients[0, 0] = 1.0
+
+    def test_invalid_marker(self):
+        """A corrupt marker raises ValueError."""
+        data = bytearray(self.data)
+        data[198 * 3] = 0xFF
+        with self.assertRaises(ValueError) as cm:
+            SectionArrays.from_buffer(self.header, memoryview(bytes(data)), 10)
+        self.assertIn("index 3", str(cm.exception))
+
+    def test_invalid_date(self):
+        """An impossible center date raises ValueError."""
+        data = bytearray(self.data)
+        data[198 * 2 + 5] = 31  # June 31st
+        with self.assertRaises(ValueError):
+            SectionArrays.from_buffer(self.header, memoryview(bytes(data)), 10)
+
+    def test_truncated_data(self):
+        """Truncated data raises ValueError."""
+        with self.assertRaises(ValueError):
+            SectionArrays.from_buffer(self.header, memoryview(self.data[:-1]), 10)
+
+
+class TestTierArrays(unittest.TestCase):
+    """Test the columnar form of monthly and multi-year tiers."""
+
+    def test_disjoint_monthly_tier(self):
+        """Each date maps to the monthly block for its month."""
+        blocks = [
+            MonthlyBlock(year=2023, month=month, day_count=28, coeffs=[float(month)])
+            for month in (3, 1, 2)
+        ]
+        tier = TierArrays.from_blocks(blocks)
+        self.assertTrue(tier.disjoint)
+
+        jan, feb, mar = (block.julian_span()[0] for block in blocks[1:] + blocks[:1])
+        jd = np.array([jan, feb - 0.5, mar + 10, jan - 1, mar + 31])
+        np.testing.assert_array_equal(tier.find_rows(jd), [1, 1, 0, -1, -1])
+
+    def test_overlapping_tier_prefers_file_order(self):
+        """With overlapping spans, the first block in file order wins."""
+        decade = MultiYearBlock(start_year=2020, duration=10, coeffs=[1.0])
+        year = MultiYearBlock(start_year=2023, duration=1, coeffs=[2.0, 0.5])
+        tier = TierArrays.from_blocks([decade, year])
+        self.assertFalse(tier.disjoint)
+
+        start, end = year.julian_span()
+        jd = np.array([start - 1, start, end - 1, end + 1])
+        np.testing.assert_array_equal(tier.find_rows(jd), [0, 0, 0, 0])
+
+        tier = TierArrays.from_blocks([year, decade])
+        np.testing.assert_array_equal(tier.find_rows(jd), [1, 0, 0, 1])
+
+        # Coefficients are zero-padded to the widest block
+        np.testing.assert_array_equal(tier.coefficients, [[2.0, 0.5], [1.0, 0.0]])
+        self.assertFalse(tier.coefficients.flags.writeable)
+        self.assertFalse(tier.derivative_coefficients.flags.writeable)
+
+    def test_empty_tier(self):
+        """A tier without blocks covers nothing."""
+        tier = TierArrays.from_blocks([])
+        np.testing.assert_array_equal(tier.find_rows(np.array([2460000.5])), [-1])
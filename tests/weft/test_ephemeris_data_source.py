@@ -4,9 +4,12 @@ import unittest
 from datetime import datetime, timedelta, timezone
 from typing import Dict
 
+import numpy as np
+
 from starloom.ephemeris.time_spec import TimeSpec
-from starloom.ephemeris import Quantity
+from starloom.ephemeris import Ephemeris, PositionTable, Quantity
 from starloom.horizons.quantities import EphemerisQuantity, EphemerisQuantityToQuantity
+from starloom.space_time.julian import julian_from_datetime
 from starloom.weft.ephemeris_data_source import EphemerisDataSource
 
 
@@ -28,6 +31,24 @@ class MockEphemeris:
         }
 
 
+class JulianMockEphemeris(Ephemeris):
+    """The same mock data as an Ephemeris, keyed by Julian date."""
+
+    def __init__(self, data: Dict[datetime, Dict[Quantity, float]]):
+        self.mock = MockEphemeris(data)
+
+    def get_planet_position(self, planet, time=None):
+        raise NotImplementedError
+
+    def get_planet_positions(self, planet_id, time_spec):
+        return {
+            julian_from_datetime(dt): values
+            for dt, values in self.mock.get_planet_positions(
+                planet_id, time_spec
+            ).items()
+        }
+
+
 class TestEphemerisDataSource(unittest.TestCase):
     """Test EphemerisDataSource functionality."""
 
@@ -97,6 +118,99 @@ class TestEphemerisDataSource(unittest.TestCase):
         end_value = data_source.get_value_at(self.end)
         self.assertEqual(end_value, 0.0)  # 360 degrees = 0 degrees
 
+    def test_arrays(self):
+        """Test that samples are stored as Julian date and value arrays."""
+        data_source = EphemerisDataSource(
+            ephemeris=self.mock_ephemeris,
+            planet_id="499",
+            quantity=self.quantity,
+            start_date=self.start,
+            end_date=self.end,
+            step_hours=1,
+        )
+
+        self.assertEqual(data_source.julian_dates.dtype, np.float64)
+        self.assertEqual(data_source.julian_dates[0], 2460676.5)
+        self.assertEqual(data_source.values.tolist()[:3], [0.0, 15.0, 30.0])
+        self.assertIs(data_source.columns[self.standard_quantity], data_source.values)
+
+        # Bounds are inclusive, and samples are views of the stored arrays
+        julian_dates, values = data_source.get_samples(
+            self.start + timedelta(hours=6), self.start + timedelta(hours=12)
+        )
+        self.assertEqual(
+            values.tolist(), [90.0, 105.0, 120.0, 135.0, 150.0, 165.0, 180.0]
+        )
+        self.assertTrue(np.shares_memory(values, data_source.values))
+        self.assertEqual(
+            data_source.index_range(
+                self.end + timedelta(hours=1), self.end + timedelta(hours=2)
+            ),
+            (25, 25),
+        )
+        with self.assertRaises(KeyError):
+            data_source.get_value_at(self.start + timedelta(minutes=30))
+
+    def test_duck_typed_source_matches_ephemeris(self):
+        """Test that a datetime-keyed source reads the same as an Ephemeris."""
+        duck_typed, ephemeris = (
+            EphemerisDataSource(
+                ephemeris=source,
+                planet_id="499",
+                quantity=self.quantity,
+                start_date=self.start,
+                end_date=self.end,
+                step_hours=1,
+            )
+            for source in (self.mock_ephemeris, JulianMockEphemeris(self.test_data))
+        )
+        np.testing.assert_array_equal(duck_typed.julian_dates, ephemeris.julian_dates)
+        np.testing.assert_array_equal(duck_typed.values, ephemeris.values)
+
+    def test_prefetched_table(self):
+        """Test that a given table is used instead of querying the ephemeris."""
+        table = PositionTable(
+            [2460676.5, 2460676.75], {self.standard_quantity: [10.0, 20.0]}
+        )
+        data_source = EphemerisDataSource(
+            ephemeris=None,
+            planet_id="499",
+            quantity=self.quantity,
+            start_date=self.start,
+            end_date=self.end,
+            step_hours=6,
+            table=table,
+        )
+        self.assertEqual(data_source.values.tolist(), [10.0, 20.0])
+        self.assertEqual(
+            data_source.get_value_at(self.start + timedelta(hours=6)), 20.0
+        )
+
+    def test_with_quantity(self):
+        """Test that another quantity is read from the same fetched table."""
+        table = PositionTable(
+            [2460676.5, 2460676.75],
+            {
+                self.standard_quantity: [10.0, 20.0],
+                Quantity.ECLIPTIC_LATITUDE: [1.0, 2.0],
+            },
+        )
+        data_source = EphemerisDataSource(
+            ephemeris=None,
+            planet_id="499",
+            quantity=self.quantity,
+            start_date=self.start,
+            end_date=self.end,
+            step_hours=6,
+            table=table,
+        )
+        latitude = data_source.with_quantity(EphemerisQuantity.ECLIPTIC_LATITUDE)
+        self.assertEqual(latitude.values.tolist(), [1.0, 2.0])
+        self.assertIs(latitude.julian_dates, data_source.julian_dates)
+        self.assertEqual(latitude.step_hours_str, "6h")
+        with self.assertRaises(ValueError):
+            data_source.with_quantity(EphemerisQuantity.DISTANCE)
+
     def test_get_values_in_range(self):
         """Test getting values for a time range."""
         data_source = EphemerisDataSource(
@@ -1,12 +1,39 @@
 """Tests for ephemeris weft generator detection logic."""
 
+import math
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
-from starloom.weft.ephemeris_weft_generator import generate_weft_file
+from starloom.weft.ephemeris_weft_generator import (
+    generate_weft_file,
+    generate_weft_files,
+)
 from starloom.planet import Planet
 from starloom.ephemeris.quantities import Quantity
+from starloom.horizons.quantities import EphemerisQuantity
+from starloom.space_time.julian import julian_from_datetime
+
+
+class CountingEphemeris:
+    """An ephemeris of smooth positions that counts its queries."""
+
+    def __init__(self):
+        self.queries = 0
+
+    def get_planet_positions(self, planet_id, time_spec):
+        self.queries += 1
+        positions = {}
+        for dt in time_spec.get_time_points():
+            days = julian_from_datetime(dt) - 2460310.5
+            positions[dt] = {
+                Quantity.ECLIPTIC_LONGITUDE: (0.5 * days) % 360,
+                Quantity.ECLIPTIC_LATITUDE: 1.5 * math.sin(days / 20),
+                Quantity.DELTA: 1.2 + 0.3 * math.cos(days / 40),
+            }
+        return positions
 
 
 class TestEphemerisWeftGeneratorDetection(unittest.TestCase):
@@ -87,5 +114,97 @@ class TestEphemerisWeftGeneratorDetection(unittest.TestCase):
         mock_horizons_ephemeris.assert_called_once()
 
 
+class TestGenerateWeftFiles(unittest.TestCase):
+    """Test generating several quantities from one ephemeris query."""
+
+    def setUp(self):
+        self.start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self.end = self.start + timedelta(days=70)
+        self.quantities = [
+            EphemerisQuantity.ECLIPTIC_LONGITUDE,
+            EphemerisQuantity.ECLIPTIC_LATITUDE,
+            EphemerisQuantity.DISTANCE,
+        ]
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
+
+    def read_blocks(self, path):
+        """Read a file's bytes after its preamble, which has a timestamp."""
+        with open(path, "rb") as f:
+            return f.read().split(b"\n\n", 1)[1]
+
+    def test_single_query_matches_separate_files(self):
+        """Each file matches generate_weft_file's, from a single query."""
+        ephemeris = CountingEphemeris()
+        paths = [
+            os.path.join(self.temp_dir, f"{quantity.name}.weft")
+            for quantity in self.quantities
+        ]
+        result = generate_weft_files(
+            planet=Planet.MARS,
+            quantities=self.quantities,
+            start_date=self.start,
+            end_date=self.end,
+            output_paths=paths,
+            ephemeris=ephemeris,
+            step_hours="6h",
+        )
+        self.assertEqual(result, paths)
+        self.assertEqual(ephemeris.queries, 1)
+
+        for quantity, path in zip(self.quantities, paths):
+            single_path = os.path.join(self.temp_dir, "single.weft")
+            generate_weft_file(
+                planet=Planet.MARS,
+                quantity=quantity,
+                start_date=self.start,
+                end_date=self.end,
+                output_path=single_path,
+                ephemeris=CountingEphemeris(),
+                step_hours="6h",
+            )
+            self.assertEqual(self.read_blocks(path), self.read_blocks(single_path))
+
+    def test_mismatched_output_paths(self):
+        """A different number of output paths and quantities is rejected."""
+        with self.assertRaises(ValueError):
+            generate_weft_files(
+                planet=Planet.MARS,
+                quantities=self.quantities,
+                start_date=self.start,
+                end_date=self.end,
+                output_paths=["a.weft"],
+                ephemeris=CountingEphemeris(),
+            )
+
+    def test_stream_with_workers(self):
+        """Streamed files are fitted in one process, so workers is rejected."""
+        ephemeris = CountingEphemeris()
+        with self.assertRaises(ValueError):
+            generate_weft_file(
+                planet=Planet.MARS,
+                quantity=Quantity.ECLIPTIC_LONGITUDE,
+                start_date=self.start,
+                end_date=self.end,
+                output_path=os.path.join(self.temp_dir, "stream.weft"),
+                ephemeris=ephemeris,
+                stream=True,
+                workers=2,
+            )
+        self.assertEqual(ephemeris.queries, 0)
+
+    def test_mixed_ephemeris_sources(self):
+        """Observer and orbital element quantities cannot share a query."""
+        with self.assertRaises(ValueError):
+            generate_weft_files(
+                planet=Planet.MARS,
+                quantities=[Quantity.ECLIPTIC_LONGITUDE, Quantity.ECCENTRICITY],
+                start_date=self.start,
+                end_date=self.end,
+                output_paths=["a.weft", "b.weft"],
+            )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,54 @@
+"""Tests for fitting Chebyshev series from chunks of samples."""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+from numpy.polynomial import chebyshev
+
+from starloom.weft import incremental_fit
+from starloom.weft.incremental_fit import IncrementalChebyshevFit
+
+
+class TestIncrementalChebyshevFit(unittest.TestCase):
+    """Test IncrementalChebyshevFit against chebfit."""
+
+    def setUp(self):
+        """Create noisy samples of a smooth function."""
+        rng = np.random.default_rng(23)
+        self.x = np.linspace(-1.0, 1.0, 5001)
+        self.values = (
+            np.sin(7 * self.x)
+            + 0.3 * np.cos(40 * self.x)
+            + rng.normal(scale=1e-3, size=self.x.size)
+        )
+
+    def test_matches_chebfit(self):
+        """Chunked fits match one chebfit call on all the samples."""
+        for degree in (3, 63, 255):
+            fit = IncrementalChebyshevFit(degree)
+            for first in range(0, self.x.size, 700):
+                fit.add(self.x[first : first + 700], self.values[first : first + 700])
+
+            self.assertEqual(fit.count, self.x.size)
+            expected = chebyshev.chebfit(self.x, self.values, degree)
+            np.testing.assert_allclose(fit.coefficients(), expected, atol=1e-12)
+
+    def test_large_chunks_are_factored_in_pieces(self):
+        """A chunk larger than MAX_FACTOR_ROWS gives the same fit."""
+        fit = IncrementalChebyshevFit(31)
+        with mock.patch.object(incremental_fit, "MAX_FACTOR_ROWS", 64):
+            fit.add(self.x, self.values)
+        expected = chebyshev.chebfit(self.x, self.values, 31)
+        np.testing.assert_allclose(fit.coefficients(), expected, atol=1e-12)
+
+    def test_no_samples(self):
+        """Solving before any samples are added raises ValueError."""
+        fit = IncrementalChebyshevFit(5)
+        fit.add([], [])
+        with self.assertRaises(ValueError):
+            fit.coefficients()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""Tests for process-pool evaluation of .weft files."""
+
+import os
+import tempfile
+import unittest
+from datetime import date, timedelta
+from unittest import mock
+
+import numpy as np
+
+from starloom.weft import parallel
+from starloom.weft.blocks import (
+    FortyEightHourBlock,
+    FortyEightHourSectionHeader,
+    MonthlyBlock,
+    MultiYearBlock,
+)
+from starloom.weft.blocks.utils import julian_from_date
+from starloom.weft.parallel import parallel_get_values
+from starloom.weft.weft_file import WeftFile
+from starloom.weft.weft_reader import WeftReader
+
+
+class TestParallelGetValues(unittest.TestCase):
+    """Test parallel_get_values against WeftReader."""
+
+    def setUp(self):
+        """Write a file with multi-year, monthly and 48-hour blocks."""
+        rng = np.random.default_rng(19)
+        start = date(2023, 6, 1)
+        header = FortyEightHourSectionHeader(
+            start_day=start,
+            end_day=start + timedelta(days=9),
+            block_size=198,
+            block_count=10,
+        )
+        blocks = [
+            MultiYearBlock(start_year=2020, duration=10, coeffs=[180.0, 90.0, 5.0]),
+            MonthlyBlock(year=2023, month=5, day_count=31, coeffs=[170.0, 3.0]),
+            header,
+        ]
+        for i in range(10):
+            coeffs = [150.0 + i] + list(rng.normal(size=5))
+            blocks.append(
+                FortyEightHourBlock(
+                    header=header,
+                    coeffs=coeffs + [0.0] * (header.coefficient_count - len(coeffs)),
+                    center_date=start + timedelta(days=i),
+                )
+            )
+        weft_file = WeftFile(
+            "#weft! v0.02 mars jpl:horizons 2020-2030 32bit ECLIPTIC_LONGITUDE "
+            "wrapping[0,360] chebychevs generated@test\n\n",
+            blocks,
+        )
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "mars_longitude.weft")
+        with open(self.path, "wb") as f:
+            f.write(weft_file.to_bytes())
+
+        first = julian_from_date(date(2023, 5, 1))
+        self.times = first + np.linspace(0.0, 60.0, 3001)
+
+        self.reader = WeftReader(self.path)
+
+    def tearDown(self):
+        """Clean up the temporary file."""
+        self.reader.close()
+        for name in os.listdir(self.temp_dir):
+            os.remove(os.path.join(self.temp_dir, name))
+        os.rmdir(self.temp_dir)
+
+    def test_matches_reader(self):
+        """Sharded results are identical to a single get_values call."""
+        with mock.patch.object(parallel, "MIN_PARALLEL_POINTS", 0):
+            values = parallel_get_values(
+                self.path, self.times, processes=2, chunk_size=700
+            )
+        np.testing.assert_array_equal(values, self.reader.get_values(self.times))
+
+    def test_rates_and_shape(self):
+        """Rates are evaluated too, and the shape of times is kept."""
+        times = self.times[:3000].reshape(30, 100)
+        with mock.patch.object(parallel, "MIN_PARALLEL_POINTS", 0):
+            rates = parallel_get_values(
+                self.path, times, processes=2, chunk_size=1000, rates=True
+            )
+        self.assertEqual(rates.shape, (30, 100))
+        np.testing.assert_array_equal(rates, self.reader.get_rates(times))
+
+    def test_small_batches_run_in_process(self):
+        """Small batches are evaluated without starting a pool."""
+        with mock.patch.object(parallel, "ProcessPoolExecutor") as executor:
+            values = parallel_get_values(self.path, self.times, processes=4)
+        executor.assert_not_called()
+        np.testing.assert_array_equal(values, self.reader.get_values(self.times))
+
+    def test_uncovered_times(self):
+        """A time outside every block raises ValueError from the worker."""
+        times = np.append(self.times, julian_from_date(date(2040, 1, 1)))
+        with mock.patch.object(parallel, "MIN_PARALLEL_POINTS", 0):
+            with self.assertRaises(ValueError):
+                parallel_get_values(self.path, times, processes=2, chunk_size=1000)
+
+    def test_invalid_arguments(self):
+        """Non-positive chunk sizes and process counts are rejected."""
+        with self.assertRaises(ValueError):
+            parallel_get_values(self.path, self.times, chunk_size=0)
+        with self.assertRaises(ValueError):
+            parallel_get_values(self.path, self.times, processes=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
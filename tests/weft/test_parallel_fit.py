@@ -0,0 +1,113 @@
+"""Tests for fitting .weft blocks across a pool of processes."""
+
+import unittest
+from datetime import datetime, timezone
+from multiprocessing import shared_memory
+from unittest import mock
+
+import numpy as np
+
+from starloom.ephemeris import PositionTable, Quantity
+from starloom.horizons.quantities import EphemerisQuantity
+from starloom.weft import parallel_fit, weft_writer
+from starloom.weft.ephemeris_data_source import EphemerisDataSource
+from starloom.weft.parallel_fit import FitPool
+from starloom.weft.weft_writer import WeftWriter
+
+
+class TestParallelFit(unittest.TestCase):
+    """Test that fitting in worker processes gives identical blocks."""
+
+    def setUp(self):
+        """Create two years of hourly samples of a wrapping longitude."""
+        self.start = datetime(2024, 11, 20, tzinfo=timezone.utc)
+        self.end = datetime(2026, 1, 10, tzinfo=timezone.utc)
+        julian_dates = 2460634.5 + np.arange(0, 416 * 24 + 1) / 24
+        days = julian_dates - julian_dates[0]
+        table = PositionTable(
+            julian_dates,
+            {Quantity.ECLIPTIC_LONGITUDE: (13.2 * days + 5 * np.sin(days / 3)) % 360},
+        )
+        self.data_source = EphemerisDataSource(
+            ephemeris=None,
+            planet_id="301",
+            quantity=EphemerisQuantity.ECLIPTIC_LONGITUDE,
+            start_date=self.start,
+            end_date=self.end,
+            step_hours="1h",
+            table=table,
+        )
+        self.config = {
+            "multi_year": {"enabled": True, "polynomial_degree": 63},
+            "monthly": {"enabled": True, "polynomial_degree": 31},
+            "forty_eight_hour": {"enabled": True, "polynomial_degree": 23},
+        }
+
+    def create_blocks(self, workers):
+        """Create the file's blocks and return them as bytes."""
+        writer = WeftWriter(EphemerisQuantity.ECLIPTIC_LONGITUDE)
+        weft_file = writer.create_multi_precision_file(
+            data_source=self.data_source,
+            quantity=EphemerisQuantity.ECLIPTIC_LONGITUDE,
+            start_date=self.start,
+            end_date=self.end,
+            config=self.config,
+            workers=workers,
+        )
+        return b"".join(block.to_bytes() for block in weft_file.blocks)
+
+    def test_byte_identical(self):
+        """Blocks fitted by two workers are identical to one process's."""
+        with mock.patch.object(weft_writer, "FIT_BATCH_SIZE", 50):
+            expected = self.create_blocks(workers=1)
+            with mock.patch.object(parallel_fit, "MIN_PARALLEL_SAMPLES", 0):
+                self.assertEqual(self.create_blocks(workers=2), expected)
+
+    def test_small_batches_run_in_process(self):
+        """Small amounts of work are fitted without using the pool."""
+        with FitPool(self.data_source, 2) as pool:
+            with mock.patch.object(pool, "_executor") as executor:
+                fitted = pool.map([[(0, 49, self.start, self.end)]] * 2, 5)
+        executor.submit.assert_not_called()
+        self.assertEqual(len(fitted), 2)
+        np.testing.assert_array_equal(fitted[0], fitted[1])
+
+    def test_shared_memory_released_on_failure(self):
+        """Shared memory is unlinked if the workers cannot be started."""
+        created = []
+        shared_memory_class = shared_memory.SharedMemory
+
+        def create(*args, **kwargs):
+            memory = shared_memory_class(*args, **kwargs)
+            created.append(memory.name)
+            return memory
+
+        with mock.patch.object(
+            parallel_fit.shared_memory, "SharedMemory", side_effect=create
+        ), mock.patch.object(
+            parallel_fit, "ProcessPoolExecutor", side_effect=RuntimeError
+        ):
+            with self.assertRaises(RuntimeError):
+                FitPool(self.data_source, 2)
+
+        self.assertEqual(len(created), 2)
+        for name in created:
+            with self.assertRaises(FileNotFoundError):
+                shared_memory.SharedMemory(name=name)
+
+    def test_invalid_workers(self):
+        """Non-positive worker counts are rejected."""
+        writer = WeftWriter(EphemerisQuantity.ECLIPTIC_LONGITUDE)
+        with self.assertRaises(ValueError):
+            writer.create_multi_precision_file(
+                data_source=self.data_source,
+                quantity=EphemerisQuantity.ECLIPTIC_LONGITUDE,
+                start_date=self.start,
+                end_date=self.end,
+                config=self.config,
+                workers=0,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,6 +12,7 @@ from starloom.weft.blocks import (
     FortyEightHourBlock,
 )
 from starloom.weft.blocks.utils import evaluate_chebyshev, unwrap_angles
+from starloom.space_time.julian import datetime_to_julian
 
 
 class TestChebyshevFunctions(unittest.TestCase):
@@ -106,6 +107,38 @@ class TestMultiYearBlock(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.block.evaluate(dt)
 
+    def test_evaluate_jd(self):
+        """Test that evaluate_jd matches evaluate at the same instant."""
+        for dt in [
+            datetime(self.start_year, 1, 1, tzinfo=timezone.utc),
+            datetime(self.start_year + 3, 7, 2, 18, tzinfo=timezone.utc),
+            datetime(self.start_year + self.duration - 1, 12, 31, tzinfo=timezone.utc),
+        ]:
+            self.assertAlmostEqual(
+                self.block.evaluate_jd(datetime_to_julian(dt)), self.block.evaluate(dt)
+            )
+
+        start, end = self.block.julian_span()
+        with self.assertRaises(ValueError):
+            self.block.evaluate_jd(end)
+        with self.assertRaises(ValueError):
+            self.block.evaluate_jd(start - 0.5)
+
+    def test_evaluate_rate_jd(self):
+        """Test that evaluate_rate_jd matches a central difference.
+
+        Multi-year blocks are evaluated at the start of each day, so the
+        difference steps by whole days.
+        """
+        jd = datetime_to_julian(
+            datetime(self.start_year + 3, 7, 2, tzinfo=timezone.utc)
+        )
+        h = 1.0
+        expected = (self.block.evaluate_jd(jd + h) - self.block.evaluate_jd(jd - h)) / (
+            2 * h
+        )
+        self.assertAlmostEqual(self.block.evaluate_rate_jd(jd), expected, places=9)
+
 
 class TestMonthlyBlock(unittest.TestCase):
     def setUp(self):
@@ -179,6 +212,34 @@ class TestMonthlyBlock(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.block.evaluate(dt)
 
+    def test_evaluate_jd(self):
+        """Test that evaluate_jd matches evaluate at the same instant."""
+        for dt in [
+            datetime(self.year, self.month, 1, tzinfo=timezone.utc),
+            datetime(self.year, self.month, 16, 6, 30, tzinfo=timezone.utc),
+            datetime(self.year, self.month, 31, 23, tzinfo=timezone.utc),
+        ]:
+            self.assertAlmostEqual(
+                self.block.evaluate_jd(datetime_to_julian(dt)), self.block.evaluate(dt)
+            )
+
+        offset, scale = self.block.x_transform()
+        start, end = self.block.julian_span()
+        self.assertEqual((start - offset) * scale, -1.0)
+        with self.assertRaises(ValueError):
+            self.block.evaluate_jd(end)
+
+    def test_evaluate_rate_jd(self):
+        """Test that evaluate_rate_jd matches a central difference."""
+        jd = datetime_to_julian(
+            datetime(self.year, self.month, 16, tzinfo=timezone.utc)
+        )
+        h = 1e-3
+        expected = (self.block.evaluate_jd(jd + h) - self.block.evaluate_jd(jd - h)) / (
+            2 * h
+        )
+        self.assertAlmostEqual(self.block.evaluate_rate_jd(jd), expected, places=6)
+
 
 class TestFortyEightHourBlocks(unittest.TestCase):
     """Test FortyEightHourBlock functionality."""
@@ -255,6 +316,29 @@ class TestFortyEightHourBlocks(unittest.TestCase):
         dt = datetime(self.year, self.month, self.day, 23, 59, 59, tzinfo=timezone.utc)
         self.assertEqual(self.block.evaluate(dt), 1.0)
 
+    def test_forty_eight_hour_evaluate_jd(self):
+        """Test FortyEightHourBlock evaluation at Julian dates."""
+        center = self.block.center_julian()
+        self.assertEqual(self.block.x_transform(), (center, 1.0))
+        for jd in (center - 1.0, center, center + 0.5, center + 1.0):
+            self.assertEqual(self.block.evaluate_jd(jd), 1.0)
+        with self.assertRaises(ValueError):
+            self.block.evaluate_jd(center + 1.5)
+
+    def test_forty_eight_hour_evaluate_rate_jd(self):
+        """Test FortyEightHourBlock rates at Julian dates."""
+        center = self.block.center_julian()
+        self.assertEqual(self.block.evaluate_rate_jd(center), 0.0)
+
+        block = FortyEightHourBlock(
+            header=self.header,
+            coeffs=[1.0, 2.0, 0.5],
+            center_date=date(self.year, self.month, self.day),
+        )
+        # d/dx (T0 + 2 T1 + 0.5 T2) = 2 + 2x
+        for x in (-1.0, -0.25, 0.0, 0.5, 1.0):
+            self.assertAlmostEqual(block.evaluate_rate_jd(center + x), 2.0 + 2.0 * x)
+
     def test_forty_eight_hour_from_stream(self):
         """Test FortyEightHourBlock reading from stream."""
         # Write block to stream
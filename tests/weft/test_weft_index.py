@@ -0,0 +1,142 @@
+"""Tests for the v0.03 table-of-contents index."""
+
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+from datetime import date, timedelta
+
+import numpy as np
+
+from starloom.horizons.quantities import EphemerisQuantity
+from starloom.weft.blocks import (
+    FortyEightHourBlock,
+    FortyEightHourSectionHeader,
+    MonthlyBlock,
+    MultiYearBlock,
+)
+from starloom.weft.weft_file import LazyWeftFile, WeftFile, add_index
+from starloom.weft.weft_index import WeftIndex
+from starloom.weft.weft_reader import WeftReader
+from starloom.weft.weft_writer import WeftWriter
+
+
+def _build_weft_file() -> WeftFile:
+    """Build a small file with every kind of block and two 48-hour sections."""
+    blocks = [MultiYearBlock(start_year=2020, duration=10, coeffs=[10.0, 2.0, 0.5])]
+    for month in range(1, 13):
+        blocks.append(
+            MonthlyBlock(year=2022, month=month, day_count=28, coeffs=[month, 1.0])
+        )
+    for start_day in (date(2022, 3, 1), date(2022, 9, 1)):
+        days = [start_day + timedelta(days=i) for i in range(10)]
+        header = FortyEightHourSectionHeader(
+            start_day=days[0], end_day=days[-1], block_size=198, block_count=10
+        )
+        blocks.append(header)
+        for i, day in enumerate(days):
+            blocks.append(
+                FortyEightHourBlock(
+                    header=header, coeffs=[100.0 + i, 0.5, 0.25], center_date=day
+                )
+            )
+
+    preamble = (
+        "#weft! v0.02 mars jpl:horizons 2020s 32bit ECLIPTIC_LATITUDE "
+        "unbounded chebychevs generated@test\n\n"
+    )
+    return WeftFile(preamble, blocks)
+
+
+class TestWeftIndex(unittest.TestCase):
+    """Test writing and reading files with an index."""
+
+    def setUp(self):
+        self.weft_file = _build_weft_file()
+        self.plain = self.weft_file.to_bytes()
+        self.indexed = self.weft_file.to_bytes(include_index=True)
+
+    def test_to_bytes_appends_index(self):
+        """The indexed file is v0.03, keeps the blocks, and ends with the index."""
+        self.assertTrue(self.indexed.startswith(b"#weft! v0.03 mars"))
+        self.assertTrue(self.indexed.endswith(WeftIndex.magic))
+        self.assertEqual(self.indexed[13 : len(self.plain)], self.plain[13:])
+
+        found = WeftIndex.from_buffer(memoryview(self.indexed))
+        self.assertIsNotNone(found)
+        index, position = found
+        self.assertEqual(position, len(self.plain))
+        # One entry per multi-year block, monthly block and section header
+        self.assertEqual(len(index.entries), 1 + 12 + 2)
+
+    def test_lazy_file_matches_scanned_file(self):
+        """Loading from the index gives the same blocks and values as scanning."""
+        scanned = LazyWeftFile.from_bytes(self.plain)
+        indexed = LazyWeftFile.from_bytes(self.indexed)
+
+        self.assertEqual(
+            [type(b) for b in scanned.blocks], [type(b) for b in indexed.blocks]
+        )
+        self.assertEqual(
+            list(scanned.section_positions.values()),
+            list(indexed.section_positions.values()),
+        )
+
+        julian_dates = np.linspace(2459580.5, 2459944.0, 400)
+        scanned_reader, indexed_reader = WeftReader(), WeftReader()
+        scanned_reader.file, indexed_reader.file = scanned, indexed
+        np.testing.assert_array_equal(
+            scanned_reader.get_values(julian_dates),
+            indexed_reader.get_values(julian_dates),
+        )
+
+    def test_full_file_reads_indexed_data(self):
+        """WeftFile.from_bytes stops at the index."""
+        full = WeftFile.from_bytes(self.indexed)
+        self.assertEqual(len(full.blocks), len(self.weft_file.blocks))
+
+    def test_add_index(self):
+        """add_index upgrades a v0.02 file, and re-indexing is a no-op."""
+        self.assertEqual(add_index(self.plain), self.indexed)
+        self.assertEqual(add_index(self.indexed), self.indexed)
+
+    def test_corrupt_index_raises(self):
+        """An index pointing at the wrong place is rejected."""
+        _, position = WeftIndex.from_buffer(memoryview(self.indexed))
+        corrupt = bytearray(self.indexed)
+        # Point the first entry's offset into the middle of the preamble
+        struct.pack_into(">Q", corrupt, position + 2 + 4 + 2, 3)
+        with self.assertRaises(ValueError):
+            LazyWeftFile.from_bytes(bytes(corrupt))
+
+    def test_v02_file_is_scanned(self):
+        """Files without an index still load."""
+        lazy = LazyWeftFile.from_bytes(self.plain)
+        self.assertEqual(len(lazy.blocks), 1 + 12 + 2)
+
+
+class TestWeftWriterIndex(unittest.TestCase):
+    """Test that WeftWriter.save_file writes an index."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_save_file_writes_index(self):
+        """Saved files are v0.03 with an index."""
+        path = os.path.join(self.temp_dir, "indexed.weft")
+        WeftWriter(EphemerisQuantity.ECLIPTIC_LATITUDE).save_file(
+            _build_weft_file(), path
+        )
+
+        with open(path, "rb") as f:
+            data = f.read()
+        self.assertTrue(data.startswith(b"#weft! v0.03"))
+        self.assertIsNotNone(WeftIndex.from_buffer(memoryview(data)))
+
+
+if __name__ == "__main__":
+    unittest.main()
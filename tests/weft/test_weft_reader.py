@@ -1,11 +1,14 @@
 import unittest
-from datetime import datetime, date, timezone
+from datetime import datetime, date, timedelta, timezone
 import os
 import tempfile
 import shutil
+from unittest import mock
+
+import numpy as np
 
 # Import from starloom package
-from starloom.weft.weft_file import WeftFile
+from starloom.weft.weft_file import LazyWeftFile, WeftFile
 from starloom.weft.blocks import (
     MultiYearBlock,
     MonthlyBlock,
@@ -13,6 +16,7 @@ from starloom.weft.blocks import (
     FortyEightHourBlock,
 )
 from starloom.weft.weft_reader import WeftReader
+from starloom.space_time.julian_calc import datetime_to_julian
 
 
 class TestWeftReader(unittest.TestCase):
@@ -118,5 +122,565 @@ class TestWeftReader(unittest.TestCase):
             reader.get_value(dt)
 
 
+def _build_weft_file(behavior: str, base_value: float) -> WeftFile:
+    """Build a file with multi-year, monthly and a dense 48-hour section."""
+    rng = np.random.default_rng(1234)
+    blocks = [
+        MultiYearBlock(start_year=2020, duration=10, coeffs=[base_value, 10.0, -5.0]),
+        MultiYearBlock(start_year=2023, duration=1, coeffs=[base_value, 1.0]),
+    ]
+    for month in range(1, 13):
+        day_count = (
+            date(2023 + month // 12, month % 12 + 1, 1) - date(2023, month, 1)
+        ).days
+        blocks.append(
+            MonthlyBlock(
+                year=2023,
+                month=month,
+                day_count=day_count,
+                coeffs=[base_value + month, 3.0, -1.5, 0.25],
+            )
+        )
+
+    start_day = date(2023, 6, 1)
+    centers = [start_day + timedelta(days=i) for i in range(30)]
+    header = FortyEightHourSectionHeader(
+        start_day=centers[0],
+        end_day=centers[-1],
+        block_size=198,
+        block_count=len(centers),
+    )
+    blocks.append(header)
+    for i, center in enumerate(centers):
+        # Values sweep through the top of the range so wrapping files cross it
+        coeffs = [base_value + 12.0 * i, 6.0] + list(rng.normal(scale=0.1, size=6))
+        blocks.append(
+            FortyEightHourBlock(header=header, coeffs=coeffs, center_date=center)
+        )
+
+    preamble = (
+        f"#weft! v0.02 mars jpl:horizons 2020s 32bit ECLIPTIC_LONGITUDE "
+        f"{behavior} chebychevs generated@test\n\n"
+    )
+    return WeftFile(preamble, blocks)
+
+
+def _write_reader(
+    temp_dir: str, name: str, behavior: str, base_value: float
+) -> WeftReader:
+    """Write a _build_weft_file file into temp_dir and open a reader on it."""
+    path = os.path.join(temp_dir, name)
+    _build_weft_file(behavior, base_value).write_to_file(path)
+    return WeftReader(path)
+
+
+class TestWeftReaderGetValues(unittest.TestCase):
+    """Test batch evaluation with WeftReader.get_values."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _reader(self, behavior: str, base_value: float) -> WeftReader:
+        return _write_reader(self.temp_dir, "batch.weft", behavior, base_value)
+
+    def _sample_times(self):
+        start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        rng = np.random.default_rng(42)
+        offsets = rng.uniform(0, 10 * 365 * 86400, size=300)
+        times = [start + timedelta(seconds=float(s)) for s in offsets]
+
+        # Dense coverage of the 48-hour section, including exact midnights
+        section_start = datetime(2023, 5, 31, tzinfo=timezone.utc)
+        times += [section_start + timedelta(hours=7 * i) for i in range(110)]
+        times += [datetime(2023, 6, d, tzinfo=timezone.utc) for d in range(1, 31)]
+        return times
+
+    def _assert_matches_scalar(self, reader: WeftReader) -> None:
+        times = self._sample_times()
+        expected = np.array([reader.get_value(t) for t in times])
+
+        julian_dates = np.array([datetime_to_julian(t) for t in times])
+        np.testing.assert_array_equal(reader.get_values(julian_dates), expected)
+        np.testing.assert_array_equal(
+            [reader.get_value_jd(float(jd)) for jd in julian_dates], expected
+        )
+
+        datetimes = np.array(
+            [t.replace(tzinfo=None) for t in times], dtype="datetime64[us]"
+        )
+        np.testing.assert_array_equal(reader.get_values(datetimes), expected)
+
+    def test_wrapping_matches_scalar(self):
+        """Batch values match scalar values exactly for wrapping files."""
+        self._assert_matches_scalar(self._reader("wrapping[0.0,360.0]", 300.0))
+
+    def test_bounded_matches_scalar(self):
+        """Batch values match scalar values exactly for bounded files."""
+        self._assert_matches_scalar(self._reader("bounded[-90.0,90.0]", -20.0))
+
+    def test_unbounded_matches_scalar(self):
+        """Batch values match scalar values exactly for unbounded files."""
+        self._assert_matches_scalar(self._reader("unbounded", 1.5))
+
+    def test_preserves_shape(self):
+        """The result has the same shape as the input."""
+        reader = self._reader("unbounded", 1.5)
+        julian_dates = np.linspace(2459000.5, 2459100.5, 12).reshape(3, 4)
+        self.assertEqual(reader.get_values(julian_dates).shape, (3, 4))
+
+    def test_uncovered_time_raises(self):
+        """Times outside every block raise like get_value does."""
+        reader = self._reader("unbounded", 1.5)
+        with self.assertRaises(ValueError):
+            reader.get_value_jd(
+                datetime_to_julian(datetime(2040, 1, 1, tzinfo=timezone.utc))
+            )
+        with self.assertRaises(ValueError):
+            reader.get_values(
+                np.array(
+                    [
+                        2459000.5,
+                        datetime_to_julian(datetime(2040, 1, 1, tzinfo=timezone.utc)),
+                    ]
+                )
+            )
+
+    def test_iter_values_matches_get_values(self):
+        """Iterated values match get_values at the same evenly spaced times."""
+        reader = self._reader("wrapping[0.0,360.0]", 300.0)
+        start = datetime_to_julian(datetime(2023, 5, 20, tzinfo=timezone.utc))
+        step = 0.1
+        stop = start + 500 * step
+
+        pairs = list(reader.iter_values(start, stop, step, chunk_size=64))
+        julian_dates = start + np.arange(501) * step
+
+        self.assertEqual(len(pairs), 501)
+        np.testing.assert_array_equal([jd for jd, _ in pairs], julian_dates)
+        np.testing.assert_array_equal(
+            [value for _, value in pairs], reader.get_values(julian_dates)
+        )
+
+    def test_iter_chunks(self):
+        """Chunks hold at most chunk_size points and can evaluate rates."""
+        reader = self._reader("unbounded", 1.5)
+        chunks = list(reader.iter_chunks(2459000.5, 2459010.5, 0.5, 8, rates=True))
+
+        self.assertEqual([len(jd) for jd, _ in chunks], [8, 8, 5])
+        julian_dates = np.concatenate([jd for jd, _ in chunks])
+        np.testing.assert_array_equal(
+            np.concatenate([rates for _, rates in chunks]),
+            reader.get_rates(julian_dates),
+        )
+        self.assertEqual(list(reader.iter_values(2459010.5, 2459000.5, 1.0)), [])
+
+    def test_iter_invalid_arguments(self):
+        """Non-positive steps and chunk sizes are rejected."""
+        reader = self._reader("unbounded", 1.5)
+        with self.assertRaises(ValueError):
+            next(reader.iter_values(2459000.5, 2459010.5, 0.0))
+        with self.assertRaises(ValueError):
+            next(reader.iter_chunks(2459000.5, 2459010.5, 1.0, chunk_size=0))
+        with self.assertRaises(ValueError):
+            next(WeftReader().iter_values(2459000.5, 2459010.5, 1.0))
+
+
+class TestWeftReaderRates(unittest.TestCase):
+    """Test analytic rates with WeftReader.get_rate and get_rates."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _reader(self, behavior: str, base_value: float) -> WeftReader:
+        return _write_reader(self.temp_dir, "rates.weft", behavior, base_value)
+
+    def _sample_julian_dates(self):
+        # Monthly blocks in 2023 and the 48-hour section in June 2023
+        rng = np.random.default_rng(7)
+        return np.concatenate(
+            [
+                rng.uniform(2459945.5, 2460310.0, size=100),
+                np.arange(2460096.5, 2460126.5, 0.3) + 0.01,
+            ]
+        )
+
+    def _assert_rates(self, reader: WeftReader, wrapping: bool) -> None:
+        julian_dates = self._sample_julian_dates()
+        rates = reader.get_rates(julian_dates)
+        np.testing.assert_array_equal(
+            rates, [reader.get_rate(float(jd)) for jd in julian_dates]
+        )
+
+        h = 1e-4
+        differences = reader.get_values(julian_dates + h) - reader.get_values(
+            julian_dates - h
+        )
+        if wrapping:
+            differences = (differences + 180.0) % 360.0 - 180.0
+        np.testing.assert_allclose(rates, differences / (2 * h), atol=1e-4)
+
+    def test_wrapping_rates(self):
+        """Rates of wrapping files ignore the jump at the top of the range."""
+        self._assert_rates(self._reader("wrapping[0.0,360.0]", 300.0), True)
+
+    def test_unbounded_rates(self):
+        """Rates match central differences of the values."""
+        self._assert_rates(self._reader("unbounded", 1.5), False)
+
+    def test_uncovered_time_raises(self):
+        """Times outside every block raise like get_value_jd does."""
+        reader = self._reader("unbounded", 1.5)
+        with self.assertRaises(ValueError):
+            reader.get_rate(2466154.5)
+        with self.assertRaises(ValueError):
+            reader.get_rates(np.array([2459000.5, 2466154.5]))
+
+
+class TestWeftReaderCrossings(unittest.TestCase):
+    """Test solving for target values with WeftReader.find_crossings."""
+
+    # 2020 through 2029, covering every tier of _build_weft_file
+    start, end = 2458849.5, 2462502.5
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _reader(self, behavior: str, base_value: float) -> WeftReader:
+        return _write_reader(self.temp_dir, "crossings.weft", behavior, base_value)
+
+    def _assert_matches_sampling(self, reader: WeftReader, target: float) -> None:
+        """Every sign change on a fine grid brackets exactly one crossing."""
+        julian_dates = np.arange(self.start, self.end, 1 / 64)
+        differences = reader.get_values(julian_dates) - target
+        wrapping = reader.file.value_behavior["type"] == "wrapping"
+        if wrapping:
+            differences = (differences + 180.0) % 360.0 - 180.0
+        changes = (differences[:-1] < 0) != (differences[1:] < 0)
+        if wrapping:
+            changes &= np.abs(np.diff(differences)) < 180.0
+        lows = julian_dates[:-1][changes]
+        highs = julian_dates[1:][changes]
+
+        crossings = np.array(reader.find_crossings(target, self.start, self.end))
+        self.assertEqual(len(crossings), len(lows))
+        np.testing.assert_array_less(lows - 1e-9, crossings)
+        np.testing.assert_array_less(crossings, highs + 1e-9)
+
+    def test_wrapping_crossings(self):
+        """Wrapping values cross the target once per revolution."""
+        reader = self._reader("wrapping[0.0,360.0]", 300.0)
+        for target in (0.0, 45.0, 310.0):
+            self._assert_matches_sampling(reader, target)
+
+    def test_unbounded_crossings(self):
+        """Crossings in every tier and at seams match sampling."""
+        reader = self._reader("unbounded", 1.5)
+        for target in (2.0, 5.0, 13.0, 100.0):
+            self._assert_matches_sampling(reader, target)
+
+    def test_crossings_hit_target(self):
+        """Crossings inside a 48-hour section are exact roots of the blend."""
+        reader = self._reader("wrapping[0.0,360.0]", 300.0)
+        crossings = 0
+        for target in np.arange(0.0, 360.0, 30.0):
+            for jd in reader.find_crossings(target, 2460097.0, 2460125.0):
+                value = reader.get_value_jd(jd)
+                difference = (value - target + 180.0) % 360.0 - 180.0
+                self.assertAlmostEqual(difference, 0.0, places=8)
+                crossings += 1
+        self.assertGreaterEqual(crossings, 10)
+
+    def test_seam_crossing(self):
+        """A jump across the target between tiers is reported at the seam."""
+        reader = self._reader("unbounded", 1.5)
+        # The 48-hour section ends at 2023-06-30, where monthly values take over
+        seam = 2460125.5
+        self.assertGreater(reader.get_value_jd(seam - 1e-6), 100.0)
+        self.assertLess(reader.get_value_jd(seam), 100.0)
+        self.assertIn(seam, reader.find_crossings(100.0, seam - 10, seam + 10))
+
+    def test_multi_year_crossings_at_midnight(self):
+        """Multi-year values change at midnight, so their crossings do too."""
+        reader = self._reader("unbounded", 1.5)
+        # Before 2023 only the first multi-year block covers the file
+        crossings = reader.find_crossings(0.0, self.start, 2459945.5)
+        self.assertTrue(crossings)
+        for jd in crossings:
+            self.assertEqual(jd % 1.0, 0.5)
+
+    def test_invalid_arguments(self):
+        """Ranges must be ordered, and bounded targets must be in range."""
+        reader = self._reader("bounded[-90.0,90.0]", -20.0)
+        with self.assertRaises(ValueError):
+            reader.find_crossings(0.0, self.end, self.start)
+        self.assertEqual(reader.find_crossings(95.0, self.start, self.end), [])
+
+
+class TestWeftReaderMmap(unittest.TestCase):
+    """Test memory-mapped loading of .weft files."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "mmap.weft")
+        _build_weft_file("wrapping[0.0,360.0]", 300.0).write_to_file(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_matches_in_memory_reader(self):
+        """A memory-mapped reader returns the same values as an in-memory one."""
+        in_memory = WeftReader(self.path)
+        mapped = WeftReader(self.path, use_mmap=True)
+        try:
+            julian_dates = np.linspace(2458849.5, 2462502.0, 2000)
+            julian_dates = np.concatenate(
+                [julian_dates, np.linspace(2460096.5, 2460127.5, 500)]
+            )
+            np.testing.assert_array_equal(
+                mapped.get_values(julian_dates), in_memory.get_values(julian_dates)
+            )
+
+            dt = datetime(2023, 6, 15, 12, tzinfo=timezone.utc)
+            self.assertEqual(mapped.get_value(dt), in_memory.get_value(dt))
+        finally:
+            mapped.close()
+
+    def test_load_bytes_matches_file(self):
+        """A reader loaded from bytes returns the same values as one loaded from disk."""
+        from_file = WeftReader(self.path)
+        from_bytes = WeftReader()
+        with open(self.path, "rb") as f:
+            from_bytes.load_bytes(f.read())
+
+        julian_dates = np.linspace(2458849.5, 2462502.0, 2000)
+        np.testing.assert_array_equal(
+            from_bytes.get_values(julian_dates), from_file.get_values(julian_dates)
+        )
+
+    def test_load_file_at_offset(self):
+        """A .weft file embedded in a larger file is read from its offset."""
+        with open(self.path, "rb") as f:
+            data = f.read()
+        embedded_path = os.path.join(self.temp_dir, "embedded.bin")
+        with open(embedded_path, "wb") as f:
+            f.write(b"\xaa" * 1000 + data + b"\xbb" * 100)
+
+        from_file = WeftReader(self.path)
+        julian_dates = np.linspace(2458849.5, 2462502.0, 2000)
+        for use_mmap in (True, False):
+            reader = WeftReader()
+            reader.load_file(
+                embedded_path, use_mmap=use_mmap, offset=1000, length=len(data)
+            )
+            try:
+                np.testing.assert_array_equal(
+                    reader.get_values(julian_dates), from_file.get_values(julian_dates)
+                )
+            finally:
+                reader.close()
+            self.assertIsNone(reader.file)
+
+    def test_close_releases_mapping(self):
+        """Closing the reader releases the mapping and unloads the file."""
+        reader = WeftReader(self.path, use_mmap=True)
+        reader.close()
+        self.assertIsNone(reader.file)
+
+        dt = datetime(2023, 6, 15, 12, tzinfo=timezone.utc)
+        with self.assertRaises(ValueError):
+            reader.get_value(dt)
+
+    def test_invalid_file_raises(self):
+        """Files that are not valid .weft data raise ValueError."""
+        bad_path = os.path.join(self.temp_dir, "bad.weft")
+        with open(bad_path, "wb") as f:
+            f.write(b"#weft! v0.02\n\n\xff\xff")
+        with self.assertRaises(ValueError):
+            WeftReader(bad_path, use_mmap=True)
+
+
+class TestLazyWeftFileIndex(unittest.TestCase):
+    """Test the date index LazyWeftFile builds at load time."""
+
+    def _brute_force(self, weft_file: WeftFile, dt: datetime):
+        blocks = [
+            block
+            for block in weft_file.blocks
+            if isinstance(block, (MultiYearBlock, MonthlyBlock)) and block.contains(dt)
+        ]
+        sections = [
+            block
+            for block in weft_file.blocks
+            if isinstance(block, FortyEightHourSectionHeader)
+            and block.contains_datetime(dt)
+        ]
+        return blocks, sections[0] if sections else None
+
+    def test_matches_linear_scan(self):
+        """Indexed lookups find the same blocks, in file order, as a linear scan."""
+        weft_file = _build_weft_file("unbounded", 1.5)
+        lazy = LazyWeftFile.from_bytes(weft_file.to_bytes())
+
+        start = datetime(2019, 12, 1, tzinfo=timezone.utc)
+        times = [start + timedelta(hours=13 * i) for i in range(8000)]
+        times += [
+            datetime(2023, month, 1, tzinfo=timezone.utc) for month in range(1, 13)
+        ]
+        for dt in times:
+            expected_blocks, expected_section = self._brute_force(lazy, dt)
+            blocks = lazy.get_blocks_for_datetime(dt)
+            self.assertEqual(
+                [b for b in blocks if not isinstance(b, FortyEightHourBlock)],
+                expected_blocks,
+            )
+            self.assertIs(
+                lazy.get_forty_eight_hour_section_for_datetime(dt), expected_section
+            )
+
+    def test_overlapping_blocks_in_file_order(self):
+        """Overlapping blocks of the same tier are all returned in file order."""
+        first = MonthlyBlock(year=2023, month=6, day_count=30, coeffs=[1.0])
+        second = MonthlyBlock(year=2023, month=6, day_count=30, coeffs=[2.0])
+        year = MultiYearBlock(start_year=2023, duration=1, coeffs=[3.0])
+        decade = MultiYearBlock(start_year=2020, duration=10, coeffs=[4.0])
+        lazy = LazyWeftFile(
+            "#weft! v0.02 mars jpl:horizons 2020s 32bit ECLIPTIC_LONGITUDE "
+            "unbounded chebychevs generated@test\n\n",
+            [first, year, second, decade],
+        )
+
+        dt = datetime(2023, 6, 10, tzinfo=timezone.utc)
+        self.assertEqual(
+            lazy.get_blocks_for_datetime(dt), [first, year, second, decade]
+        )
+
+        dt = datetime(2023, 7, 10, tzinfo=timezone.utc)
+        self.assertEqual(lazy.get_blocks_for_datetime(dt), [year, decade])
+
+
+class TestLazyWeftFileSections(unittest.TestCase):
+    """Test locating FortyEightHourBlocks within dense and sparse sections."""
+
+    def _lazy_file(self, offsets):
+        start_day = date(2023, 6, 1)
+        centers = [start_day + timedelta(days=i) for i in offsets]
+        header = FortyEightHourSectionHeader(
+            start_day=centers[0],
+            end_day=centers[-1],
+            block_size=198,
+            block_count=len(centers),
+        )
+        blocks = [header] + [
+            FortyEightHourBlock(header=header, coeffs=[float(i)], center_date=center)
+            for i, center in enumerate(centers)
+        ]
+        preamble = (
+            "#weft! v0.02 mars jpl:horizons 2020s 32bit ECLIPTIC_LONGITUDE "
+            "unbounded chebychevs generated@test\n\n"
+        )
+        lazy = LazyWeftFile.from_bytes(WeftFile(preamble, blocks).to_bytes())
+        return lazy, lazy.blocks[0]
+
+    def _assert_matches_brute_force(self, offsets, expect_dense):
+        lazy, header = self._lazy_file(offsets)
+        self.assertEqual(lazy._is_dense_section(header), expect_dense)
+
+        all_blocks = lazy.get_blocks_in_section(header)
+        first = datetime_to_julian(datetime(2023, 5, 30, tzinfo=timezone.utc))
+        for jd in np.concatenate(
+            [first + np.arange(0, 40, 0.25), first + np.linspace(0, 40, 997)]
+        ):
+            expected = [
+                block.center_date
+                for block in all_blocks
+                if abs(jd - block.center_julian()) <= 1.0
+            ]
+            with mock.patch.object(
+                lazy,
+                "get_forty_eight_hour_block_at_index",
+                wraps=lazy.get_forty_eight_hour_block_at_index,
+            ) as decode:
+                found = lazy.find_blocks_for_julian_in_section(header, float(jd))
+            self.assertEqual([block.center_date for block in found], expected)
+            self.assertEqual(decode.call_count, len(expected))
+            self.assertLessEqual(decode.call_count, 3)
+
+    def test_dense_section(self):
+        """Dense sections are addressed arithmetically."""
+        self._assert_matches_brute_force(range(30), expect_dense=True)
+
+    def test_sparse_section(self):
+        """Sections with gaps fall back to bisecting the center dates."""
+        self._assert_matches_brute_force(
+            [0, 1, 2, 5, 6, 9, 10, 11, 20, 29], expect_dense=False
+        )
+
+    def test_padded_section_is_not_dense(self):
+        """A section whose blocks do not start on its start day is sparse."""
+        lazy, header = self._lazy_file(range(5))
+        header.start_day = date(2023, 5, 31)
+        header.end_day = date(2023, 6, 4)
+        self.assertFalse(lazy._is_dense_section(header))
+
+
+class TestLazyWeftFileCache(unittest.TestCase):
+    """Test caching of decoded FortyEightHourBlocks in LazyWeftFile."""
+
+    def setUp(self):
+        self.data = _build_weft_file("unbounded", 1.5).to_bytes()
+        self.dt = datetime(2023, 6, 10, 6, tzinfo=timezone.utc)
+
+    def test_repeated_lookups_hit_cache(self):
+        """Only the first lookup of a block decodes it."""
+        reader = WeftReader()
+        reader.file = LazyWeftFile.from_bytes(self.data)
+        first = reader.get_value(self.dt)
+        misses = reader.file.block_cache.misses
+
+        for _ in range(10):
+            self.assertEqual(reader.get_value(self.dt), first)
+
+        self.assertEqual(reader.file.block_cache.misses, misses)
+        self.assertGreaterEqual(reader.file.block_cache.hits, 10)
+
+    def test_cached_values_match_uncached(self):
+        """Values are identical with and without the cache."""
+        cached = WeftReader()
+        cached.file = LazyWeftFile.from_bytes(self.data)
+        uncached = WeftReader()
+        uncached.file = LazyWeftFile.from_bytes(self.data, cache_entries=0)
+
+        julian_dates = np.linspace(2460094.5, 2460127.5, 300)
+        for _ in range(2):
+            np.testing.assert_array_equal(
+                cached.get_values(julian_dates), uncached.get_values(julian_dates)
+            )
+            self.assertEqual(cached.get_value(self.dt), uncached.get_value(self.dt))
+        self.assertEqual(len(uncached.file.block_cache), 0)
+        self.assertGreater(cached.file.block_cache.hits, 0)
+
+    def test_byte_budget_bounds_cache(self):
+        """The cache stays within its byte budget."""
+        lazy = LazyWeftFile.from_bytes(self.data, cache_bytes=2000)
+        header = next(
+            block
+            for block in lazy.blocks
+            if isinstance(block, FortyEightHourSectionHeader)
+        )
+        for i in range(header.block_count):
+            lazy.get_forty_eight_hour_block_at_index(header, i)
+        self.assertLessEqual(lazy.block_cache.current_bytes, 2000)
+        self.assertGreater(len(lazy.block_cache), 0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,8 +2,16 @@ import unittest
 from datetime import datetime, timezone, timedelta
 import math
 
+import numpy as np
+from numpy.polynomial import chebyshev
+
 # Import from starloom package
+from starloom.ephemeris import Ephemeris, Quantity
+from starloom.space_time.julian import julian_from_datetime, julian_to_datetime
 from starloom.weft.blocks.utils import evaluate_chebyshev
+from starloom.weft.ephemeris_data_source import EphemerisDataSource
+from starloom.weft.weft_file import MonthlyBlock, MultiYearBlock, WeftFile
+from starloom.weft.weft_reader import WeftReader
 from starloom.weft.weft_writer import WeftWriter
 from starloom.horizons.quantities import EphemerisQuantity
 
@@ -17,23 +25,35 @@ class TestWeftWriter(unittest.TestCase):
         self.writer = WeftWriter(EphemerisQuantity.ECLIPTIC_LONGITUDE)
 
 
-class MockDataSource:
-    """A mock data source that returns values from a known function."""
+class FunctionEphemeris(Ephemeris):
+    """An ephemeris whose longitude is a known function of time."""
 
-    def __init__(self, func, start_dt: datetime, end_dt: datetime, step_count=96):
+    def __init__(self, func):
         """Initialize with a function that takes a datetime and returns a value."""
         self.func = func
-        self.start_dt = start_dt
-        self.end_dt = end_dt
-        # step_count timestamps in the range start_dt to end_dt
-        duration = end_dt - start_dt
-        step = duration / step_count
-        self.timestamps = [start_dt + step * i for i in range(step_count + 1)]
 
-    def get_value_at(self, dt: datetime) -> float:
-        """Get the value at the given datetime using our known function."""
-        self.timestamps.append(dt)
-        return self.func(dt)
+    def get_planet_position(self, planet, time=None):
+        raise NotImplementedError
+
+    def get_planet_positions(self, planet, time_spec):
+        return {
+            jd: {Quantity.ECLIPTIC_LONGITUDE: self.func(julian_to_datetime(jd))}
+            for jd in time_spec.to_julian_array().tolist()
+        }
+
+
+def make_data_source(
+    func, start_dt: datetime, end_dt: datetime, step: str = "15m"
+) -> EphemerisDataSource:
+    """Sample a known function from start_dt to end_dt."""
+    return EphemerisDataSource(
+        ephemeris=FunctionEphemeris(func),
+        planet_id="moon",
+        quantity=EphemerisQuantity.ECLIPTIC_LONGITUDE,
+        start_date=start_dt,
+        end_date=end_dt,
+        step_hours=step,
+    )
 
 
 def test_chebyshev_coefficient_generation():
@@ -57,7 +77,7 @@ def test_chebyshev_coefficient_generation():
     end_dt = datetime(2025, 1, 2, tzinfo=timezone.utc)
 
     # Create mock data source
-    data_source = MockDataSource(known_function, start_dt, end_dt)
+    data_source = make_data_source(known_function, start_dt, end_dt)
 
     # Generate coefficients with higher degree
     coeffs = writer._generate_chebyshev_coefficients(
@@ -137,7 +157,7 @@ def test_sample_generation():
     end_dt = datetime(2025, 1, 2, tzinfo=timezone.utc)
 
     # Create mock data source
-    data_source = MockDataSource(known_function, start_dt, end_dt)
+    data_source = make_data_source(known_function, start_dt, end_dt)
 
     # Generate samples
     x_values, values = writer._generate_samples(
@@ -176,5 +196,122 @@ def test_sample_generation():
     print(f"Number of samples: {len(x_values)}")
 
 
+def test_batched_fit_matches_chebfit():
+    """Test that windows fitted together match fitting each on its own."""
+    start_dt = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    def wavy_longitude(dt: datetime) -> float:
+        days = (dt - start_dt).total_seconds() / 86400
+        return (13.2 * days + 5 * math.sin(days / 3)) % 360
+
+    data_source = make_data_source(
+        wavy_longitude, start_dt, start_dt + timedelta(days=12), "1h"
+    )
+    writer = WeftWriter(EphemerisQuantity.ECLIPTIC_LONGITUDE)
+
+    # Whole 48-hour windows share a layout; the clipped last one does not
+    windows = [
+        (start_dt + timedelta(days=day - 1), start_dt + timedelta(days=day + 1))
+        for day in range(1, 12)
+    ]
+    windows.append((start_dt + timedelta(days=11), start_dt + timedelta(days=12)))
+
+    fitted = writer._fit_windows(data_source, windows, degree=23)
+
+    assert len(fitted) == len(windows)
+    for (window_start, window_end), coeffs in zip(windows, fitted):
+        x_values, values = writer._generate_samples(
+            data_source, window_start, window_end
+        )
+        expected = chebyshev.chebfit(x_values, values, deg=23)
+        np.testing.assert_allclose(coeffs, expected[: len(coeffs)], atol=1e-9)
+        assert np.all(np.abs(expected[len(coeffs) :]) < 1e-9)
+
+
+def test_trim_coefficients():
+    """Test that only negligible trailing coefficients are dropped."""
+    coeffs = np.array([1.0, 0.0, 0.5, 1e-13, -1e-14])
+    assert WeftWriter._trim_coefficients(coeffs) == [1.0, 0.0, 0.5]
+    assert WeftWriter._trim_coefficients(np.zeros(4)) == [0.0]
+
+
+class RecordingEphemeris(FunctionEphemeris):
+    """A FunctionEphemeris that records the TimeSpec of each fetch."""
+
+    def __init__(self, func):
+        super().__init__(func)
+        self.time_specs = []
+
+    def get_planet_positions(self, planet, time_spec):
+        self.time_specs.append(time_spec)
+        return super().get_planet_positions(planet, time_spec)
+
+
+def test_stream_multi_precision_file(tmp_path):
+    """Test that a streamed file matches one built in memory."""
+    start_dt = datetime(2024, 12, 20, tzinfo=timezone.utc)
+    end_dt = datetime(2026, 1, 5, tzinfo=timezone.utc)
+
+    def wavy_longitude(dt: datetime) -> float:
+        days = (dt - start_dt).total_seconds() / 86400
+        return (13.2 * days + 5 * math.sin(days / 3)) % 360
+
+    config = {
+        "multi_year": {"enabled": True, "polynomial_degree": 31},
+        "monthly": {"enabled": True, "polynomial_degree": 15},
+        "forty_eight_hour": {"enabled": True, "polynomial_degree": 11},
+    }
+    writer = WeftWriter(EphemerisQuantity.ECLIPTIC_LONGITUDE)
+
+    in_memory_path = tmp_path / "in_memory.weft"
+    data_source = make_data_source(wavy_longitude, start_dt, end_dt, "2h")
+    weft_file = writer.create_multi_precision_file(
+        data_source=data_source,
+        quantity=EphemerisQuantity.ECLIPTIC_LONGITUDE,
+        start_date=start_dt,
+        end_date=end_dt,
+        config=config,
+    )
+    writer.save_file(weft_file, str(in_memory_path))
+
+    # One month of two-hourly samples per fetch
+    ephemeris = RecordingEphemeris(wavy_longitude)
+    streamed_path = tmp_path / "streamed.weft"
+    writer.stream_multi_precision_file(
+        ephemeris=ephemeris,
+        planet_id="moon",
+        start_date=start_dt,
+        end_date=end_dt,
+        config=config,
+        output_path=str(streamed_path),
+        step_hours="2h",
+        chunk_size=400,
+    )
+
+    # The range was fetched once, in chunks
+    assert len(ephemeris.time_specs) == 14
+    np.testing.assert_array_equal(
+        np.concatenate([spec.to_julian_array() for spec in ephemeris.time_specs]),
+        data_source.julian_dates,
+    )
+
+    # The multi-year block for 2025 is fitted from every chunk
+    streamed = WeftFile.from_bytes(streamed_path.read_bytes())
+    assert streamed.preamble.startswith("#weft! v0.03 moon")
+    (expected_block,) = [b for b in weft_file.blocks if isinstance(b, MultiYearBlock)]
+    (streamed_block,) = [b for b in streamed.blocks if isinstance(b, MultiYearBlock)]
+    assert streamed_block.start_year == expected_block.start_year == 2025
+    np.testing.assert_allclose(streamed_block.coeffs, expected_block.coeffs, atol=1e-9)
+    assert [
+        (b.year, b.month) for b in streamed.blocks if isinstance(b, MonthlyBlock)
+    ] == [(b.year, b.month) for b in weft_file.blocks if isinstance(b, MonthlyBlock)]
+
+    # Readers pick the same blocks, so values agree everywhere
+    times = julian_from_datetime(start_dt) + np.linspace(2.0, 374.0, 20001)
+    expected = WeftReader(str(in_memory_path)).get_values(times)
+    values = WeftReader(str(streamed_path)).get_values(times)
+    np.testing.assert_allclose((values - expected + 180) % 360 - 180, 0, atol=1e-9)
+
+
 if __name__ == "__main__":
     unittest.main()
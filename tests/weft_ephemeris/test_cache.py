@@ -0,0 +1,119 @@
+"""Tests for the decompressed weftball cache."""
+
+import io
+import os
+import tarfile
+
+import pytest
+from click.testing import CliRunner
+
+from starloom.cli.weft import weft
+from starloom.weft.blocks import MultiYearBlock
+from starloom.weft.weft_file import WeftFile
+from starloom.weft_ephemeris.cache import MANIFEST_NAME, WeftballCache
+
+
+def _write_weftball(path, value=1.0):
+    """Write a weftball with one constant .weft file per quantity."""
+    with tarfile.open(path, "w:gz") as tar:
+        for suffix in ("longitude", "latitude", "distance"):
+            weft_file = WeftFile(
+                "#weft! v0.02 mars jpl:horizons 2000-2040 32bit DELTA "
+                "unbounded chebychevs generated@test\n\n",
+                [MultiYearBlock(start_year=2000, duration=40, coeffs=[value])],
+            )
+            data = weft_file.to_bytes(include_index=True)
+            info = tarfile.TarInfo(f"mars_{suffix}.weft")
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+
+@pytest.fixture
+def weftball(tmp_path):
+    """Fixture to provide a small weftball."""
+    path = tmp_path / "mars_weftball.tar.gz"
+    _write_weftball(path)
+    return path
+
+
+class TestWeftballCache:
+    """Test the WeftballCache class."""
+
+    def test_warm_extracts_members(self, weftball, tmp_path):
+        """Test that warming extracts each member and writes a manifest."""
+        cache = WeftballCache(tmp_path / "cache")
+        assert cache.lookup(weftball) is None
+
+        entry = cache.warm(weftball)
+        assert sorted(entry.members) == [
+            "mars_distance.weft",
+            "mars_latitude.weft",
+            "mars_longitude.weft",
+        ]
+        assert (entry.directory / MANIFEST_NAME).exists()
+        with tarfile.open(weftball) as tar:
+            member = tar.extractfile("mars_longitude.weft")
+            assert member is not None
+            assert (
+                entry.member_path("mars_longitude.weft").read_bytes() == member.read()
+            )
+
+        assert cache.lookup(weftball) == entry
+        assert cache.warm(weftball) == entry
+        assert cache.entries() == [entry]
+
+    def test_changed_weftball_is_stale(self, weftball, tmp_path):
+        """Test that rewriting a weftball invalidates its entry."""
+        cache = WeftballCache(tmp_path / "cache")
+        old_entry = cache.warm(weftball)
+
+        _write_weftball(weftball, value=2.0)
+        stat = os.stat(weftball)
+        os.utime(weftball, ns=(stat.st_atime_ns, old_entry.mtime_ns + 10**9))
+
+        assert old_entry.is_stale()
+        assert cache.lookup(weftball) is None
+        new_entry = cache.warm(weftball)
+        assert new_entry.directory != old_entry.directory
+        assert new_entry.sha256 != old_entry.sha256
+
+        assert cache.prune() == [old_entry.directory]
+        assert cache.entries() == [new_entry]
+
+    def test_prune_removes_missing_and_everything(self, weftball, tmp_path):
+        """Test pruning entries whose weftballs were deleted, and everything."""
+        cache = WeftballCache(tmp_path / "cache")
+        other = tmp_path / "other_weftball.tar.gz"
+        _write_weftball(other)
+        cache.warm(weftball)
+        cache.warm(other)
+
+        os.remove(other)
+        assert len(cache.prune()) == 1
+        assert [entry.source for entry in cache.entries()] == [
+            os.path.realpath(weftball)
+        ]
+
+        assert len(cache.prune(everything=True)) == 1
+        assert cache.entries() == []
+
+    def test_cli(self, weftball, tmp_path):
+        """Test the warm, list and prune commands."""
+        runner = CliRunner()
+        cache_dir = str(tmp_path / "cache")
+
+        result = runner.invoke(
+            weft, ["cache", "warm", str(tmp_path), "--cache-dir", cache_dir]
+        )
+        assert result.exit_code == 0, result.output
+        assert "3 files" in result.output
+
+        result = runner.invoke(weft, ["cache", "list", "--cache-dir", cache_dir])
+        assert result.exit_code == 0, result.output
+        assert "[ok]" in result.output
+
+        result = runner.invoke(
+            weft, ["cache", "prune", "--all", "--cache-dir", cache_dir]
+        )
+        assert result.exit_code == 0, result.output
+        assert "Removed 1 cache entries" in result.output
@@ -1,18 +1,34 @@
 """Tests for the WeftEphemeris class."""
 
+import io
 import os
 import pytest
 import shutil
+import tarfile
 import tempfile
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 
+import numpy as np
+
+from starloom.ephemeris.ephemeris import Ephemeris
 from starloom.ephemeris.quantities import Quantity
 from starloom.ephemeris.time_spec import TimeSpec
+from starloom.weft.blocks import MultiYearBlock
+from starloom.weft.weft_file import WeftFile
 from starloom.weft_ephemeris.ephemeris import WeftEphemeris
 from starloom.space_time.julian import datetime_to_julian
 
 
+@pytest.fixture(autouse=True)
+def weft_cache_dir(tmp_path, monkeypatch):
+    """Fixture to keep the weftball cache out of the user's home directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("STARLOOM_CACHE_DIR", str(cache_dir))
+    return cache_dir / "weft"
+
+
 @pytest.fixture
 def mercury_weftball_path():
     """Fixture to provide path to the mercury weftball."""
@@ -23,6 +39,33 @@ def mercury_weftball_path():
     return str(weftball_path.absolute())
 
 
+def _write_synthetic_weftball(path, planet, values):
+    """Write a weftball with constant longitude, latitude and distance."""
+    with tarfile.open(path, "w:gz") as tar:
+        for suffix, quantity, value in zip(
+            ("longitude", "latitude", "distance"),
+            ("ECLIPTIC_LONGITUDE", "ECLIPTIC_LATITUDE", "DELTA"),
+            values,
+        ):
+            weft_file = WeftFile(
+                f"#weft! v0.02 {planet} jpl:horizons 2000-2040 32bit {quantity} "
+                "unbounded chebychevs generated@test\n\n",
+                [MultiYearBlock(start_year=2000, duration=40, coeffs=[value])],
+            )
+            data = weft_file.to_bytes(include_index=True)
+            info = tarfile.TarInfo(f"{planet}_{suffix}.weft")
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+
+@pytest.fixture
+def synthetic_weftball_path(tmp_path):
+    """Fixture to provide a small weftball with constant values."""
+    path = tmp_path / "mars_weftball.tar.gz"
+    _write_synthetic_weftball(path, "mars", (123.0, 1.5, 0.75))
+    return str(path)
+
+
 class TestWeftEphemeris:
     """Test the WeftEphemeris class."""
 
@@ -116,6 +159,286 @@ class TestWeftEphemeris:
             assert Quantity.ECLIPTIC_LATITUDE in pos
             assert Quantity.DELTA in pos
 
+    def test_get_planet_rates(self, mercury_weftball_path):
+        """Test that analytic rates match the finite-difference default."""
+        ephemeris = WeftEphemeris(data=mercury_weftball_path)
+        time_spec = TimeSpec.from_dates(
+            [
+                datetime(2024, 4, 1, 12, tzinfo=timezone.utc),  # Near a station
+                datetime(2025, 3, 22, tzinfo=timezone.utc),
+            ]
+        )
+
+        rates = ephemeris.get_planet_rates("mercury", time_spec)
+        estimates = Ephemeris.get_planet_rates(ephemeris, "mercury", time_spec)
+
+        assert rates.keys() == estimates.keys()
+        for jd, rate in rates.items():
+            for quantity in (
+                Quantity.ECLIPTIC_LONGITUDE,
+                Quantity.ECLIPTIC_LATITUDE,
+                Quantity.DELTA,
+            ):
+                assert rate[quantity] == pytest.approx(
+                    estimates[jd][quantity], abs=1e-4
+                )
+
+    def test_get_planet_position_arrays(self, mercury_weftball_path):
+        """Test that columns match evaluating each date separately."""
+        ephemeris = WeftEphemeris(data=mercury_weftball_path)
+        time_spec = TimeSpec.from_range(
+            datetime(2025, 3, 1, tzinfo=timezone.utc),
+            datetime(2025, 4, 1, tzinfo=timezone.utc),
+            "10m",
+        )
+
+        julian_dates, columns = ephemeris.get_planet_position_arrays(
+            "mercury", time_spec
+        )
+        np.testing.assert_array_equal(
+            julian_dates, np.array(time_spec.to_julian_days())
+        )
+        positions = ephemeris.get_planet_positions("mercury", time_spec)
+        assert list(positions) == julian_dates.tolist()
+
+        readers = ephemeris.readers["mercury"]
+        for quantity, suffix in (
+            (Quantity.ECLIPTIC_LONGITUDE, "longitude"),
+            (Quantity.ECLIPTIC_LATITUDE, "latitude"),
+            (Quantity.DELTA, "distance"),
+        ):
+            expected = [
+                readers[f"mercury_{suffix}"].get_value_jd(jd)
+                for jd in julian_dates[::97]
+            ]
+            assert columns[quantity][::97].tolist() == expected
+            assert [positions[jd][quantity] for jd in julian_dates[::97]] == expected
+
+    def test_position_arrays_fill_uncovered_times(self, synthetic_weftball_path):
+        """Test that times outside the weft files get 0.0, as for positions."""
+        ephemeris = WeftEphemeris(data=synthetic_weftball_path)
+        # The synthetic files cover 2000-2040
+        time_spec = TimeSpec.from_dates([2451544.5 - 1.0, 2460000.5])
+
+        julian_dates, columns = ephemeris.get_planet_position_arrays(
+            "mars", time_spec, quantities=[Quantity.DELTA]
+        )
+        assert julian_dates.tolist() == [2451543.5, 2460000.5]
+        assert list(columns) == [Quantity.DELTA]
+        assert columns[Quantity.DELTA].tolist() == [0.0, 0.75]
+        assert ephemeris.get_planet_positions(
+            "mars", time_spec, quantities=[Quantity.DELTA]
+        ) == {2451543.5: {Quantity.DELTA: 0.0}, 2460000.5: {Quantity.DELTA: 0.75}}
+
+    def test_get_planet_positions_table(self, synthetic_weftball_path):
+        """Test that the table holds the same values as get_planet_positions."""
+        ephemeris = WeftEphemeris(data=synthetic_weftball_path)
+        time_spec = TimeSpec.from_dates([2460000.5, 2451600.5, 2455000.25])
+
+        table = ephemeris.get_planet_positions_table("mars", time_spec)
+
+        assert table.julian_dates.tolist() == [2451600.5, 2455000.25, 2460000.5]
+        assert table[Quantity.ECLIPTIC_LONGITUDE].dtype == np.float64
+        assert table[Quantity.DELTA].tolist() == [0.75, 0.75, 0.75]
+        assert dict(table.positions) == ephemeris.get_planet_positions(
+            "mars", time_spec
+        )
+
+    def test_iter_position_tables(self, synthetic_weftball_path):
+        """Test that streamed tables hold the same values as the full table."""
+        ephemeris = WeftEphemeris(data=synthetic_weftball_path)
+        time_spec = TimeSpec.from_range(2451600.5, 2451700.5, "6h")
+
+        tables = list(
+            ephemeris.iter_position_tables(
+                "mars", time_spec, quantities=[Quantity.DELTA], chunk_size=64
+            )
+        )
+        julian_dates, columns = ephemeris.get_planet_position_arrays(
+            "mars", time_spec, quantities=[Quantity.DELTA]
+        )
+
+        assert [len(table) for table in tables] == [64] * 6 + [17]
+        assert all(table.quantities == [Quantity.DELTA] for table in tables)
+        np.testing.assert_array_equal(
+            np.concatenate([table.julian_dates for table in tables]), julian_dates
+        )
+        np.testing.assert_array_equal(
+            np.concatenate([table[Quantity.DELTA] for table in tables]),
+            columns[Quantity.DELTA],
+        )
+
+    def test_iter_planet_positions(self, synthetic_weftball_path):
+        """Test that iterated positions follow the TimeSpec's order."""
+        ephemeris = WeftEphemeris(data=synthetic_weftball_path)
+        # The synthetic files cover 2000-2040
+        time_spec = TimeSpec.from_dates([2460000.5, 2451543.5, 2455000.25])
+
+        positions = list(
+            ephemeris.iter_planet_positions("mars", time_spec, chunk_size=2)
+        )
+
+        assert [jd for jd, _ in positions] == [2460000.5, 2451543.5, 2455000.25]
+        assert positions[0][1] == {
+            Quantity.ECLIPTIC_LONGITUDE: 123.0,
+            Quantity.ECLIPTIC_LATITUDE: 1.5,
+            Quantity.DELTA: 0.75,
+        }
+        assert positions[1][1][Quantity.DELTA] == 0.0
+
+    def test_get_bodies_positions(self, synthetic_weftball_path, tmp_path):
+        """Test getting several planets' positions from a weftball directory."""
+        _write_synthetic_weftball(
+            tmp_path / "venus_weftball.tar.gz", "venus", (45.0, -2.0, 1.25)
+        )
+        ephemeris = WeftEphemeris(data=str(tmp_path))
+        time_spec = TimeSpec.from_dates([2451600.5, 2455000.25, 2460000.5])
+
+        result = ephemeris.get_bodies_positions(["mars", "venus"], time_spec)
+
+        assert list(result) == ["mars", "venus"]
+        for planet in ("mars", "venus"):
+            assert result[planet] == ephemeris.get_planet_positions(planet, time_spec)
+        assert result["venus"][2455000.25] == {
+            Quantity.ECLIPTIC_LONGITUDE: 45.0,
+            Quantity.ECLIPTIC_LATITUDE: -2.0,
+            Quantity.DELTA: 1.25,
+        }
+
+    def test_loads_without_temporary_files(
+        self, synthetic_weftball_path, tmp_path, monkeypatch
+    ):
+        """Test that weft files are parsed straight from the archive."""
+        working_dir = tmp_path / "cwd"
+        working_dir.mkdir()
+        monkeypatch.chdir(working_dir)
+
+        ephemeris = WeftEphemeris(data=synthetic_weftball_path)
+        position = ephemeris.get_planet_position(
+            "mars", datetime(2025, 3, 22, tzinfo=timezone.utc)
+        )
+
+        assert position == {
+            Quantity.ECLIPTIC_LONGITUDE: 123.0,
+            Quantity.ECLIPTIC_LATITUDE: 1.5,
+            Quantity.DELTA: 0.75,
+        }
+        assert list(working_dir.iterdir()) == []
+
+    def test_uses_cache(self, synthetic_weftball_path, weft_cache_dir):
+        """Test that weftballs are decompressed once and then memory-mapped."""
+        first = WeftEphemeris(data=synthetic_weftball_path)
+        expected = first.get_planet_position("mars", 2460000.5)
+        assert len(list(weft_cache_dir.iterdir())) == 1
+
+        second = WeftEphemeris(data=synthetic_weftball_path)
+        assert second.get_planet_position("mars", 2460000.5) == expected
+        reader = second.readers["mars"]["mars_longitude"]
+        assert reader.file is not None and reader.file._mmap is not None
+
+        uncached = WeftEphemeris(data=synthetic_weftball_path, use_cache=False)
+        assert uncached.get_planet_position("mars", 2460000.5) == expected
+
+    @pytest.mark.parametrize("use_cache", [True, False])
+    def test_loads_quantities_on_demand(self, synthetic_weftball_path, use_cache):
+        """Test that only the quantities asked for are loaded."""
+        ephemeris = WeftEphemeris(data=synthetic_weftball_path, use_cache=use_cache)
+        time_spec = TimeSpec.from_dates([2460000.5, 2460001.5])
+
+        positions = ephemeris.get_planet_positions(
+            "mars", time_spec, quantities=[Quantity.ECLIPTIC_LONGITUDE]
+        )
+        assert positions == {
+            2460000.5: {Quantity.ECLIPTIC_LONGITUDE: 123.0},
+            2460001.5: {Quantity.ECLIPTIC_LONGITUDE: 123.0},
+        }
+        assert list(ephemeris.readers["mars"]) == ["mars_longitude"]
+
+        rates = ephemeris.get_planet_rates(
+            "mars", time_spec, quantities=[Quantity.DELTA]
+        )
+        assert rates[2460000.5] == {Quantity.DELTA: 0.0}
+        assert sorted(ephemeris.readers["mars"]) == ["mars_distance", "mars_longitude"]
+
+        assert ephemeris.get_planet_position("mars", 2460000.5) == {
+            Quantity.ECLIPTIC_LONGITUDE: 123.0,
+            Quantity.ECLIPTIC_LATITUDE: 1.5,
+            Quantity.DELTA: 0.75,
+        }
+        assert len(ephemeris.readers["mars"]) == 3
+
+        with pytest.raises(ValueError):
+            ephemeris.get_planet_positions(
+                "mars", time_spec, quantities=[Quantity.RIGHT_ASCENSION]
+            )
+
+    def test_concurrent_loading(self, synthetic_weftball_path):
+        """Test that ephemerides loading at the same time see complete data."""
+        barrier = threading.Barrier(8)
+        positions = []
+        errors = []
+
+        def load():
+            try:
+                ephemeris = WeftEphemeris(data=synthetic_weftball_path)
+                barrier.wait()
+                positions.append(ephemeris.get_planet_position("mars", 2460000.5))
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=load) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(positions) == 8
+        assert all(position[Quantity.DELTA] == 0.75 for position in positions)
+
+    def test_shared_between_threads(self, synthetic_weftball_path, monkeypatch):
+        """Test that threads sharing an ephemeris load each file once."""
+        ephemeris = WeftEphemeris(data=synthetic_weftball_path)
+        loads = []
+        load_reader = ephemeris._load_reader
+
+        def counting_load_reader(weftball_path, filename):
+            loads.append(filename)
+            return load_reader(weftball_path, filename)
+
+        monkeypatch.setattr(ephemeris, "_load_reader", counting_load_reader)
+
+        time_spec = TimeSpec.from_range(2451600.5, 2451700.5, "1h")
+        expected = WeftEphemeris(data=synthetic_weftball_path).get_planet_positions(
+            "mars", time_spec
+        )
+        barrier = threading.Barrier(8)
+        results = []
+        errors = []
+
+        def query():
+            try:
+                barrier.wait()
+                for _ in range(5):
+                    results.append(ephemeris.get_planet_positions("mars", time_spec))
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=query) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(results) == 40
+        assert all(result == expected for result in results)
+        assert sorted(loads) == [
+            "mars_distance.weft",
+            "mars_latitude.weft",
+            "mars_longitude.weft",
+        ]
+
     def test_file_not_found(self):
         """Test handling of a non-existent weftball."""
         # Use a non-existent path
@@ -0,0 +1,142 @@
+"""Tests for the indexed weftball container."""
+
+import io
+import tarfile
+from datetime import datetime, timezone
+
+import pytest
+from click.testing import CliRunner
+
+from starloom.cli.weft import weft
+from starloom.ephemeris.quantities import Quantity
+from starloom.weft.blocks import MultiYearBlock
+from starloom.weft.weft_file import WeftFile
+from starloom.weft_ephemeris import WeftEphemeris
+from starloom.weft_ephemeris.weftpack import (
+    COMPRESSION_STORED,
+    COMPRESSION_ZLIB,
+    MEMBER_ALIGNMENT,
+    Weftpack,
+    convert_tarball,
+    is_weftpack,
+    write_weftpack,
+)
+
+_VALUES = (
+    ("longitude", "ECLIPTIC_LONGITUDE", 123.0),
+    ("latitude", "ECLIPTIC_LATITUDE", 1.5),
+    ("distance", "DELTA", 0.75),
+)
+
+
+def _members():
+    """Build one constant .weft file per quantity."""
+    members = []
+    for suffix, quantity, value in _VALUES:
+        weft_file = WeftFile(
+            f"#weft! v0.02 mars jpl:horizons 2000-2040 32bit {quantity} "
+            "unbounded chebychevs generated@test\n\n",
+            [MultiYearBlock(start_year=2000, duration=40, coeffs=[value])],
+        )
+        members.append((f"mars_{suffix}.weft", weft_file.to_bytes(include_index=True)))
+    return members
+
+
+@pytest.fixture
+def weftball(tmp_path):
+    """Fixture to provide a small .tar.gz weftball."""
+    path = tmp_path / "mars_weftball.tar.gz"
+    with tarfile.open(path, "w:gz") as tar:
+        for name, data in _members():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return str(path)
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_round_trip(tmp_path, compress):
+    """Test that members are read back unchanged."""
+    path = str(tmp_path / "mars_weftball.weftpack")
+    members = _members()
+    write_weftpack(path, members, compress=compress)
+
+    assert is_weftpack(path)
+    pack = Weftpack(path)
+    assert pack.names() == [name for name, _ in members]
+    for name, data in members:
+        member = pack.members[name]
+        assert member.offset % MEMBER_ALIGNMENT == 0
+        assert member.compression == (
+            COMPRESSION_ZLIB if compress else COMPRESSION_STORED
+        )
+        assert pack.read(name) == data
+
+    reader = pack.open_reader("mars_latitude.weft")
+    try:
+        assert reader.get_value_jd(2460000.5) == 1.5
+    finally:
+        reader.close()
+
+    with pytest.raises(KeyError):
+        pack.read("mars_speed.weft")
+
+
+def test_invalid_files(tmp_path, weftball):
+    """Test that files that are not weftpacks, or are corrupt, are rejected."""
+    assert not is_weftpack(weftball)
+    with pytest.raises(ValueError):
+        Weftpack(weftball)
+
+    path = tmp_path / "mars_weftball.weftpack"
+    write_weftpack(str(path), _members())
+    member = Weftpack(str(path)).members["mars_longitude.weft"]
+    data = bytearray(path.read_bytes())
+    data[member.offset + member.size - 1] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError):
+        Weftpack(str(path)).read("mars_longitude.weft")
+
+
+def test_convert_tarball(weftball):
+    """Test converting a .tar.gz weftball."""
+    output = convert_tarball(weftball)
+    assert output.endswith("mars_weftball.weftpack")
+
+    pack = Weftpack(output)
+    assert pack.names() == [name for name, _ in _members()]
+    with tarfile.open(weftball) as tar:
+        member = tar.extractfile("mars_distance.weft")
+        assert member is not None
+        assert pack.read("mars_distance.weft") == member.read()
+
+
+def test_ephemeris_reads_weftpack(tmp_path, weftball):
+    """Test that WeftEphemeris reads weftpacks, directly or from a directory."""
+    (tmp_path / "packs").mkdir()
+    convert_tarball(weftball, str(tmp_path / "packs" / "mars_weftball.weftpack"))
+    time_point = datetime(2025, 3, 22, tzinfo=timezone.utc)
+    expected = {
+        Quantity.ECLIPTIC_LONGITUDE: 123.0,
+        Quantity.ECLIPTIC_LATITUDE: 1.5,
+        Quantity.DELTA: 0.75,
+    }
+
+    for data in (
+        str(tmp_path / "packs" / "mars_weftball.weftpack"),
+        str(tmp_path / "packs"),
+    ):
+        ephemeris = WeftEphemeris(data=data, cache_dir=str(tmp_path / "cache"))
+        assert ephemeris.get_planet_position("mars", time_point) == expected
+
+    # Weftpacks are read in place, so nothing is cached
+    assert not (tmp_path / "cache").exists()
+
+
+def test_cli_pack(tmp_path, weftball):
+    """Test the weft pack command."""
+    output = tmp_path / "out.weftpack"
+    result = CliRunner().invoke(weft, ["pack", weftball, "-o", str(output)])
+    assert result.exit_code == 0, result.output
+    assert "3 files" in result.output
+    assert is_weftpack(str(output))